@@ -11,6 +11,7 @@ _JWT_MIN_LEN = 32
 # staging/prod 이미지 업로드 한도 상한 (오타로 보호 해제 방지)
 _IMAGE_MAX_UPLOAD_BYTES_CAP = 50_000_000  # 50MB
 _IMAGE_MAX_PIXELS_CAP = 10_000
+_IMAGE_VARIANT_FORMATS = frozenset({"webp", "avif"})
 
 
 def is_jwt_placeholder(secret: str) -> bool:
@@ -78,6 +79,48 @@ class Settings(BaseSettings):
 
     # Scheduler (예약 알림)
     scheduler_enabled: bool = Field(default=True, alias="SCHEDULER_ENABLED")
+    # 같은 날 D-3/D-1 행사가 여러 개면 구독자마다 한 번의 묶음 알림으로 보낸다
+    scheduled_notification_digest: bool = Field(
+        default=False, alias="SCHEDULED_NOTIFICATION_DIGEST"
+    )
+    # true 면 웹 프로세스 대신 백그라운드 워커(apps.api.worker)가 스케줄러를 띄운다
+    scheduler_in_worker: bool = Field(default=False, alias="SCHEDULER_IN_WORKER")
+    # 예약 발송 push 서비스 origin 별 초당 허용량(429/5xx 에 따라 min~max 에서 조절)
+    push_rate_initial_per_second: float = Field(
+        default=50.0, gt=0, alias="PUSH_RATE_INITIAL_PER_SECOND"
+    )
+    push_rate_min_per_second: float = Field(
+        default=1.0, gt=0, alias="PUSH_RATE_MIN_PER_SECOND"
+    )
+    push_rate_max_per_second: float = Field(
+        default=500.0, gt=0, alias="PUSH_RATE_MAX_PER_SECOND"
+    )
+
+    # 구독 건강도: 연속 실패가 N 번 쌓이면 base 분부터 두 배씩(max 시간 상한) 발송에서
+    # 빼고, revoke 일수 동안 성공이 없으면 매일 sweep 이 해지한다. 0 이면 해당 기능 끔.
+    push_quarantine_after_failures: int = Field(
+        default=3, ge=0, alias="PUSH_QUARANTINE_AFTER_FAILURES"
+    )
+    push_quarantine_base_minutes: float = Field(
+        default=60.0, gt=0, alias="PUSH_QUARANTINE_BASE_MINUTES"
+    )
+    push_quarantine_max_hours: float = Field(
+        default=168.0, gt=0, alias="PUSH_QUARANTINE_MAX_HOURS"
+    )
+    push_revoke_after_days: int = Field(
+        default=30, ge=0, alias="PUSH_REVOKE_AFTER_DAYS"
+    )
+
+    # 발송 로그 보존 일수. 0 이면 자동 정리하지 않는다(관리자 prune-logs 로만 정리).
+    # 지난 달 파티션은 DELETE 대신 통째로 지운다.
+    notification_log_retention_days: int = Field(
+        default=0, ge=0, alias="NOTIFICATION_LOG_RETENTION_DAYS"
+    )
+
+    # Background jobs (PostgreSQL 작업 큐 워커)
+    job_poll_interval_seconds: float = Field(
+        default=2.0, alias="JOB_POLL_INTERVAL_SECONDS"
+    )
 
     # Media/Uploads
     media_root: str = Field(default="uploads", alias="MEDIA_ROOT")
@@ -92,6 +135,41 @@ class Settings(BaseSettings):
         default=5_000_000, alias="IMAGE_MAX_UPLOAD_BYTES"
     )  # 5MB
     image_max_pixels: int = Field(default=1920, alias="IMAGE_MAX_PIXELS")
+    # 이미지 처리 프로세스 풀 (0이면 min(2, CPU 코어 수))과 대기 상한(초과 시 429)
+    image_workers: int = Field(default=0, ge=0, alias="IMAGE_WORKERS")
+    image_max_pending: int = Field(default=8, ge=1, alias="IMAGE_MAX_PENDING")
+    # 게시글 이미지 반응형 변형(srcset) 폭·형식(webp/avif). 빈 목록이면 생성 안 함
+    image_variant_widths: list[int] = Field(
+        default_factory=lambda: [320, 640, 1280], alias="IMAGE_VARIANT_WIDTHS"
+    )
+    image_variant_formats: list[str] = Field(
+        default_factory=lambda: ["webp", "avif"], alias="IMAGE_VARIANT_FORMATS"
+    )
+    # 업로드 스트리밍 수집: 이 크기까지는 메모리, 넘으면 임시 파일로 스풀
+    upload_spool_bytes: int = Field(
+        default=1_000_000, ge=0, alias="UPLOAD_SPOOL_BYTES"
+    )
+    # 헤더상 가로·세로 상한(디코딩 폭탄 차단, 전체 디코딩 전에 검사)
+    image_max_source_pixels: int = Field(
+        default=50_000_000, ge=1, alias="IMAGE_MAX_SOURCE_PIXELS"
+    )
+    # 참조가 끊긴 미디어 파일·행을 지우기 전 유예(업로드 후 게시 전 구간 보호)
+    media_gc_grace_hours: int = Field(default=24, ge=1, alias="MEDIA_GC_GRACE_HOURS")
+    # 미디어 전달: app=Python 이 직접 전송, accel=nginx X-Accel-Redirect 로 위임
+    media_delivery: str = Field(default="app", alias="MEDIA_DELIVERY")
+    # accel 모드에서 nginx internal location 접두 (ops/nginx/sogecon.conf 와 일치)
+    media_accel_prefix: str = Field(default="/_media/", alias="MEDIA_ACCEL_PREFIX")
+    # 콘텐츠 해시가 아닌(예전 이름) 미디어의 캐시 수명(초)
+    media_cache_max_age: int = Field(
+        default=86_400, ge=0, alias="MEDIA_CACHE_MAX_AGE"
+    )
+
+    # 비밀번호 해시 전용 스레드 풀 (0이면 CPU 코어 수)
+    password_hash_workers: int = Field(default=0, ge=0, alias="PASSWORD_HASH_WORKERS")
+    # 풀 대기 작업 상한. 초과 요청은 429(auth_busy)로 즉시 거절한다.
+    password_hash_max_pending: int = Field(
+        default=32, ge=1, alias="PASSWORD_HASH_MAX_PENDING"
+    )
 
     # Observability / Sentry
     sentry_dsn: str = Field(default="", alias="SENTRY_DSN")
@@ -186,6 +264,38 @@ class Settings(BaseSettings):
                 raise ValueError(msg)
         return self
 
+    @field_validator("image_variant_formats")
+    @classmethod
+    def _validate_image_variant_formats(cls, v: list[str]) -> list[str]:
+        formats = [fmt.strip().lower() for fmt in v if fmt.strip()]
+        unknown = sorted(set(formats) - _IMAGE_VARIANT_FORMATS)
+        if unknown:
+            raise ValueError(
+                "IMAGE_VARIANT_FORMATS supports only: "
+                + ", ".join(sorted(_IMAGE_VARIANT_FORMATS))
+            )
+        return list(dict.fromkeys(formats))
+
+    @field_validator("media_delivery")
+    @classmethod
+    def _validate_media_delivery(cls, v: str) -> str:
+        vv = (v or "").strip().lower() or "app"
+        if vv not in {"app", "accel"}:
+            raise ValueError("MEDIA_DELIVERY must be app or accel")
+        return vv
+
+    @field_validator("media_accel_prefix")
+    @classmethod
+    def _normalize_media_accel_prefix(cls, v: str) -> str:
+        return "/" + (v or "").strip().strip("/") + "/"
+
+    @field_validator("image_variant_widths")
+    @classmethod
+    def _validate_image_variant_widths(cls, v: list[int]) -> list[int]:
+        if any(width <= 0 for width in v):
+            raise ValueError("IMAGE_VARIANT_WIDTHS must be positive")
+        return sorted(set(v))
+
     @model_validator(mode="after")
     def _validate_image_limits(self) -> "Settings":
         if self.image_max_upload_bytes <= 0 or self.image_max_pixels <= 0:
@@ -46,3 +46,14 @@ class DirectoryMemberRead(BaseModel):
     @computed_field(return_type=str | None)
     def avatar_url(self) -> str | None:
         return build_media_url(self.avatar_path)
+
+
+class DirectoryMemberPage(BaseModel):
+    """동문 수첩 커서 페이지. next_cursor 가 없으면 마지막 페이지다.
+
+    total 은 include_total 요청 시에만 채워진다.
+    """
+
+    items: list[DirectoryMemberRead]
+    next_cursor: str | None = None
+    total: int | None = None
@@ -0,0 +1,105 @@
+"""홈 히어로 배너 슬롯·캐러셀 스키마.
+
+schemas.py가 같은 이름으로 다시 내보내므로 호출부는 `schemas.HeroSlide`
+처럼 기존 경로를 그대로 사용한다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .media_utils import build_media_url, normalize_media_path
+
+HeroTargetTypeLiteral = Literal["post", "event"]
+
+
+class HeroItemBase(BaseModel):
+    """홈 히어로 배너 슬롯(추천) 기본 스키마."""
+
+    target_type: HeroTargetTypeLiteral
+    target_id: int
+    enabled: bool = True
+    pinned: bool = False
+    title_override: str | None = None
+    description_override: str | None = None
+    image_override: str | None = None
+
+
+class HeroItemCreate(HeroItemBase):
+    @field_validator("image_override", mode="before")
+    @classmethod
+    def _normalize_image_override(cls, value: str | None) -> str | None:
+        return normalize_media_path(value)
+
+
+class HeroItemUpdate(BaseModel):
+    """히어로 배너 슬롯 부분 업데이트 스키마."""
+
+    target_type: HeroTargetTypeLiteral | None = None
+    target_id: int | None = None
+    enabled: bool | None = None
+    pinned: bool | None = None
+    title_override: str | None = None
+    description_override: str | None = None
+    image_override: str | None = None
+
+    @field_validator("image_override", mode="before")
+    @classmethod
+    def _normalize_image_override(cls, value: str | None) -> str | None:
+        return normalize_media_path(value)
+
+
+class HeroItemRead(HeroItemBase):
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("image_override", mode="before")
+    @classmethod
+    def _build_image_override(cls, value: str | None) -> str | None:
+        return build_media_url(value)
+
+
+class HeroSlide(BaseModel):
+    """홈 히어로 캐러셀용 응답(대상 resolve 포함)."""
+
+    id: int
+    target_type: HeroTargetTypeLiteral
+    target_id: int
+    title: str
+    description: str
+    image: str | None = None
+    # 형식(webp/avif)별 srcset 문자열 (변형이 없는 이미지는 빈 객체)
+    image_srcset: dict[str, str] = Field(default_factory=dict)
+    href: str
+    unpublished: bool = False
+
+    @field_validator("image", mode="before")
+    @classmethod
+    def _build_image(cls, value: str | None) -> str | None:
+        return build_media_url(value)
+
+
+class HeroTargetLookupRequest(BaseModel):
+    """관리자용: 대상(게시글/행사) ID 목록으로 hero_item 상태 조회."""
+
+    target_type: HeroTargetTypeLiteral
+    target_ids: list[int]
+
+
+class HeroTargetLookupItem(BaseModel):
+    """관리자용: 대상별 hero_item 요약."""
+
+    target_id: int
+    hero_item_id: int
+    enabled: bool
+    pinned: bool
+
+
+class HeroTargetLookupResponse(BaseModel):
+    items: list[HeroTargetLookupItem]
@@ -0,0 +1,404 @@
+"""이미지 디코딩·리사이즈·인코딩 파이프라인.
+
+PIL 디코딩/LANCZOS 리사이즈/재인코딩은 큰 휴대폰 사진 한 장에 수백 ms CPU 를
+쓰고 GIL 을 오래 잡는다. 이벤트 루프에서 직접 실행하면 같은 워커의 모든 요청이
+멈추므로 별도 프로세스 풀에서 처리한다.
+
+- 워커 함수(render_*)는 바이트나 임시 파일 경로를 받아 결과 바이트를 돌려주는 순수
+  함수라 프로세스 경계를 넘을 수 있다(큰 업로드는 경로만 넘겨 사본을 만들지 않음).
+- 게시글 이미지는 같은 디코딩 결과로 폭별 WebP/AVIF 변형(srcset 용)도 만든다.
+- 대기 작업 수가 IMAGE_MAX_PENDING 이상이면 메모리에 쌓지 않고 429 로 거절한다.
+- 단계별(대기/디코딩/리사이즈/인코딩/저장) 소요 시간을 구조화 로그로 남긴다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError
+from PIL.Image import DecompressionBombError
+
+from .config import get_settings
+from .errors import ApiError
+from .jpeg_quality import search_jpeg_quality
+from .logging_utils import log_json
+
+logger = logging.getLogger(__name__)
+
+StageTimings = dict[str, float]
+# 메모리에 스풀된 업로드는 bytes, 디스크로 넘친 업로드는 임시 파일 경로
+ImageSource = bytes | str
+
+_ALLOWED_AVATAR_FORMATS = {"JPEG", "PNG", "WEBP"}
+_UPLOAD_SAVE_FORMATS = {".gif": "GIF", ".png": "PNG", ".webp": "WEBP"}
+_DEFAULT_MAX_WORKERS = 2
+# 변형 형식별 인코더 옵션 (AVIF 는 speed 를 올려 인코딩 CPU 를 줄인다)
+_VARIANT_SAVE_OPTIONS: dict[str, dict[str, int]] = {
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60, "speed": 8},
+}
+
+# 모듈 상태 (global 문 대신 dict 사용)
+_pool: dict[str, ProcessPoolExecutor | None] = {"executor": None}
+_counters: dict[str, int] = {"pending": 0}
+
+
+class ImageProcessingError(ValueError):
+    """워커 프로세스의 이미지 오류. pickle 되도록 args 만으로 복원한다."""
+
+    def __init__(self, code: str, detail: str) -> None:
+        super().__init__(code, detail)
+        self.code = code
+        self.detail = detail
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    """반응형 변형 생성 설정. widths 보다 원본이 작으면 원본 폭 하나만 만든다."""
+
+    widths: tuple[int, ...]
+    formats: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RenderedVariant:
+    width: int
+    format: str  # "webp" | "avif"
+    data: bytes
+
+
+@dataclass(frozen=True)
+class RenderedImage:
+    """워커 결과. 프로세스 경계를 넘도록 바이트와 원시 값만 담는다."""
+
+    data: bytes
+    size: tuple[int, int]
+    variants: tuple[RenderedVariant, ...] = ()
+
+    @property
+    def total_bytes(self) -> int:
+        return len(self.data) + sum(len(v.data) for v in self.variants)
+
+
+RenderResult = tuple[RenderedImage, StageTimings]
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+# ---- 워커 프로세스에서 실행되는 순수 함수 ----
+
+
+def _resize_image_if_needed(img: Image.Image, max_pixels: int) -> Image.Image:
+    """이미지가 max_pixels보다 크면 리사이즈."""
+    width, height = img.size
+    if width <= max_pixels and height <= max_pixels:
+        return img
+    if width > height:
+        new_width = max_pixels
+        new_height = int(height * (max_pixels / width))
+    else:
+        new_height = max_pixels
+        new_width = int(width * (max_pixels / height))
+    new_size: tuple[int, int] = (new_width, new_height)
+    return img.resize(new_size, Image.Resampling.LANCZOS)
+
+
+def _open_source(source: ImageSource) -> Image.Image:
+    """경로는 파일에서 바로 디코딩해 바이트 사본을 만들지 않는다."""
+    if isinstance(source, bytes):
+        return Image.open(io.BytesIO(source))
+    return Image.open(source)
+
+
+def _render_variants(
+    img: Image.Image, spec: VariantSpec
+) -> tuple[RenderedVariant, ...]:
+    """폭별·형식별 변형을 인코딩한다. 원본보다 큰 폭은 만들지 않는다."""
+    has_alpha = img.mode in {"RGBA", "LA", "PA"} or "transparency" in img.info
+    current = img.convert("RGBA" if has_alpha else "RGB")
+    width, height = current.size
+    widths = sorted({w for w in spec.widths if w < width} | {width}, reverse=True)
+    variants: list[RenderedVariant] = []
+    for target in widths:
+        if target != current.width:
+            # 직전(더 큰) 변형에서 이어 줄이면 매번 원본을 리샘플하는 것보다 싸다.
+            current = current.copy()
+            current.thumbnail((target, height), Image.Resampling.LANCZOS)
+        for fmt in spec.formats:
+            buffer = io.BytesIO()
+            current.save(buffer, format=fmt.upper(), **_VARIANT_SAVE_OPTIONS[fmt])
+            variants.append(RenderedVariant(target, fmt, buffer.getvalue()))
+    return tuple(variants)
+
+
+def render_upload_image(
+    source: ImageSource,
+    ext: str,
+    max_pixels: int,
+    spec: VariantSpec | None = None,
+) -> RenderResult:
+    """게시글 이미지: 디코딩 → 리사이즈 → 재인코딩 (+ 반응형 변형)."""
+    timings: StageTimings = {}
+    started = time.perf_counter()
+    try:
+        img = _open_source(source)
+        img.load()  # 이미지 유효성 검증
+    except (
+        UnidentifiedImageError,
+        DecompressionBombError,
+        OSError,
+        SyntaxError,
+        ValueError,
+    ) as exc:
+        raise ImageProcessingError(
+            "invalid_image_data", "이미지 파일을 읽을 수 없습니다."
+        ) from exc
+    timings["decode_ms"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    img = _resize_image_if_needed(img, max_pixels)
+    timings["resize_ms"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    buffer = io.BytesIO()
+    save_format = _UPLOAD_SAVE_FORMATS.get(ext, "JPEG")
+    if save_format == "GIF":
+        # GIF: 애니메이션 보존을 위해 리사이즈된 첫 프레임만 저장
+        img.save(buffer, format="GIF", optimize=True)
+    elif save_format in {"PNG", "WEBP"}:
+        # PNG/WebP: 투명도 유지
+        img.save(buffer, format=save_format, quality=85, optimize=True)
+    else:
+        # JPEG: RGB 변환 필수
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+        img.save(buffer, format="JPEG", quality=85, optimize=True)
+    timings["encode_ms"] = _elapsed_ms(started)
+
+    variants: tuple[RenderedVariant, ...] = ()
+    if spec is not None and spec.formats:
+        started = time.perf_counter()
+        variants = _render_variants(img, spec)
+        timings["variants_ms"] = _elapsed_ms(started)
+    return RenderedImage(buffer.getvalue(), img.size, variants), timings
+
+
+def _load_and_normalize_image(source: ImageSource) -> Image.Image:
+    try:
+        image = _open_source(source)
+    except UnidentifiedImageError as exc:
+        raise ImageProcessingError(
+            "avatar_invalid_image", "이미지 형식을 인식할 수 없습니다."
+        ) from exc
+
+    if image.format not in _ALLOWED_AVATAR_FORMATS:
+        raise ImageProcessingError(
+            "avatar_unsupported_format",
+            "JPG, PNG, WEBP 형식만 업로드할 수 있습니다.",
+        )
+
+    image.load()
+    if image.mode not in {"RGB", "L", "RGBA"}:
+        image = image.convert("RGBA")
+    if image.mode == "RGBA":
+        background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        return background.convert("RGB")
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    return image
+
+
+def _compress_to_jpeg(image: Image.Image, *, max_bytes: int) -> bytes:
+    result = search_jpeg_quality(image, max_bytes=max_bytes)
+    if result is None:
+        raise ImageProcessingError(
+            "avatar_compress_failed", "이미지를 100KB 이하로 압축할 수 없습니다."
+        )
+    return result.data
+
+
+def render_avatar(
+    source: ImageSource, max_pixels: int, max_bytes: int
+) -> RenderResult:
+    """아바타: 디코딩·RGB 정규화 → 썸네일 → max_bytes 이하 JPEG."""
+    timings: StageTimings = {}
+    started = time.perf_counter()
+    image = _load_and_normalize_image(source)
+    timings["decode_ms"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    normalized = image.copy()
+    normalized.thumbnail((max_pixels, max_pixels))
+    timings["resize_ms"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    encoded = _compress_to_jpeg(normalized, max_bytes=max_bytes)
+    timings["encode_ms"] = _elapsed_ms(started)
+    return RenderedImage(encoded, normalized.size), timings
+
+
+# ---- 이벤트 루프 측 async API ----
+
+
+def _executor() -> ProcessPoolExecutor:
+    executor = _pool["executor"]
+    if executor is None:
+        workers = get_settings().image_workers or min(
+            _DEFAULT_MAX_WORKERS, os.cpu_count() or 1
+        )
+        # spawn: 스레드가 있는 서버 프로세스를 fork 하지 않는다.
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        _pool["executor"] = executor
+    return executor
+
+
+def _source_size(source: ImageSource) -> int:
+    if isinstance(source, bytes):
+        return len(source)
+    return os.path.getsize(source)
+
+
+async def _run_in_pool(
+    kind: str,
+    render: Callable[..., RenderResult],
+    source: ImageSource,
+    *args: int | str | VariantSpec | None,
+) -> RenderedImage:
+    limit = get_settings().image_max_pending
+    if _counters["pending"] >= limit:
+        log_json(
+            logger,
+            logging.WARNING,
+            "image_pipeline_rejected",
+            kind=kind,
+            pending=_counters["pending"],
+            limit=limit,
+        )
+        raise ApiError(
+            code="image_busy",
+            detail="이미지 처리 요청이 많습니다. 잠시 후 다시 시도해 주세요.",
+            status=429,
+        )
+
+    # 카운터는 이벤트 루프 스레드에서만 바뀌므로 잠금이 필요 없다.
+    _counters["pending"] += 1
+    started = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        rendered, timings = await loop.run_in_executor(
+            _executor(), render, source, *args
+        )
+    except ImageProcessingError as exc:
+        raise ApiError(code=exc.code, detail=exc.detail, status=422) from exc
+    except BrokenProcessPool as exc:
+        # 워커가 비정상 종료(OOM 등)하면 다음 요청에서 풀을 새로 만든다.
+        _pool["executor"] = None
+        raise ApiError(
+            code="image_pipeline_unavailable",
+            detail="이미지를 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.",
+            status=503,
+        ) from exc
+    finally:
+        _counters["pending"] -= 1
+
+    total_ms = _elapsed_ms(started)
+    log_json(
+        logger,
+        logging.INFO,
+        "image_pipeline",
+        kind=kind,
+        queue_ms=round(max(total_ms - sum(timings.values()), 0.0), 1),
+        total_ms=total_ms,
+        input_bytes=_source_size(source),
+        output_bytes=rendered.total_bytes,
+        variants=len(rendered.variants),
+        **timings,
+    )
+    return rendered
+
+
+def upload_variant_spec() -> VariantSpec:
+    """설정(IMAGE_VARIANT_WIDTHS/FORMATS)에서 변형 생성 설정을 만든다."""
+    settings = get_settings()
+    return VariantSpec(
+        widths=tuple(settings.image_variant_widths),
+        formats=tuple(settings.image_variant_formats),
+    )
+
+
+async def process_upload_image(
+    source: ImageSource,
+    *,
+    ext: str,
+    max_pixels: int,
+    variants: VariantSpec | None = None,
+) -> RenderedImage:
+    """게시글 이미지를 프로세스 풀에서 처리해 본문·변형 바이트를 반환한다."""
+    return await _run_in_pool(
+        "upload", render_upload_image, source, ext, max_pixels, variants
+    )
+
+
+async def process_avatar(
+    source: ImageSource, *, max_pixels: int, max_bytes: int
+) -> RenderedImage:
+    """아바타 이미지를 프로세스 풀에서 처리해 JPEG 바이트와 크기를 반환한다."""
+    return await _run_in_pool("avatar", render_avatar, source, max_pixels, max_bytes)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    # 같은 해시 파일을 동시에 쓰거나 읽어도 반쯤 쓴 파일이 보이지 않게 교체한다.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.{os.getpid()}.{time.monotonic_ns()}")
+    partial.write_bytes(data)
+    os.replace(partial, path)
+
+
+async def write_media_file(path: Path, data: bytes) -> None:
+    """미디어 파일 저장(블로킹 I/O 는 스레드에서)."""
+    started = time.perf_counter()
+    await asyncio.to_thread(_write_file, path, data)
+    log_json(
+        logger,
+        logging.INFO,
+        "image_pipeline_write",
+        path=path.name,
+        bytes=len(data),
+        write_ms=_elapsed_ms(started),
+    )
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+async def remove_media_file(path: Path) -> None:
+    """미디어 파일 삭제(없으면 무시)."""
+    await asyncio.to_thread(_unlink_quietly, path)
+
+
+def shutdown_image_pipeline() -> None:
+    """앱 종료 시 프로세스 풀을 정리한다."""
+    executor = _pool["executor"]
+    _pool["executor"] = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -9,7 +9,6 @@ from urllib.parse import urlsplit
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from sentry_sdk import get_current_scope
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -20,11 +19,15 @@ from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import JSONResponse, Response
 from starlette.types import ASGIApp
 
+from . import scheduler_leader
 from .config import get_settings
 from .db import dispose_engine
 from .errors import ApiError
+from .image_pipeline import shutdown_image_pipeline
 from .logging_utils import emit_error_event, log_json, reset_request_id, set_request_id
+from .media_delivery import MediaFiles, media_delivery_policy
 from .observability import init_sentry
+from .passwords import password_hash_metrics, shutdown_password_hash_pool
 from .ratelimit import create_limiter
 from .routers import (
     admin_events,
@@ -48,6 +51,8 @@ from .routers import (
     uploads,
 )
 from .scheduler import shutdown_scheduler, start_scheduler
+from .support_log import shutdown_support_log
+from .upload_ingest import UploadSizeLimitMiddleware, upload_size_limits
 
 settings = get_settings()
 init_sentry(settings)
@@ -59,8 +64,11 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     # startup: 스케줄러 시작
     start_scheduler()
     yield
-    # shutdown: 스케줄러 종료 후 DB 커넥션 풀 정리
-    shutdown_scheduler()
+    # shutdown: 스케줄러·해시/이미지 풀·문의 로그 종료 후 DB 커넥션 풀 정리
+    await shutdown_scheduler()
+    shutdown_password_hash_pool()
+    shutdown_image_pipeline()
+    shutdown_support_log()
     await dispose_engine()
 
 
@@ -105,9 +113,10 @@ media_root.mkdir(parents=True, exist_ok=True)
 media_mount_path = urlsplit(settings.media_url_base).path or "/"
 if not media_mount_path.startswith("/"):
     media_mount_path = f"/{media_mount_path}"
+# 캐시 헤더 + (MEDIA_DELIVERY=accel 이면) nginx X-Accel-Redirect 위임
 app.mount(
     media_mount_path,
-    StaticFiles(directory=str(media_root)),
+    MediaFiles(directory=str(media_root), policy=media_delivery_policy()),
     name="media",
 )
 
@@ -165,6 +174,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+# 업로드 본문 크기 선검사(Content-Length). RequestContext 안쪽에서 실행돼 로그가 남는다.
+app.add_middleware(UploadSizeLimitMiddleware, limits=upload_size_limits())
 app.add_middleware(RequestContextMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 
@@ -231,8 +242,14 @@ app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
 @app.get("/healthz")
-def healthcheck() -> dict[str, bool]:
-    return {"ok": True}
+def healthcheck() -> dict[str, bool | dict[str, str | None] | dict[str, float]]:
+    # scheduler: 이 프로세스의 leader 선출 역할과 마지막으로 확인한 leader
+    # password_hash: bcrypt 해시 풀 대기·완료·거절 수와 평균/최대 지연(ms)
+    return {
+        "ok": True,
+        "scheduler": scheduler_leader.health_snapshot(),
+        "password_hash": password_hash_metrics(),
+    }
 
 
 # Domain → HTTP 매핑 (전역 핸들러, Problem Details 형식 간소 버전)
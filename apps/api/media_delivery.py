@@ -0,0 +1,84 @@
+"""MEDIA_URL_BASE 아래 업로드 미디어 전달.
+
+기본 StaticFiles 마운트는 모든 아바타·게시글 이미지를 Python 워커가 읽어 보내고,
+SecurityHeadersMiddleware 가 API 응답용 `Cache-Control: no-store` 를 덧붙여
+브라우저·CDN 이 매번 다시 받는다. 여기서는
+
+- MEDIA_DELIVERY=accel: 파일을 열지 않고 `X-Accel-Redirect` 만 돌려 nginx 의
+  internal location(MEDIA_ACCEL_PREFIX)이 sendfile·Range·ETag 를 처리하게 하고,
+- MEDIA_DELIVERY=app: StaticFiles 의 ETag/Last-Modified 조건부 요청과 Range 응답을
+  그대로 쓰되 캐시 헤더를 붙인다.
+
+콘텐츠 해시 파일명(`<sha256>.<ext>`, `<sha256>_w<폭>.<형식>`)은 내용이 바뀌지
+않으므로 1년 immutable, 예전 이름은 MEDIA_CACHE_MAX_AGE 동안 공개 캐시한다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from urllib.parse import quote
+
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import PathLike, StaticFiles
+from starlette.types import Scope
+
+from .config import get_settings
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_CONTENT_ADDRESSED_NAME = re.compile(r"^[0-9a-f]{64}(?:_w\d+)?\.[a-z0-9]+$")
+
+
+@dataclass(frozen=True)
+class MediaDeliveryPolicy:
+    mode: str  # "app" | "accel"
+    accel_prefix: str
+    max_age: int
+
+
+def media_delivery_policy() -> MediaDeliveryPolicy:
+    settings = get_settings()
+    return MediaDeliveryPolicy(
+        mode=settings.media_delivery,
+        accel_prefix=settings.media_accel_prefix,
+        max_age=settings.media_cache_max_age,
+    )
+
+
+def media_cache_control(path: str, max_age: int) -> str:
+    """파일명이 콘텐츠 해시면 immutable, 아니면 max_age 동안 공개 캐시."""
+    if _CONTENT_ADDRESSED_NAME.match(os.path.basename(path)):
+        return IMMUTABLE_CACHE_CONTROL
+    return f"public, max-age={max_age}"
+
+
+class MediaFiles(StaticFiles):
+    """캐시 헤더를 붙이고 accel 모드에서는 nginx 로 전송을 넘기는 StaticFiles."""
+
+    def __init__(self, *, directory: PathLike, policy: MediaDeliveryPolicy) -> None:
+        super().__init__(directory=directory)
+        self.policy = policy
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if self.policy.mode != "accel":
+            response = await super().get_response(path, scope)
+            response.headers["Cache-Control"] = media_cache_control(
+                path, self.policy.max_age
+            )
+            return response
+
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+        # get_path 가 정규화한 경로라도 루트 밖이나 널 문자는 nginx 로 넘기지 않는다.
+        if path in ("", ".") or path.startswith(("..", "/", "\\")) or "\0" in path:
+            raise HTTPException(status_code=404)
+        target = self.policy.accel_prefix + quote(path.replace(os.sep, "/"))
+        return Response(
+            status_code=200,
+            headers={
+                "X-Accel-Redirect": target,
+                "Cache-Control": media_cache_control(path, self.policy.max_age),
+            },
+        )
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import TypedDict
 from urllib.parse import SplitResult, urlsplit
 
 from .config import get_settings
 
 
+class MediaVariant(TypedDict):
+    """반응형 변형 이미지 매니페스트 항목(path는 MEDIA_ROOT 기준 상대경로)."""
+
+    path: str
+    width: int
+    format: str
+
+
 def _trim_value(value: str | None) -> str | None:
     """문자열 입력을 정리하고 비어 있으면 None을 반환한다."""
     if value is None:
@@ -147,3 +157,18 @@ def build_media_urls(values: list[str] | None) -> list[str] | None:
         if built:
             urls.append(built)
     return urls
+
+
+def build_srcset(variants: Sequence[MediaVariant] | None) -> dict[str, str]:
+    """변형 목록을 형식별 srcset 문자열(`url 320w, url 640w`)로 만든다."""
+    by_format: dict[str, list[tuple[int, str]]] = {}
+    for variant in variants or ():
+        url = build_media_url(variant["path"])
+        if url:
+            by_format.setdefault(variant["format"], []).append(
+                (variant["width"], url)
+            )
+    return {
+        fmt: ", ".join(f"{url} {width}w" for width, url in sorted(items))
+        for fmt, items in by_format.items()
+    }
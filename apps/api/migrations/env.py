@@ -12,8 +12,9 @@ ROOT = Path(__file__).resolve().parents[3]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from apps.api import models, models_support  # noqa: E402
+from apps.api import models, models_jobs, models_support  # noqa: E402
 from apps.api.config import get_settings  # noqa: E402
+from apps.api.repositories import send_log_partitions  # noqa: E402
 
 config = context.config
 
@@ -28,10 +29,19 @@ config.set_main_option("sqlalchemy.url", _safe_url)
 
 if models_support.SupportTicket.metadata is not models.Base.metadata:
     raise RuntimeError("SupportTicket must use the shared SQLAlchemy metadata")
+if models_jobs.BackgroundJob.metadata is not models.Base.metadata:
+    raise RuntimeError("BackgroundJob must use the shared SQLAlchemy metadata")
 
 target_metadata = models.Base.metadata
 
 
+def include_name(name: str | None, type_: str, parent_names: object) -> bool:
+    # 월/DEFAULT 파티션은 스케줄러가 만드는 테이블이라 autogenerate 비교에서 뺀다
+    if type_ == "table" and name is not None:
+        return not send_log_partitions.is_partition_table(name)
+    return True
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(url=url, target_metadata=target_metadata, literal_binds=True)
@@ -53,6 +63,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             version_table="alembic_version",
             version_num_length=64,  # Extended to 64 to support long revision IDs
+            include_name=include_name,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,87 @@
+"""add background_jobs table
+
+Revision ID: a4d9e2f7c1b3
+Revises: f8c2a4d6b9e1
+Create Date: 2026-10-19 00:00:00.000000
+
+웹 프로세스 밖에서 긴 작업(전체 Push 발송 등)을 실행하는 PostgreSQL 작업 큐.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d9e2f7c1b3"
+down_revision: str | None = "f8c2a4d6b9e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(length=64), nullable=False),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column(
+            "status", sa.String(length=16), nullable=False, server_default="queued"
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="100"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column(
+            "run_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("locked_by", sa.String(length=128), nullable=True),
+        sa.Column("progress", postgresql.JSONB(), nullable=True),
+        sa.Column("result", postgresql.JSONB(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="ck_background_jobs_status",
+        ),
+    )
+    op.create_index(
+        "ix_background_jobs_ready",
+        "background_jobs",
+        ["priority", "run_at", "id"],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "ix_background_jobs_running_locked_at",
+        "background_jobs",
+        ["locked_at"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_background_jobs_running_locked_at", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_ready", table_name="background_jobs")
+    op.drop_table("background_jobs")
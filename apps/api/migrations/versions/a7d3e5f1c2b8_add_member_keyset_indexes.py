@@ -0,0 +1,55 @@
+"""add member directory keyset pagination indexes
+
+Revision ID: a7d3e5f1c2b8
+Revises: f6c2d8a4b1e9
+Create Date: 2026-10-19 00:00:00.000000
+
+동문 수첩 정렬 키마다 id 타이브레이커를 포함한 복합 인덱스를 둔다.
+커서 조건(정렬 키 > 마지막 값)이 인덱스 범위 스캔 한 번으로 끝나도록 하고,
+같은 키 앞부분을 가진 기존 단일/2컬럼 인덱스는 대체 후 제거한다.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3e5f1c2b8"
+down_revision: str | None = "f6c2d8a4b1e9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+NEW_INDEXES = (
+    ("ix_members_updated_at_name_id", "updated_at DESC, name, id"),
+    ("ix_members_cohort_name_id", "cohort, name, id"),
+    ("ix_members_cohort_desc_name_id", "cohort DESC, name, id"),
+    ("ix_members_name_id", "name, id"),
+)
+
+REPLACED_INDEXES = (
+    ("ix_members_updated_at", "updated_at"),
+    ("ix_members_cohort_name", "cohort, name"),
+)
+
+
+def upgrade() -> None:
+    # 새 인덱스를 먼저 만든 뒤 대체된 인덱스를 제거한다(무중단).
+    with op.get_context().autocommit_block():
+        for name, columns in NEW_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON members ({columns})"
+            )
+        for name, _columns in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in REPLACED_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON members ({columns})"
+            )
+        for name, _columns in NEW_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
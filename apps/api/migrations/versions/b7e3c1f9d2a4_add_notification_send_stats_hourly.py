@@ -0,0 +1,53 @@
+"""add notification_send_stats_hourly rollup
+
+Revision ID: b7e3c1f9d2a4
+Revises: a4d9e2f7c1b3
+Create Date: 2026-10-19 00:00:00.000000
+
+관리자 발송 통계용 시간별 집계 표. 기존 notification_send_logs 를 한 번 집계해 채운다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e3c1f9d2a4"
+down_revision: str | None = "a4d9e2f7c1b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_send_stats_hourly",
+        sa.Column("hour", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ok", sa.Integer(), nullable=False),
+        sa.Column("status_class", sa.String(length=8), nullable=False),
+        sa.Column("total", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("hour", "ok", "status_class"),
+    )
+    # repositories/send_logs.status_class 와 같은 구간 규칙
+    op.execute(
+        """
+        INSERT INTO notification_send_stats_hourly (hour, ok, status_class, total)
+        SELECT
+            date_trunc('hour', created_at, 'UTC'),
+            ok,
+            CASE
+                WHEN status_code IS NULL THEN 'none'
+                WHEN status_code IN (404, 410) THEN status_code::text
+                WHEN status_code BETWEEN 100 AND 599
+                    THEN (status_code / 100)::text || 'xx'
+                ELSE 'other'
+            END,
+            count(*)
+        FROM notification_send_logs
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_send_stats_hourly")
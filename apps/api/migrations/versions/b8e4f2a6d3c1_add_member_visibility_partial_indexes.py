@@ -0,0 +1,37 @@
+"""add member directory visibility partial indexes
+
+Revision ID: b8e4f2a6d3c1
+Revises: a7d3e5f1c2b8
+Create Date: 2026-10-19 00:00:00.000000
+
+동문 수첩 공개 범위 조건이 조회자 id·기수 파라미터로 바뀌어(스칼라 서브쿼리
+제거) OR 분기마다 인덱스를 쓸 수 있다. 분기별 부분 인덱스를 추가한다.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e4f2a6d3c1"
+down_revision: str | None = "a7d3e5f1c2b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_members_visibility_all "
+            "ON members (id) WHERE visibility = 'all'"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_members_visibility_cohort "
+            "ON members (cohort) WHERE visibility = 'cohort'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_members_visibility_cohort")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_members_visibility_all")
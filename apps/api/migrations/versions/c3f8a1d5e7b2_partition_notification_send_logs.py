@@ -0,0 +1,123 @@
+"""partition notification_send_logs by month
+
+Revision ID: c3f8a1d5e7b2
+Revises: b7e3c1f9d2a4
+Create Date: 2026-10-19 00:00:00.000000
+
+notification_send_logs 를 created_at 월 단위 RANGE 파티션 테이블로 바꾼다.
+기존 행이 있는 달부터 두 달 뒤까지 월 파티션(notification_send_logs_pYYYYMM)과
+DEFAULT 파티션을 만들고 행을 옮긴다. id 시퀀스는 그대로 이어 쓴다.
+이후 달은 스케줄러 잡(send_log_partitions.ensure_partitions)이 미리 만든다.
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8a1d5e7b2"
+down_revision: str | None = "b7e3c1f9d2a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "notification_send_logs"
+MONTHS_AHEAD = 2
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def _next_month(month: datetime) -> datetime:
+    return month.replace(
+        year=month.year + month.month // 12, month=month.month % 12 + 1
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index(f"ix_{TABLE}_created_at", TABLE, ["created_at"])
+    op.create_index(f"ix_{TABLE}_endpoint_hash", TABLE, ["endpoint_hash"])
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # 시퀀스를 새 테이블로 넘기기 위해 기존 컬럼 소유를 푼다(DROP 시 함께 지워지지 않게)
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY NONE")
+    op.execute(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_unpartitioned")
+    op.execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            id INTEGER NOT NULL DEFAULT nextval('{TABLE}_id_seq'),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            ok INTEGER NOT NULL,
+            status_code INTEGER,
+            endpoint_hash VARCHAR(64) NOT NULL,
+            endpoint_tail VARCHAR(32)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+
+    oldest = bind.execute(
+        sa.text(f"SELECT min(created_at) FROM {TABLE}_unpartitioned")
+    ).scalar()
+    now = datetime.now(UTC)
+    month = _month_start(oldest if oldest is not None and oldest < now else now)
+    last = _month_start(now)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        upper = _next_month(month)
+        op.execute(
+            f"CREATE TABLE {TABLE}_p{month:%Y%m} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    op.execute(
+        f"INSERT INTO {TABLE} "
+        "(id, created_at, ok, status_code, endpoint_hash, endpoint_tail) "
+        "SELECT id, created_at, ok, status_code, endpoint_hash, endpoint_tail "
+        f"FROM {TABLE}_unpartitioned"
+    )
+    op.execute(f"DROP TABLE {TABLE}_unpartitioned")
+    op.create_primary_key(f"{TABLE}_pkey", TABLE, ["id", "created_at"])
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY NONE")
+    op.execute(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_partitioned")
+    op.execute(f"ALTER INDEX {TABLE}_pkey RENAME TO {TABLE}_partitioned_pkey")
+    op.execute(f"ALTER INDEX ix_{TABLE}_created_at RENAME TO ix_{TABLE}_p_created_at")
+    op.execute(
+        f"ALTER INDEX ix_{TABLE}_endpoint_hash RENAME TO ix_{TABLE}_p_endpoint_hash"
+    )
+    op.execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            id INTEGER NOT NULL DEFAULT nextval('{TABLE}_id_seq'),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            ok INTEGER NOT NULL,
+            status_code INTEGER,
+            endpoint_hash VARCHAR(64) NOT NULL,
+            endpoint_tail VARCHAR(32),
+            CONSTRAINT {TABLE}_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+    op.execute(
+        f"INSERT INTO {TABLE} "
+        "(id, created_at, ok, status_code, endpoint_hash, endpoint_tail) "
+        "SELECT id, created_at, ok, status_code, endpoint_hash, endpoint_tail "
+        f"FROM {TABLE}_partitioned"
+    )
+    # 파티션 부모를 지우면 하위 파티션도 함께 지워진다
+    op.execute(f"DROP TABLE {TABLE}_partitioned")
+    _create_indexes()
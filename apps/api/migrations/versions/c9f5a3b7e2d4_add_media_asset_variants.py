@@ -0,0 +1,55 @@
+"""add media assets and post image variant manifest
+
+Revision ID: c9f5a3b7e2d4
+Revises: b8e4f2a6d3c1
+Create Date: 2026-10-19 00:00:00.000000
+
+업로드 이미지마다 폭별 WebP/AVIF 변형 목록을 media_assets 에 기록하고,
+게시글 저장 시 참조 이미지의 매니페스트를 posts.image_variants 에 복사해
+목록·히어로 응답에서 추가 조회 없이 srcset 을 만들 수 있게 한다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c9f5a3b7e2d4"
+down_revision: str | None = "b8e4f2a6d3c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_assets",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("path", sa.String(length=512), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=False),
+        sa.Column("height", sa.Integer(), nullable=False),
+        sa.Column(
+            "variants",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("path", name="media_assets_path_key"),
+    )
+    op.add_column(
+        "posts",
+        sa.Column("image_variants", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("posts", "image_variants")
+    op.drop_table("media_assets")
@@ -0,0 +1,63 @@
+"""add content-addressed columns to media assets
+
+Revision ID: d1a6c4e8f3b5
+Revises: c9f5a3b7e2d4
+Create Date: 2026-10-19 00:00:00.000000
+
+업로드 이미지·아바타를 출력 바이트 해시로 저장하고, 입력 해시로 재처리를
+건너뛰며, 참조가 끊긴 자산을 유예 뒤 정리할 수 있도록 컬럼을 추가한다.
+기존 행은 kind='image', 해시 NULL 로 남고 GC 대상 판정만 같이 받는다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1a6c4e8f3b5"
+down_revision: str | None = "c9f5a3b7e2d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "media_assets",
+        sa.Column(
+            "kind",
+            sa.String(length=16),
+            server_default=sa.text("'image'"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "media_assets",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "media_assets",
+        sa.Column("source_hash", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "media_assets",
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_media_assets_kind_source_hash",
+        "media_assets",
+        ["kind", "source_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_media_assets_kind_source_hash", table_name="media_assets")
+    op.drop_column("media_assets", "last_used_at")
+    op.drop_column("media_assets", "source_hash")
+    op.drop_column("media_assets", "content_hash")
+    op.drop_column("media_assets", "kind")
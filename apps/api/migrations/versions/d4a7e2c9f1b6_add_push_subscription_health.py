@@ -0,0 +1,47 @@
+"""add push subscription health columns
+
+Revision ID: d4a7e2c9f1b6
+Revises: c3f8a1d5e7b2
+Create Date: 2026-10-19 00:00:00.000000
+
+연속 실패 수·마지막 성공/실패 시각·격리 만료 시각. 기존 구독은 건강한 상태(0)로 시작한다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a7e2c9f1b6"
+down_revision: str | None = "c3f8a1d5e7b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "push_subscriptions",
+        sa.Column(
+            "failure_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "push_subscriptions",
+        sa.Column("last_success_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "push_subscriptions",
+        sa.Column("last_failure_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "push_subscriptions",
+        sa.Column("quarantined_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("push_subscriptions", "quarantined_until")
+    op.drop_column("push_subscriptions", "last_failure_at")
+    op.drop_column("push_subscriptions", "last_success_at")
+    op.drop_column("push_subscriptions", "failure_count")
@@ -0,0 +1,59 @@
+"""add maintained RSVP counters to events
+
+Revision ID: e3b7d9f1a2c6
+Revises: d1a6c4e8f3b5
+Create Date: 2026-10-19 00:00:00.000000
+
+정원 판정마다 rsvps 를 COUNT 하던 방식을 events 행의 going_count/waitlist_count
+조건부 UPDATE 로 바꾼다. 기존 행사는 현재 RSVP 로 한 번 채운다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b7d9f1a2c6"
+down_revision: str | None = "d1a6c4e8f3b5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column("going_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "events",
+        sa.Column("waitlist_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        sa.text(
+            """
+            UPDATE events AS e
+            SET going_count = c.going, waitlist_count = c.waitlist
+            FROM (
+                SELECT
+                    event_id,
+                    COUNT(*) FILTER (WHERE status = 'going') AS going,
+                    COUNT(*) FILTER (WHERE status = 'waitlist') AS waitlist
+                FROM rsvps
+                GROUP BY event_id
+            ) AS c
+            WHERE e.id = c.event_id
+            """
+        )
+    )
+    op.create_check_constraint(
+        "ck_events_rsvp_counts",
+        "events",
+        "going_count >= 0 AND waitlist_count >= 0",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_events_rsvp_counts", "events", type_="check")
+    op.drop_column("events", "waitlist_count")
+    op.drop_column("events", "going_count")
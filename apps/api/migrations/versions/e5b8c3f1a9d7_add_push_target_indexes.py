@@ -0,0 +1,42 @@
+"""add push target indexes
+
+Revision ID: e5b8c3f1a9d7
+Revises: d4a7e2c9f1b6
+Create Date: 2026-10-19 00:00:00.000000
+
+주제·기수·회원 지정 발송 대상을 한 쿼리로 고를 때 쓰는 인덱스.
+opt-out anti-join 은 (channel, topic, enabled, member_id) 로, 회원에서 구독으로의
+조인은 활성 구독 member_id 부분 인덱스로 찾는다.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b8c3f1a9d7"
+down_revision: str | None = "d4a7e2c9f1b6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_notification_preferences_channel_topic_enabled_member "
+            "ON notification_preferences (channel, topic, enabled, member_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_push_subs_member_active "
+            "ON push_subscriptions (member_id) WHERE revoked_at IS NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_push_subs_member_active")
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "ix_notification_preferences_channel_topic_enabled_member"
+        )
@@ -0,0 +1,58 @@
+"""add member directory search document
+
+Revision ID: f6c2d8a4b1e9
+Revises: d5f2a1c9e7b3
+Create Date: 2026-10-19 00:00:00.000000
+
+동문 수첩 q 검색을 필드별 ILIKE OR 대신 생성 컬럼 하나(search_document)와
+단일 trigram GIN 인덱스로 처리한다. major/industry처럼 개별 인덱스가 없는
+필드도 같은 인덱스로 후보를 좁히고 similarity 랭킹에 사용한다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6c2d8a4b1e9"
+down_revision: str | None = "d5f2a1c9e7b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# models.MEMBER_SEARCH_DOCUMENT_SQL과 같은 식을 migration 시점 값으로 고정한다.
+SEARCH_DOCUMENT_SQL = (
+    "coalesce(name, '') || ' ' || coalesce(student_id, '') || ' ' || "
+    "coalesce(email, '') || ' ' || coalesce(major, '') || ' ' || "
+    "coalesce(company, '') || ' ' || coalesce(department, '') || ' ' || "
+    "coalesce(job_title, '') || ' ' || coalesce(industry, '') || ' ' || "
+    "coalesce(addr_personal, '') || ' ' || coalesce(addr_company, '')"
+)
+
+
+def upgrade() -> None:
+    # STORED 생성 컬럼 추가는 members 테이블을 다시 쓴다(ACCESS EXCLUSIVE).
+    # 동문 규모(수만 행 이하)에서는 짧은 lock으로 끝나므로 배포 창에서 수행한다.
+    op.add_column(
+        "members",
+        sa.Column(
+            "search_document",
+            sa.Text(),
+            sa.Computed(SEARCH_DOCUMENT_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "idx_members_search_document_trgm "
+            "ON members USING gin (search_document gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_members_search_document_trgm"
+        )
+    op.drop_column("members", "search_document")
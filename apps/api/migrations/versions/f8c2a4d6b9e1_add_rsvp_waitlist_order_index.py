@@ -0,0 +1,41 @@
+"""add rsvps (event_id, status, created_at) index for waitlist promotion
+
+Revision ID: f8c2a4d6b9e1
+Revises: e3b7d9f1a2c6
+Create Date: 2026-10-19 00:00:00.000000
+
+대기열 일괄 승급이 행사·상태 범위를 created_at 순으로 인덱스에서 바로 읽도록
+created_at 을 붙인 복합 인덱스를 만들고, 같은 앞부분을 가진 기존 인덱스는 제거한다.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8c2a4d6b9e1"
+down_revision: str | None = "e3b7d9f1a2c6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 새 인덱스를 먼저 만든 뒤 대체된 인덱스를 제거한다(무중단).
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_rsvps_event_status_created_at "
+            "ON rsvps (event_id, status, created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_rsvps_event_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_rsvps_event_status "
+            "ON rsvps (event_id, status)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_rsvps_event_status_created_at"
+        )
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     Enum,
     ForeignKey,
@@ -14,14 +15,46 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
-    UniqueConstraint,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
-Base = declarative_base()
+from .media_utils import MediaVariant
+from .models_base import Base
+from .models_media import MediaAsset
+from .models_notifications import (
+    NotificationPreference,
+    NotificationSendLog,
+    NotificationSendStatHourly,
+    PushSubscription,
+    ScheduledNotificationDelivery,
+    ScheduledNotificationLog,
+)
+
+__all__ = [
+    "RSVP",
+    "Base",
+    "Comment",
+    "Event",
+    "HeroItem",
+    "MediaAsset",
+    "Member",
+    "MemberAuth",
+    "NotificationPreference",
+    "NotificationSendLog",
+    "NotificationSendStatHourly",
+    "Post",
+    "ProfileChangeRequest",
+    "PushSubscription",
+    "RSVPStatus",
+    "ScheduledNotificationDelivery",
+    "ScheduledNotificationLog",
+    "SignupActivationIssueLog",
+    "SignupRequest",
+    "Visibility",
+]
 
 
 class Visibility(enum.Enum):
@@ -45,6 +78,26 @@ def _enum_values(enum_cls: type[enum.Enum]) -> list[str]:
     return [cast(str, member.value) for member in enum_cls]
 
 
+# 동문 수첩 통합 검색 문서. 표시 필드를 한 컬럼으로 이어 붙여 단일 trigram
+# GIN 인덱스와 similarity 랭킹이 모든 필드를 다루게 한다. 생성 컬럼은
+# IMMUTABLE 식만 허용하므로 concat_ws(STABLE) 대신 `||`를 사용한다.
+MEMBER_SEARCH_DOCUMENT_SQL = " || ' ' || ".join(
+    f"coalesce({column}, '')"
+    for column in (
+        "name",
+        "student_id",
+        "email",
+        "major",
+        "company",
+        "department",
+        "job_title",
+        "industry",
+        "addr_personal",
+        "addr_company",
+    )
+)
+
+
 class Member(Base):
     __tablename__ = "members"
     __table_args__ = (
@@ -91,6 +144,10 @@ class Member(Base):
     addr_company = Column(String(255), nullable=True)
     industry = Column(String(255), nullable=True)
     avatar_path = Column(String(255), nullable=True)
+    # 검색 전용 생성 컬럼: 응답 직렬화에 쓰지 않으므로 기본 로딩에서 제외
+    search_document = deferred(
+        Column(Text, Computed(MEMBER_SEARCH_DOCUMENT_SQL, persisted=True))
+    )
     created_at = Column(
         DateTime(timezone=True),
         nullable=False,
@@ -108,8 +165,33 @@ class Member(Base):
     rsvps = relationship("RSVP", back_populates="member", cascade="all, delete-orphan")
 
 
-Index("ix_members_updated_at", Member.updated_at)
-Index("ix_members_cohort_name", Member.cohort, Member.name)
+# 동문 수첩 정렬 키(repositories.members._order_keys)별 키셋 페이지 인덱스
+Index(
+    "ix_members_updated_at_name_id",
+    Member.updated_at.desc(),
+    Member.name,
+    Member.id,
+)
+Index("ix_members_cohort_name_id", Member.cohort, Member.name, Member.id)
+Index(
+    "ix_members_cohort_desc_name_id",
+    Member.cohort.desc(),
+    Member.name,
+    Member.id,
+)
+Index("ix_members_name_id", Member.name, Member.id)
+# 동문 수첩 공개 범위 조건(id = 조회자 OR all OR cohort = 조회자 기수)의
+# OR 분기별 bitmap 인덱스
+Index(
+    "ix_members_visibility_all",
+    Member.id,
+    postgresql_where=text("visibility = 'all'"),
+)
+Index(
+    "ix_members_visibility_cohort",
+    Member.cohort,
+    postgresql_where=text("visibility = 'cohort'"),
+)
 # PostgreSQL 전용 검색 인덱스도 migration과 metadata가 같은 catalog 계약을
 # 표현한다. 실제 생성·삭제는 운영 lock 규칙을 지키는 migration이 담당한다.
 for _index_name, _column, _column_name in (
@@ -120,6 +202,11 @@ for _index_name, _column, _column_name in (
     ("idx_members_job_title_trgm", Member.job_title, "job_title"),
     ("idx_members_student_id_trgm", Member.student_id, "student_id"),
     ("idx_members_company_trgm", Member.company, "company"),
+    (
+        "idx_members_search_document_trgm",
+        Member.search_document,
+        "search_document",
+    ),
 ):
     Index(
         _index_name,
@@ -153,6 +240,9 @@ class Post(Base):
     )
     cover_image = Column(String(512), nullable=True)
     images = Column(JSONB, nullable=True, default=list)  # 추가 이미지 URL 배열
+    # 반응형 변형 매니페스트 {원본 상대경로: [MediaVariant, ...]}
+    # 저장 시 media_assets 에서 채워 목록 조회에 추가 쿼리가 없도록 한다.
+    image_variants = Column(JSONB, nullable=True)
     view_count = Column(
         Integer, nullable=False, default=0, server_default="0", index=False
     )
@@ -162,6 +252,15 @@ class Post(Base):
         "Comment", back_populates="post", cascade="all, delete-orphan"
     )
 
+    @property
+    def cover_image_variants(self) -> list[MediaVariant]:
+        """대표 이미지의 변형 목록(없으면 빈 목록)."""
+        manifest = cast(dict[str, list[MediaVariant]] | None, self.image_variants)
+        cover = cast(str | None, self.cover_image)
+        if not manifest or not cover:
+            return []
+        return manifest.get(cover, [])
+
 
 Index("ix_posts_published_at_desc", Post.published_at.desc())
 # 복합 인덱스: list_posts 쿼리 최적화 (pinned DESC, published_at DESC)
@@ -201,6 +300,12 @@ class Comment(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        CheckConstraint(
+            "going_count >= 0 AND waitlist_count >= 0",
+            name="ck_events_rsvp_counts",
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
@@ -209,6 +314,9 @@ class Event(Base):
     ends_at = Column(DateTime(timezone=True), nullable=False)
     location = Column(String(255), nullable=False)
     capacity = Column(Integer, nullable=False)
+    # RSVP 상태 전이와 같은 트랜잭션에서 갱신하는 집계 (정원 판정은 이 행만 본다)
+    going_count = Column(Integer, nullable=False, default=0, server_default="0")
+    waitlist_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     rsvps = relationship("RSVP", back_populates="event", cascade="all, delete-orphan")
 
@@ -266,7 +374,10 @@ Index(
 
 class RSVP(Base):
     __tablename__ = "rsvps"
-    __table_args__ = (Index("ix_rsvps_event_status", "event_id", "status"),)
+    # 대기열 승급이 (event_id, status) 범위를 created_at 순으로 바로 읽도록 한다.
+    __table_args__ = (
+        Index("ix_rsvps_event_status_created_at", "event_id", "status", "created_at"),
+    )
 
     member_id = Column(
         Integer,
@@ -369,7 +480,6 @@ class SignupActivationIssueLog(Base):
     )
 
 
-# Web Push 구독 정보(민감 데이터: endpoint/key는 운영에서 암호화 저장 고려)
 class ProfileChangeRequest(Base):
     """회원 프로필 변경 요청 (이름/기수 — 관리자 승인 필요)."""
 
@@ -436,145 +546,6 @@ class ProfileChangeRequest(Base):
         return m.student_id if m is not None else None
 
 
-class PushSubscription(Base):
-    __tablename__ = "push_subscriptions"
-    __table_args__ = (
-        Index(
-            "ix_push_subs_active",
-            "id",
-            postgresql_where=text("revoked_at IS NULL"),
-        ),
-    )
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    member_id = Column(
-        Integer,
-        ForeignKey("members.id", ondelete="SET NULL"),
-        nullable=True,
-    )
-    endpoint = Column(String(512), unique=True, index=True, nullable=False)
-    endpoint_hash = Column(String(64), unique=True, index=True, nullable=False)
-    p256dh = Column(String(255), nullable=False)
-    auth = Column(String(255), nullable=False)
-    ua = Column(String(255), nullable=True)
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
-    last_seen_at = Column(DateTime(timezone=True), nullable=True)
-    revoked_at = Column(DateTime(timezone=True), nullable=True)
-
-
-class NotificationPreference(Base):
-    __tablename__ = "notification_preferences"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    member_id = Column(
-        Integer,
-        ForeignKey("members.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
-    channel = Column(String(32), nullable=False, index=True)  # e.g., 'webpush'
-    topic = Column(String(64), nullable=False)
-    enabled = Column(Boolean, nullable=False, default=True)
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
-
-
-class NotificationSendLog(Base):
-    __tablename__ = "notification_send_logs"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
-    )
-    ok = Column(Integer, nullable=False, default=0)  # 1=accepted, 0=failed
-    status_code = Column(Integer, nullable=True)
-    endpoint_hash = Column(String(64), nullable=False, index=True)
-    endpoint_tail = Column(String(32), nullable=True)
-
-
-class ScheduledNotificationLog(Base):
-    """예약 알림 발송 로그 (중복 발송 방지 및 추적용)."""
-
-    __tablename__ = "scheduled_notification_logs"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    event_id = Column(
-        Integer,
-        ForeignKey("events.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
-    d_type = Column(String(8), nullable=False)  # 'd-3' | 'd-1'
-    scheduled_at = Column(DateTime(timezone=True), nullable=False)
-    sent_at = Column(DateTime(timezone=True), nullable=True)
-    accepted_count = Column(Integer, nullable=False, default=0)
-    failed_count = Column(Integer, nullable=False, default=0)
-    status = Column(
-        String(16), nullable=False, default="pending"
-    )  # pending | in_progress | completed | failed
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
-    updated_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
-
-    __table_args__ = (
-        Index(
-            "ix_scheduled_notification_event_dtype",
-            "event_id",
-            "d_type",
-            unique=True,
-        ),
-    )
-
-
-class ScheduledNotificationDelivery(Base):
-    """예약 발송의 구독별 영속 상태.
-
-    ``in_progress``는 외부 Push 호출 직전에 커밋되는 claim이다. 프로세스가
-    외부 호출 뒤 중단되면 결과를 알 수 없으므로 자동 재전송하지 않고
-    ``unknown``으로 보존해 중복 발송을 막는다.
-    """
-
-    __tablename__ = "scheduled_notification_deliveries"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    scheduled_log_id = Column(
-        Integer,
-        ForeignKey("scheduled_notification_logs.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
-    endpoint_hash = Column(String(64), nullable=False)
-    status = Column(
-        String(16), nullable=False, default="pending", server_default="pending"
-    )  # pending | in_progress | completed | failed | unknown | abandoned
-    status_code = Column(Integer, nullable=True)
-    attempts = Column(Integer, nullable=False, default=0, server_default="0")
-    claimed_at = Column(DateTime(timezone=True), nullable=True)
-    finished_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
-
-    __table_args__ = (
-        UniqueConstraint(
-            "scheduled_log_id",
-            "endpoint_hash",
-            name="uq_scheduled_notification_delivery_log_endpoint",
-        ),
-        Index(
-            "ix_scheduled_notification_delivery_log_status",
-            "scheduled_log_id",
-            "status",
-        ),
-    )
-
-
 class MemberAuth(Base):
     __tablename__ = "member_auth"
 
@@ -0,0 +1,7 @@
+"""SQLAlchemy declarative Base (모든 테이블이 같은 metadata를 공유한다)."""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
@@ -0,0 +1,68 @@
+"""PostgreSQL 기반 백그라운드 작업 큐 테이블.
+
+웹 요청은 행 하나를 넣고 바로 응답하며, 별도 워커 프로세스
+(`python -m apps.api.worker`)가 `FOR UPDATE SKIP LOCKED` 로 꺼내 실행한다.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from .models import Base
+
+
+class BackgroundJob(Base):
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="ck_background_jobs_status",
+        ),
+        # 워커가 꺼낼 후보(queued)만 우선순위·실행 시각 순으로 읽는다.
+        Index(
+            "ix_background_jobs_ready",
+            "priority",
+            "run_at",
+            "id",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        # stale 회수는 running 행만 본다.
+        Index(
+            "ix_background_jobs_running_locked_at",
+            "locked_at",
+            postgresql_where=text("status = 'running'"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(64), nullable=False)
+    payload = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    status = Column(String(16), nullable=False, server_default="queued")
+    # 값이 작을수록 먼저 실행한다.
+    priority = Column(Integer, nullable=False, server_default="100")
+    attempts = Column(Integer, nullable=False, server_default="0")
+    max_attempts = Column(Integer, nullable=False, server_default="3")
+    run_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String(128), nullable=True)
+    progress = Column(JSONB, nullable=True)
+    result = Column(JSONB, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    finished_at = Column(DateTime(timezone=True), nullable=True)
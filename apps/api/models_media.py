@@ -0,0 +1,48 @@
+"""업로드 미디어 원본과 반응형 변형(variant) 매니페스트.
+
+파일명은 정규화된 출력 바이트의 SHA-256 이라 같은 결과물은 한 파일만 남는다.
+source_hash 로 같은 입력의 재처리를 건너뛰고, 참조가 끊긴 행·파일은
+media_service.collect_media_garbage 가 last_used_at 유예 뒤에 정리한다.
+
+models.py가 같은 이름으로 다시 내보내므로 호출부는 `models.MediaAsset`
+처럼 기존 경로를 그대로 사용한다.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from .models_base import Base
+
+
+class MediaAsset(Base):
+    __tablename__ = "media_assets"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # "image"(게시글 본문·커버) | "avatar"
+    kind = Column(String(16), nullable=False, server_default=text("'image'"))
+    # MEDIA_ROOT 기준 상대경로 (예: images/<content_hash>.jpg)
+    path = Column(String(512), nullable=False, unique=True)
+    # 저장한 출력 바이트의 SHA-256 (콘텐츠 주소 이전 행은 NULL)
+    content_hash = Column(String(64), nullable=True)
+    # 입력 바이트+처리 설정의 SHA-256. 같은 값이면 디코딩·인코딩을 건너뛴다.
+    source_hash = Column(String(64), nullable=True)
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    # [{"path": "images/..._w640.webp", "width": 640, "format": "webp"}, ...]
+    variants = Column(
+        JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb")
+    )
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    # 업로드·재사용 시각. GC 는 이 시각부터 유예 기간이 지난 행만 지운다.
+    last_used_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_media_assets_kind_source_hash", "kind", "source_hash"),
+    )
@@ -0,0 +1,228 @@
+"""Web Push 구독·알림 발송 관련 테이블.
+
+models.py가 같은 이름으로 다시 내보내므로 호출부는 `models.PushSubscription`
+처럼 기존 경로를 그대로 사용한다.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
+from sqlalchemy.sql import func
+
+from .models_base import Base
+
+
+# Web Push 구독 정보(민감 데이터: endpoint/key는 운영에서 암호화 저장 고려)
+class PushSubscription(Base):
+    __tablename__ = "push_subscriptions"
+    __table_args__ = (
+        Index(
+            "ix_push_subs_active",
+            "id",
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
+        # 기수·회원 지정 발송: members 에서 찾은 회원의 활성 구독만 따라간다
+        Index(
+            "ix_push_subs_member_active",
+            "member_id",
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    member_id = Column(
+        Integer,
+        ForeignKey("members.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    endpoint = Column(String(512), unique=True, index=True, nullable=False)
+    endpoint_hash = Column(String(64), unique=True, index=True, nullable=False)
+    p256dh = Column(String(255), nullable=False)
+    auth = Column(String(255), nullable=False)
+    ua = Column(String(255), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_seen_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    # 발송 결과 기반 건강도(services/subscription_health). 성공하면 0 으로 되돌린다.
+    failure_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_success_at = Column(DateTime(timezone=True), nullable=True)
+    last_failure_at = Column(DateTime(timezone=True), nullable=True)
+    # 연속 실패가 쌓이면 이 시각까지 발송 대상에서 뺀다
+    quarantined_until = Column(DateTime(timezone=True), nullable=True)
+
+
+class NotificationPreference(Base):
+    __tablename__ = "notification_preferences"
+    __table_args__ = (
+        # 발송 대상 조회의 opt-out anti-join 을 인덱스만으로 판정한다
+        Index(
+            "ix_notification_preferences_channel_topic_enabled_member",
+            "channel",
+            "topic",
+            "enabled",
+            "member_id",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    member_id = Column(
+        Integer,
+        ForeignKey("members.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    channel = Column(String(32), nullable=False, index=True)  # e.g., 'webpush'
+    topic = Column(String(64), nullable=False)
+    enabled = Column(Boolean, nullable=False, default=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class NotificationSendLog(Base):
+    """Push 발송 시도 로그.
+
+    created_at 기준 월 단위 RANGE 파티션(notification_send_logs_pYYYYMM)이다.
+    보존 기간 정리는 DELETE 대신 오래된 달 파티션을 통째로 떼어 지운다
+    (repositories/send_logs). 범위를 벗어난 행은 DEFAULT 파티션이 받는다.
+    """
+
+    __tablename__ = "notification_send_logs"
+    __table_args__ = ({"postgresql_partition_by": "RANGE (created_at)"},)
+
+    # 파티션 테이블의 PK 는 파티션 키를 포함해야 한다
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        server_default=func.now(),
+        index=True,
+    )
+    ok = Column(Integer, nullable=False, default=0)  # 1=accepted, 0=failed
+    status_code = Column(Integer, nullable=True)
+    endpoint_hash = Column(String(64), nullable=False, index=True)
+    endpoint_tail = Column(String(32), nullable=True)
+
+
+# create_all(테스트 픽스처)로 만든 스키마도 바로 쓸 수 있게 DEFAULT 파티션을 붙인다.
+# 운영 스키마는 마이그레이션이 월 파티션과 함께 만든다.
+event.listen(
+    NotificationSendLog.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS notification_send_logs_default "
+        "PARTITION OF notification_send_logs DEFAULT"
+    ),
+)
+
+
+class NotificationSendStatHourly(Base):
+    """발송 로그의 시간(UTC 정시)·성공 여부·상태 구간별 건수.
+
+    send_logs 저장소가 로그를 쓰는 트랜잭션에서 함께 증가시킨다. 관리자 통계는
+    원본 로그 대신 이 표를 읽어 발송량과 무관한 비용으로 집계한다.
+    """
+
+    __tablename__ = "notification_send_stats_hourly"
+
+    hour = Column(DateTime(timezone=True), primary_key=True)
+    ok = Column(Integer, primary_key=True)  # 1=accepted, 0=failed
+    # 2xx/4xx/5xx/... 구간. 만료 판정용 404·410 은 따로 센다. none=상태 코드 없음
+    status_class = Column(String(8), primary_key=True)
+    total = Column(BigInteger, nullable=False, default=0)
+
+
+class ScheduledNotificationLog(Base):
+    """예약 알림 발송 로그 (중복 발송 방지 및 추적용)."""
+
+    __tablename__ = "scheduled_notification_logs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    d_type = Column(String(8), nullable=False)  # 'd-3' | 'd-1'
+    scheduled_at = Column(DateTime(timezone=True), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    accepted_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    status = Column(
+        String(16), nullable=False, default="pending"
+    )  # pending | in_progress | completed | failed
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_scheduled_notification_event_dtype",
+            "event_id",
+            "d_type",
+            unique=True,
+        ),
+    )
+
+
+class ScheduledNotificationDelivery(Base):
+    """예약 발송의 구독별 영속 상태.
+
+    ``in_progress``는 외부 Push 호출 직전에 커밋되는 claim이다. 프로세스가
+    외부 호출 뒤 중단되면 결과를 알 수 없으므로 자동 재전송하지 않고
+    ``unknown``으로 보존해 중복 발송을 막는다.
+    """
+
+    __tablename__ = "scheduled_notification_deliveries"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    scheduled_log_id = Column(
+        Integer,
+        ForeignKey("scheduled_notification_logs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    endpoint_hash = Column(String(64), nullable=False)
+    status = Column(
+        String(16), nullable=False, default="pending", server_default="pending"
+    )  # pending | in_progress | completed | failed | unknown | abandoned
+    status_code = Column(Integer, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "scheduled_log_id",
+            "endpoint_hash",
+            name="uq_scheduled_notification_delivery_log_endpoint",
+        ),
+        Index(
+            "ix_scheduled_notification_delivery_log_status",
+            "scheduled_log_id",
+            "status",
+        ),
+    )
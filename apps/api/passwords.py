@@ -1,11 +1,38 @@
-"""bcrypt 비밀번호 해시·검증 정책."""
+"""bcrypt 비밀번호 해시·검증 정책.
+
+bcrypt 한 번은 100~300ms CPU 를 쓰므로 요청 처리 중에는 반드시 *_async 함수를
+사용한다. 전용 스레드 풀(bcrypt 는 GIL 을 해제)에서 실행해 이벤트 루프를 막지
+않고, 대기 작업이 한도를 넘으면 큐에 쌓는 대신 429 로 즉시 거절한다.
+동기 함수는 시드 스크립트·테스트 등 이벤트 루프 밖에서만 쓴다.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 import bcrypt
 
+from .config import get_settings
+from .errors import ApiError
+from .logging_utils import log_json
+
+logger = logging.getLogger(__name__)
+
 BCRYPT_MAX_PASSWORD_BYTES = 72
 BCRYPT_LENGTH_ERROR_MESSAGE = "비밀번호는 UTF-8 기준 72바이트 이하여야 합니다."
+# 대기 포함 처리 시간이 이 값을 넘으면 경고 로그를 남긴다.
+_SLOW_HASH_SECONDS = 1.0
+
+# 모듈 상태 (global 문 대신 dict 사용)
+_pool: dict[str, ThreadPoolExecutor | None] = {"executor": None}
+_counters: dict[str, int] = {"pending": 0, "completed": 0, "rejected": 0}
+_latency: dict[str, float] = {"total_seconds": 0.0, "max_seconds": 0.0}
 
 
 def encode_password_for_hash(password: str) -> bytes:
@@ -35,3 +62,103 @@ def verify_password(password: str, password_hash: str) -> bool:
         return bcrypt.checkpw(encoded, password_hash.encode("utf-8"))
     except ValueError:
         return False
+
+
+def _executor() -> ThreadPoolExecutor:
+    executor = _pool["executor"]
+    if executor is None:
+        workers = get_settings().password_hash_workers or (os.cpu_count() or 1)
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        _pool["executor"] = executor
+    return executor
+
+
+def _record_latency(operation: str, elapsed: float) -> None:
+    _counters["completed"] += 1
+    _latency["total_seconds"] += elapsed
+    _latency["max_seconds"] = max(_latency["max_seconds"], elapsed)
+    if elapsed >= _SLOW_HASH_SECONDS:
+        log_json(
+            logger,
+            logging.WARNING,
+            "password_hash_slow",
+            operation=operation,
+            elapsed_ms=round(elapsed * 1000, 1),
+            pending=_counters["pending"],
+        )
+
+
+@asynccontextmanager
+async def _hash_slot(operation: str) -> AsyncGenerator[ThreadPoolExecutor, None]:
+    """해시 풀 슬롯을 확보한다. 대기 작업이 한도 이상이면 429 로 거절한다."""
+    limit = get_settings().password_hash_max_pending
+    if _counters["pending"] >= limit:
+        _counters["rejected"] += 1
+        log_json(
+            logger,
+            logging.WARNING,
+            "password_hash_rejected",
+            operation=operation,
+            pending=_counters["pending"],
+            limit=limit,
+        )
+        raise ApiError(
+            code="auth_busy",
+            detail="요청이 많습니다. 잠시 후 다시 시도해 주세요.",
+            status=429,
+        )
+
+    # 카운터는 이벤트 루프 스레드에서만 바뀌므로 잠금이 필요 없다.
+    _counters["pending"] += 1
+    started = time.perf_counter()
+    try:
+        yield _executor()
+    finally:
+        _counters["pending"] -= 1
+        _record_latency(operation, time.perf_counter() - started)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password 를 해시 풀에서 실행한다(길이 검증은 즉시 수행)."""
+    encode_password_for_hash(password)
+    async with _hash_slot("hash") as executor:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """verify_password 를 해시 풀에서 실행한다."""
+    async with _hash_slot("verify") as executor:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, verify_password, password, password_hash
+        )
+
+
+def password_hash_metrics() -> dict[str, float]:
+    """해시 풀 지표 스냅샷(대기·완료·거절 수, 평균/최대 지연)."""
+    completed = _counters["completed"]
+    average = _latency["total_seconds"] / completed if completed else 0.0
+    return {
+        "pending": _counters["pending"],
+        "completed": completed,
+        "rejected": _counters["rejected"],
+        "avg_ms": round(average * 1000, 1),
+        "max_ms": round(_latency["max_seconds"] * 1000, 1),
+    }
+
+
+def shutdown_password_hash_pool() -> None:
+    """앱 종료 시 해시 풀을 정리한다."""
+    executor = _pool["executor"]
+    _pool["executor"] = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def reset_password_hash_metrics() -> None:
+    """지표 초기화 (테스트용)."""
+    _counters.update(pending=0, completed=0, rejected=0)
+    _latency.update(total_seconds=0.0, max_seconds=0.0)
@@ -0,0 +1,106 @@
+"""공개 콘텐츠 가시성 버전 SSOT.
+
+공개 목록 조건(`published_at <= now`)은 데이터가 바뀌지 않아도 시간이 흐르면
+결과가 달라진다. 이 모듈은 다음 예약 공개 시각을 추적하고, 그 시각이 되거나
+공개 콘텐츠에 쓰기가 발생하면 가시성 버전을 올린다. 공개 목록·히어로·집계
+캐시는 이 버전을 키에 포함해 오래 유지하면서도 정확성을 잃지 않는다.
+
+주의: 버전은 워커 프로세스 메모리에 있다. 다른 워커에서 발생한 쓰기는
+스케줄러의 주기 재동기화와 각 캐시의 최대 보존 시간으로 수렴시킨다.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import cast
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+from .post_visibility import BOARD_POST_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+PublicationWaker = Callable[[datetime], None]
+
+# 모듈 상태 (global 문 대신 dict 사용)
+_state: dict[str, int | datetime | None] = {"version": 0, "next_at": None}
+_waker: dict[str, PublicationWaker | None] = {"callback": None}
+
+
+def current_version() -> int:
+    """현재 가시성 버전."""
+    return cast(int, _state["version"])
+
+
+def next_publication_at() -> datetime | None:
+    """알려진 다음 예약 공개 시각 (없으면 None)."""
+    return cast(datetime | None, _state["next_at"])
+
+
+def bump_visibility_version(reason: str) -> int:
+    """공개 결과가 바뀌었음을 알리고 새 버전을 반환한다."""
+    version = current_version() + 1
+    _state["version"] = version
+    logger.debug("공개 가시성 버전 증가: version=%s reason=%s", version, reason)
+    return version
+
+
+def set_publication_waker(callback: PublicationWaker | None) -> None:
+    """다음 공개 시각에 깨어날 job을 등록하는 콜백(스케줄러)을 설정한다."""
+    _waker["callback"] = callback
+
+
+def _wake_at(run_at: datetime) -> None:
+    callback = _waker["callback"]
+    if callback is not None:
+        callback(run_at)
+
+
+def observe_publication(
+    published_at: datetime | None, *, now: datetime | None = None
+) -> None:
+    """공개 콘텐츠 쓰기 직후 호출한다.
+
+    버전을 올리고, 새 예약 시각이 알려진 다음 공개 시각보다 이르면
+    깨우기 시각을 앞당긴다.
+    """
+    bump_visibility_version("content_write")
+    if published_at is None:
+        return
+    current = now if now is not None else datetime.now(UTC)
+    if published_at <= current:
+        return
+    known = next_publication_at()
+    if known is not None and known <= current:
+        known = None
+    if known is None or published_at < known:
+        _state["next_at"] = published_at
+        _wake_at(published_at)
+
+
+async def refresh_next_publication(
+    db: AsyncSession, *, now: datetime | None = None
+) -> datetime | None:
+    """DB에서 다음 예약 공개 시각을 다시 계산해 상태에 반영한다."""
+    current = now if now is not None else datetime.now(UTC)
+    stmt = select(func.min(models.Post.published_at)).where(
+        models.Post.published_at > current,
+        or_(
+            models.Post.category.is_(None),
+            models.Post.category.notin_(list(BOARD_POST_CATEGORIES)),
+        ),
+    )
+    next_at = (await db.execute(stmt)).scalar_one_or_none()
+    _state["next_at"] = next_at
+    return next_at
+
+
+def reset_publication_clock() -> None:
+    """상태 초기화 (테스트용)."""
+    _state["version"] = 0
+    _state["next_at"] = None
+    _waker["callback"] = None
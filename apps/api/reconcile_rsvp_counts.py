@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+행사 RSVP 집계(events.going_count/waitlist_count) 재계산 커맨드.
+
+정상 경로는 상태 전이와 같은 트랜잭션에서 집계를 옮기지만, 직접 SQL 수정이나
+회원 삭제 cascade 처럼 서비스 계층을 거치지 않은 변경은 집계를 어긋나게 한다.
+이 커맨드는 rsvps 를 다시 세어 값이 다른 행사만 고친다.
+
+    python -m apps.api.reconcile_rsvp_counts [--event-id N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from apps.api.db import get_db_session
+from apps.api.services import events_service
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="행사 RSVP 집계 재계산")
+    parser.add_argument("--event-id", type=int, default=None, help="대상 행사 id")
+    return parser.parse_args(argv)
+
+
+async def async_main(event_id: int | None) -> list[int]:
+    async with get_db_session() as session:
+        return await events_service.reconcile_rsvp_counts(session, event_id)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    try:
+        fixed = asyncio.run(async_main(args.event_id))
+    except (RuntimeError, OSError, SQLAlchemyError) as err:
+        print(f"❌ 집계 재계산 실패: {err}")
+        raise SystemExit(1) from err
+    if not fixed:
+        print("✅ 어긋난 RSVP 집계가 없습니다")
+        return
+    print(f"✅ RSVP 집계 {len(fixed)}건 수정: {', '.join(map(str, fixed))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""append-only 대량 적재 — psycopg `COPY ... FROM STDIN (FORMAT BINARY)`.
+
+ORM unit of work(행마다 객체·INSERT 파라미터)나 거대한 multi-VALUES 대신
+세션이 잡고 있는 같은 커넥션·트랜잭션에서 COPY 로 흘려 넣는다.
+
+- 행은 iterable 에서 하나씩 꺼내 쓰고, psycopg 가 버퍼가 찰 때마다(수십 KB)
+  서버로 보낸다. 전체 행을 메모리에 모으거나 SQL 문자열로 만들지 않는다.
+- 바이너리 포맷이라 컬럼 타입을 PostgreSQL 타입 이름으로 함께 넘긴다.
+- COPY 는 ON CONFLICT 를 지원하지 않는다. 충돌 처리가 필요하면
+  `stage_rows` 로 임시 테이블에 적재한 뒤 INSERT ... SELECT 로 옮긴다.
+- 커밋은 호출자가 한다. 드라이버 오류는 SQLAlchemy `DBAPIError` 로 감싸
+  기존 `SQLAlchemyError` 처리 경로를 그대로 탄다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import cast
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# (컬럼 이름, PostgreSQL 타입 이름)
+ColumnSpec = tuple[str, str]
+
+
+async def _driver_connection(db: AsyncSession) -> psycopg.AsyncConnection[object]:
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    return cast(psycopg.AsyncConnection[object], raw.driver_connection)
+
+
+async def copy_rows(
+    db: AsyncSession,
+    table: str,
+    columns: Sequence[ColumnSpec],
+    rows: Iterable[Sequence[object]],
+) -> int:
+    """rows 를 table 에 COPY 하고 적재한 행 수를 돌려준다."""
+    statement = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(name) for name, _ in columns),
+    )
+    driver = await _driver_connection(db)
+    count = 0
+    try:
+        async with driver.cursor() as cur, cur.copy(statement) as copy:
+            copy.set_types([pg_type for _, pg_type in columns])
+            for row in rows:
+                await copy.write_row(row)
+                count += 1
+    except psycopg.Error as exc:
+        raise DBAPIError(statement.as_string(driver), None, exc) from exc
+    return count
+
+
+async def stage_rows(
+    db: AsyncSession,
+    name: str,
+    columns: Sequence[ColumnSpec],
+    rows: Iterable[Sequence[object]],
+) -> int:
+    """트랜잭션 동안만 사는 임시 테이블 name 을 만들고 rows 를 COPY 한다."""
+    definition = ", ".join(f"{column} {pg_type}" for column, pg_type in columns)
+    await db.execute(
+        text(f"CREATE TEMPORARY TABLE {name} ({definition}) ON COMMIT DROP")
+    )
+    return await copy_rows(db, name, columns, rows)
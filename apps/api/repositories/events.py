@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-from sqlalchemy import asc, case, func, select
+from sqlalchemy import asc, case, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
-from .. import models, schemas
+from .. import models, publication_clock, schemas
 from ..errors import NotFoundError
 from . import escape_like
+from .page_total import fetch_page_with_total
 
 
 async def list_events(
@@ -118,17 +119,17 @@ async def list_admin_events_with_total(
     if conditions:
         stmt = stmt.where(*conditions)
 
-    result = await db.execute(stmt)
-    rows: list[tuple[models.Event, int, int, int]] = []
-    for evt, going, waitlist, cancel in result.all():
-        rows.append((evt, int(going), int(waitlist), int(cancel)))
-
     count_stmt = select(func.count(models.Event.id))
     if conditions:
         count_stmt = count_stmt.where(*conditions)
-    total = (await db.execute(count_stmt)).scalar_one()
-
-    return rows, int(total)
+    # 목록과 전체 건수를 COUNT(*) OVER () 로 한 번에 조회한다.
+    page, total = await fetch_page_with_total(
+        db, stmt, offset=offset, count_stmt=count_stmt
+    )
+    rows: list[tuple[models.Event, int, int, int]] = []
+    for evt, going, waitlist, cancel in page:
+        rows.append((evt, int(going), int(waitlist), int(cancel)))
+    return rows, total
 
 
 async def get_event(db: AsyncSession, event_id: int) -> models.Event:
@@ -156,6 +157,8 @@ async def update_event(
         setattr(event, key, value)
     await db.commit()
     await db.refresh(event)
+    # 히어로 행사 슬라이드가 제목/설명을 참조한다.
+    publication_clock.bump_visibility_version("event_write")
     return event
 
 
@@ -163,4 +166,106 @@ async def delete_event(db: AsyncSession, event_id: int) -> int:
     event = await get_event(db, event_id)
     await db.delete(event)
     await db.commit()
+    publication_clock.bump_visibility_version("event_write")
     return int(event_id)
+
+
+async def try_reserve_going_seat(db: AsyncSession, event_id: int) -> bool:
+    """정원이 남아 있으면 going_count 를 1 올린다(커밋은 호출자 트랜잭션).
+
+    조건부 UPDATE 한 문장이라 동시 요청이 몰려도 정원을 넘겨 예약되지 않고,
+    성공한 트랜잭션이 끝날 때까지 같은 행사의 다른 전이는 행 잠금에서 기다린다.
+    """
+    stmt = (
+        update(models.Event)
+        .where(
+            models.Event.id == event_id,
+            models.Event.going_count < models.Event.capacity,
+        )
+        .values(going_count=models.Event.going_count + 1)
+        .returning(models.Event.id)
+        .execution_options(synchronize_session="fetch")
+    )
+    return (await db.execute(stmt)).first() is not None
+
+
+async def lock_rsvp_counts(db: AsyncSession, event_id: int) -> tuple[int, int, int]:
+    """행사 행을 잠그고 (capacity, going_count, waitlist_count) 를 읽는다."""
+    stmt = (
+        select(
+            models.Event.capacity,
+            models.Event.going_count,
+            models.Event.waitlist_count,
+        )
+        .where(models.Event.id == event_id)
+        .with_for_update()
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        raise NotFoundError(code="event_not_found", detail="Event not found")
+    capacity, going, waitlist = row
+    return int(capacity), int(going), int(waitlist)
+
+
+async def adjust_rsvp_counts(
+    db: AsyncSession, event_id: int, *, going: int = 0, waitlist: int = 0
+) -> None:
+    """RSVP 상태 전이만큼 집계를 더하거나 뺀다(커밋은 호출자 트랜잭션)."""
+    if going == 0 and waitlist == 0:
+        return
+    stmt = (
+        update(models.Event)
+        .where(models.Event.id == event_id)
+        .values(
+            going_count=models.Event.going_count + going,
+            waitlist_count=models.Event.waitlist_count + waitlist,
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+    await db.execute(stmt)
+
+
+async def reconcile_rsvp_counts(
+    db: AsyncSession, event_id: int | None = None
+) -> list[int]:
+    """집계를 rsvps 실제 값으로 맞추고, 값이 달랐던 행사 id 를 돌려준다.
+
+    대상 행사 행을 먼저 잠가 진행 중인 전이가 끝난 뒤의 RSVP 로 다시 센다.
+    """
+    lock_stmt = select(models.Event.id).with_for_update()
+    if event_id is not None:
+        lock_stmt = lock_stmt.where(models.Event.id == event_id)
+    await db.execute(lock_stmt)
+
+    actual = (
+        select(
+            models.Event.id.label("event_id"),
+            func.count(models.RSVP.member_id)
+            .filter(models.RSVP.status == models.RSVPStatus.GOING)
+            .label("going"),
+            func.count(models.RSVP.member_id)
+            .filter(models.RSVP.status == models.RSVPStatus.WAITLIST)
+            .label("waitlist"),
+        )
+        .outerjoin(models.RSVP, models.RSVP.event_id == models.Event.id)
+        .group_by(models.Event.id)
+    )
+    if event_id is not None:
+        actual = actual.where(models.Event.id == event_id)
+    counts = actual.subquery()
+    stmt = (
+        update(models.Event)
+        .where(
+            models.Event.id == counts.c.event_id,
+            or_(
+                models.Event.going_count != counts.c.going,
+                models.Event.waitlist_count != counts.c.waitlist,
+            ),
+        )
+        .values(going_count=counts.c.going, waitlist_count=counts.c.waitlist)
+        .returning(models.Event.id)
+        .execution_options(synchronize_session=False)
+    )
+    fixed = (await db.execute(stmt)).scalars().all()
+    await db.commit()
+    return sorted(int(value) for value in fixed)
@@ -5,7 +5,7 @@ from collections.abc import Sequence
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models, schemas
+from .. import models, publication_clock, schemas
 from ..errors import NotFoundError
 
 
@@ -70,6 +70,7 @@ async def create_hero_item(
     db.add(item)
     await db.commit()
     await db.refresh(item)
+    publication_clock.bump_visibility_version("hero_item_write")
     return item
 
 
@@ -82,6 +83,7 @@ async def update_hero_item(
         setattr(item, field, value)
     await db.commit()
     await db.refresh(item)
+    publication_clock.bump_visibility_version("hero_item_write")
     return item
 
 
@@ -89,4 +91,5 @@ async def delete_hero_item(db: AsyncSession, hero_item_id: int) -> int:
     item = await get_hero_item(db, hero_item_id)
     await db.delete(item)
     await db.commit()
+    publication_clock.bump_visibility_version("hero_item_write")
     return hero_item_id
@@ -0,0 +1,167 @@
+"""background_jobs 큐 접근.
+
+상태 전이는 모두 한 문장 UPDATE 로 하고 즉시 커밋한다. 워커끼리는
+`FOR UPDATE SKIP LOCKED` 로 서로 다른 행을 꺼내므로 대기 없이 병렬로 돈다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import CursorResult, case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..errors import NotFoundError
+from ..models_jobs import BackgroundJob
+
+DEFAULT_PRIORITY = 100
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _empty_payload() -> dict[str, object]:
+    return {}
+
+
+@dataclass(frozen=True)
+class NewJob:
+    kind: str
+    payload: Mapping[str, object] = field(default_factory=_empty_payload)
+    priority: int = DEFAULT_PRIORITY
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    run_at: datetime | None = None
+
+
+async def enqueue_job(db: AsyncSession, job: NewJob) -> BackgroundJob:
+    row = BackgroundJob(
+        kind=job.kind,
+        payload=dict(job.payload),
+        priority=job.priority,
+        max_attempts=job.max_attempts,
+    )
+    if job.run_at is not None:
+        setattr(row, "run_at", job.run_at)
+    db.add(row)
+    await db.commit()
+    await db.refresh(row)
+    return row
+
+
+async def get_job(db: AsyncSession, job_id: int) -> BackgroundJob:
+    row = await db.get(BackgroundJob, job_id, populate_existing=True)
+    if row is None:
+        raise NotFoundError(code="job_not_found", detail="Job not found")
+    return row
+
+
+async def claim_next_job(db: AsyncSession, *, worker_id: str) -> BackgroundJob | None:
+    """실행 시각이 된 queued 작업 하나를 running 으로 바꿔 가져온다."""
+    candidate = (
+        select(BackgroundJob.id)
+        .where(BackgroundJob.status == "queued", BackgroundJob.run_at <= func.now())
+        .order_by(BackgroundJob.priority, BackgroundJob.run_at, BackgroundJob.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(BackgroundJob)
+        .where(BackgroundJob.id == candidate)
+        .values(
+            status="running",
+            attempts=BackgroundJob.attempts + 1,
+            locked_at=func.now(),
+            locked_by=worker_id,
+            updated_at=func.now(),
+        )
+        .returning(BackgroundJob)
+        .execution_options(populate_existing=True)
+    )
+    row = (await db.execute(stmt)).scalar_one_or_none()
+    await db.commit()
+    return row
+
+
+async def update_job_progress(
+    db: AsyncSession, job_id: int, progress: Mapping[str, object]
+) -> None:
+    """진행 상황을 기록하고 lock 시각을 갱신한다(heartbeat 겸용)."""
+    await db.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job_id, BackgroundJob.status == "running")
+        .values(progress=dict(progress), locked_at=func.now(), updated_at=func.now())
+    )
+    await db.commit()
+
+
+async def complete_job(
+    db: AsyncSession, job_id: int, result: Mapping[str, object]
+) -> None:
+    await db.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job_id)
+        .values(
+            status="succeeded",
+            result=dict(result),
+            last_error=None,
+            locked_at=None,
+            locked_by=None,
+            updated_at=func.now(),
+            finished_at=func.now(),
+        )
+    )
+    await db.commit()
+
+
+async def fail_job(
+    db: AsyncSession,
+    job_id: int,
+    *,
+    error: str,
+    retry_at: datetime | None,
+) -> None:
+    """retry_at 이 있으면 그 시각에 다시 queued, 없으면 failed 로 마감한다."""
+    values: dict[str, object] = {
+        "last_error": error[:2000],
+        "locked_at": None,
+        "locked_by": None,
+        "updated_at": func.now(),
+    }
+    if retry_at is None:
+        values.update(status="failed", finished_at=func.now())
+    else:
+        values.update(status="queued", run_at=retry_at)
+    await db.execute(
+        update(BackgroundJob).where(BackgroundJob.id == job_id).values(**values)
+    )
+    await db.commit()
+
+
+async def reclaim_stale_jobs(db: AsyncSession, *, locked_before: datetime) -> int:
+    """heartbeat 가 끊긴 running 작업을 되돌린다.
+
+    시도 횟수가 남았으면 queued, 다 썼으면 failed 로 마감한다.
+    """
+    exhausted = BackgroundJob.attempts >= BackgroundJob.max_attempts
+    stmt = (
+        update(BackgroundJob)
+        .where(
+            BackgroundJob.status == "running",
+            BackgroundJob.locked_at < locked_before,
+        )
+        .values(
+            status=case((exhausted, "failed"), else_="queued"),
+            finished_at=case((exhausted, func.now()), else_=None),
+            run_at=func.now(),
+            last_error="worker heartbeat lost",
+            locked_at=None,
+            locked_by=None,
+            updated_at=func.now(),
+        )
+    )
+    result = await db.execute(stmt)
+    cursor = cast(CursorResult[object], result)
+    await db.commit()
+    return int(cursor.rowcount or 0)
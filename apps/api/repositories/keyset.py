@@ -0,0 +1,130 @@
+"""키셋(커서) 페이지네이션 공용 헬퍼.
+
+OFFSET 은 깊은 페이지에서 앞선 행을 모두 읽고 버리며, 페이지 사이에 정렬 키가
+바뀌면(예: 프로필 수정으로 updated_at 갱신) 중복·누락이 생긴다. 키셋 방식은
+직전 페이지 마지막 행의 정렬 키 값 이후만 읽으므로 인덱스 범위 스캔 한 번으로
+끝난다. 정렬 키 마지막에는 반드시 유일 컬럼(id)을 둔다.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import DateTime, Float, Integer, String, and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..errors import ApiError
+
+# (정렬 식, 내림차순 여부)
+OrderKey = tuple[ColumnElement[Any], bool]
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """키셋 페이지 요청. cursor 가 없으면 첫 페이지."""
+
+    limit: int
+    cursor: str | None = None
+    include_total: bool = False
+
+
+def order_by_clauses(keys: Sequence[OrderKey]) -> list[ColumnElement[Any]]:
+    """정렬 키를 ORDER BY 절로 변환한다."""
+    return [expr.desc() if descending else expr.asc() for expr, descending in keys]
+
+
+def _after(expr: ColumnElement[Any], descending: bool, value: object) -> Any:
+    return expr < value if descending else expr > value
+
+
+def after_condition(
+    keys: Sequence[OrderKey], values: Sequence[object]
+) -> ColumnElement[bool]:
+    """정렬 순서상 values 보다 뒤에 오는 행 조건.
+
+    방향이 섞인 정렬도 처리하도록 (k1 > v1) OR (k1 = v1 AND k2 > v2) ... 로
+    전개하고, 첫 키의 닫힌 범위를 AND 로 덧붙여 인덱스 범위 스캔을 유도한다.
+    """
+    branches: list[ColumnElement[bool]] = []
+    for idx, (expr, descending) in enumerate(keys):
+        equals = [keys[i][0] == values[i] for i in range(idx)]
+        branches.append(and_(*equals, _after(expr, descending, values[idx])))
+    first_expr, first_desc = keys[0]
+    first_bound = (
+        first_expr <= values[0] if first_desc else first_expr >= values[0]
+    )
+    return and_(first_bound, or_(*branches))
+
+
+def _invalid_cursor() -> ApiError:
+    return ApiError(
+        code="invalid_cursor",
+        detail="페이지 커서가 올바르지 않습니다.",
+        status=400,
+    )
+
+
+def encode_cursor(tag: str, values: Sequence[object]) -> str:
+    """정렬 이름(tag)과 마지막 행 키 값을 URL-safe 문자열로 만든다."""
+    encoded: list[object] = [
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps({"k": tag, "v": encoded}, ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, tag: str, keys: Sequence[OrderKey]
+) -> list[object]:
+    """encode_cursor 결과를 검증하고 키 값 목록으로 되돌린다."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload: object = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise _invalid_cursor() from exc
+    if not isinstance(payload, dict):
+        raise _invalid_cursor()
+    data = cast(dict[str, object], payload)
+    raw_values = data.get("v")
+    if data.get("k") != tag or not isinstance(raw_values, list):
+        raise _invalid_cursor()
+    values = cast(list[object], raw_values)
+    if len(values) != len(keys):
+        raise _invalid_cursor()
+
+    return [
+        _decode_value(expr, value)
+        for (expr, _), value in zip(keys, values, strict=True)
+    ]
+
+
+def _decode_value(expr: ColumnElement[Any], value: object) -> object:
+    """정렬 식 타입에 맞는 값만 허용한다(잘못된 타입은 DB 오류 대신 400)."""
+    col_type = expr.type
+    if isinstance(col_type, DateTime):
+        if not isinstance(value, str):
+            raise _invalid_cursor()
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise _invalid_cursor() from exc
+    if isinstance(col_type, Integer):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise _invalid_cursor()
+        return value
+    if isinstance(col_type, Float):
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            raise _invalid_cursor()
+        return float(value)
+    if isinstance(col_type, String):
+        if not isinstance(value, str):
+            raise _invalid_cursor()
+        return value
+    raise _invalid_cursor()
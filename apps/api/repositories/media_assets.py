@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import delete, func, select, union, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models
+from ..media_utils import MediaVariant
+
+
+@dataclass(frozen=True)
+class NewMediaAsset:
+    """콘텐츠 주소로 저장한 자산 한 건(경로가 같으면 기존 행을 재사용)."""
+
+    kind: str
+    path: str
+    content_hash: str
+    source_hash: str | None
+    size: tuple[int, int]
+    variants: Sequence[MediaVariant] = ()
+
+
+@dataclass(frozen=True)
+class MediaAssetFiles:
+    """GC 판정용 자산 요약."""
+
+    id: int
+    path: str
+    variants: list[MediaVariant]
+    last_used_at: datetime
+
+
+async def claim_by_source(
+    db: AsyncSession, *, kind: str, source_hash: str
+) -> models.MediaAsset | None:
+    """같은 입력으로 만든 자산이 있으면 last_used_at 을 갱신해 돌려준다."""
+    stmt = (
+        update(models.MediaAsset)
+        .where(
+            models.MediaAsset.kind == kind,
+            models.MediaAsset.source_hash == source_hash,
+        )
+        .values(last_used_at=func.now())
+        .returning(models.MediaAsset)
+        .execution_options(populate_existing=True)
+    )
+    asset = (await db.execute(stmt)).scalars().first()
+    await db.commit()
+    return asset
+
+
+async def upsert_media_asset(
+    db: AsyncSession, data: NewMediaAsset
+) -> models.MediaAsset:
+    """경로(=출력 해시)가 이미 있으면 재사용 시각·변형만 갱신한다."""
+    insert_stmt = pg_insert(models.MediaAsset).values(
+        kind=data.kind,
+        path=data.path,
+        content_hash=data.content_hash,
+        source_hash=data.source_hash,
+        width=data.size[0],
+        height=data.size[1],
+        variants=list(data.variants),
+    )
+    stmt = (
+        insert_stmt.on_conflict_do_update(
+            index_elements=["path"],
+            set_={
+                "last_used_at": func.now(),
+                "variants": insert_stmt.excluded.variants,
+                "source_hash": func.coalesce(
+                    models.MediaAsset.source_hash, insert_stmt.excluded.source_hash
+                ),
+            },
+        )
+        .returning(models.MediaAsset)
+        .execution_options(populate_existing=True)
+    )
+    asset = (await db.execute(stmt)).scalars().one()
+    await db.commit()
+    return asset
+
+
+async def get_variant_manifest(
+    db: AsyncSession, paths: Iterable[str | None]
+) -> dict[str, list[MediaVariant]]:
+    """경로별 변형 목록을 한 번에 조회한다(변형이 없는 경로는 제외)."""
+    wanted = sorted({path for path in paths if path})
+    if not wanted:
+        return {}
+    stmt = select(models.MediaAsset.path, models.MediaAsset.variants).where(
+        models.MediaAsset.path.in_(wanted)
+    )
+    rows = (await db.execute(stmt)).all()
+    return {
+        cast(str, path): cast(list[MediaVariant], variants)
+        for path, variants in rows
+        if variants
+    }
+
+
+async def referenced_media_paths(db: AsyncSession) -> set[str]:
+    """게시글 커버·본문 이미지, 회원 아바타, 히어로 대체 이미지가 가리키는 값."""
+    post_images = (
+        select(func.jsonb_array_elements_text(models.Post.images).label("value"))
+        .where(func.jsonb_typeof(models.Post.images) == "array")
+        .subquery()
+    )
+    stmt = union(
+        select(models.Post.cover_image.label("value")).where(
+            models.Post.cover_image.is_not(None)
+        ),
+        select(post_images.c.value),
+        select(models.Member.avatar_path.label("value")).where(
+            models.Member.avatar_path.is_not(None)
+        ),
+        select(models.HeroItem.image_override.label("value")).where(
+            models.HeroItem.image_override.is_not(None)
+        ),
+    )
+    rows = (await db.execute(stmt)).scalars().all()
+    return {value for value in rows if value}
+
+
+async def list_media_asset_files(db: AsyncSession) -> list[MediaAssetFiles]:
+    stmt = select(
+        models.MediaAsset.id,
+        models.MediaAsset.path,
+        models.MediaAsset.variants,
+        models.MediaAsset.last_used_at,
+    )
+    rows = (await db.execute(stmt)).all()
+    return [
+        MediaAssetFiles(
+            id=cast(int, asset_id),
+            path=cast(str, path),
+            variants=cast(list[MediaVariant], variants or []),
+            last_used_at=cast(datetime, last_used_at),
+        )
+        for asset_id, path, variants, last_used_at in rows
+    ]
+
+
+async def delete_unused_media_assets(
+    db: AsyncSession, ids: Sequence[int], *, used_before: datetime
+) -> list[str]:
+    """ids 중 그 사이 재사용되지 않은 행만 지우고 지운 경로를 반환한다."""
+    if not ids:
+        return []
+    stmt = (
+        delete(models.MediaAsset)
+        .where(
+            models.MediaAsset.id.in_(list(ids)),
+            models.MediaAsset.last_used_at < used_before,
+        )
+        .returning(models.MediaAsset.path)
+    )
+    paths = (await db.execute(stmt)).scalars().all()
+    await db.commit()
+    return list(paths)
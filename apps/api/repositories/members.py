@@ -1,36 +1,50 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import and_, func, literal, or_, select
+from sqlalchemy import (
+    Double,
+    Select,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased
 from sqlalchemy.sql.elements import ColumnElement
 
 from .. import models, schemas
 from ..errors import NotFoundError
-from . import escape_like
+from . import escape_like, keyset
+from .page_total import with_window_total
 
 _SUPER_ADMIN_ROLE_LOCK_ID = 0x534F4745434F4E
 
 
+@dataclass(frozen=True)
+class DirectoryViewer:
+    """동문 수첩 조회자. 인증 의존성에서 확인한 회원 id·기수."""
+
+    id: int
+    cohort: int
+
+
 def _build_member_conditions(
     filters: schemas.MemberListFilters,
     *,
-    viewer_student_id: str | None = None,
+    viewer: DirectoryViewer | None = None,
 ) -> list[ColumnElement[bool]]:
     conds: list[ColumnElement[bool]] = []
     qv = filters.get('q')
     if qv:
+        # 통합 검색 문서 하나로 모든 표시 필드를 검색한다(단일 trigram GIN).
         like = f"%{escape_like(qv)}%"
-        conds.append(
-            or_(
-                models.Member.name.ilike(like, escape="\\"),
-                models.Member.email.ilike(like, escape="\\"),
-                models.Member.student_id.ilike(like, escape="\\"),
-            )
-        )
+        conds.append(models.Member.search_document.ilike(like, escape="\\"))
 
     cohort = filters.get('cohort')
     if cohort is not None:
@@ -61,23 +75,16 @@ def _build_member_conditions(
             models.Member.job_title.ilike(f"%{escape_like(job_title)}%", escape="\\")
         )
 
-    if viewer_student_id is not None:
-        viewer = aliased(models.Member)
-        viewer_cohort = (
-            select(viewer.cohort)
-            .where(viewer.student_id == viewer_student_id)
-            .scalar_subquery()
-        )
+    if viewer is not None:
+        # 조회자 기수는 인증 의존성이 이미 DB에서 읽었으므로 상수 파라미터로 쓴다.
+        # visibility 부분 인덱스(ix_members_visibility_*)가 이 조건을 처리한다.
         conds.append(
-            and_(
-                viewer_cohort.is_not(None),
-                or_(
-                    models.Member.student_id == viewer_student_id,
-                    models.Member.visibility == models.Visibility.ALL,
-                    and_(
-                        models.Member.visibility == models.Visibility.COHORT,
-                        models.Member.cohort == viewer_cohort,
-                    ),
+            or_(
+                models.Member.id == viewer.id,
+                models.Member.visibility == models.Visibility.ALL,
+                and_(
+                    models.Member.visibility == models.Visibility.COHORT,
+                    models.Member.cohort == viewer.cohort,
                 ),
             )
         )
@@ -86,17 +93,70 @@ def _build_member_conditions(
     return conds
 
 
-def _order_columns(sort_value: str | None) -> list[ColumnElement[Any]]:
-    mapping: dict[str, list[ColumnElement[Any]]] = {
-        'cohort_desc': [models.Member.cohort.desc(), models.Member.name.asc()],
-        'cohort_asc': [models.Member.cohort.asc(), models.Member.name.asc()],
-        'name': [models.Member.name.asc()],
-        'recent': [models.Member.updated_at.desc(), models.Member.name.asc()],
+def _relevance_keys(q: str) -> list[keyset.OrderKey]:
+    """검색어 관련도 정렬: 이름 일치 > 이름 접두 일치 > 문서 유사도."""
+    term = q.strip()
+    tier = case(
+        (func.lower(models.Member.name) == func.lower(literal(term)), 0),
+        (models.Member.name.ilike(f"{escape_like(term)}%", escape="\\"), 1),
+        else_=2,
+    )
+    # word_similarity 는 real(float4)이라 커서에 실은 float8 값과 다시 비교하면
+    # 같은 값이 같지 않게 된다. 정렬·비교 모두 double precision 으로 맞춘다.
+    similarity: ColumnElement[float] = cast(
+        func.word_similarity(literal(term), models.Member.search_document),
+        Double[float](),
+    )
+    return [
+        (tier, False),
+        (similarity, True),
+        (models.Member.name, False),
+        (models.Member.id, False),
+    ]
+
+
+def _order_keys(
+    sort_value: str | None, q: str | None = None
+) -> tuple[str, list[keyset.OrderKey]]:
+    """정렬 이름을 정규화하고 id 를 마지막 키로 둔 정렬 키를 반환한다.
+
+    키 조합마다 ix_members_*_name_id 복합 인덱스가 있어 키셋 페이지가
+    인덱스 범위 스캔으로 처리된다(relevance 는 검색 결과 집합 안에서 정렬).
+    """
+    key = sort_value.lower() if sort_value else 'recent'
+    if key == 'relevance' and q and q.strip():
+        return key, _relevance_keys(q)
+    name_id: list[keyset.OrderKey] = [
+        (models.Member.name, False),
+        (models.Member.id, False),
+    ]
+    mapping: dict[str, list[keyset.OrderKey]] = {
+        'cohort_desc': [(models.Member.cohort, True), *name_id],
+        'cohort_asc': [(models.Member.cohort, False), *name_id],
+        'name': name_id,
+        'recent': [(models.Member.updated_at, True), *name_id],
     }
-    if not sort_value:
-        return mapping['recent']
-    key = sort_value.lower()
-    return mapping.get(key, mapping['recent'])
+    if key not in mapping:
+        key = 'recent'
+    return key, mapping[key]
+
+
+def _order_columns(
+    sort_value: str | None, q: str | None = None
+) -> list[ColumnElement[Any]]:
+    return keyset.order_by_clauses(_order_keys(sort_value, q)[1])
+
+
+def _filtered_members_stmt(
+    filters: schemas.MemberListFilters,
+    viewer: DirectoryViewer | None,
+    *columns: ColumnElement[Any],
+) -> Select[Any]:
+    stmt = select(models.Member, *columns)
+    conds = _build_member_conditions(filters, viewer=viewer)
+    if conds:
+        stmt = stmt.where(and_(*conds))
+    return stmt
 
 
 async def list_members(
@@ -105,33 +165,71 @@ async def list_members(
     limit: int,
     offset: int,
     filters: schemas.MemberListFilters | None = None,
-    viewer_student_id: str | None = None,
+    viewer: DirectoryViewer | None = None,
 ) -> Sequence[models.Member]:
     """회원 목록 조회(기본 필터 지원).
 
-    - q: 이름/이메일 부분 일치
+    - q: 통합 검색 문서(이름/학번/이메일/소속/주소 등) 부분 일치
     - cohort: 기수 정확히 일치
     - major: 전공 부분 일치
     - exclude_private: visibility=PRIVATE을 기본 제외
+    - sort=relevance: q가 있을 때 이름 일치·접두 일치·유사도 순
     """
-    stmt = select(models.Member)
     f = filters or {}
-    conds = _build_member_conditions(f, viewer_student_id=viewer_student_id)
-    if conds:
-        stmt = stmt.where(and_(*conds))
-    stmt = stmt.order_by(*_order_columns(f.get('sort')))
+    stmt = _filtered_members_stmt(f, viewer)
+    stmt = stmt.order_by(*_order_columns(f.get('sort'), f.get('q')))
     stmt = stmt.offset(offset).limit(limit)
     result = await db.execute(stmt)
     return result.scalars().all()
 
 
+async def list_members_keyset(
+    db: AsyncSession,
+    *,
+    page: keyset.PageRequest,
+    filters: schemas.MemberListFilters | None = None,
+    viewer: DirectoryViewer | None = None,
+) -> tuple[list[models.Member], str | None, int | None]:
+    """커서 기반 회원 목록. (행 목록, 다음 커서, 전체 건수 또는 None).
+
+    정렬 키 값을 함께 SELECT 해 마지막 행에서 다음 커서를 만든다.
+    limit+1 행을 읽어 다음 페이지 존재 여부를 판단한다.
+    page.include_total 이면 첫 페이지는 COUNT(*) OVER () 로 같은 쿼리에서 건수를
+    얻고, 커서 이후 페이지는 커서 조건이 건수를 줄이므로 COUNT 를 따로 실행한다.
+    """
+    f = filters or {}
+    tag, keys = _order_keys(f.get('sort'), f.get('q'))
+    stmt = _filtered_members_stmt(f, viewer, *(e for e, _ in keys))
+    if page.cursor:
+        after = keyset.decode_cursor(page.cursor, tag, keys)
+        stmt = stmt.where(keyset.after_condition(keys, after))
+    stmt = stmt.order_by(*keyset.order_by_clauses(keys)).limit(page.limit + 1)
+
+    window_total = page.include_total and not page.cursor
+    if window_total:
+        stmt = with_window_total(stmt)
+    rows = [tuple(row) for row in (await db.execute(stmt)).all()]
+    total: int | None = None
+    if window_total:
+        total = int(rows[0][-1]) if rows else 0
+        rows = [row[:-1] for row in rows]
+    elif page.include_total:
+        total = await count_members(db, filters=f, viewer=viewer)
+
+    visible = rows[:page.limit]
+    next_cursor: str | None = None
+    if len(rows) > page.limit and visible:
+        next_cursor = keyset.encode_cursor(tag, list(visible[-1][1:]))
+    return [row[0] for row in visible], next_cursor, total
+
+
 async def count_members(
     db: AsyncSession, *, filters: schemas.MemberListFilters | None = None,
-    viewer_student_id: str | None = None,
+    viewer: DirectoryViewer | None = None,
 ) -> int:
     stmt = select(func.count()).select_from(models.Member)
     f = filters or {}
-    conds = _build_member_conditions(f, viewer_student_id=viewer_student_id)
+    conds = _build_member_conditions(f, viewer=viewer)
     if conds:
         stmt = stmt.where(and_(*conds))
     result = await db.execute(stmt)
@@ -182,11 +280,9 @@ async def get_directory_member(
     db: AsyncSession,
     *,
     member_id: int,
-    viewer_student_id: str,
+    viewer: DirectoryViewer,
 ) -> models.Member:
-    conditions = _build_member_conditions(
-        {}, viewer_student_id=viewer_student_id
-    )
+    conditions = _build_member_conditions({}, viewer=viewer)
     stmt = select(models.Member).where(
         models.Member.id == member_id,
         *conditions,
@@ -2,11 +2,30 @@ from __future__ import annotations
 
 import hashlib
 from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import TypedDict, cast
 
-from sqlalchemy import CursorResult, delete, func, select
+from sqlalchemy import (
+    ARRAY,
+    CursorResult,
+    Integer,
+    String,
+    any_,
+    bindparam,
+    case,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.elements import BindParameter
 
 from .. import models
 from ..crypto_utils import encrypt_str
@@ -24,6 +43,12 @@ class SubscriptionOwnershipError(Exception):
     """구독 행이 다른 회원 소유일 때 발생."""
 
 
+# 성공이 이어지는 구독은 last_success_at 을 이 간격보다 자주 갱신하지 않는다(쓰기 절감)
+SUCCESS_TOUCH_INTERVAL = timedelta(hours=1)
+# 2**n 백오프 지수 상한(power 오버플로 방지). 실제 상한은 호출자의 max 초가 정한다
+_MAX_BACKOFF_EXPONENT = 30
+
+
 def _hash_endpoint(endpoint: str) -> str:
     return hashlib.sha256(endpoint.encode()).hexdigest()
 
@@ -76,6 +101,10 @@ async def upsert_subscription(
             "auth": insert_stmt.excluded.auth,
             "ua": insert_stmt.excluded.ua,
             "member_id": insert_stmt.excluded.member_id,
+            # 다시 구독하면 새 키로 보는 것이므로 건강도·해지 상태를 초기화한다
+            "revoked_at": None,
+            "failure_count": 0,
+            "quarantined_until": None,
         },
         where=(
             (models.PushSubscription.member_id.is_(None))
@@ -113,16 +142,90 @@ async def delete_subscription(
     await db.commit()
 
 
+def _not_quarantined() -> ColumnElement[bool]:
+    until = models.PushSubscription.quarantined_until
+    return or_(until.is_(None), until <= func.now())
+
+
 async def list_active_subscriptions(
     db: AsyncSession,
 ) -> Sequence[models.PushSubscription]:
+    """해지되지 않았고 격리 중이 아닌 구독."""
     stmt = select(models.PushSubscription).where(
-        models.PushSubscription.revoked_at.is_(None)
+        models.PushSubscription.revoked_at.is_(None), _not_quarantined()
     )
     result = await db.execute(stmt)
     return result.scalars().all()
 
 
+@dataclass(frozen=True)
+class SubscriptionTarget:
+    """발송 대상 조건. 모두 비우면 활성 구독 전체(익명 포함).
+
+    cohorts·member_ids 는 합집합이며, 하나라도 있으면 회원 구독만 고른다.
+    topic 이 있으면 그 주제를 opt-out 한 회원을 뺀다.
+    """
+
+    topic: str | None = None
+    cohorts: tuple[int, ...] = ()
+    member_ids: tuple[int, ...] = ()
+
+
+async def list_target_subscriptions(
+    db: AsyncSession,
+    target: SubscriptionTarget,
+    *,
+    channel: str = "webpush",
+) -> Sequence[models.PushSubscription]:
+    """활성·비격리 구독 중 target 에 맞는 것을 한 쿼리로 고른다.
+
+    회원 조건은 members 조인(기수는 ix_members_cohort_*, 구독은
+    ix_push_subs_member_active), opt-out 은 preferences anti-join
+    (ix_notification_preferences_channel_topic_enabled_member)으로 푼다.
+    """
+    sub = models.PushSubscription
+    stmt = select(sub).where(sub.revoked_at.is_(None), _not_quarantined())
+    if target.cohorts or target.member_ids:
+        member = models.Member
+        conditions: list[ColumnElement[bool]] = []
+        if target.cohorts:
+            conditions.append(
+                member.cohort == any_(_int_array("cohorts", target.cohorts))
+            )
+        if target.member_ids:
+            conditions.append(
+                member.id == any_(_int_array("member_ids", target.member_ids))
+            )
+        stmt = stmt.join(member, member.id == sub.member_id).where(or_(*conditions))
+    if target.topic is not None:
+        pref = models.NotificationPreference
+        opted_out = (
+            select(pref.member_id)
+            .where(
+                pref.channel == channel,
+                pref.topic == target.topic,
+                pref.enabled.is_(False),
+                pref.member_id == sub.member_id,
+            )
+            .exists()
+        )
+        stmt = stmt.where(~opted_out)
+    result = await db.execute(stmt.order_by(sub.id))
+    return result.scalars().all()
+
+
+async def list_eligible_subscriptions(
+    db: AsyncSession,
+    *,
+    topic: str,
+    channel: str = "webpush",
+) -> Sequence[models.PushSubscription]:
+    """활성·비격리 구독 중 회원이 topic 을 opt-out 하지 않은 것(익명 구독 포함)."""
+    return await list_target_subscriptions(
+        db, SubscriptionTarget(topic=topic), channel=channel
+    )
+
+
 async def count_active_subscriptions(db: AsyncSession) -> int:
     stmt = (
         select(func.count())
@@ -157,3 +260,93 @@ async def remove_by_endpoint_hashes(
         total += int(cursor.rowcount or 0)
         await db.commit()
     return total
+
+
+def _int_array(name: str, values: Sequence[int]) -> BindParameter[Sequence[int]]:
+    return bindparam(name, sorted(set(values)), type_=ARRAY(Integer))
+
+
+def _hash_array(hashes: Sequence[str]) -> ColumnElement[bool]:
+    # 대상 수와 무관하게 배열 파라미터 하나로 보낸다
+    cleaned = sorted({h for h in hashes if h})
+    return models.PushSubscription.endpoint_hash == any_(
+        bindparam("hashes", cleaned, type_=ARRAY(String))
+    )
+
+
+async def mark_send_successes(db: AsyncSession, hashes: Sequence[str]) -> None:
+    """발송 성공: 연속 실패·격리를 풀고 마지막 성공 시각을 남긴다."""
+    if not any(hashes):
+        return
+    sub = models.PushSubscription
+    stmt = (
+        update(sub)
+        .where(
+            _hash_array(hashes),
+            or_(
+                sub.failure_count > 0,
+                sub.quarantined_until.is_not(None),
+                sub.last_success_at.is_(None),
+                sub.last_success_at < func.now() - SUCCESS_TOUCH_INTERVAL,
+            ),
+        )
+        .values(failure_count=0, quarantined_until=None, last_success_at=func.now())
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def mark_send_failures(
+    db: AsyncSession,
+    hashes: Sequence[str],
+    *,
+    quarantine_after: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+) -> None:
+    """발송 실패: 연속 실패 수를 올리고, quarantine_after 번째부터 격리한다.
+
+    격리 기간은 base * 2**(실패 수 - quarantine_after) 초(max 상한).
+    quarantine_after 가 0 이면 세기만 한다.
+    """
+    if not any(hashes):
+        return
+    sub = models.PushSubscription
+    failures = sub.failure_count + 1
+    stmt = update(sub).where(_hash_array(hashes))
+    if quarantine_after > 0:
+        exponent = func.least(failures - quarantine_after, _MAX_BACKOFF_EXPONENT)
+        seconds = func.least(
+            backoff_base_seconds * func.power(literal(2.0), exponent),
+            backoff_max_seconds,
+        )
+        stmt = stmt.values(
+            quarantined_until=case(
+                (
+                    failures >= quarantine_after,
+                    func.now() + seconds * literal_column("interval '1 second'"),
+                ),
+                else_=sub.quarantined_until,
+            )
+        )
+    await db.execute(stmt.values(failure_count=failures, last_failure_at=func.now()))
+    await db.commit()
+
+
+async def revoke_dead_subscriptions(
+    db: AsyncSession, *, min_failures: int, dead_before: datetime
+) -> int:
+    """min_failures 번 이상 연속 실패했고 dead_before 이후 성공이 없는 구독을 해지."""
+    sub = models.PushSubscription
+    stmt = (
+        update(sub)
+        .where(
+            sub.revoked_at.is_(None),
+            sub.failure_count >= min_failures,
+            func.coalesce(sub.last_success_at, sub.created_at) < dead_before,
+        )
+        .values(revoked_at=func.now())
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    return int(cast(CursorResult[object], result).rowcount or 0)
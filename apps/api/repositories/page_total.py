@@ -0,0 +1,42 @@
+"""목록 페이지와 전체 건수를 한 번의 쿼리로 가져오는 헬퍼.
+
+목록 + COUNT 를 따로 실행하면 같은 WHERE 절을 두 번 계획·실행한다.
+`COUNT(*) OVER ()` 윈도 컬럼을 덧붙이면 LIMIT/OFFSET 적용 전 결과 집합의
+행 수가 모든 행에 실려 오므로 한 번에 끝난다. 단, OFFSET 이 결과 범위를
+넘어 빈 페이지가 나오면 건수를 알 수 없으므로 그때만 COUNT 를 따로 실행한다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_TOTAL_LABEL = "_page_total"
+
+
+def with_window_total(stmt: Select[Any]) -> Select[Any]:
+    """SELECT 끝에 전체 건수 윈도 컬럼을 추가한다(GROUP BY 후 그룹 수 기준)."""
+    return stmt.add_columns(func.count().over().label(_TOTAL_LABEL))
+
+
+async def fetch_page_with_total(
+    db: AsyncSession,
+    stmt: Select[Any],
+    *,
+    offset: int,
+    count_stmt: Select[Any],
+) -> tuple[list[tuple[Any, ...]], int]:
+    """(윈도 컬럼을 뺀 행 목록, 전체 건수)를 반환한다.
+
+    count_stmt 는 빈 페이지(offset > 0)에서만 실행되는 폴백이다.
+    """
+    rows = (await db.execute(with_window_total(stmt))).all()
+    if rows:
+        total = int(rows[0][-1])
+        return [tuple(row[:-1]) for row in rows], total
+    if offset == 0:
+        return [], 0
+    total = int((await db.execute(count_stmt)).scalar_one())
+    return [], total
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TypedDict
+from datetime import datetime
+from typing import TypedDict, cast
 
 from sqlalchemy import ColumnElement, and_, desc, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from .. import models, schemas
+from .. import models, publication_clock, schemas
 from ..errors import NotFoundError
 from ..post_visibility import (
     BOARD_POST_CATEGORIES,
@@ -15,6 +16,7 @@ from ..post_visibility import (
     public_visibility_clause,
 )
 from . import escape_like
+from . import media_assets as media_assets_repo
 
 
 class AdminPostFilters(TypedDict, total=False):
@@ -136,13 +138,24 @@ async def get_public_post(db: AsyncSession, post_id: int) -> models.Post:
     return post
 
 
+async def _attach_image_variants(db: AsyncSession, post: models.Post) -> None:
+    """대표·추가 이미지의 반응형 변형 매니페스트를 게시글에 기록한다."""
+    images = cast(list[str] | None, post.images) or []
+    manifest = await media_assets_repo.get_variant_manifest(
+        db, [cast(str | None, post.cover_image), *images]
+    )
+    setattr(post, "image_variants", manifest or None)
+
+
 async def create_post(db: AsyncSession, payload: schemas.PostCreate) -> models.Post:
     data = payload.model_dump()
     data["view_count"] = 0
     post = models.Post(**data)
+    await _attach_image_variants(db, post)
     db.add(post)
     await db.commit()
     await db.refresh(post)
+    publication_clock.observe_publication(cast(datetime | None, post.published_at))
     return post
 
 
@@ -193,8 +206,11 @@ async def update_post(
         update_data["published_at"] = None
     for field, value in update_data.items():
         setattr(post, field, value)
+    if update_data.keys() & {"cover_image", "images"}:
+        await _attach_image_variants(db, post)
     await db.commit()
     await db.refresh(post)
+    publication_clock.observe_publication(cast(datetime | None, post.published_at))
     return post
 
 
@@ -203,6 +219,7 @@ async def delete_post(db: AsyncSession, post_id: int) -> int:
     post = await get_post(db, post_id)  # NotFoundError if not exist
     await db.delete(post)
     await db.commit()
+    publication_clock.observe_publication(None)
     return post_id
 
 
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models, schemas
+from .. import models
 from ..errors import AlreadyExistsError, NotFoundError
 
 
@@ -30,24 +31,66 @@ async def get_rsvp(db: AsyncSession, member_id: int, event_id: int) -> models.RS
     return rsvp
 
 
-async def create_rsvp(
+async def lock_rsvp(
+    db: AsyncSession, member_id: int, event_id: int
+) -> models.RSVP | None:
+    """상태 전이 동안 RSVP 행을 FOR UPDATE 로 잠가 최신 값으로 읽는다."""
+    key: tuple[int, int] = (member_id, event_id)
+    return await db.get(
+        models.RSVP, key, with_for_update=True, populate_existing=True
+    )
+
+
+async def add_rsvp(
     db: AsyncSession,
     *,
     member_id: int,
     event_id: int,
-    status: schemas.RSVPLiteral,
+    status: models.RSVPStatus,
 ) -> models.RSVP:
-    # 복합 PK 중복 방지
-    key: tuple[int, int] = (member_id, event_id)
-    exists = await db.get(models.RSVP, key)
-    if exists is not None:
-        raise AlreadyExistsError(code="rsvp_exists", detail="RSVP already exists")
-    rsvp = models.RSVP(
-        member_id=member_id,
-        event_id=event_id,
-        status=models.RSVPStatus(status),
-    )
+    """RSVP 를 추가하고 flush 한다(커밋은 호출자 트랜잭션).
+
+    같은 회원·행사의 동시 생성은 복합 PK 충돌로 드러나며, 이때 트랜잭션을
+    되돌려 같은 트랜잭션에서 올린 집계도 함께 취소한다.
+    """
+    rsvp = models.RSVP(member_id=member_id, event_id=event_id, status=status)
     db.add(rsvp)
-    await db.commit()
-    await db.refresh(rsvp)
+    try:
+        await db.flush()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise AlreadyExistsError(
+            code="rsvp_exists", detail="RSVP already exists"
+        ) from exc
     return rsvp
+
+
+async def promote_waitlisted(
+    db: AsyncSession, *, event_id: int, limit: int
+) -> list[int]:
+    """대기열 앞에서 limit 명을 한 문장으로 going 으로 바꾸고 회원 id 를 돌려준다.
+
+    다른 트랜잭션이 잠근 RSVP(상태 전이 중)는 SKIP LOCKED 로 건너뛴다.
+    커밋과 집계 조정은 호출자 트랜잭션에서 한다.
+    """
+    if limit <= 0:
+        return []
+    candidates = (
+        select(models.RSVP.member_id, models.RSVP.event_id)
+        .where(
+            models.RSVP.event_id == event_id,
+            models.RSVP.status == models.RSVPStatus.WAITLIST,
+        )
+        .order_by(models.RSVP.created_at.asc(), models.RSVP.member_id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(models.RSVP)
+        .where(tuple_(models.RSVP.member_id, models.RSVP.event_id).in_(candidates))
+        .values(status=models.RSVPStatus.GOING)
+        .returning(models.RSVP.member_id)
+        .execution_options(synchronize_session="fetch")
+    )
+    promoted = (await db.execute(stmt)).scalars().all()
+    return sorted(int(member_id) for member_id in promoted)
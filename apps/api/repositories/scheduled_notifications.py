@@ -5,11 +5,26 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import cast
 
-from sqlalchemy import case, func, select, update
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    String,
+    bindparam,
+    case,
+    column,
+    exists,
+    func,
+    literal,
+    select,
+    table,
+    true,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import ScheduledNotificationDelivery, ScheduledNotificationLog
+from . import bulk_copy
 
 
 @dataclass(frozen=True)
@@ -47,15 +62,49 @@ async def ensure_deliveries(
     endpoint_hashes: Sequence[str],
 ) -> None:
     """예약 로그에 구독별 delivery 행을 멱등적으로 준비한다."""
+    await ensure_deliveries_for_logs(
+        db, scheduled_log_ids=[scheduled_log_id], endpoint_hashes=endpoint_hashes
+    )
+
+
+_TARGETS_STAGING = "scheduled_delivery_targets"
+_targets = table(_TARGETS_STAGING, column("endpoint_hash", String))
+
+
+async def ensure_deliveries_for_logs(
+    db: AsyncSession,
+    *,
+    scheduled_log_ids: Sequence[int],
+    endpoint_hashes: Sequence[str],
+) -> None:
+    """여러 예약 로그에 같은 대상의 delivery 행을 한 번에 준비한다.
+
+    endpoint 해시는 COPY 로 트랜잭션 임시 테이블에 흘려 넣고(bulk_copy),
+    로그 id 배열과 곱해 INSERT ... SELECT 한 문장으로 넣는다. 대상 수와 무관하게
+    거대한 VALUES·IN 목록을 만들지 않는다. 대상에서 빠진 endpoint 의
+    미처리(pending/failed) 행은 abandoned 로 닫는다.
+    """
+    log_ids = sorted(set(scheduled_log_ids))
+    if not log_ids:
+        return
     hashes = _clean_hashes(endpoint_hashes)
+    if hashes:
+        await bulk_copy.stage_rows(
+            db,
+            _TARGETS_STAGING,
+            [("endpoint_hash", "text")],
+            ((value,) for value in hashes),
+        )
 
     stale_stmt = update(ScheduledNotificationDelivery).where(
-        ScheduledNotificationDelivery.scheduled_log_id == scheduled_log_id,
+        ScheduledNotificationDelivery.scheduled_log_id.in_(log_ids),
         ScheduledNotificationDelivery.status.in_(["pending", "failed"]),
     )
     if hashes:
         stale_stmt = stale_stmt.where(
-            ~ScheduledNotificationDelivery.endpoint_hash.in_(hashes)
+            ~exists().where(
+                _targets.c.endpoint_hash == ScheduledNotificationDelivery.endpoint_hash
+            )
         )
     await db.execute(stale_stmt.values(status="abandoned", finished_at=func.now()))
 
@@ -63,18 +112,21 @@ async def ensure_deliveries(
         await db.commit()
         return
 
-    values = [
-        {
-            "scheduled_log_id": scheduled_log_id,
-            "endpoint_hash": endpoint_hash,
-            "status": "pending",
-            "attempts": 0,
-        }
-        for endpoint_hash in hashes
-    ]
-    stmt = pg_insert(ScheduledNotificationDelivery).values(values)
-    stmt = stmt.on_conflict_do_nothing(
-        index_elements=["scheduled_log_id", "endpoint_hash"]
+    logs = (
+        func.unnest(bindparam("log_ids", log_ids, type_=ARRAY(Integer)))
+        .table_valued("log_id")
+        .render_derived(name="logs")
+    )
+    rows = select(
+        logs.c.log_id,
+        _targets.c.endpoint_hash,
+        literal("pending"),
+        literal(0),
+    ).select_from(logs.join(_targets, true()))
+    stmt = (
+        pg_insert(ScheduledNotificationDelivery)
+        .from_select(["scheduled_log_id", "endpoint_hash", "status", "attempts"], rows)
+        .on_conflict_do_nothing(index_elements=["scheduled_log_id", "endpoint_hash"])
     )
     await db.execute(stmt)
     await db.commit()
@@ -279,6 +331,44 @@ async def reclaim_stale_logs(
     return len(log_ids)
 
 
+async def touch_pending_logs(
+    db: AsyncSession,
+    *,
+    log_ids: Sequence[int],
+) -> None:
+    """발송 차례를 기다리는 pending 로그의 updated_at 을 갱신한다(stale 회수 방지)."""
+    if log_ids:
+        await db.execute(
+            update(ScheduledNotificationLog)
+            .where(
+                ScheduledNotificationLog.id.in_(list(log_ids)),
+                ScheduledNotificationLog.status == "pending",
+            )
+            .values(updated_at=func.now())
+        )
+    await db.commit()
+
+
+async def start_log(db: AsyncSession, *, log_id: int) -> bool:
+    """pending 로그만 in_progress 로 바꾼다.
+
+    그 사이 stale 회수가 실패로 마감했거나 다른 워커가 다시 확보했으면
+    False 이고, 호출자는 발송하지 않는다.
+    """
+    result = await db.execute(
+        update(ScheduledNotificationLog)
+        .where(
+            ScheduledNotificationLog.id == log_id,
+            ScheduledNotificationLog.status == "pending",
+        )
+        .values(status="in_progress", updated_at=func.now())
+        .returning(ScheduledNotificationLog.id)
+    )
+    started = result.scalar_one_or_none() is not None
+    await db.commit()
+    return started
+
+
 async def mark_log_failed(
     db: AsyncSession,
     *,
@@ -0,0 +1,145 @@
+"""notification_send_logs 월 파티션 관리.
+
+- 파티션 이름은 `notification_send_logs_pYYYYMM`, 범위는 UTC 월 [1일, 다음 달 1일).
+- `ensure_partitions` 가 이번 달부터 몇 달 앞까지 미리 만든다(스케줄러 일일 잡).
+  그사이 DEFAULT 파티션에 들어간 같은 달 행이 있으면 새 파티션으로 옮긴다.
+- `drop_partitions_before` 는 cutoff 이전에 끝나는 달 파티션을 떼어 지운다.
+  DELETE 와 달리 WAL·bloat 없이 메타데이터 작업으로 끝난다.
+
+DDL 에는 바인드 파라미터를 쓸 수 없어 이름·경계는 datetime 에서만 만든다.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+PARENT_TABLE = "notification_send_logs"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+PARTITION_MONTHS_AHEAD = 2
+
+_LIST_PARTITIONS_SQL = text(
+    "SELECT c.relname FROM pg_inherits i "
+    "JOIN pg_class c ON c.oid = i.inhrelid "
+    "WHERE i.inhparent = CAST(:parent AS regclass)"
+)
+
+
+def month_start(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def next_month(month: datetime) -> datetime:
+    return month.replace(
+        year=month.year + month.month // 12, month=month.month % 12 + 1
+    )
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_month(name: str) -> datetime | None:
+    """월 파티션 이름이면 그 달 시작 시각, 아니면(DEFAULT 등) None."""
+    suffix = name.removeprefix(PARTITION_PREFIX)
+    if suffix == name or len(suffix) != len("YYYYMM") or not suffix.isdigit():
+        return None
+    return datetime(int(suffix[:4]), int(suffix[4:]), 1, tzinfo=UTC)
+
+
+def is_partition_table(name: str) -> bool:
+    return name == DEFAULT_PARTITION or partition_month(name) is not None
+
+
+async def list_partitions(db: AsyncSession) -> list[str]:
+    result = await db.execute(_LIST_PARTITIONS_SQL, {"parent": PARENT_TABLE})
+    return sorted(str(name) for name in result.scalars().all())
+
+
+async def _default_has_rows(db: AsyncSession, lower: datetime, upper: datetime) -> bool:
+    stmt = text(
+        f"SELECT 1 FROM {DEFAULT_PARTITION} "
+        "WHERE created_at >= :lower AND created_at < :upper LIMIT 1"
+    )
+    row = (await db.execute(stmt, {"lower": lower, "upper": upper})).first()
+    return row is not None
+
+
+async def _create_month_partition(
+    db: AsyncSession, month: datetime, *, has_default: bool
+) -> None:
+    lower, upper = month, next_month(month)
+    create = text(
+        f"CREATE TABLE {partition_name(month)} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    )
+    if not has_default or not await _default_has_rows(db, lower, upper):
+        await db.execute(create)
+        return
+    # DEFAULT 에 같은 달 행이 있으면 새 파티션을 붙일 수 없다. 잠시 떼고 옮긴다.
+    bounds = {"lower": lower, "upper": upper}
+    await db.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+    )
+    await db.execute(create)
+    await db.execute(
+        text(
+            f"INSERT INTO {PARENT_TABLE} SELECT * FROM {DEFAULT_PARTITION} "
+            "WHERE created_at >= :lower AND created_at < :upper"
+        ),
+        bounds,
+    )
+    await db.execute(
+        text(
+            f"DELETE FROM {DEFAULT_PARTITION} "
+            "WHERE created_at >= :lower AND created_at < :upper"
+        ),
+        bounds,
+    )
+    await db.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
+
+
+async def ensure_partitions(
+    db: AsyncSession,
+    *,
+    now: datetime | None = None,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+) -> list[str]:
+    """이번 달부터 months_ahead 달 뒤까지 없는 월 파티션을 만든다."""
+    existing = set(await list_partitions(db))
+    month = month_start(now or datetime.now(UTC))
+    created: list[str] = []
+    for _ in range(months_ahead + 1):
+        name = partition_name(month)
+        if name not in existing:
+            await _create_month_partition(
+                db, month, has_default=DEFAULT_PARTITION in existing
+            )
+            created.append(name)
+        month = next_month(month)
+    await db.commit()
+    return created
+
+
+async def drop_partitions_before(db: AsyncSession, cutoff: datetime) -> int:
+    """cutoff 이전에 끝나는 월 파티션을 떼어 지우고 지운 행 수를 돌려준다.
+
+    커밋은 호출자가 한다(경계 달 정리와 한 트랜잭션).
+    """
+    dropped = 0
+    for name in await list_partitions(db):
+        month = partition_month(name)
+        if month is None or next_month(month) > cutoff:
+            continue
+        count = (await db.execute(text(f"SELECT count(*) FROM {name}"))).scalar_one()
+        await db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+        dropped += int(count)
+    return dropped
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Sequence
+from collections import Counter
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
+from typing import cast
 
-from sqlalchemy import delete, desc, select
+from sqlalchemy import CursorResult, delete, desc, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import case, func
+from sqlalchemy.sql import ColumnElement, case, func
 
 from .. import models
+from . import bulk_copy
+from . import send_log_partitions as partitions
 
 
 def hash_endpoint(endpoint: str) -> tuple[str, str]:
@@ -39,6 +44,50 @@ class SendLogItem:
     endpoint: str | None = None
     # 복호화 불가 시 DB에 저장된 endpoint_hash로 로그.
     stored_endpoint_hash: str | None = None
+    # pacer 가 origin 을 멈춘 동안 받은 실패(구독 건강도 집계에서 제외, 저장 안 함)
+    origin_paused: bool = False
+    # Push provider 응답이 아닌 우리 쪽 실패(복호화 실패, 이전 실행 중단으로
+    # 결과를 모르는 claim). 구독 건강도 집계에서 제외, 저장 안 함
+    local_failure: bool = False
+
+
+_EXPIRED_STATUSES = frozenset({int(HTTPStatus.NOT_FOUND), int(HTTPStatus.GONE)})
+_MIN_STATUS = 100
+_MAX_STATUS = 599
+
+
+def status_class(status_code: int | None) -> str:
+    """시간별 집계의 상태 구간. 만료 판정에 쓰는 404·410 은 따로 센다."""
+    if status_code is None:
+        return "none"
+    if status_code in _EXPIRED_STATUSES:
+        return str(status_code)
+    if _MIN_STATUS <= status_code <= _MAX_STATUS:
+        return f"{status_code // 100}xx"
+    return "other"
+
+
+async def _bump_hourly_stats(
+    db: AsyncSession, counts: Counter[tuple[int, str]]
+) -> None:
+    """현재 시각(UTC 정시) 집계 행을 증가시킨다. 커밋은 호출자가 로그와 함께."""
+    if not counts:
+        return
+    stats = models.NotificationSendStatHourly
+    hour = func.date_trunc("hour", func.now(), "UTC")
+    # 동시 발송끼리 행 잠금 순서를 맞춰 교착을 피한다
+    insert_stmt = pg_insert(stats).values(
+        [
+            {"hour": hour, "ok": ok, "status_class": cls, "total": total}
+            for (ok, cls), total in sorted(counts.items())
+        ]
+    )
+    await db.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=["hour", "ok", "status_class"],
+            set_={"total": stats.total + insert_stmt.excluded.total},
+        )
+    )
 
 
 async def create_log(
@@ -52,39 +101,51 @@ async def create_log(
         endpoint_tail=endpoint_tail,
     )
     db.add(row)
+    await _bump_hourly_stats(
+        db, Counter({(1 if ok else 0, status_class(status_code)): 1})
+    )
     await db.commit()
     await db.refresh(row)
     return row
 
 
+_LOG_COPY_COLUMNS = (
+    ("ok", "int4"),
+    ("status_code", "int4"),
+    ("endpoint_hash", "text"),
+    ("endpoint_tail", "text"),
+)
+
+
 async def create_logs_batch(
     db: AsyncSession, items: Sequence[SendLogItem]
 ) -> int:
-    """발송 로그를 한 트랜잭션에 batch insert."""
+    """발송 로그를 한 트랜잭션에 COPY 로 적재(ORM 객체를 만들지 않음)."""
     if not items:
         return 0
-    rows: list[models.NotificationSendLog] = []
-    for item in items:
-        if item.stored_endpoint_hash:
-            endpoint_hash = item.stored_endpoint_hash
-            endpoint_tail = endpoint_hash[-16:]
-        elif item.endpoint:
-            endpoint_hash, endpoint_tail = hash_endpoint(item.endpoint)
-        else:
-            continue
-        rows.append(
-            models.NotificationSendLog(
-                ok=1 if item.ok else 0,
-                status_code=item.status_code,
-                endpoint_hash=endpoint_hash,
-                endpoint_tail=endpoint_tail,
-            )
-        )
-    if not rows:
+    counts: Counter[tuple[int, str]] = Counter()
+
+    def _rows() -> Iterator[tuple[int, int | None, str, str]]:
+        for item in items:
+            if item.stored_endpoint_hash:
+                endpoint_hash = item.stored_endpoint_hash
+                endpoint_tail = endpoint_hash[-16:]
+            elif item.endpoint:
+                endpoint_hash, endpoint_tail = hash_endpoint(item.endpoint)
+            else:
+                continue
+            ok = 1 if item.ok else 0
+            counts[(ok, status_class(item.status_code))] += 1
+            yield ok, item.status_code, endpoint_hash, endpoint_tail
+
+    written = await bulk_copy.copy_rows(
+        db, models.NotificationSendLog.__tablename__, _LOG_COPY_COLUMNS, _rows()
+    )
+    if not written:
         return 0
-    db.add_all(rows)
+    await _bump_hourly_stats(db, counts)
     await db.commit()
-    return len(rows)
+    return written
 
 
 async def list_recent(
@@ -115,10 +176,12 @@ async def list_since(
     return result.scalars().all()
 
 
-async def aggregate_since(db: AsyncSession, *, cutoff: datetime) -> LogAggregates:
-    """기간 내 발송 로그를 DB aggregate로 집계 (전건 ORM 로드 없음)."""
-    ok_col = models.NotificationSendLog.ok
-    sc_col = models.NotificationSendLog.status_code
+async def _aggregate_raw(
+    db: AsyncSession, *, start: datetime, end: datetime | None = None
+) -> LogAggregates:
+    log = models.NotificationSendLog
+    ok_col = log.ok
+    sc_col = log.status_code
     stmt = select(
         func.coalesce(func.sum(case((ok_col != 0, 1), else_=0)), 0),
         func.coalesce(func.sum(case((ok_col == 0, 1), else_=0)), 0),
@@ -146,7 +209,9 @@ async def aggregate_since(db: AsyncSession, *, cutoff: datetime) -> LogAggregate
             ),
             0,
         ),
-    ).where(models.NotificationSendLog.created_at >= cutoff)
+    ).where(log.created_at >= start)
+    if end is not None:
+        stmt = stmt.where(log.created_at < end)
     result = await db.execute(stmt)
     row = result.one()
     return LogAggregates(
@@ -157,18 +222,62 @@ async def aggregate_since(db: AsyncSession, *, cutoff: datetime) -> LogAggregate
     )
 
 
-async def prune_older_than_days(db: AsyncSession, *, days: int) -> int:
-    cutoff = func.now() - func.make_interval(0, 0, 0, days)
-    # PostgreSQL 전용 (make_interval 사용)
-    count_stmt = select(func.count()).select_from(models.NotificationSendLog).where(
-        models.NotificationSendLog.created_at < cutoff
+async def aggregate_since(db: AsyncSession, *, cutoff: datetime) -> LogAggregates:
+    """기간 내 발송 로그를 DB aggregate로 집계 (전건 ORM 로드 없음)."""
+    return await _aggregate_raw(db, start=cutoff)
+
+
+async def aggregate_hourly_since(
+    db: AsyncSession, *, cutoff: datetime
+) -> LogAggregates:
+    """cutoff 이후 발송 통계를 시간별 집계 표 위주로 구한다.
+
+    cutoff 부터 다음 정시 전까지는 원본 로그를(한 시간 미만, 파티션 프루닝),
+    그 정시부터는 시간별 집계 행을 더한다. 조회 비용은 발송량과 거의 무관하다.
+    """
+    stats = models.NotificationSendStatHourly
+    start = cutoff.astimezone(UTC)
+    next_hour = start.replace(minute=0, second=0, microsecond=0)
+    if next_hour < start:
+        next_hour += timedelta(hours=1)
+    failed = stats.ok == 0
+
+    def _sum(cond: ColumnElement[bool]) -> ColumnElement[int]:
+        return func.coalesce(func.sum(case((cond, stats.total), else_=0)), 0)
+
+    stmt = select(
+        _sum(stats.ok != 0),
+        _sum(failed),
+        _sum(failed & (stats.status_class == str(int(HTTPStatus.NOT_FOUND)))),
+        _sum(failed & (stats.status_class == str(int(HTTPStatus.GONE)))),
+    ).where(stats.hour >= next_hour)
+    row = (await db.execute(stmt)).one()
+    edge = (
+        await _aggregate_raw(db, start=start, end=next_hour)
+        if next_hour > start
+        else LogAggregates(0, 0, 0, 0)
     )
-    count_result = await db.execute(count_stmt)
-    count = int(count_result.scalar() or 0)
+    return LogAggregates(
+        accepted=int(row[0] or 0) + edge.accepted,
+        failed=int(row[1] or 0) + edge.failed,
+        failed_404=int(row[2] or 0) + edge.failed_404,
+        failed_410=int(row[3] or 0) + edge.failed_410,
+    )
+
 
-    delete_stmt = delete(models.NotificationSendLog).where(
-        models.NotificationSendLog.created_at < cutoff
+async def prune_older_than_days(db: AsyncSession, *, days: int) -> int:
+    """cutoff 이전 로그를 지운다.
+
+    통째로 지난 달은 파티션을 떼어 지우고(send_log_partitions), 경계 달
+    파티션·DEFAULT 에 남은 행만 DELETE 한다(파티션 프루닝으로 그 범위만 스캔).
+    시간별 통계(notification_send_stats_hourly)는 유지된다.
+    """
+    cutoff = datetime.now(UTC) - timedelta(days=days)
+    dropped = await partitions.drop_partitions_before(db, cutoff)
+    result = await db.execute(
+        delete(models.NotificationSendLog).where(
+            models.NotificationSendLog.created_at < cutoff
+        )
     )
-    await db.execute(delete_stmt)
     await db.commit()
-    return count
+    return dropped + int(cast(CursorResult[object], result).rowcount or 0)
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
 from .. import models, schemas
+from .page_total import fetch_page_with_total
 
 
 def _build_conditions(
@@ -91,14 +92,14 @@ async def list_signup_requests_with_total(
     if conditions:
         stmt = stmt.where(and_(*conditions))
 
-    rows = (await db.execute(stmt)).scalars().all()
-
     count_stmt = select(func.count(models.SignupRequest.id))
     if conditions:
         count_stmt = count_stmt.where(and_(*conditions))
-    total = int((await db.execute(count_stmt)).scalar_one())
-
-    return rows, total
+    # 목록과 전체 건수를 COUNT(*) OVER () 로 한 번에 조회한다.
+    page, total = await fetch_page_with_total(
+        db, stmt, offset=offset, count_stmt=count_stmt
+    )
+    return [row[0] for row in page], total
 
 
 async def save_signup_request(
@@ -13,11 +13,11 @@ import os
 from dataclasses import dataclass
 from typing import Final, cast
 
-from sqlalchemy import column, delete, inspect, table
+from sqlalchemy import column, delete, inspect, table, update
 from sqlalchemy.engine import Connection, CursorResult
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.dml import Delete
+from sqlalchemy.sql.dml import Delete, Update
 
 from apps.api.db import get_db_session
 
@@ -56,11 +56,13 @@ ALLOWED_DELETE_TABLES: Final[frozenset[str]] = frozenset(
 
 PRESERVED_TABLES: Final[tuple[str, ...]] = (
     "notification_send_logs",
+    "notification_send_stats_hourly",
     "scheduled_notification_deliveries",
     "scheduled_notification_logs",
     "support_tickets",
     "events",
     "hero_items",
+    "media_assets",
 )
 
 
@@ -87,6 +89,12 @@ def _build_delete_statement(step: DeleteStep) -> Delete:
     return delete(table_clause)
 
 
+def _reset_event_rsvp_counts_statement() -> Update:
+    """보존하는 events 의 RSVP 집계를 rsvps 전체 삭제에 맞춰 0 으로 돌린다."""
+    events = table("events", column("going_count"), column("waitlist_count"))
+    return update(events).values(going_count=0, waitlist_count=0)
+
+
 def _normalize_rowcount(value: int | None) -> int:
     if value is None:
         return 0
@@ -107,6 +115,8 @@ async def reset_transition_data(session: AsyncSession) -> ResetSummary:
             result = await session.execute(_build_delete_statement(step))
             cursor_result = cast(CursorResult[object], result)
             deleted_rows[step.table] = _normalize_rowcount(cursor_result.rowcount)
+        if "rsvps" in deleted_rows and await _table_exists(session, "events"):
+            await session.execute(_reset_event_rsvp_counts_statement())
         await session.commit()
     except SQLAlchemyError:
         await session.rollback()
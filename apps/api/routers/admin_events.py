@@ -128,6 +128,32 @@ async def upsert_member_rsvp(
     return schemas.RSVPRead.model_validate(rsvp)
 
 
+class WaitlistPromotionResponse(BaseModel):
+    promoted_member_ids: list[int]
+    going_count: int
+    waitlist_count: int
+
+
+@router.post(
+    "/{event_id}/waitlist/promote",
+    response_model=WaitlistPromotionResponse,
+)
+async def promote_event_waitlist(
+    event_id: int,
+    db: AsyncSession = Depends(get_db),
+    _admin: CurrentUser = Depends(
+        require_permission("admin_events", allow_admin_fallback=False)
+    ),
+) -> WaitlistPromotionResponse:
+    """빈 자리만큼 대기열을 신청 순서대로 일괄 승급한다."""
+    result = await events_service.promote_waitlist(db, event_id)
+    return WaitlistPromotionResponse(
+        promoted_member_ids=result.promoted_member_ids,
+        going_count=result.going_count,
+        waitlist_count=result.waitlist_count,
+    )
+
+
 @router.get(
     "/{event_id}/rsvps/{member_id}",
     response_model=schemas.RSVPRead,
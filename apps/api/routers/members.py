@@ -2,17 +2,22 @@ from __future__ import annotations
 
 from typing import Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import schemas
 from ..db import get_db
-from ..services import members_service
+from ..directory_schemas import DirectoryMemberPage
+from ..repositories.keyset import PageRequest
+from ..repositories.members import DirectoryViewer
+from ..services import directory_service
 from .auth import CurrentMember, require_member
 
 router = APIRouter(prefix="/members", tags=["members"])
 
+SortLiteral = Literal["recent", "cohort_desc", "cohort_asc", "name", "relevance"]
+
 
 class MemberListParams(BaseModel):
     limit: int = Field(10, ge=1, le=100)
@@ -24,15 +29,35 @@ class MemberListParams(BaseModel):
     industry: str | None = None
     region: str | None = None
     job_title: str | None = None
-    sort: Literal["recent", "cohort_desc", "cohort_asc", "name"] = "recent"
+    sort: SortLiteral = "recent"
 
 
-@router.get("/", response_model=list[schemas.DirectoryMemberRead])
-async def list_members(
-    params: MemberListParams = Depends(),
-    db: AsyncSession = Depends(get_db),
+class MemberPageParams(BaseModel):
+    limit: int = Field(10, ge=1, le=100)
+    cursor: str | None = Field(None, max_length=1024)
+    include_total: bool = False
+    q: str | None = None
+    cohort: int | None = None
+    major: str | None = None
+    company: str | None = None
+    industry: str | None = None
+    region: str | None = None
+    job_title: str | None = None
+    sort: SortLiteral = "recent"
+
+
+async def require_directory_viewer(
     current_member: CurrentMember = Depends(require_member),
-) -> list[schemas.DirectoryMemberRead]:
+) -> DirectoryViewer:
+    """인증 시 확인한 회원 id·기수를 조회자 컨텍스트로 전달한다."""
+    if current_member.id is None or current_member.cohort is None:
+        raise HTTPException(status_code=401, detail="unauthorized")
+    return DirectoryViewer(id=current_member.id, cohort=current_member.cohort)
+
+
+def _build_filters(
+    params: MemberListParams | MemberPageParams, sort: str | None = None
+) -> schemas.MemberListFilters:
     filters: schemas.MemberListFilters = {}
     if params.q:
         filters['q'] = params.q
@@ -48,14 +73,45 @@ async def list_members(
         filters['region'] = params.region
     if params.job_title:
         filters['job_title'] = params.job_title
-    if params.sort:
-        filters['sort'] = params.sort
-    return await members_service.list_directory_members(
+    if sort:
+        filters['sort'] = sort
+    return filters
+
+
+@router.get("/", response_model=list[schemas.DirectoryMemberRead])
+async def list_members(
+    params: MemberListParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    viewer: DirectoryViewer = Depends(require_directory_viewer),
+) -> list[schemas.DirectoryMemberRead]:
+    return await directory_service.list_directory_members(
         db,
         limit=params.limit,
         offset=params.offset,
-        filters=filters,
-        viewer_student_id=current_member.student_id,
+        filters=_build_filters(params, params.sort),
+        viewer=viewer,
+    )
+
+
+@router.get("/page", response_model=DirectoryMemberPage)
+async def list_members_page(
+    params: MemberPageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    viewer: DirectoryViewer = Depends(require_directory_viewer),
+) -> DirectoryMemberPage:
+    """커서 기반 동문 수첩 목록. 다음 요청에 next_cursor 를 그대로 전달한다.
+
+    include_total=true 면 전체 건수를 함께 반환해 /members/count 호출을 생략한다.
+    """
+    return await directory_service.list_directory_members_page(
+        db,
+        page=PageRequest(
+            limit=params.limit,
+            cursor=params.cursor,
+            include_total=params.include_total,
+        ),
+        filters=_build_filters(params, params.sort),
+        viewer=viewer,
     )
 
 
@@ -67,27 +123,12 @@ class MemberCount(BaseModel):
 async def count_members(
     params: MemberListParams = Depends(),
     db: AsyncSession = Depends(get_db),
-    current_member: CurrentMember = Depends(require_member),
+    viewer: DirectoryViewer = Depends(require_directory_viewer),
 ) -> MemberCount:
-    filters: schemas.MemberListFilters = {}
-    if params.q:
-        filters['q'] = params.q
-    if params.cohort is not None:
-        filters['cohort'] = int(params.cohort)
-    if params.major:
-        filters['major'] = params.major
-    if params.company:
-        filters['company'] = params.company
-    if params.industry:
-        filters['industry'] = params.industry
-    if params.region:
-        filters['region'] = params.region
-    if params.job_title:
-        filters['job_title'] = params.job_title
-    c = await members_service.count_directory_members(
+    c = await directory_service.count_directory_members(
         db,
-        filters=filters,
-        viewer_student_id=current_member.student_id,
+        filters=_build_filters(params),
+        viewer=viewer,
     )
     return MemberCount(count=c)
 
@@ -96,10 +137,10 @@ async def count_members(
 async def get_member(
     member_id: int,
     db: AsyncSession = Depends(get_db),
-    current_member: CurrentMember = Depends(require_member),
+    viewer: DirectoryViewer = Depends(require_directory_viewer),
 ) -> schemas.DirectoryMemberRead:
-    return await members_service.get_directory_member(
+    return await directory_service.get_directory_member(
         db,
         member_id=member_id,
-        viewer_student_id=current_member.student_id,
+        viewer=viewer,
     )
@@ -4,14 +4,16 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Annotated, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from slowapi import Limiter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.config import get_settings
 from apps.api.crypto_utils import is_push_encryption_effective
 from apps.api.db import get_db
+from apps.api.errors import NotFoundError
 from apps.api.ratelimit import consume_limit, get_client_ip_for_rate_limit
+from apps.api.repositories import jobs as jobs_repo
 from apps.api.repositories import notifications as subs_repo
 from apps.api.repositories import send_logs as logs_repo
 from apps.api.routers.auth import (
@@ -20,6 +22,7 @@ from apps.api.routers.auth import (
     require_member,
     require_permission,
 )
+from apps.api.services import jobs_service, scheduled_trigger_service
 from apps.api.services import notifications_service as notif_svc
 from apps.api.services import scheduled_notifications_service as sched_svc
 from apps.api.services.scheduled_notifications_service import KST
@@ -97,6 +100,16 @@ class SendPushPayload(BaseModel):
     title: str
     body: str
     url: str | None = None
+    # 대상 지정(모두 비우면 전체 발송). cohorts·member_ids 는 합집합,
+    # topic 은 그 주제를 끈 회원을 뺀다.
+    topic: str | None = Field(default=None, min_length=1, max_length=64)
+    cohorts: list[int] | None = Field(default=None, max_length=100)
+    member_ids: list[int] | None = Field(default=None, max_length=1000)
+
+
+class BroadcastJobAccepted(BaseModel):
+    job_id: int
+    status: str
 
 
 @router.post("/admin/notifications/send", status_code=202)
@@ -108,18 +121,71 @@ async def send_push(
     ],
     request: Request,
     db: AsyncSession = Depends(get_db),
-    provider: notif_svc.PushProvider = Depends(get_push_provider),
-) -> dict[str, int]:
+) -> BroadcastJobAccepted:
+    """전체·대상 지정 발송 작업을 큐에 넣고 바로 응답한다(발송은 백그라운드 워커)."""
     consume_limit(
         limiter_notifications,
         request,
         get_settings().rate_limit_notify_send,
     )
 
-    result = await notif_svc.send_to_all(
-        db, provider, title=_payload.title, body=_payload.body, url=_payload.url
+    job = await jobs_service.enqueue_broadcast(
+        db,
+        notif_svc.BroadcastMessage(
+            title=_payload.title,
+            body=_payload.body,
+            url=_payload.url,
+            target=subs_repo.SubscriptionTarget(
+                topic=_payload.topic,
+                cohorts=tuple(_payload.cohorts or ()),
+                member_ids=tuple(_payload.member_ids or ()),
+            ),
+        ),
+    )
+    return BroadcastJobAccepted(job_id=cast(int, job.id), status=cast(str, job.status))
+
+
+class BroadcastJobRead(BaseModel):
+    id: int
+    status: str
+    attempts: int
+    max_attempts: int
+    progress: dict[str, int] | None
+    accepted: int | None
+    failed: int | None
+    last_error: str | None
+    created_at: str
+    finished_at: str | None
+
+
+@router.get("/admin/notifications/jobs/{job_id}")
+async def get_broadcast_job(
+    job_id: int,
+    _admin: Annotated[
+        CurrentUser,
+        Depends(require_permission("admin_notifications", allow_admin_fallback=False)),
+    ],
+    db: AsyncSession = Depends(get_db),
+) -> BroadcastJobRead:
+    """전체 발송 작업의 상태·진행률 조회."""
+    job = await jobs_repo.get_job(db, job_id)
+    if cast(str, job.kind) != jobs_service.BROADCAST_PUSH:
+        raise NotFoundError(code="job_not_found", detail="Job not found")
+    result = cast(dict[str, int] | None, job.result) or {}
+    created_dt = cast(datetime | None, job.created_at)
+    finished_dt = cast(datetime | None, job.finished_at)
+    return BroadcastJobRead(
+        id=cast(int, job.id),
+        status=cast(str, job.status),
+        attempts=cast(int, job.attempts),
+        max_attempts=cast(int, job.max_attempts),
+        progress=cast(dict[str, int] | None, job.progress),
+        accepted=result.get("accepted"),
+        failed=result.get("failed"),
+        last_error=cast(str | None, job.last_error),
+        created_at=created_dt.isoformat() if created_dt else "",
+        finished_at=finished_dt.isoformat() if finished_dt else None,
     )
-    return {"accepted": result.accepted, "failed": result.failed}
 
 
 class SendLogRead(BaseModel):
@@ -185,7 +251,8 @@ async def get_stats(
     cutoff = datetime.now(UTC_TZ) - delta
 
     active = await subs_repo.count_active_subscriptions(db)
-    agg = await logs_repo.aggregate_since(db, cutoff=cutoff)
+    # 원본 로그 대신 시간별 집계 표를 읽는다(정시 단위, 비용이 발송량과 무관)
+    agg = await logs_repo.aggregate_hourly_since(db, cutoff=cutoff)
     settings = get_settings()
 
     return NotificationStats(
@@ -251,7 +318,7 @@ async def trigger_scheduled_notifications(
         target = datetime.now(KST).date()
 
     # 실제 발송 수행
-    result = await sched_svc.trigger_scheduled_notifications(
+    result = await scheduled_trigger_service.trigger_scheduled_notifications(
         db, provider, target_date=target
     )
 
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, File, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status as http_status
 
-from .. import schemas
+from .. import schemas, upload_ingest
 from ..db import get_db
 from ..services import members_service, profile_change_service
 from .auth import CurrentMember, require_member
@@ -42,14 +42,11 @@ async def upload_avatar(
     m: CurrentMember = Depends(require_member),
 ) -> schemas.MemberRead:
     row = await members_service.get_member_by_student_id(db, m.student_id)
-    file_bytes = await avatar.read()
-    await avatar.close()
-    updated = await members_service.update_member_avatar(
-        db,
-        member_id=cast(int, row.id),
-        file_bytes=file_bytes,
-        filename_hint=avatar.filename,
-    )
+    policy = upload_ingest.avatar_upload_policy()
+    async with upload_ingest.ingest_image(avatar, policy) as ingested:
+        updated = await members_service.update_member_avatar(
+            db, member_id=cast(int, row.id), image=ingested
+        )
     return schemas.MemberRead.model_validate(updated)
 
 
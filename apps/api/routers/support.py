@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import logging
+import hashlib
 import re
 import time
-from datetime import UTC, datetime
-from pathlib import Path
+from collections import OrderedDict
 
 from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel, Field
@@ -21,16 +20,54 @@ from ..routers.auth import (
     require_member,
     require_permission,
 )
+from ..support_log import format_support_entry, get_support_log
 
 router = APIRouter(prefix="/support", tags=["support"])
 limiter = Limiter(key_func=get_client_ip_for_rate_limit)
 
-# 최근 중복/쿨다운 체크(간단 메모리)
-_recent: dict[str, tuple[float, str]] = {}
 _COOLDOWN_SEC = 60.0
+# 쿨다운 추적 상한(식별자 수). 넘치면 가장 오래 갱신되지 않은 항목부터 버린다.
+_RECENT_MAX_ENTRIES = 10_000
 _BLOCKLIST = re.compile(r"(viagra|casino|loan|bet|bitcoin|crypto|porn)", re.I)
 
 
+class RecentSubmissions:
+    """식별자별 최근 접수 지문을 TTL·개수 상한 안에서만 기억한다.
+
+    갱신 순서대로 OrderedDict 끝에 두므로 앞쪽부터 만료 항목을 걷어 내면 되고,
+    본문 대신 16바이트 해시만 보관해 항목당 메모리도 고정된다.
+    """
+
+    def __init__(self, *, ttl: float, max_entries: int) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seen(self, ident: str, content: str, *, now: float) -> bool:
+        """ttl 안에 같은 내용이 접수됐으면 True. 어느 쪽이든 시각을 갱신한다."""
+        self._evict_expired(now)
+        fingerprint = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        previous = self._entries.pop(ident, None)
+        self._entries[ident] = (now, fingerprint)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return previous is not None and previous[1] == fingerprint
+
+    def _evict_expired(self, now: float) -> None:
+        while self._entries:
+            ident, (seen_at, _fingerprint) = next(iter(self._entries.items()))
+            if now - seen_at < self._ttl:
+                return
+            del self._entries[ident]
+
+
+# 최근 중복/쿨다운 체크(프로세스 메모리, 상한 있음)
+_recent = RecentSubmissions(ttl=_COOLDOWN_SEC, max_entries=_RECENT_MAX_ENTRIES)
+
+
 class ContactPayload(BaseModel):
     subject: str = Field(min_length=3, max_length=120)
     body: str = Field(min_length=10, max_length=10_000)
@@ -58,12 +95,8 @@ async def contact(
     email = getattr(_m, "email", "") or ""
     ident = f"{host}|{email}"
     h = f"{payload.subject}\n{payload.body}"
-    now = time.monotonic()
-    t_prev, h_prev = _recent.get(ident, (0.0, ""))
-    if h_prev == h and (now - t_prev) < _COOLDOWN_SEC:
-        _recent[ident] = (now, h)
+    if _recent.seen(ident, h, now=time.monotonic()):
         return {"status": "accepted"}
-    _recent[ident] = (now, h)
 
     # DB 티켓 저장
     await tickets_repo.create_ticket(
@@ -77,28 +110,10 @@ async def contact(
         },
     )
 
-    # 개발 단계: 파일 로그로 보관(간단 로테이션)
-    logs_dir = Path("logs")
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now(UTC).isoformat()
-    line = (
-        f"{ts}\t{payload.subject}\t{payload.contact or ''}\n{payload.body}\n---\n"
-    )
-    log_path = logs_dir / "support.log"
-    try:
-        if log_path.exists() and log_path.stat().st_size > 1 * 1024 * 1024:
-            backup = logs_dir / "support.log.1"
-            if backup.exists():
-                backup.unlink()
-            log_path.replace(backup)
-    except (OSError, PermissionError) as e:
-        logging.getLogger(__name__).warning("support.log rotation failed: %s", e)
-    prev = (
-        log_path.read_text(encoding="utf-8", errors="ignore")
-        if log_path.exists()
-        else ""
+    # 파일 로그 보관: 큐에 넣기만 하고 append·로테이션은 백그라운드 스레드에서
+    get_support_log().write(
+        format_support_entry(payload.subject, payload.contact, payload.body)
     )
-    log_path.write_text(prev + line, encoding="utf-8")
     return {"status": "accepted"}
 
 
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-import io
-import secrets
-import time
 from pathlib import Path
+from typing import cast
 
 from fastapi import APIRouter, Depends, UploadFile
-from PIL import Image, UnidentifiedImageError
-from PIL.Image import DecompressionBombError
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from .. import upload_ingest
 from ..config import get_settings
+from ..db import get_db
 from ..errors import ApiError
+from ..media_utils import MediaVariant, build_srcset
+from ..services import media_service
 from .auth import CurrentMember, require_member
 
 router = APIRouter(prefix="/uploads", tags=["uploads"])
@@ -27,26 +28,14 @@ class ImageUploadResponse(BaseModel):
 
     url: str
     filename: str
-
-
-def _resize_image_if_needed(img: Image.Image, max_pixels: int) -> Image.Image:
-    """이미지가 max_pixels보다 크면 리사이즈."""
-    width, height = img.size
-    if width <= max_pixels and height <= max_pixels:
-        return img
-    if width > height:
-        new_width = max_pixels
-        new_height = int(height * (max_pixels / width))
-    else:
-        new_height = max_pixels
-        new_width = int(width * (max_pixels / height))
-    new_size: tuple[int, int] = (new_width, new_height)
-    return img.resize(new_size, Image.Resampling.LANCZOS)
+    # 형식(webp/avif)별 srcset 문자열
+    srcset: dict[str, str] = Field(default_factory=dict)
 
 
 @router.post("/images", response_model=ImageUploadResponse)
 async def upload_image(
     file: UploadFile,
+    db: AsyncSession = Depends(get_db),
     _member: CurrentMember = Depends(require_member),
 ) -> ImageUploadResponse:
     """이미지 파일 업로드.
@@ -56,6 +45,8 @@ async def upload_image(
     - 최대 크기: 5MB (설정 가능)
     - 자동 리사이즈: 1920px 이하로 조정
     - GIF: 애니메이션은 첫 프레임만 저장 (정지 이미지로 변환)
+    - 반응형 변형: IMAGE_VARIANT_WIDTHS 폭별 WebP/AVIF 를 함께 저장 (srcset)
+    - 파일명: 출력 바이트 SHA-256 (같은 이미지는 한 파일로 중복 제거)
     """
     settings = get_settings()
 
@@ -78,61 +69,16 @@ async def upload_image(
             status=422,
         )
 
-    # 파일 읽기 및 크기 검증
-    file_bytes = await file.read()
-    if len(file_bytes) > settings.image_max_upload_bytes:
-        max_mb = settings.image_max_upload_bytes / 1_000_000
-        raise ApiError(
-            code="image_too_large",
-            detail=f"이미지 크기가 {max_mb:.1f}MB를 초과했습니다.",
-            status=422,
-        )
-
-    # 이미지 로드 및 리사이즈
-    try:
-        img = Image.open(io.BytesIO(file_bytes))
-        img.load()  # 이미지 유효성 검증
-    except (
-        UnidentifiedImageError,
-        DecompressionBombError,
-        OSError,
-        SyntaxError,
-        ValueError,
-    ) as exc:
-        raise ApiError(
-            code="invalid_image_data",
-            detail="이미지 파일을 읽을 수 없습니다.",
-            status=422,
-        ) from exc
-
-    img = _resize_image_if_needed(img, settings.image_max_pixels)
-
-    # 저장 경로 설정
-    media_root = Path(settings.media_root)
-    storage_dir = media_root / "images"
-    storage_dir.mkdir(parents=True, exist_ok=True)
-
-    # 파일명 생성 (충돌 방지)
-    timestamp = int(time.time())
-    random_hex = secrets.token_hex(8)
-    new_filename = f"{timestamp}_{random_hex}{ext}"
-    file_path = storage_dir / new_filename
-
-    # 저장 (형식별 처리)
-    if ext == ".gif":
-        # GIF: 애니메이션 보존을 위해 리사이즈된 첫 프레임만 저장
-        img.save(file_path, format="GIF", optimize=True)
-    elif ext in {".png", ".webp"}:
-        # PNG/WebP: 투명도 유지
-        img.save(file_path, quality=85, optimize=True)
-    else:
-        # JPEG: RGB 변환 필수
-        if img.mode in ("RGBA", "P"):
-            img = img.convert("RGB")
-        img.save(file_path, format="JPEG", quality=85, optimize=True)
-
-    # URL 반환
-    relative_path = f"images/{new_filename}"
-    url = f"{settings.media_url_base}/{relative_path}"
-
-    return ImageUploadResponse(url=url, filename=new_filename)
+    # 청크 단위 수집: 크기 상한·매직 바이트·헤더 해상도를 디코딩 전에 검증
+    # 디코딩·리사이즈·인코딩·변형 생성은 프로세스 풀에서 (이벤트 루프 차단 방지)
+    policy = upload_ingest.image_upload_policy()
+    # 같은 원본을 다시 올리면 처리 없이 기존 파일을 재사용한다(콘텐츠 해시 파일명)
+    async with upload_ingest.ingest_image(file, policy) as ingested:
+        asset = await media_service.store_post_image(db, ingested, ext=ext)
+
+    relative_path = cast(str, asset.path)
+    return ImageUploadResponse(
+        url=f"{settings.media_url_base}/{relative_path}",
+        filename=Path(relative_path).name,
+        srcset=build_srcset(cast(list[MediaVariant], asset.variants)),
+    )
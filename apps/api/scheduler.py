@@ -1,26 +1,29 @@
 """APScheduler 기반 예약 알림 스케줄러.
 
-주의사항 (다중 워커 환경):
-- uvicorn --workers N 으로 다중 워커 실행 시, 각 워커마다 스케줄러가 시작됨
-- 중복 발송 방지를 위해:
-  1. 다중 워커 환경에서는 하나의 워커만 SCHEDULER_ENABLED=true로 설정
-  2. 또는 단일 워커(--workers 1)로 실행
-  3. 또는 스케줄러를 별도 프로세스로 분리 (권장)
-- ON CONFLICT DO NOTHING으로 동시 삽입은 방지되나, 불필요한 중복 작업이 발생할 수 있음
+다중 워커 환경:
+- 예약 알림·stale sweep·미디어 GC·발송 로그 파티션 관리·죽은 구독 해지는
+  클러스터에서 한 번만 돌면 되는 잡이다. 프로세스마다 등록하되 멈춘 상태로
+  두고, PostgreSQL advisory lock 으로 뽑힌 leader 만 재개한다(scheduler_leader).
+  leader 가 죽으면 다른 프로세스가 넘겨받는다.
+- 예약 게시글 공개 tick 은 프로세스 메모리의 가시성 버전을 올리므로 웹 워커마다 돈다.
+- SCHEDULER_IN_WORKER=true 면 leader 잡은 웹 대신 `python -m apps.api.worker` 에서 돈다.
 """
 
 from __future__ import annotations
 
 import logging
-import os
-from datetime import timedelta, timezone
+from datetime import datetime, timedelta, timezone
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from . import publication_clock, scheduler_leader
 from .config import get_settings
 from .db import AsyncSessionLocal
+from .repositories import send_log_partitions, send_logs
+from .services import media_service, scheduled_trigger_service, subscription_health
 from .services import scheduled_notifications_service as sched_svc
 from .services.notifications_service import PyWebPushProvider
 
@@ -38,7 +41,9 @@ async def process_scheduled_notifications() -> None:
 
     async with AsyncSessionLocal() as db:
         provider = PyWebPushProvider()
-        result = await sched_svc.trigger_scheduled_notifications(db, provider)
+        result = await scheduled_trigger_service.trigger_scheduled_notifications(
+            db, provider
+        )
 
         logger.info(
             f"예약 알림 처리 완료: total={result.total_events}, "
@@ -55,34 +60,92 @@ async def reclaim_stale_scheduled_notifications() -> None:
             logger.info("stale 예약 로그 sweep 완료: count=%s", reclaimed)
 
 
-def start_scheduler() -> None:
-    """스케줄러 시작.
+async def collect_media_garbage() -> None:
+    """참조가 끊긴 업로드 미디어 정리 (매일 04:30 KST 실행)."""
+    async with AsyncSessionLocal() as db:
+        result = await media_service.collect_media_garbage(db)
+    if result.assets_deleted or result.files_deleted:
+        logger.info(
+            "미디어 GC 완료: assets=%s, files=%s, bytes=%s",
+            result.assets_deleted,
+            result.files_deleted,
+            result.bytes_freed,
+        )
 
-    다중 워커 환경에서는 단일 워커에서만 SCHEDULER_ENABLED=true로 설정해야 함.
-    """
-    settings = get_settings()
 
-    # 스케줄러 비활성화 옵션 확인 (기본: 활성화)
-    if not getattr(settings, "scheduler_enabled", True):
-        logger.info("스케줄러 비활성화됨 (SCHEDULER_ENABLED=false)")
+async def maintain_send_log_partitions() -> None:
+    """발송 로그 월 파티션 생성·보존 기간 정리 (매일 03:10 KST 실행)."""
+    retention_days = get_settings().notification_log_retention_days
+    async with AsyncSessionLocal() as db:
+        created = await send_log_partitions.ensure_partitions(db)
+        pruned = (
+            await send_logs.prune_older_than_days(db, days=retention_days)
+            if retention_days
+            else 0
+        )
+    if created or pruned:
+        logger.info("발송 로그 파티션 정리: created=%s, pruned=%s", created, pruned)
+
+
+async def sweep_dead_push_subscriptions() -> None:
+    """오래 실패만 쌓인 Push 구독 해지 (매일 03:20 KST 실행)."""
+    async with AsyncSessionLocal() as db:
+        revoked = await subscription_health.sweep_dead_subscriptions(db)
+    if revoked:
+        logger.info("죽은 Push 구독 해지: count=%s", revoked)
+
+
+def _schedule_publication_tick(run_at: datetime) -> None:
+    """다음 예약 공개 시각에 1회성 tick job을 (재)등록한다."""
+    scheduler = _state["scheduler"]
+    if scheduler is None:
         return
+    scheduler.add_job(
+        tick_post_publication,
+        trigger=DateTrigger(run_date=run_at),
+        id="post_publication_tick",
+        name="예약 게시글 공개 시각 도래",
+        misfire_grace_time=300,
+        replace_existing=True,
+    )
 
-    # 다중 워커 경고 (uvicorn의 WEB_CONCURRENCY 확인)
-    workers = os.environ.get("WEB_CONCURRENCY")
-    if workers and int(workers) > 1:
-        logger.warning(
-            f"다중 워커 환경에서 스케줄러 실행 감지 (workers={workers}). "
-            "중복 작업 방지를 위해 단일 워커에서만 SCHEDULER_ENABLED=true 설정 권장."
-        )
 
-    scheduler = AsyncIOScheduler(timezone=KST)
+async def sync_post_publication_clock() -> None:
+    """다음 예약 공개 시각을 DB 기준으로 재동기화한다.
+
+    다른 워커에서 등록된 예약 게시글도 주기적으로 반영한다.
+    """
+    async with AsyncSessionLocal() as db:
+        next_at = await publication_clock.refresh_next_publication(db)
+    if next_at is not None:
+        _schedule_publication_tick(next_at)
 
+
+async def tick_post_publication() -> None:
+    """예약 게시글 공개 시각 도래: 가시성 버전을 올리고 다음 시각을 예약한다."""
+    publication_clock.bump_visibility_version("scheduled_publication")
+    await sync_post_publication_clock()
+
+
+# 클러스터에서 leader 한 프로세스만 실행하는 잡
+LEADER_JOB_IDS = (
+    "scheduled_notifications",
+    "scheduled_notification_stale_sweep",
+    "media_gc",
+    "send_log_partitions",
+    "push_subscription_health",
+)
+
+
+def _add_leader_jobs(scheduler: AsyncIOScheduler) -> None:
+    """leader 잡은 멈춘 상태(next_run_time=None)로 등록하고 선출 시 재개한다."""
     # 매일 09:00 KST에 실행
     scheduler.add_job(
         process_scheduled_notifications,
         trigger=CronTrigger(hour=9, minute=0),
         id="scheduled_notifications",
         name="D-3/D-1 이벤트 알림 발송",
+        next_run_time=None,
         replace_existing=True,
     )
     scheduler.add_job(
@@ -90,16 +153,107 @@ def start_scheduler() -> None:
         trigger=IntervalTrigger(minutes=5),
         id="scheduled_notification_stale_sweep",
         name="예약 알림 stale 로그 sweep",
+        next_run_time=None,
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        collect_media_garbage,
+        trigger=CronTrigger(hour=4, minute=30),
+        id="media_gc",
+        name="참조 없는 업로드 미디어 정리",
+        next_run_time=None,
         replace_existing=True,
     )
+    scheduler.add_job(
+        maintain_send_log_partitions,
+        trigger=CronTrigger(hour=3, minute=10),
+        id="send_log_partitions",
+        name="발송 로그 월 파티션 생성·보존 정리",
+        next_run_time=None,
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        sweep_dead_push_subscriptions,
+        trigger=CronTrigger(hour=3, minute=20),
+        id="push_subscription_health",
+        name="오래 실패한 Push 구독 해지",
+        next_run_time=None,
+        replace_existing=True,
+    )
+
+
+def _add_publication_jobs(scheduler: AsyncIOScheduler) -> None:
+    # 시작 직후 1회 + 10분 주기로 다음 예약 공개 시각을 재동기화
+    scheduler.add_job(
+        sync_post_publication_clock,
+        trigger=IntervalTrigger(minutes=10),
+        id="post_publication_sync",
+        name="예약 게시글 공개 시각 동기화",
+        next_run_time=datetime.now(KST),
+        replace_existing=True,
+    )
+
+
+def _resume_leader_jobs() -> None:
+    scheduler = _state["scheduler"]
+    if scheduler is None:
+        return
+    for job_id in LEADER_JOB_IDS:
+        scheduler.resume_job(job_id)
+    logger.info("leader 잡 재개: %s", ", ".join(LEADER_JOB_IDS))
+
+
+def _pause_leader_jobs() -> None:
+    scheduler = _state["scheduler"]
+    if scheduler is None:
+        return
+    for job_id in LEADER_JOB_IDS:
+        scheduler.pause_job(job_id)
+    logger.info("leader 잡 중지: %s", ", ".join(LEADER_JOB_IDS))
+
+
+def start_scheduler(*, in_worker: bool = False) -> None:
+    """스케줄러 시작.
+
+    in_worker 는 호출한 프로세스가 백그라운드 워커인지 여부다. leader 잡은
+    SCHEDULER_IN_WORKER 와 일치하는 쪽에서만 선출에 참여하고, 예약 공개 tick 은
+    웹 프로세스에서만 돈다.
+    """
+    settings = get_settings()
+
+    # 스케줄러 비활성화 옵션 확인 (기본: 활성화)
+    if not getattr(settings, "scheduler_enabled", True):
+        logger.info("스케줄러 비활성화됨 (SCHEDULER_ENABLED=false)")
+        return
+    run_leader_jobs = settings.scheduler_in_worker == in_worker
+    run_publication_jobs = not in_worker
+    if not (run_leader_jobs or run_publication_jobs):
+        logger.info("스케줄러는 다른 프로세스에서 실행 (SCHEDULER_IN_WORKER)")
+        return
+
+    scheduler = AsyncIOScheduler(timezone=KST)
+    if run_leader_jobs:
+        _add_leader_jobs(scheduler)
+    if run_publication_jobs:
+        _add_publication_jobs(scheduler)
 
     scheduler.start()
     _state["scheduler"] = scheduler
-    logger.info("스케줄러 시작됨 (매일 09:00 KST + 5분 stale sweep)")
+    if run_publication_jobs:
+        publication_clock.set_publication_waker(_schedule_publication_tick)
+    if run_leader_jobs:
+        scheduler_leader.start_election(_resume_leader_jobs, _pause_leader_jobs)
+    logger.info(
+        "스케줄러 시작됨 (leader 선출: %s, 예약 공개 tick: %s)",
+        run_leader_jobs,
+        run_publication_jobs,
+    )
 
 
-def shutdown_scheduler() -> None:
-    """스케줄러 종료."""
+async def shutdown_scheduler() -> None:
+    """스케줄러 종료. leader 였다면 잠금을 풀어 다른 프로세스가 바로 넘겨받게 한다."""
+    await scheduler_leader.stop_election()
+    publication_clock.set_publication_waker(None)
     scheduler = _state["scheduler"]
     if scheduler is not None:
         scheduler.shutdown(wait=False)
@@ -0,0 +1,224 @@
+"""스케줄러 leader 선출 — PostgreSQL advisory lock.
+
+uvicorn 워커(또는 노드)가 여러 개여도 예약 알림·stale sweep·미디어 GC 같은
+클러스터 단일 잡은 advisory lock 을 쥔 프로세스 하나만 실행한다.
+
+- 각 프로세스는 전용 커넥션(NullPool)으로 `pg_try_advisory_lock` 을 주기적으로 시도한다.
+- 잠금은 세션 수준이라 커넥션이 살아 있는 동안 유지되고, leader 프로세스가 죽으면
+  PostgreSQL 이 커넥션과 함께 풀어 다음 시도에서 다른 프로세스가 넘겨받는다.
+- leader 는 같은 주기로 커넥션을 확인하고, 끊기면 즉시 잡을 멈춘다(양쪽 동시 실행 방지).
+- leader 커넥션의 application_name 에 식별자를 실어 두어, 다른 프로세스도
+  pg_locks/pg_stat_activity 로 현재 leader 를 알 수 있다(헬스 출력용).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_lock(bigint) 키. 2^31 미만이라 pg_locks 에서 classid=0, objid=키.
+SCHEDULER_LEADER_LOCK_KEY = 0x736F6765
+LEADER_APPLICATION_PREFIX = "sogecon-scheduler:"
+ELECTION_INTERVAL_SECONDS = 15.0
+
+_CURRENT_LEADER_SQL = text(
+    "SELECT a.application_name FROM pg_locks l "
+    "JOIN pg_stat_activity a ON a.pid = l.pid "
+    "WHERE l.locktype = 'advisory' AND l.granted "
+    "AND l.classid = 0 AND l.objid = :key AND l.objsubid = 1 "
+    "LIMIT 1"
+)
+
+LeadershipCallback = Callable[[], None]
+
+
+@dataclass
+class LeaderStatus:
+    """현재 프로세스 기준 leader 선출 상태."""
+
+    role: str  # "leader" | "follower" | "disabled"
+    identity: str
+    leader: str | None = None
+    leader_since: datetime | None = None
+
+
+def process_identity() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+# 모듈 상태 (global 문 대신 dict 사용)
+_status: dict[str, LeaderStatus] = {
+    "status": LeaderStatus(role="disabled", identity=process_identity())
+}
+_conn: dict[str, AsyncConnection | None] = {"conn": None}
+_engine: dict[str, AsyncEngine | None] = {"engine": None}
+_task: dict[str, asyncio.Task[None] | None] = {"task": None}
+
+
+def leader_status() -> LeaderStatus:
+    return _status["status"]
+
+
+def is_leader() -> bool:
+    return _status["status"].role == "leader"
+
+
+def health_snapshot() -> dict[str, str | None]:
+    """헬스 출력용 요약 (DB 조회 없이 마지막 선출 주기 기준)."""
+    status = _status["status"]
+    since = status.leader_since
+    return {
+        "role": status.role,
+        "identity": status.identity,
+        "leader": status.leader,
+        "leader_since": since.isoformat() if since else None,
+    }
+
+
+async def _current_leader(conn: AsyncConnection) -> str | None:
+    name = (
+        await conn.execute(_CURRENT_LEADER_SQL, {"key": SCHEDULER_LEADER_LOCK_KEY})
+    ).scalar_one_or_none()
+    if not name:
+        return None
+    return str(name).removeprefix(LEADER_APPLICATION_PREFIX)
+
+
+async def _try_acquire(
+    engine: AsyncEngine, identity: str
+) -> tuple[AsyncConnection | None, str | None]:
+    """잠금을 시도한다. 실패하면 커넥션을 닫고 현재 leader 식별자를 돌려준다."""
+    conn = await engine.connect()
+    try:
+        await conn.execute(
+            text("SELECT set_config('application_name', :name, false)"),
+            {"name": f"{LEADER_APPLICATION_PREFIX}{identity}"[:63]},
+        )
+        locked = bool(
+            (
+                await conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": SCHEDULER_LEADER_LOCK_KEY},
+                )
+            ).scalar_one()
+        )
+        leader = identity if locked else await _current_leader(conn)
+        # 세션 잠금은 커밋과 무관하다. idle in transaction 으로 남지 않게 닫는다.
+        await conn.commit()
+    except (SQLAlchemyError, OSError):
+        # 커넥션을 닫으면 잡았던 잠금도 함께 풀린다.
+        await conn.close()
+        raise
+    if locked:
+        return conn, leader
+    await conn.close()
+    return None, leader
+
+
+async def _release(conn: AsyncConnection) -> None:
+    with contextlib.suppress(SQLAlchemyError, OSError):
+        await conn.execute(
+            text("SELECT pg_advisory_unlock(:key)"),
+            {"key": SCHEDULER_LEADER_LOCK_KEY},
+        )
+        await conn.commit()
+    with contextlib.suppress(SQLAlchemyError, OSError):
+        await conn.close()
+
+
+async def _elect_once(
+    engine: AsyncEngine,
+    on_elected: LeadershipCallback,
+    on_deposed: LeadershipCallback,
+) -> None:
+    """한 주기: follower 면 잠금을 시도하고, leader 면 커넥션을 확인한다."""
+    status = _status["status"]
+    conn = _conn["conn"]
+    if conn is None:
+        conn, status.leader = await _try_acquire(engine, status.identity)
+        if conn is None:
+            status.role = "follower"
+            return
+        _conn["conn"] = conn
+        status.role = "leader"
+        status.leader = status.identity
+        status.leader_since = datetime.now(UTC)
+        logger.info("스케줄러 leader 획득: %s", status.identity)
+        on_elected()
+        return
+    try:
+        await conn.execute(text("SELECT 1"))
+        await conn.commit()
+    except (SQLAlchemyError, OSError):
+        logger.warning("스케줄러 leader 커넥션 끊김: 잡 중지 후 재선출")
+        _conn["conn"] = None
+        status.role = "follower"
+        status.leader = None
+        status.leader_since = None
+        on_deposed()
+        await _release(conn)
+
+
+async def _election_loop(
+    engine: AsyncEngine,
+    on_elected: LeadershipCallback,
+    on_deposed: LeadershipCallback,
+    interval: float,
+) -> None:
+    while True:
+        try:
+            await _elect_once(engine, on_elected, on_deposed)
+        except (SQLAlchemyError, OSError):
+            logger.warning("스케줄러 leader 선출 시도 실패", exc_info=True)
+        await asyncio.sleep(interval)
+
+
+def start_election(
+    on_elected: LeadershipCallback,
+    on_deposed: LeadershipCallback,
+    *,
+    interval: float = ELECTION_INTERVAL_SECONDS,
+) -> None:
+    """실행 중인 이벤트 루프에 선출 루프를 띄운다(첫 시도는 즉시)."""
+    if _task["task"] is not None:
+        return
+    engine = create_async_engine(get_settings().database_url, poolclass=NullPool)
+    _engine["engine"] = engine
+    _status["status"] = LeaderStatus(role="follower", identity=process_identity())
+    _task["task"] = asyncio.get_running_loop().create_task(
+        _election_loop(engine, on_elected, on_deposed, interval)
+    )
+
+
+async def stop_election() -> None:
+    """선출 루프를 멈추고, leader 였다면 잠금을 바로 풀어 넘겨준다."""
+    task = _task["task"]
+    _task["task"] = None
+    if task is not None:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    conn = _conn["conn"]
+    _conn["conn"] = None
+    if conn is not None:
+        await _release(conn)
+    engine = _engine["engine"]
+    _engine["engine"] = None
+    if engine is not None:
+        await engine.dispose()
+    _status["status"] = LeaderStatus(role="disabled", identity=process_identity())
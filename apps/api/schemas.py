@@ -15,11 +15,14 @@ from pydantic import (
     field_validator,
 )
 
+from . import hero_schemas as _hero
 from .config import get_settings
 from .directory_schemas import DirectoryMemberRead as _DirectoryMemberRead
 from .media_utils import (
+    MediaVariant,
     build_media_url,
     build_media_urls,
+    build_srcset,
     normalize_media_path,
     normalize_media_paths,
 )
@@ -27,9 +30,17 @@ from .post_visibility import PostCategoryLiteral
 
 VisibilityLiteral = Literal["all", "cohort", "private"]
 DirectoryMemberRead = _DirectoryMemberRead
+HeroItemBase = _hero.HeroItemBase
+HeroItemCreate = _hero.HeroItemCreate
+HeroItemRead = _hero.HeroItemRead
+HeroItemUpdate = _hero.HeroItemUpdate
+HeroSlide = _hero.HeroSlide
+HeroTargetLookupItem = _hero.HeroTargetLookupItem
+HeroTargetLookupRequest = _hero.HeroTargetLookupRequest
+HeroTargetLookupResponse = _hero.HeroTargetLookupResponse
+HeroTargetTypeLiteral = _hero.HeroTargetTypeLiteral
 RSVPLiteral = Literal["going", "waitlist", "cancel"]
 EventStatusLiteral = Literal["upcoming", "ongoing", "ended"]
-HeroTargetTypeLiteral = Literal["post", "event"]
 MemberStatusLiteral = Literal["pending", "active", "suspended", "rejected"]
 SignupRequestStatusLiteral = Literal["pending", "approved", "rejected", "activated"]
 SignupActivationIssueTypeLiteral = Literal["approve", "reissue"]
@@ -361,6 +372,10 @@ class PostRead(PostBase):
     created_at: datetime | None
     view_count: int = 0
     comment_count: int = 0  # 댓글 수 (집계 결과)
+    # 대표 이미지 반응형 변형: 형식(webp/avif)별 srcset 문자열
+    cover_image_srcset: dict[str, str] = Field(
+        default_factory=dict, validation_alias="cover_image_variants"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -374,6 +389,13 @@ class PostRead(PostBase):
     def _build_images(cls, value: list[str] | None) -> list[str] | None:
         return build_media_urls(value)
 
+    @field_validator("cover_image_srcset", mode="before")
+    @classmethod
+    def _build_cover_image_srcset(
+        cls, value: list[MediaVariant] | None
+    ) -> dict[str, str]:
+        return build_srcset(value)
+
 
 class CommentBase(BaseModel):
     content: str
@@ -438,93 +460,6 @@ class EventUpdate(BaseModel):
     capacity: int | None = None
 
 
-class HeroItemBase(BaseModel):
-    """홈 히어로 배너 슬롯(추천) 기본 스키마."""
-
-    target_type: HeroTargetTypeLiteral
-    target_id: int
-    enabled: bool = True
-    pinned: bool = False
-    title_override: str | None = None
-    description_override: str | None = None
-    image_override: str | None = None
-
-
-class HeroItemCreate(HeroItemBase):
-    @field_validator("image_override", mode="before")
-    @classmethod
-    def _normalize_image_override(cls, value: str | None) -> str | None:
-        return normalize_media_path(value)
-
-
-class HeroItemUpdate(BaseModel):
-    """히어로 배너 슬롯 부분 업데이트 스키마."""
-
-    target_type: HeroTargetTypeLiteral | None = None
-    target_id: int | None = None
-    enabled: bool | None = None
-    pinned: bool | None = None
-    title_override: str | None = None
-    description_override: str | None = None
-    image_override: str | None = None
-
-    @field_validator("image_override", mode="before")
-    @classmethod
-    def _normalize_image_override(cls, value: str | None) -> str | None:
-        return normalize_media_path(value)
-
-
-class HeroItemRead(HeroItemBase):
-    id: int
-    created_at: datetime
-    updated_at: datetime
-
-    model_config = ConfigDict(from_attributes=True)
-
-    @field_validator("image_override", mode="before")
-    @classmethod
-    def _build_image_override(cls, value: str | None) -> str | None:
-        return build_media_url(value)
-
-
-class HeroSlide(BaseModel):
-    """홈 히어로 캐러셀용 응답(대상 resolve 포함)."""
-
-    id: int
-    target_type: HeroTargetTypeLiteral
-    target_id: int
-    title: str
-    description: str
-    image: str | None = None
-    href: str
-    unpublished: bool = False
-
-    @field_validator("image", mode="before")
-    @classmethod
-    def _build_image(cls, value: str | None) -> str | None:
-        return build_media_url(value)
-
-
-class HeroTargetLookupRequest(BaseModel):
-    """관리자용: 대상(게시글/행사) ID 목록으로 hero_item 상태 조회."""
-
-    target_type: HeroTargetTypeLiteral
-    target_ids: list[int]
-
-
-class HeroTargetLookupItem(BaseModel):
-    """관리자용: 대상별 hero_item 요약."""
-
-    target_id: int
-    hero_item_id: int
-    enabled: bool
-    pinned: bool
-
-
-class HeroTargetLookupResponse(BaseModel):
-    items: list[HeroTargetLookupItem]
-
-
 class RSVPBase(BaseModel):
     member_id: int
     event_id: int
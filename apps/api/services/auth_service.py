@@ -19,7 +19,7 @@ from .. import models
 from ..config import get_settings
 from ..db import get_db
 from ..errors import ApiError, NotFoundError
-from ..passwords import hash_password, verify_password
+from ..passwords import hash_password_async, verify_password_async
 from ..ratelimit import consume_limit, get_client_ip_for_rate_limit
 from ..repositories import auth as auth_repo
 from ..repositories import members as members_repo
@@ -48,9 +48,10 @@ class CurrentAdmin:
 
 @dataclass
 class CurrentMember:
-    """멤버 세션 정보."""
+    """멤버 세션 정보. cohort 는 요청 시점 DB 값(동문 수첩 공개 범위 판단용)."""
     student_id: str
     id: int | None = None
+    cohort: int | None = None
 
 
 @dataclass
@@ -283,7 +284,7 @@ async def require_member(
     """
     user = _get_user_session(req)
     if user is not None:
-        user, _member = await _refresh_user_session(db, req, user)
+        user, member = await _refresh_user_session(db, req, user)
         if not (
             "member" in user.roles
             or "admin" in user.roles
@@ -293,6 +294,7 @@ async def require_member(
         return CurrentMember(
             student_id=user.student_id,
             id=user.id if isinstance(user.id, int) else None,
+            cohort=cast(int, member.cohort),
         )
     raise HTTPException(status_code=401, detail="unauthorized")
 
@@ -320,7 +322,7 @@ async def login_member(
     member, creds = await auth_repo.get_member_with_auth_by_student_id(db, student_id)
     if member is None or creds is None:
         raise ApiError(code="login_failed", detail="login_failed", status=401)
-    if not verify_password(password, cast(str, creds.password_hash)):
+    if not await verify_password_async(password, cast(str, creds.password_hash)):
         raise ApiError(code="login_failed", detail="login_failed", status=401)
     if cast(str, member.status) == "pending":
         raise ApiError(
@@ -366,7 +368,7 @@ async def activate_member(
     member = await resolve_activation_member(db, payload.student_id)
 
     # 비밀번호 해시 생성 및 저장
-    pwd_hash = hash_password(password)
+    pwd_hash = await hash_password_async(password)
     await auth_repo.create_or_update_member_auth(
         db,
         member_id=cast(int, member.id),
@@ -403,10 +405,12 @@ async def change_member_password(
 
     if auth_row is None:
         raise HTTPException(status_code=401, detail="unauthorized")
-    if not verify_password(current_password, cast(str, auth_row.password_hash)):
+    if not await verify_password_async(
+        current_password, cast(str, auth_row.password_hash)
+    ):
         raise HTTPException(status_code=401, detail="login_failed")
 
-    new_hash = hash_password(new_password)
+    new_hash = await hash_password_async(new_password)
     await auth_repo.update_member_auth_password(db, auth_row, new_hash)
     return {"ok": "true"}
 
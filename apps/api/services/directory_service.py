@@ -0,0 +1,83 @@
+"""동문 수첩(회원 전용 디렉터리) 조회 서비스.
+
+조회자별 공개 범위가 즉시 반영되어야 하므로 관리자용 집계 캐시를 쓰지 않는다.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import schemas
+from ..directory_schemas import DirectoryMemberPage
+from ..repositories import keyset
+from ..repositories import members as members_repo
+from ..repositories.members import DirectoryViewer
+
+
+async def list_directory_members(
+    db: AsyncSession,
+    *,
+    limit: int,
+    offset: int,
+    filters: schemas.MemberListFilters,
+    viewer: DirectoryViewer,
+) -> list[schemas.DirectoryMemberRead]:
+    members = await members_repo.list_members(
+        db,
+        limit=limit,
+        offset=offset,
+        filters=filters,
+        viewer=viewer,
+    )
+    return [schemas.DirectoryMemberRead.model_validate(member) for member in members]
+
+
+async def list_directory_members_page(
+    db: AsyncSession,
+    *,
+    page: keyset.PageRequest,
+    filters: schemas.MemberListFilters,
+    viewer: DirectoryViewer,
+) -> DirectoryMemberPage:
+    """커서 기반 동문 수첩 페이지. 페이지 사이 수정이 있어도 중복·누락이 없다.
+
+    include_total 이면 /members/count 없이 전체 건수를 함께 담는다.
+    """
+    members, next_cursor, total = await members_repo.list_members_keyset(
+        db,
+        page=page,
+        filters=filters,
+        viewer=viewer,
+    )
+    return DirectoryMemberPage(
+        items=[schemas.DirectoryMemberRead.model_validate(m) for m in members],
+        next_cursor=next_cursor,
+        total=total,
+    )
+
+
+async def count_directory_members(
+    db: AsyncSession,
+    *,
+    filters: schemas.MemberListFilters,
+    viewer: DirectoryViewer,
+) -> int:
+    return await members_repo.count_members(
+        db,
+        filters=filters,
+        viewer=viewer,
+    )
+
+
+async def get_directory_member(
+    db: AsyncSession,
+    *,
+    member_id: int,
+    viewer: DirectoryViewer,
+) -> schemas.DirectoryMemberRead:
+    member = await members_repo.get_directory_member(
+        db,
+        member_id=member_id,
+        viewer=viewer,
+    )
+    return schemas.DirectoryMemberRead.model_validate(member)
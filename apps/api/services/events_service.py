@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import cast
 
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import models, schemas
+from ..errors import AlreadyExistsError
 from ..repositories import events as events_repo
 from ..repositories import members as members_repo
 from ..repositories import rsvps as rsvps_repo
@@ -51,65 +52,91 @@ async def list_admin_events_with_total(
 async def update_event(
     db: AsyncSession, event_id: int, payload: schemas.EventUpdate
 ) -> models.Event:
-    return await events_repo.update_event(db, event_id, payload)
+    event = await events_repo.update_event(db, event_id, payload)
+    # 정원을 늘리면 늘어난 자리만큼 대기열을 바로 승급한다.
+    if payload.capacity is not None:
+        await promote_waitlist(db, event_id)
+    return event
 
 
 async def delete_event(db: AsyncSession, event_id: int) -> int:
     return await events_repo.delete_event(db, event_id)
 
 
-async def _promote_waitlist_candidate(db: AsyncSession, event_id: int) -> None:
-    """대기열 최상위 1인을 going으로 승급(경합 완화 포함)."""
-    # SAVEPOINT 사용 (async version)
-    async with db.begin_nested():
-        stmt = (
-            select(models.RSVP)
-            .where(
-                models.RSVP.event_id == event_id,
-                models.RSVP.status == models.RSVPStatus.WAITLIST,
-            )
-            .order_by(models.RSVP.created_at.asc())
-            .with_for_update(skip_locked=True)
-            .limit(1)
-        )
-        result = await db.execute(stmt)
-        candidate = result.scalars().first()
+@dataclass(frozen=True)
+class WaitlistPromotion:
+    promoted_member_ids: list[int]
+    going_count: int
+    waitlist_count: int
 
-        if candidate is not None:
-            setattr(candidate, "status", models.RSVPStatus.GOING)
 
-    if candidate is not None:
-        await db.commit()
-        await db.refresh(candidate)
+async def promote_waitlist(db: AsyncSession, event_id: int) -> WaitlistPromotion:
+    """빈 자리 수만큼 대기열을 created_at 순으로 한 번에 승급한다.
+
+    행사 행을 잠가 빈 자리를 확정한 뒤 UPDATE 한 문장으로 채우므로, 정원 증설이나
+    취소가 겹쳐도 정원을 넘기지 않고 자리가 남은 채로 두지도 않는다.
+    """
+    capacity, going, waitlist = await events_repo.lock_rsvp_counts(db, event_id)
+    promoted = await rsvps_repo.promote_waitlisted(
+        db, event_id=event_id, limit=capacity - going
+    )
+    if promoted:
+        await events_repo.adjust_rsvp_counts(
+            db, event_id, going=len(promoted), waitlist=-len(promoted)
+        )
+    await db.commit()
+    return WaitlistPromotion(
+        promoted_member_ids=promoted,
+        going_count=going + len(promoted),
+        waitlist_count=waitlist - len(promoted),
+    )
 
 
-async def normalize_rsvp_status_for_capacity(
+async def transition_rsvp_status(
     db: AsyncSession,
     *,
     event_id: int,
-    capacity: int,
+    member_id: int,
     requested: schemas.RSVPLiteral,
-    existing: models.RSVP | None,
-) -> models.RSVPStatus:
-    """capacity v1: `going` 요청 시 정원이 가득 찼다면 `waitlist`로 강제."""
-    if requested != "going":
-        return models.RSVPStatus(requested)
-
-    count_stmt = select(func.count(models.RSVP.member_id)).where(
-        models.RSVP.event_id == event_id,
-        models.RSVP.status == models.RSVPStatus.GOING,
+    create_only: bool = False,
+) -> models.RSVP:
+    """RSVP 를 생성/갱신하고 events 집계를 같은 트랜잭션에서 옮긴다.
+
+    - RSVP 행을 잠근 뒤 현재 상태를 읽어 재요청·동시 요청에서도 한 번만 센다.
+    - `going` 요청은 조건부 UPDATE 로 자리를 잡지 못하면 `waitlist`로 강제한다.
+    - going 자리를 cancel 로 비우면 커밋 뒤 빈 자리만큼 대기열을 승급한다.
+    """
+    rsvp = await rsvps_repo.lock_rsvp(db, member_id, event_id)
+    if rsvp is not None and create_only:
+        raise AlreadyExistsError(code="rsvp_exists", detail="RSVP already exists")
+    current = cast(models.RSVPStatus, rsvp.status) if rsvp is not None else None
+    target = models.RSVPStatus(requested)
+
+    if target == models.RSVPStatus.GOING and current != models.RSVPStatus.GOING:
+        if not await events_repo.try_reserve_going_seat(db, event_id):
+            target = models.RSVPStatus.WAITLIST
+    released = current == models.RSVPStatus.GOING and target != current
+    await events_repo.adjust_rsvp_counts(
+        db,
+        event_id,
+        going=-1 if released else 0,
+        waitlist=int(target == models.RSVPStatus.WAITLIST)
+        - int(current == models.RSVPStatus.WAITLIST),
     )
-    result = await db.execute(count_stmt)
-    going_count = int(result.scalar_one())
-    # 업데이트 시 본인 카운트는 제외하여 재요청으로 인한 부당한 대기열 강등을 방지
-    effective = going_count
-    if existing is not None:
-        current: models.RSVPStatus = cast(models.RSVPStatus, existing.status)
-        if current == models.RSVPStatus.GOING:
-            effective -= 1
-    if effective >= capacity:
-        return models.RSVPStatus.WAITLIST
-    return models.RSVPStatus.GOING
+
+    if rsvp is None:
+        rsvp = await rsvps_repo.add_rsvp(
+            db, member_id=member_id, event_id=event_id, status=target
+        )
+    else:
+        # 타입체커 호환을 위해 setattr 사용
+        setattr(rsvp, "status", target)
+    await db.commit()
+    await db.refresh(rsvp)
+    # going 이던 회원이 cancel 하면 비어 있는 자리만큼 대기열을 승급
+    if released and target == models.RSVPStatus.CANCEL:
+        await promote_waitlist(db, event_id)
+    return rsvp
 
 
 async def upsert_rsvp_status(
@@ -118,44 +145,21 @@ async def upsert_rsvp_status(
     """RSVP 상태를 생성/갱신.
 
     - 회원/이벤트 존재 여부 확인 후 생성 또는 상태 갱신.
-    - capacity v1: `going` 요청 시 정원이 가득 찼다면 `waitlist`로 강제.
+    - capacity: `going` 요청 시 정원이 가득 찼다면 `waitlist`로 강제.
     """
-    event_obj = await events_repo.get_event(db, event_id)
+    _ = await events_repo.get_event(db, event_id)
     _ = await members_repo.get_member(db, member_id)
 
-    rsvp = await db.get(models.RSVP, (member_id, event_id))
-    cap_int = cast(int, event_obj.capacity)
-    if rsvp is None:
-        final_status = await normalize_rsvp_status_for_capacity(
-            db,
-            event_id=event_id,
-            capacity=cap_int,
-            requested=status,
-            existing=None,
-        )
-        rsvp = await rsvps_repo.create_rsvp(
-            db,
-            member_id=member_id,
-            event_id=event_id,
-            status=final_status.value,
-        )
-    else:
-        # 타입체커 호환을 위해 setattr 사용
-        new_status = await normalize_rsvp_status_for_capacity(
-            db,
-            event_id=event_id,
-            capacity=cap_int,
-            requested=status,
-            existing=rsvp,
-        )
-        setattr(rsvp, "status", new_status)
-        await db.commit()
-        await db.refresh(rsvp)
-        # RSVP v2: cancel 시 대기열 최상위 1인을 going으로 승급
-        if new_status == models.RSVPStatus.CANCEL:
-            # Postgres: SKIP LOCKED로 경쟁 중복 승급 방지
-            await _promote_waitlist_candidate(db, event_id)
-    return rsvp
+    return await transition_rsvp_status(
+        db, event_id=event_id, member_id=member_id, requested=status
+    )
+
+
+async def reconcile_rsvp_counts(
+    db: AsyncSession, event_id: int | None = None
+) -> list[int]:
+    """집계 드리프트(직접 SQL·회원 삭제 cascade 등)를 rsvps 기준으로 바로잡는다."""
+    return await events_repo.reconcile_rsvp_counts(db, event_id)
 
 
 async def get_member_rsvp(
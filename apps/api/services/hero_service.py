@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Sequence
 from typing import cast
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models, schemas
+from .. import models, publication_clock, schemas
+from ..media_utils import build_srcset
 from ..post_visibility import is_post_public, post_public_href
 from ..repositories import events as events_repo
 from ..repositories import hero_items as hero_items_repo
+from ..repositories import media_assets as media_assets_repo
 from ..repositories import posts as posts_repo
 
+# 공개 히어로 캐시: 가시성 버전이 바뀌면 무효화된다. 다른 워커의 쓰기는
+# 버전에 반영되지 않으므로 최대 보존 시간으로 수렴시킨다.
+_HERO_CACHE_MAX_AGE = 300.0
+_hero_slides_cache: dict[int, tuple[int, float, list[schemas.HeroSlide]]] = {}
+
 
 async def _get_posts_by_ids(
     db: AsyncSession, ids: Sequence[int]
@@ -37,6 +45,37 @@ async def _get_events_by_ids(
 
 async def list_hero_slides(
     db: AsyncSession, *, limit: int, allow_unpublished: bool = False
+) -> list[schemas.HeroSlide]:
+    if allow_unpublished:
+        return await _build_hero_slides(db, limit=limit, allow_unpublished=True)
+
+    version = publication_clock.current_version()
+    now = time.monotonic()
+    cached = _hero_slides_cache.get(limit)
+    if cached and cached[0] == version and (now - cached[1]) < _HERO_CACHE_MAX_AGE:
+        return list(cached[2])
+
+    slides = await _build_hero_slides(db, limit=limit, allow_unpublished=False)
+    _hero_slides_cache[limit] = (version, now, slides)
+    return list(slides)
+
+
+def reset_hero_slides_cache() -> None:
+    _hero_slides_cache.clear()
+
+
+def _slide_image_path(
+    item: models.HeroItem, posts: dict[int, models.Post]
+) -> str | None:
+    override = cast(str | None, item.image_override)
+    if override or cast(str, item.target_type) != "post":
+        return override
+    post = posts.get(cast(int, item.target_id))
+    return cast(str | None, post.cover_image) if post is not None else None
+
+
+async def _build_hero_slides(
+    db: AsyncSession, *, limit: int, allow_unpublished: bool
 ) -> list[schemas.HeroSlide]:
     # invalid/missing target을 건너뛰는 경우를 고려해 여유 있게 조회
     fetch_limit = min(limit * 3, 50)
@@ -53,6 +92,10 @@ async def list_hero_slides(
 
     posts = await _get_posts_by_ids(db, post_ids)
     events = await _get_events_by_ids(db, event_ids)
+    # 슬라이드 이미지 변형은 한 번에 조회 (override 우선, 없으면 게시글 대표 이미지)
+    variants = await media_assets_repo.get_variant_manifest(
+        db, [_slide_image_path(item, posts) for item in items]
+    )
 
     slides: list[schemas.HeroSlide] = []
     for item in items:
@@ -66,6 +109,7 @@ async def list_hero_slides(
             unpublished = not is_post_public(post)
             if unpublished and not allow_unpublished:
                 continue
+            image_path = _slide_image_path(item, posts)
 
             slides.append(
                 schemas.HeroSlide(
@@ -74,7 +118,8 @@ async def list_hero_slides(
                     target_id=target_id,
                     title=cast(str, item.title_override or post.title),
                     description=cast(str, item.description_override or post.content),
-                    image=cast(str | None, item.image_override or post.cover_image),
+                    image=image_path,
+                    image_srcset=build_srcset(variants.get(image_path or "")),
                     href=post_public_href(post),
                     unpublished=unpublished,
                 )
@@ -83,6 +128,7 @@ async def list_hero_slides(
             event = events.get(target_id)
             if event is None:
                 continue
+            image_path = _slide_image_path(item, posts)
             slides.append(
                 schemas.HeroSlide(
                     id=cast(int, item.id),
@@ -95,7 +141,8 @@ async def list_hero_slides(
                         or event.description
                         or "행사 안내",
                     ),
-                    image=cast(str | None, item.image_override),
+                    image=image_path,
+                    image_srcset=build_srcset(variants.get(image_path or "")),
                     href=f"/events/{target_id}",
                     unpublished=False,
                 )
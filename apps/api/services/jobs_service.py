@@ -0,0 +1,201 @@
+"""백그라운드 작업 실행 — 종류별 핸들러, 재시도 backoff, stale 회수.
+
+웹 요청은 `enqueue_*` 로 행만 넣고 작업 id 를 돌려준다. 실제 실행은
+`python -m apps.api.worker` 프로세스가 `run_next_job` 을 반복 호출해 맡는다.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models_jobs import BackgroundJob
+from ..repositories import jobs as jobs_repo
+from ..repositories.notifications import SubscriptionTarget
+from . import notifications_service as notif_svc
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_PUSH = "broadcast_push"
+
+# 재시도 간격: 30초부터 두 배씩, 최대 1시간
+JOB_RETRY_BASE = timedelta(seconds=30)
+JOB_RETRY_MAX = timedelta(hours=1)
+# 이 시간 동안 heartbeat(진행 기록)가 없는 running 작업은 워커가 죽은 것으로 본다
+JOB_STALE_AFTER = timedelta(minutes=10)
+
+# 핸들러 실패 중 재시도 대상 (그 밖의 예외는 워커 버그로 보고 전파)
+JOB_ERRORS: tuple[type[Exception], ...] = (
+    SQLAlchemyError,
+    OSError,
+    RuntimeError,
+    ValueError,
+    TypeError,
+    LookupError,
+)
+
+
+class JobPayloadError(ValueError):
+    """payload 가 잘못돼 재시도해도 성공할 수 없는 작업."""
+
+
+@dataclass(frozen=True)
+class JobContext:
+    job_id: int
+    payload: Mapping[str, object]
+    attempt: int
+
+    async def report_progress(
+        self, db: AsyncSession, progress: Mapping[str, object]
+    ) -> None:
+        await jobs_repo.update_job_progress(db, self.job_id, progress)
+
+
+JobHandler = Callable[[AsyncSession, JobContext], Awaitable[dict[str, object]]]
+
+
+def retry_delay(attempt: int) -> timedelta:
+    """attempt 번째 실패 뒤 다음 시도까지 기다릴 시간."""
+    return min(JOB_RETRY_BASE * (2 ** max(attempt - 1, 0)), JOB_RETRY_MAX)
+
+
+async def enqueue_broadcast(
+    db: AsyncSession, message: notif_svc.BroadcastMessage
+) -> BackgroundJob:
+    """전체(또는 대상 지정) Push 발송 작업을 넣는다.
+
+    구독별 발송 원장이 없어 재실행하면 이미 받은 구독도 다시 받으므로
+    자동 재시도는 하지 않는다(max_attempts=1).
+    """
+    target = message.target
+    return await jobs_repo.enqueue_job(
+        db,
+        jobs_repo.NewJob(
+            kind=BROADCAST_PUSH,
+            payload={
+                "title": message.title,
+                "body": message.body,
+                "url": message.url,
+                "topic": target.topic,
+                "cohorts": list(target.cohorts),
+                "member_ids": list(target.member_ids),
+            },
+            priority=50,
+            max_attempts=1,
+        ),
+    )
+
+
+def _int_list(payload: Mapping[str, object], key: str) -> tuple[int, ...]:
+    raw = payload.get(key)
+    if raw is None:
+        return ()
+    if not isinstance(raw, list):
+        raise JobPayloadError(f"broadcast {key} must be a list of integers")
+    values = cast(list[object], raw)
+    # bool 은 int 의 하위 타입이라 따로 거른다
+    if any(isinstance(v, bool) or not isinstance(v, int) for v in values):
+        raise JobPayloadError(f"broadcast {key} must be a list of integers")
+    return tuple(cast(list[int], values))
+
+
+def _broadcast_message(payload: Mapping[str, object]) -> notif_svc.BroadcastMessage:
+    title = payload.get("title")
+    body = payload.get("body")
+    url = payload.get("url")
+    topic = payload.get("topic")
+    if not isinstance(title, str) or not isinstance(body, str):
+        raise JobPayloadError("broadcast payload requires title and body")
+    if url is not None and not isinstance(url, str):
+        raise JobPayloadError("broadcast url must be a string")
+    if topic is not None and not isinstance(topic, str):
+        raise JobPayloadError("broadcast topic must be a string")
+    target = SubscriptionTarget(
+        topic=topic,
+        cohorts=_int_list(payload, "cohorts"),
+        member_ids=_int_list(payload, "member_ids"),
+    )
+    return notif_svc.BroadcastMessage(title=title, body=body, url=url, target=target)
+
+
+def broadcast_push_handler(provider: notif_svc.PushProvider) -> JobHandler:
+    async def _run(db: AsyncSession, ctx: JobContext) -> dict[str, object]:
+        message = _broadcast_message(ctx.payload)
+
+        async def _progress(done: int, total: int) -> None:
+            await ctx.report_progress(db, {"done": done, "total": total})
+
+        result = await notif_svc.broadcast(db, provider, message, on_progress=_progress)
+        return {"accepted": result.accepted, "failed": result.failed}
+
+    return _run
+
+
+def default_job_handlers(provider: notif_svc.PushProvider) -> dict[str, JobHandler]:
+    return {BROADCAST_PUSH: broadcast_push_handler(provider)}
+
+
+async def run_next_job(
+    db: AsyncSession,
+    *,
+    worker_id: str,
+    handlers: Mapping[str, JobHandler],
+) -> bool:
+    """queued 작업 하나를 꺼내 실행한다. 꺼낼 작업이 없으면 False."""
+    job = await jobs_repo.claim_next_job(db, worker_id=worker_id)
+    if job is None:
+        return False
+    job_id = cast(int, job.id)
+    kind = cast(str, job.kind)
+    attempt = cast(int, job.attempts)
+    handler = handlers.get(kind)
+    if handler is None:
+        logger.error("알 수 없는 작업 종류: job=%s, kind=%s", job_id, kind)
+        await jobs_repo.fail_job(
+            db, job_id, error=f"unknown job kind: {kind}", retry_at=None
+        )
+        return True
+
+    ctx = JobContext(
+        job_id=job_id,
+        payload=cast(dict[str, object], job.payload or {}),
+        attempt=attempt,
+    )
+    try:
+        result = await handler(db, ctx)
+    except JobPayloadError as exc:
+        await db.rollback()
+        logger.warning("작업 payload 오류: job=%s, kind=%s", job_id, kind)
+        await jobs_repo.fail_job(db, job_id, error=str(exc), retry_at=None)
+        return True
+    except JOB_ERRORS as exc:
+        await db.rollback()
+        logger.exception(
+            "작업 실행 실패: job=%s, kind=%s, attempt=%s", job_id, kind, attempt
+        )
+        retry_at = (
+            datetime.now(UTC) + retry_delay(attempt)
+            if attempt < cast(int, job.max_attempts)
+            else None
+        )
+        await jobs_repo.fail_job(
+            db, job_id, error=f"{type(exc).__name__}: {exc}", retry_at=retry_at
+        )
+        return True
+
+    await jobs_repo.complete_job(db, job_id, result)
+    logger.info("작업 완료: job=%s, kind=%s", job_id, kind)
+    return True
+
+
+async def reclaim_stale_jobs(db: AsyncSession, *, now: datetime | None = None) -> int:
+    current = now or datetime.now(UTC)
+    return await jobs_repo.reclaim_stale_jobs(
+        db, locked_before=current - JOB_STALE_AFTER
+    )
@@ -0,0 +1,228 @@
+"""업로드 미디어의 콘텐츠 주소 저장·중복 제거·참조 없는 파일 정리.
+
+- 파일명은 정규화된 출력 바이트의 SHA-256 이다. 같은 포스터를 여러 공지에 붙여도
+  파일은 하나이고, 변형(`<해시>_w<폭>.<형식>`)도 원본과 같은 이름으로 묶인다.
+- 업로드 원본 해시와 처리 설정으로 만든 source_hash 가 이미 있으면 프로세스 풀을
+  거치지 않고 기존 자산을 돌려준다.
+- 참조(게시글 커버·본문 이미지, 회원 아바타, 히어로 대체 이미지)는 GC 시점에 DB 에서
+  직접 모은다. 쓰기 경로마다 카운터를 맞출 필요가 없고, 관리자 수정·시드·리셋으로
+  바뀐 참조도 그대로 반영된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import image_pipeline, models
+from ..config import get_settings
+from ..logging_utils import log_json
+from ..media_utils import MediaVariant, normalize_media_path
+from ..repositories import media_assets as media_assets_repo
+from ..upload_ingest import IngestedImage
+
+logger = logging.getLogger(__name__)
+
+# GC 가 훑는 MEDIA_ROOT 하위 디렉터리 (그 밖의 파일은 건드리지 않는다)
+MANAGED_MEDIA_DIRS = ("images", "avatars")
+
+
+@dataclass(frozen=True)
+class MediaGcResult:
+    assets_deleted: int
+    files_deleted: int
+    bytes_freed: int
+
+
+def _source_hash(kind: str, digest: str, profile: str) -> str:
+    """입력 해시에 처리 설정을 섞는다. 설정이 바뀌면 다시 처리한다."""
+    return hashlib.sha256(f"{kind}|{profile}|{digest}".encode()).hexdigest()
+
+
+def _touch_if_exists(path: Path) -> bool:
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+async def _write_if_missing(path: Path, data: bytes) -> None:
+    # 같은 내용의 파일을 다시 쓰는 경우 mtime 을 지금으로 당겨, 새 참조가 저장되기
+    # 전에 GC 가 유예 기간이 지난 고아 파일로 보고 지우지 않게 한다.
+    if await asyncio.to_thread(_touch_if_exists, path):
+        return
+    await image_pipeline.write_media_file(path, data)
+
+
+async def _reuse(
+    db: AsyncSession, *, kind: str, source_hash: str
+) -> models.MediaAsset | None:
+    asset = await media_assets_repo.claim_by_source(
+        db, kind=kind, source_hash=source_hash
+    )
+    if asset is not None:
+        log_json(logger, logging.INFO, "media_asset_reused", kind=kind, path=asset.path)
+    return asset
+
+
+async def store_post_image(
+    db: AsyncSession, image: IngestedImage, *, ext: str
+) -> models.MediaAsset:
+    """게시글 이미지를 처리해 본문·변형 파일과 media_assets 매니페스트를 남긴다."""
+    settings = get_settings()
+    spec = image_pipeline.upload_variant_spec()
+    profile = f"{ext}|{settings.image_max_pixels}|{spec.widths}|{spec.formats}"
+    source_hash = _source_hash("image", image.digest, profile)
+    reused = await _reuse(db, kind="image", source_hash=source_hash)
+    if reused is not None:
+        return reused
+
+    rendered = await image_pipeline.process_upload_image(
+        image.source, ext=ext, max_pixels=settings.image_max_pixels, variants=spec
+    )
+    media_root = Path(settings.media_root)
+    content_hash = hashlib.sha256(rendered.data).hexdigest()
+    relative_path = f"images/{content_hash}{ext}"
+    await _write_if_missing(media_root / relative_path, rendered.data)
+
+    variants: list[MediaVariant] = []
+    for variant in rendered.variants:
+        variant_path = f"images/{content_hash}_w{variant.width}.{variant.format}"
+        await _write_if_missing(media_root / variant_path, variant.data)
+        variants.append(
+            MediaVariant(path=variant_path, width=variant.width, format=variant.format)
+        )
+
+    return await media_assets_repo.upsert_media_asset(
+        db,
+        media_assets_repo.NewMediaAsset(
+            kind="image",
+            path=relative_path,
+            content_hash=content_hash,
+            source_hash=source_hash,
+            size=rendered.size,
+            variants=variants,
+        ),
+    )
+
+
+async def store_avatar(db: AsyncSession, image: IngestedImage) -> models.MediaAsset:
+    """아바타를 max_bytes 이하 JPEG 로 처리해 `avatars/<해시>.jpg` 로 저장한다."""
+    settings = get_settings()
+    profile = f"{settings.avatar_max_pixels}|{settings.avatar_max_bytes}"
+    source_hash = _source_hash("avatar", image.digest, profile)
+    reused = await _reuse(db, kind="avatar", source_hash=source_hash)
+    if reused is not None:
+        return reused
+
+    rendered = await image_pipeline.process_avatar(
+        image.source,
+        max_pixels=settings.avatar_max_pixels,
+        max_bytes=settings.avatar_max_bytes,
+    )
+    content_hash = hashlib.sha256(rendered.data).hexdigest()
+    relative_path = f"avatars/{content_hash}.jpg"
+    await _write_if_missing(Path(settings.media_root) / relative_path, rendered.data)
+    return await media_assets_repo.upsert_media_asset(
+        db,
+        media_assets_repo.NewMediaAsset(
+            kind="avatar",
+            path=relative_path,
+            content_hash=content_hash,
+            source_hash=source_hash,
+            size=rendered.size,
+        ),
+    )
+
+
+def _relative_reference(value: str) -> str | None:
+    """참조 값을 MEDIA_ROOT 상대경로로 맞춘다(외부 URL 이면 None)."""
+    normalized = normalize_media_path(value)
+    if not normalized or "://" in normalized:
+        return None
+    return normalized.split("?", 1)[0].split("#", 1)[0]
+
+
+def _sweep_orphan_files(
+    media_root: Path, keep: set[str], cutoff: float
+) -> tuple[int, int]:
+    """관리 디렉터리에서 keep 에 없고 cutoff 이전에 쓰인 파일을 지운다."""
+    files = freed = 0
+    for directory in MANAGED_MEDIA_DIRS:
+        base = media_root / directory
+        if not base.is_dir():
+            continue
+        for path in base.rglob("*"):
+            relative = path.relative_to(media_root).as_posix()
+            if relative in keep or not path.is_file():
+                continue
+            stat = path.stat()
+            if stat.st_mtime >= cutoff:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            files += 1
+            freed += stat.st_size
+    return files, freed
+
+
+async def collect_media_garbage(
+    db: AsyncSession, *, now: datetime | None = None
+) -> MediaGcResult:
+    """참조가 끊기고 유예 기간 동안 재사용되지 않은 자산 행과 파일을 정리한다."""
+    settings = get_settings()
+    cutoff = (now or datetime.now(UTC)) - timedelta(hours=settings.media_gc_grace_hours)
+    started = time.perf_counter()
+
+    referenced = {
+        relative
+        for value in await media_assets_repo.referenced_media_paths(db)
+        if (relative := _relative_reference(value)) is not None
+    }
+    assets = await media_assets_repo.list_media_asset_files(db)
+    stale_ids = [
+        asset.id
+        for asset in assets
+        if asset.path not in referenced and asset.last_used_at < cutoff
+    ]
+    deleted = set(
+        await media_assets_repo.delete_unused_media_assets(
+            db, stale_ids, used_before=cutoff
+        )
+    )
+
+    keep = set(referenced)
+    for asset in assets:
+        if asset.path in deleted:
+            continue
+        keep.add(asset.path)
+        keep.update(variant["path"] for variant in asset.variants)
+
+    media_root = Path(settings.media_root)
+    files, freed = await asyncio.to_thread(
+        _sweep_orphan_files, media_root, keep, cutoff.timestamp()
+    )
+    log_json(
+        logger,
+        logging.INFO,
+        "media_gc",
+        referenced=len(referenced),
+        assets_deleted=len(deleted),
+        files_deleted=files,
+        bytes_freed=freed,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+    return MediaGcResult(
+        assets_deleted=len(deleted), files_deleted=files, bytes_freed=freed
+    )
@@ -1,22 +1,19 @@
 from __future__ import annotations
 
-import io
-import secrets
 import time
 from collections import OrderedDict
 from collections.abc import Sequence
-from pathlib import Path
 from typing import Never, cast
 
-from PIL import Image, UnidentifiedImageError
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import models, schemas
-from ..config import get_settings
 from ..errors import AlreadyExistsError, ApiError
 from ..repositories import members as members_repo
+from ..upload_ingest import IngestedImage
+from . import media_service
 from .activation_service import create_member_activation_token
 from .roles_service import (
     normalize_assignable_roles,
@@ -24,10 +21,6 @@ from .roles_service import (
     serialize_roles,
 )
 
-_ALLOWED_IMAGE_FORMATS = {"JPEG", "PNG", "WEBP"}
-_INITIAL_JPEG_QUALITY = 85
-_MIN_JPEG_QUALITY = 50
-
 _MEMBER_COUNT_CACHE_TTL = 30.0
 _MEMBER_COUNT_CACHE_MAX = 64
 _member_count_cache: OrderedDict[
@@ -68,116 +61,23 @@ def _raise_member_conflict_from_integrity_error(exc: IntegrityError) -> Never:
     raise exc
 
 
-def _load_and_normalize_image(file_bytes: bytes) -> Image.Image:
-    try:
-        image = Image.open(io.BytesIO(file_bytes))
-    except UnidentifiedImageError as exc:
-        raise ApiError(
-            code="avatar_invalid_image",
-            detail="이미지 형식을 인식할 수 없습니다.",
-            status=422,
-        ) from exc
-
-    if image.format not in _ALLOWED_IMAGE_FORMATS:
-        raise ApiError(
-            code="avatar_unsupported_format",
-            detail="JPG, PNG, WEBP 형식만 업로드할 수 있습니다.",
-            status=422,
-        )
-
-    image.load()
-    if image.mode not in {"RGB", "L", "RGBA"}:
-        image = image.convert("RGBA")
-    if image.mode == "RGBA":
-        background = Image.new("RGBA", image.size, (255, 255, 255, 255))
-        background.paste(image, mask=image.split()[-1])
-        return background.convert("RGB")
-    if image.mode != "RGB":
-        return image.convert("RGB")
-    return image
-
-
-def _compress_to_jpeg(
-    image: Image.Image,
-    *,
-    max_pixels: int,
-    max_bytes: int,
-) -> bytes:
-    normalized = image.copy()
-    normalized.thumbnail((max_pixels, max_pixels))
-
-    buffer = io.BytesIO()
-    quality = _INITIAL_JPEG_QUALITY
-    while True:
-        buffer.seek(0)
-        buffer.truncate(0)
-        normalized.save(buffer, format="JPEG", optimize=True, quality=quality)
-        if buffer.tell() <= max_bytes or quality <= _MIN_JPEG_QUALITY:
-            break
-        quality -= 5
-
-    data = buffer.getvalue()
-    if len(data) > max_bytes:
-        raise ApiError(
-            code="avatar_compress_failed",
-            detail="이미지를 100KB 이하로 압축할 수 없습니다.",
-            status=422,
-        )
-    return data
-
-
-def _remove_previous_avatar(previous_path: str | None, media_root: Path) -> None:
-    if not previous_path:
-        return
-    old_file = media_root / previous_path
-    try:
-        old_file.unlink()
-    except FileNotFoundError:
-        pass
-
-
 async def list_members(
     db: AsyncSession,
     *,
     limit: int,
     offset: int,
     filters: schemas.MemberListFilters | None = None,
-    viewer_student_id: str | None = None,
 ) -> Sequence[models.Member]:
     return await members_repo.list_members(
-        db, limit=limit, offset=offset, filters=filters,
-        viewer_student_id=viewer_student_id,
-    )
-
-
-async def list_directory_members(
-    db: AsyncSession,
-    *,
-    limit: int,
-    offset: int,
-    filters: schemas.MemberListFilters,
-    viewer_student_id: str,
-) -> list[schemas.DirectoryMemberRead]:
-    members = await list_members(
-        db,
-        limit=limit,
-        offset=offset,
-        filters=filters,
-        viewer_student_id=viewer_student_id,
+        db, limit=limit, offset=offset, filters=filters
     )
-    return [schemas.DirectoryMemberRead.model_validate(member) for member in members]
 
 
 async def count_members(
     db: AsyncSession, *, filters: schemas.MemberListFilters | None = None,
-    viewer_student_id: str | None = None,
 ) -> int:
-    # 조회자별 공개 범위는 즉시 반영되어야 하므로 짧은 캐시도 사용하지 않는다.
-    # 관리자용 집계만 기존 필터 캐시를 유지한다.
-    if viewer_student_id is not None:
-        return await members_repo.count_members(
-            db, filters=filters, viewer_student_id=viewer_student_id
-        )
+    # 관리자용 집계 캐시. 조회자별 동문 수첩 집계는 directory_service 가
+    # 캐시 없이 처리한다(공개 범위 변경 즉시 반영).
 
     def _normalize_value(value: object) -> str:
         if isinstance(value, bool):
@@ -209,37 +109,10 @@ async def count_members(
     return count
 
 
-async def count_directory_members(
-    db: AsyncSession,
-    *,
-    filters: schemas.MemberListFilters,
-    viewer_student_id: str,
-) -> int:
-    return await count_members(
-        db,
-        filters=filters,
-        viewer_student_id=viewer_student_id,
-    )
-
-
 async def get_member(db: AsyncSession, member_id: int) -> models.Member:
     return await members_repo.get_member(db, member_id)
 
 
-async def get_directory_member(
-    db: AsyncSession,
-    *,
-    member_id: int,
-    viewer_student_id: str,
-) -> schemas.DirectoryMemberRead:
-    member = await members_repo.get_directory_member(
-        db,
-        member_id=member_id,
-        viewer_student_id=viewer_student_id,
-    )
-    return schemas.DirectoryMemberRead.model_validate(member)
-
-
 async def create_member(
     db: AsyncSession, payload: schemas.MemberCreate
 ) -> models.Member:
@@ -420,51 +293,18 @@ async def update_member_avatar(
     db: AsyncSession,
     *,
     member_id: int,
-    file_bytes: bytes,
-    filename_hint: str | None = None,
+    image: IngestedImage,
 ) -> models.Member:
-    settings = get_settings()
-    if not file_bytes:
-        raise ApiError(
-            code="avatar_empty",
-            detail="이미지 파일이 비어 있습니다.",
-            status=422,
-        )
-    if len(file_bytes) > settings.avatar_max_upload_bytes:
-        raise ApiError(
-            code="avatar_too_large_raw",
-            detail="업로드 파일 크기가 허용 범위를 초과했습니다.",
-            status=422,
-        )
-    image = _load_and_normalize_image(file_bytes)
-    avatar_bytes = _compress_to_jpeg(
-        image,
-        max_pixels=settings.avatar_max_pixels,
-        max_bytes=settings.avatar_max_bytes,
-    )
-
-    media_root = Path(settings.media_root)
-    storage_dir = media_root / "avatars"
-    storage_dir.mkdir(parents=True, exist_ok=True)
-
-    suffix = Path(filename_hint or "avatar.jpg").suffix.lower() or ".jpg"
-    if suffix not in {".jpg", ".jpeg"}:
-        suffix = ".jpg"
-    new_filename = (
-        f"member_{member_id}_{int(time.time())}_{secrets.token_hex(4)}{suffix}"
-    )
-    relative_path = f"avatars/{new_filename}"
-    file_path = storage_dir / new_filename
-    file_path.write_bytes(avatar_bytes)
+    """아바타 교체. image 는 upload_ingest 로 크기·형식 검증을 마친 원본.
 
+    파일은 콘텐츠 해시 이름이라 다른 회원과 공유될 수 있으므로 이전 파일을 바로
+    지우지 않고, 참조가 끊기면 media_service.collect_media_garbage 가 정리한다.
+    """
+    asset = await media_service.store_avatar(db, image)
     member = await members_repo.get_member(db, member_id)
-    previous_path = getattr(member, "avatar_path", None)
-    setattr(member, "avatar_path", relative_path)
+    setattr(member, "avatar_path", asset.path)
     await db.commit()
     await db.refresh(member)
-
-    _remove_previous_avatar(previous_path, media_root)
-
     return member
 
 
@@ -0,0 +1,56 @@
+"""예약 알림 대상(토픽별 수신 가능 구독) 스냅샷.
+
+트리거 한 번에 D-3/D-1 행사가 여러 개여도 활성 구독·opt-out 을 한 번만 읽고
+모든 행사가 같은 대상을 공유한다. version 은 endpoint_hash 집합의 다이제스트라
+로그로 어느 실행들이 같은 대상을 봤는지 비교할 수 있다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import PushSubscription
+from ..repositories import notifications as subs_repo
+
+
+@dataclass(frozen=True)
+class AudienceSnapshot:
+    topic: str
+    subscriptions: tuple[PushSubscription, ...]
+    version: str
+    resolved_at: datetime
+
+    @property
+    def endpoint_hashes(self) -> list[str]:
+        return [cast(str, sub.endpoint_hash) for sub in self.subscriptions]
+
+
+def audience_version(endpoint_hashes: list[str]) -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    for value in sorted(endpoint_hashes):
+        digest.update(value.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+async def resolve_audience(db: AsyncSession, *, topic: str) -> AudienceSnapshot:
+    """수신 가능 구독을 한 쿼리로 읽어 세션에서 분리한 스냅샷으로 돌려준다.
+
+    행사 하나의 발송이 실패해 세션을 rollback 해도 만료되지 않도록 expunge 한다
+    (발송 경로는 이미 읽은 컬럼만 쓴다).
+    """
+    subs = tuple(await subs_repo.list_eligible_subscriptions(db, topic=topic))
+    for sub in subs:
+        db.expunge(sub)
+    hashes = [cast(str, sub.endpoint_hash) for sub in subs]
+    return AudienceSnapshot(
+        topic=topic,
+        subscriptions=subs,
+        version=audience_version(hashes),
+        resolved_at=datetime.now(UTC),
+    )
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import json
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, Protocol, cast
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Protocol, cast, runtime_checkable
 
 from pywebpush import WebPushException, webpush
 from requests.exceptions import RequestException
@@ -16,8 +16,14 @@ from ..errors import ApiError
 from ..models import PushSubscription
 from ..repositories import notifications as repo
 from ..repositories import send_logs
-from ..repositories.notifications import SubscriptionData, SubscriptionOwnershipError
+from ..repositories.notifications import (
+    SubscriptionData,
+    SubscriptionOwnershipError,
+    SubscriptionTarget,
+)
 from ..repositories.send_logs import SendLogItem
+from . import subscription_health
+from .push_pacing import parse_retry_after
 
 
 class PushProvider(Protocol):
@@ -34,10 +40,24 @@ class PushProvider(Protocol):
         ...
 
 
+@runtime_checkable
+class RetryAfterSource(Protocol):
+    def pop_retry_after(self, endpoint: str) -> float | None:
+        """마지막 실패 응답의 `Retry-After`(초). 한 번 읽으면 지운다."""
+        ...
+
+
 class PyWebPushProvider:
     def __init__(self) -> None:
         self._webpush: Callable[..., Any] = webpush
         self._settings = get_settings()
+        # endpoint 해시 -> Retry-After(초). 발송 결과 튜플을 바꾸지 않고 pacer 에
+        # 넘긴다. 발송 루프가 호출마다 꺼내 가므로 쌓이지 않고, 평문 endpoint 는
+        # 남기지 않는다.
+        self._retry_after: dict[str, float] = {}
+
+    def pop_retry_after(self, endpoint: str) -> float | None:
+        return self._retry_after.pop(repo.hash_endpoint(endpoint), None)
 
     def send(
         self, sub: PushSubscription, payload: dict[str, Any]
@@ -69,7 +89,12 @@ class PyWebPushProvider:
             status = getattr(resp, "status_code", None)
             return (True, int(status) if status is not None else None)
         except WebPushException as exc:
-            status = getattr(getattr(exc, "response", None), "status_code", None)
+            response = getattr(exc, "response", None)
+            status = getattr(response, "status_code", None)
+            headers = cast(Mapping[str, str], getattr(response, "headers", None) or {})
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                self._retry_after[repo.hash_endpoint(endpoint)] = retry_after
             return (False, int(status) if status is not None else None)
         except (ValueError, TypeError, RuntimeError, RequestException):
             # Treat config/transport failures as send failures so caller can log
@@ -116,6 +141,29 @@ async def delete_subscription(
         raise _ownership_error() from exc
 
 
+# 전체 발송 진행 상황 콜백 (처리한 구독 수, 전체 구독 수)
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# 진행 상황 콜백을 부르는 간격(구독 수)
+BROADCAST_PROGRESS_EVERY = 50
+
+
+@dataclass(frozen=True)
+class BroadcastMessage:
+    title: str
+    body: str
+    url: str | None = None
+    # 비우면 활성 구독 전체. 주제 opt-out·기수·회원 지정은 한 쿼리로 고른다
+    target: SubscriptionTarget = field(default_factory=SubscriptionTarget)
+
+    def payload(self) -> dict[str, str]:
+        return {
+            "title": self.title,
+            "body": self.body,
+            **({"url": self.url} if self.url else {}),
+        }
+
+
 async def send_to_all(
     db: AsyncSession,
     provider: PushProvider,
@@ -124,13 +172,33 @@ async def send_to_all(
     body: str,
     url: str | None = None,
 ) -> SendResult:
-    subs = await repo.list_active_subscriptions(db)
+    return await broadcast(
+        db, provider, BroadcastMessage(title=title, body=body, url=url)
+    )
+
+
+async def broadcast(
+    db: AsyncSession,
+    provider: PushProvider,
+    message: BroadcastMessage,
+    *,
+    on_progress: ProgressCallback | None = None,
+) -> SendResult:
+    """message.target 에 맞는 활성 구독(기본은 전체)에 발송한다.
+
+    on_progress 는 BROADCAST_PROGRESS_EVERY 건마다와 마지막에 한 번 불린다
+    (백그라운드 작업의 진행률·heartbeat 기록용).
+    """
+    subs = await repo.list_target_subscriptions(db, message.target)
+    total = len(subs)
     accepted = 0
     failed = 0
     log_items: list[SendLogItem] = []
     expired_hashes: list[str] = []
-    payload = {"title": title, "body": body, **({"url": url} if url else {})}
-    for sub in subs:
+    payload = message.payload()
+    for index, sub in enumerate(subs, start=1):
+        if on_progress is not None and index % BROADCAST_PROGRESS_EVERY == 0:
+            await on_progress(index - 1, total)
         try:
             endpoint_plain = decrypt_str(cast(str, sub.endpoint))
         except CryptoError:
@@ -145,6 +213,9 @@ async def send_to_all(
             continue
 
         ok, status = await provider.send_async(sub, payload)
+        if isinstance(provider, RetryAfterSource):
+            # 전체 발송은 pacer 를 쓰지 않지만 꺼내 가지 않으면 provider 에 쌓인다
+            provider.pop_retry_after(endpoint_plain)
         if ok:
             accepted += 1
         else:
@@ -154,7 +225,10 @@ async def send_to_all(
         log_items.append(
             SendLogItem(endpoint=endpoint_plain, ok=ok, status_code=status)
         )
-    # DB: 발송 로그·만료 구독 정리는 bounded batch commit
+    # DB: 발송 로그·구독 건강도·만료 구독 정리는 bounded batch commit
     await send_logs.create_logs_batch(db, log_items)
+    await subscription_health.record_outcomes(db, log_items)
     await repo.remove_by_endpoint_hashes(db, expired_hashes)
+    if on_progress is not None:
+        await on_progress(total, total)
     return SendResult(accepted=accepted, failed=failed)
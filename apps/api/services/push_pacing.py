@@ -0,0 +1,185 @@
+"""Push 발송 속도 조절 — push 서비스 origin 별 토큰 버킷 + AIMD.
+
+예약 발송 루프는 고정 배치 크기·고정 sleep 대신 이 pacer 로 호출 간격을 정한다.
+
+- origin(예: fcm.googleapis.com, updates.push.services.mozilla.com)마다
+  버킷을 따로 둔다. 한 서비스가 느려져도 다른 서비스로 가는 발송은 막히지 않는다.
+- 성공하면 초당 허용량을 조금씩 늘리고(additive increase), 429/5xx 를 받으면
+  절반으로 줄인다(multiplicative decrease). 연속된 실패로 한꺼번에 바닥까지
+  떨어지지 않도록 감소는 `DECREASE_COOLDOWN_SECONDS` 에 한 번만 적용한다.
+- `Retry-After` 를 받으면 그 시각까지 해당 origin 발송을 멈춘다
+  (`RETRY_AFTER_MAX_SECONDS` 상한).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from ..config import get_settings
+
+DECREASE_COOLDOWN_SECONDS = 1.0
+TOO_MANY_REQUESTS = 429
+SERVER_ERROR_MIN = 500
+RETRY_AFTER_MAX_SECONDS = 120.0
+# 보충 계산의 부동소수 오차로 1토큰 직전에서 아주 짧은 sleep 이 반복되지 않게 한다
+_TOKEN_EPSILON = 1e-9
+
+Clock = Callable[[], float]
+Sleeper = Callable[[float], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class PacingConfig:
+    """origin 별 초당 발송 허용량 설정."""
+
+    initial_rate: float = 50.0
+    min_rate: float = 1.0
+    max_rate: float = 500.0
+    increase_step: float = 1.0
+    decrease_factor: float = 0.5
+
+
+@dataclass
+class _OriginBucket:
+    rate: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    last_decrease: float | None = None
+
+    @property
+    def capacity(self) -> float:
+        # 최대 1초 분량까지만 몰아서 보낸다
+        return max(1.0, self.rate)
+
+
+def push_origin(endpoint: str) -> str:
+    """구독 endpoint 의 push 서비스 origin (scheme://host[:port])."""
+    parts = urlsplit(endpoint)
+    return f"{parts.scheme}://{parts.netloc}" if parts.netloc else endpoint
+
+
+def is_throttled(status: int | None) -> bool:
+    """push 서비스가 과부하를 알린 응답인지 (429, 5xx)."""
+    return status is not None and (
+        status == TOO_MANY_REQUESTS or status >= SERVER_ERROR_MIN
+    )
+
+
+def parse_retry_after(
+    value: str | None, *, now: datetime | None = None
+) -> float | None:
+    """`Retry-After` 헤더(초 또는 HTTP-date)를 남은 초로 바꾼다."""
+    if not value:
+        return None
+    raw = value.strip()
+    if raw.isdigit():
+        return float(raw)
+    try:
+        when = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - (now or datetime.now(UTC))).total_seconds(), 0.0)
+
+
+class PushPacer:
+    """origin 별 토큰 버킷. `acquire` 로 발송 차례를 받고 `record` 로 결과를 알린다."""
+
+    def __init__(
+        self,
+        config: PacingConfig | None = None,
+        *,
+        clock: Clock = time.monotonic,
+        sleep: Sleeper = asyncio.sleep,
+    ) -> None:
+        self._config = config or PacingConfig()
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, _OriginBucket] = {}
+
+    def _bucket(self, origin: str) -> _OriginBucket:
+        bucket = self._buckets.get(origin)
+        if bucket is None:
+            rate = self._config.initial_rate
+            bucket = _OriginBucket(
+                rate=rate, tokens=max(1.0, rate), updated=self._clock()
+            )
+            self._buckets[origin] = bucket
+        return bucket
+
+    def rate(self, origin: str) -> float:
+        return self._bucket(origin).rate
+
+    async def acquire(self, origin: str) -> None:
+        """origin 으로 한 건 보낼 수 있을 때까지 기다린다."""
+        bucket = self._bucket(origin)
+        while True:
+            now = self._clock()
+            if bucket.blocked_until > now:
+                await self._sleep(bucket.blocked_until - now)
+                continue
+            elapsed = max(now - bucket.updated, 0.0)
+            bucket.tokens = min(bucket.capacity, bucket.tokens + elapsed * bucket.rate)
+            bucket.updated = now
+            if bucket.tokens >= 1.0 - _TOKEN_EPSILON:
+                bucket.tokens = max(bucket.tokens - 1.0, 0.0)
+                return
+            await self._sleep((1.0 - bucket.tokens) / bucket.rate)
+
+    def record(self, origin: str, status: int | None, *, ok: bool) -> None:
+        """발송 결과로 허용량을 조정한다(결과를 모르는 호출은 반영하지 않음)."""
+        bucket = self._bucket(origin)
+        cfg = self._config
+        if ok:
+            bucket.rate = min(cfg.max_rate, bucket.rate + cfg.increase_step)
+            return
+        if not is_throttled(status):
+            return
+        now = self._clock()
+        last = bucket.last_decrease
+        if last is not None and now - last < DECREASE_COOLDOWN_SECONDS:
+            return
+        bucket.rate = max(cfg.min_rate, bucket.rate * cfg.decrease_factor)
+        bucket.tokens = min(bucket.tokens, bucket.capacity)
+        bucket.last_decrease = now
+
+    def is_paused(self, origin: str) -> bool:
+        """Retry-After/backoff 로 origin 발송이 멈춰 있는지."""
+        return self._bucket(origin).blocked_until > self._clock()
+
+    def pause(self, origin: str, seconds: float) -> None:
+        """origin 발송을 `seconds` 동안 멈춘다(Retry-After/backoff)."""
+        bucket = self._bucket(origin)
+        delay = min(max(seconds, 0.0), RETRY_AFTER_MAX_SECONDS)
+        bucket.blocked_until = max(bucket.blocked_until, self._clock() + delay)
+
+
+# 모듈 상태 (global 문 대신 dict 사용) — 프로세스 안 발송 간에 학습한 허용량을 잇는다
+_state: dict[str, PushPacer | None] = {"pacer": None}
+
+
+def default_pacer() -> PushPacer:
+    pacer = _state["pacer"]
+    if pacer is None:
+        settings = get_settings()
+        pacer = PushPacer(
+            PacingConfig(
+                initial_rate=settings.push_rate_initial_per_second,
+                min_rate=settings.push_rate_min_per_second,
+                max_rate=settings.push_rate_max_per_second,
+            )
+        )
+        _state["pacer"] = pacer
+    return pacer
+
+
+def reset_default_pacer() -> None:
+    _state["pacer"] = None
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,7 +9,7 @@ from ..errors import ApiError
 from ..repositories import events as events_repo
 from ..repositories import members as members_repo
 from ..repositories import rsvps as rsvps_repo
-from .events_service import normalize_rsvp_status_for_capacity
+from .events_service import transition_rsvp_status
 
 
 async def list_rsvps(
@@ -43,18 +42,12 @@ async def create_rsvp(
     member_id: int,
     payload: schemas.RSVPCreate,
 ) -> models.RSVP:
-    event_obj = await events_repo.get_event(db, payload.event_id)  # 존재 확인
+    _ = await events_repo.get_event(db, payload.event_id)  # 존재 확인
     _ = await members_repo.get_member(db, member_id)  # 존재 확인
-    final_status = await normalize_rsvp_status_for_capacity(
+    return await transition_rsvp_status(
         db,
         event_id=int(payload.event_id),
-        capacity=cast(int, event_obj.capacity),
-        requested=payload.status,
-        existing=None,
-    )
-    return await rsvps_repo.create_rsvp(
-        db,
         member_id=member_id,
-        event_id=payload.event_id,
-        status=final_status.value,
+        requested=payload.status,
+        create_only=True,
     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import cast
@@ -12,13 +13,17 @@ from ..models import PushSubscription
 from ..repositories import notifications as subs_repo
 from ..repositories import scheduled_notifications as scheduled_repo
 from ..repositories import send_logs
-from .notifications_service import PushProvider
+from . import subscription_health
+from .notifications_service import PushProvider, RetryAfterSource
+from .push_pacing import PushPacer, default_pacer, is_throttled, push_origin
 
 
 @dataclass(frozen=True)
 class DeliveryBatchConfig:
     max_retries: int = 3
     scheduled_log_id: int | None = None
+    # None 이면 프로세스 공용 pacer(push_pacing.default_pacer)
+    pacer: PushPacer | None = None
 
 
 @dataclass(frozen=True)
@@ -26,19 +31,63 @@ class _DeliveryAttempt:
     ok: bool
     status_code: int | None
     uncertain: bool = False
+    origin_paused: bool = False
+
+
+def _retry_after(provider: PushProvider, endpoint: str) -> float | None:
+    if isinstance(provider, RetryAfterSource):
+        return provider.pop_retry_after(endpoint)
+    return None
+
+
+@dataclass
+class _QueuedSend:
+    """배치 안에서 발송 차례를 기다리는 구독 한 건."""
+
+    sub: PushSubscription
+    # 암호화 필드 복호화에 실패한 구독은 None(보내지 않고 실패로 기록)
+    endpoint: str | None = None
+    attempt: int = 0
+    claim: scheduled_repo.DeliveryClaim | None = None
+
+    @property
+    def origin(self) -> str | None:
+        return push_origin(self.endpoint) if self.endpoint is not None else None
+
+
+def _next_ready(queue: deque[_QueuedSend], pacer: PushPacer) -> _QueuedSend:
+    """멈추지 않은 origin 의 항목을 앞에서부터 꺼낸다(모두 멈췄으면 맨 앞)."""
+    for index, item in enumerate(queue):
+        origin = item.origin
+        if origin is None or not pacer.is_paused(origin):
+            del queue[index]
+            return item
+    return queue.popleft()
 
 
 async def _send_with_retry(
     provider: PushProvider,
-    sub: PushSubscription,
+    item: _QueuedSend,
     payload: dict[str, str],
     *,
-    max_retries: int,
-) -> _DeliveryAttempt:
-    """지수 백오프로 일시적 Push 실패를 재시도한다."""
-    status: int | None = None
-    for attempt in range(max_retries + 1):
-        ok, status = await provider.send_async(sub, payload)
+    endpoint: str,
+    config: DeliveryBatchConfig,
+) -> _DeliveryAttempt | None:
+    """origin 별 pacer 차례에 맞춰 보내고, 일시적 Push 실패를 재시도한다.
+
+    429/5xx 는 origin 전체를 `Retry-After`(없으면 지수 백오프) 동안 멈추고
+    None 을 돌려준다. 호출자는 항목을 배치 끝으로 보내 다른 origin 발송을
+    이어 가고, 멈춤이 풀린 뒤 다시 부른다.
+    """
+    pacer = config.pacer or default_pacer()
+    origin = push_origin(endpoint)
+    while True:
+        await pacer.acquire(origin)
+        ok, status = await provider.send_async(item.sub, payload)
+        retry_after = _retry_after(provider, endpoint)
+        # 다른 구독의 429/5xx 로 origin 이 멈춘 사이 받은 실패는 구독 탓이 아니다
+        paused = pacer.is_paused(origin)
+        pacer.record(origin, status, ok=ok)
         if ok:
             return _DeliveryAttempt(ok=True, status_code=status)
         if status is None:
@@ -48,12 +97,16 @@ async def _send_with_retry(
                 ok=False,
                 status_code=None,
                 uncertain=True,
+                origin_paused=paused,
             )
-        if status in (400, 404, 410):
-            return _DeliveryAttempt(ok=False, status_code=status)
-        if attempt < max_retries:
-            await asyncio.sleep((2**attempt) * 0.5)
-    return _DeliveryAttempt(ok=False, status_code=status)
+        if status in (400, 404, 410) or item.attempt >= config.max_retries:
+            return _DeliveryAttempt(ok=False, status_code=status, origin_paused=paused)
+        delay = retry_after if retry_after is not None else (2**item.attempt) * 0.5
+        item.attempt += 1
+        if is_throttled(status):
+            pacer.pause(origin, delay)
+            return None
+        await asyncio.sleep(delay)
 
 
 def _decrypt_subscription(sub: PushSubscription) -> str:
@@ -64,6 +117,18 @@ def _decrypt_subscription(sub: PushSubscription) -> str:
     return endpoint_plain
 
 
+def _queue_scheduled(sub: PushSubscription) -> _QueuedSend:
+    """claim 전에 복호화해 origin 을 알아 둔다.
+
+    origin 을 모르면 멈춘 origin 의 구독도 차례가 되어 claim 된 뒤
+    pacer.acquire 에서 Retry-After 내내 잠들어 다른 origin 까지 막는다.
+    """
+    try:
+        return _QueuedSend(sub=sub, endpoint=_decrypt_subscription(sub))
+    except CryptoError:
+        return _QueuedSend(sub=sub)
+
+
 async def _prepare_scheduled_delivery(
     db: AsyncSession,
     endpoint_hash: str,
@@ -88,22 +153,60 @@ async def _prepare_scheduled_delivery(
     return (claims[0], None) if claims else (None, state)
 
 
+def _log_item(
+    attempt: _DeliveryAttempt, *, endpoint: str | None, endpoint_hash: str
+) -> send_logs.SendLogItem:
+    if endpoint is None:
+        # 복호화 실패: provider 를 부르지 않았으므로 건강도에서 제외한다
+        return send_logs.SendLogItem(
+            ok=attempt.ok,
+            status_code=attempt.status_code,
+            stored_endpoint_hash=endpoint_hash,
+            local_failure=True,
+        )
+    return send_logs.SendLogItem(
+        endpoint=endpoint,
+        ok=attempt.ok,
+        status_code=attempt.status_code,
+        origin_paused=attempt.origin_paused,
+    )
+
+
+async def _claim_queued(
+    db: AsyncSession,
+    item: _QueuedSend,
+    *,
+    scheduled_log_id: int,
+) -> tuple[scheduled_repo.DeliveryClaim | None, str | None]:
+    """처음 꺼낸 항목만 claim 한다(배치 끝으로 미룬 항목은 claim 을 이미 가짐)."""
+    if item.claim is not None:
+        return item.claim, None
+    claim, state = await _prepare_scheduled_delivery(
+        db,
+        cast(str, item.sub.endpoint_hash),
+        scheduled_log_id=scheduled_log_id,
+    )
+    item.claim = claim
+    return claim, state
+
+
 async def _send_untracked_batch(
     db: AsyncSession,
     provider: PushProvider,
     batch: Sequence[PushSubscription],
     payload: dict[str, str],
-    *,
-    max_retries: int,
+    config: DeliveryBatchConfig,
 ) -> tuple[int, int]:
     accepted = 0
     failed = 0
     log_items: list[send_logs.SendLogItem] = []
     expired_hashes: list[str] = []
 
+    pacer = config.pacer or default_pacer()
+    queue: deque[_QueuedSend] = deque()
     for sub in batch:
         try:
-            endpoint_plain = _decrypt_subscription(sub)
+            queue.append(_QueuedSend(sub=sub, endpoint=_decrypt_subscription(sub)))
         except CryptoError:
             failed += 1
             log_items.append(
@@ -111,13 +214,20 @@ async def _send_untracked_batch(
                     ok=False,
                     status_code=None,
                     stored_endpoint_hash=cast(str, sub.endpoint_hash),
+                    local_failure=True,
                 )
             )
-            continue
 
+    while queue:
+        item = _next_ready(queue, pacer)
+        endpoint_plain = cast(str, item.endpoint)
         attempt = await _send_with_retry(
-            provider, sub, payload, max_retries=max_retries
+            provider, item, payload, endpoint=endpoint_plain, config=config
         )
+        if attempt is None:
+            # origin 이 멈췄다: 다른 origin 을 먼저 보내고 나중에 다시 시도한다
+            queue.append(item)
+            continue
         if attempt.ok:
             accepted += 1
         else:
@@ -129,10 +239,12 @@ async def _send_untracked_batch(
                 endpoint=endpoint_plain,
                 ok=attempt.ok,
                 status_code=attempt.status_code,
+                origin_paused=attempt.origin_paused,
             )
         )
 
     await send_logs.create_logs_batch(db, log_items)
+    await subscription_health.record_outcomes(db, log_items)
     await subs_repo.remove_by_endpoint_hashes(db, expired_hashes)
     return accepted, failed
 
@@ -147,48 +259,46 @@ async def send_batch_chunk(
     """일반 또는 예약 발송 배치 한 덩어리를 처리한다."""
     scheduled_log_id = config.scheduled_log_id
     if scheduled_log_id is None:
-        return await _send_untracked_batch(
-            db,
-            provider,
-            batch,
-            payload,
-            max_retries=config.max_retries,
-        )
+        return await _send_untracked_batch(db, provider, batch, payload, config)
 
     accepted = 0
     failed = 0
     log_items: list[send_logs.SendLogItem] = []
     expired_hashes: list[str] = []
 
-    for sub in batch:
-        endpoint_hash = cast(str, sub.endpoint_hash)
-        claim, state = await _prepare_scheduled_delivery(
-            db,
-            endpoint_hash,
-            scheduled_log_id=scheduled_log_id,
-        )
+    pacer = config.pacer or default_pacer()
+    queue = deque(_queue_scheduled(sub) for sub in batch)
+    while queue:
+        item = _next_ready(queue, pacer)
+        endpoint_hash = cast(str, item.sub.endpoint_hash)
+        claim, state = await _claim_queued(db, item, scheduled_log_id=scheduled_log_id)
         if claim is None:
             if state == "unknown":
+                # 이전 실행이 claim 뒤 중단된 건이라 구독 건강도와는 무관하다
                 failed += 1
                 log_items.append(
                     send_logs.SendLogItem(
                         ok=False,
                         status_code=None,
                         stored_endpoint_hash=endpoint_hash,
+                        local_failure=True,
                     )
                 )
             # completed/abandoned/in_progress 또는 다른 워커가 잠근 행이다.
             continue
 
-        try:
-            endpoint_plain = _decrypt_subscription(sub)
-        except CryptoError:
+        endpoint_plain = item.endpoint
+        if endpoint_plain is None:
             attempt = _DeliveryAttempt(ok=False, status_code=None)
-            endpoint_plain = None
         else:
-            attempt = await _send_with_retry(
-                provider, sub, payload, max_retries=config.max_retries
+            sent = await _send_with_retry(
+                provider, item, payload, endpoint=endpoint_plain, config=config
             )
+            if sent is None:
+                # claim 은 in_progress 로 둔 채 다른 origin 을 먼저 보낸다
+                queue.append(item)
+                continue
+            attempt = sent
 
         # claim 단위와 실제 외부 호출 단위를 일치시켜, 배치 후반의 미송신
         # endpoint가 프로세스 중단 때문에 unknown으로 같이 탈락하지 않게 한다.
@@ -209,25 +319,13 @@ async def send_batch_chunk(
             failed += 1
             if endpoint_plain is not None and attempt.status_code in (404, 410):
                 expired_hashes.append(subs_repo.hash_endpoint(endpoint_plain))
-        if endpoint_plain is None:
-            log_items.append(
-                send_logs.SendLogItem(
-                    ok=attempt.ok,
-                    status_code=attempt.status_code,
-                    stored_endpoint_hash=endpoint_hash,
-                )
-            )
-        else:
-            log_items.append(
-                send_logs.SendLogItem(
-                    endpoint=endpoint_plain,
-                    ok=attempt.ok,
-                    status_code=attempt.status_code,
-                )
-            )
+        log_items.append(
+            _log_item(attempt, endpoint=endpoint_plain, endpoint_hash=endpoint_hash)
+        )
 
     # 일반 발송 로그 저장이 실패해도 delivery 결과는 이미 endpoint별로
     # 커밋되어 다음 예약 실행의 재시도 경계를 보존한다.
     await send_logs.create_logs_batch(db, log_items)
+    await subscription_health.record_outcomes(db, log_items)
     await subs_repo.remove_by_endpoint_hashes(db, expired_hashes)
     return accepted, failed
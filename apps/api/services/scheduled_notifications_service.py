@@ -15,10 +15,10 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Event, PushSubscription, ScheduledNotificationLog
-from ..repositories import notification_preferences as pref_repo
-from ..repositories import notifications as subs_repo
 from ..repositories import scheduled_notifications as scheduled_repo
+from .notification_audience import AudienceSnapshot, resolve_audience
 from .notifications_service import PushProvider, SendResult
+from .push_pacing import PushPacer
 from .scheduled_delivery_service import DeliveryBatchConfig, send_batch_chunk
 
 if TYPE_CHECKING:
@@ -30,16 +30,31 @@ KST = timezone(timedelta(hours=9))
 
 DType = Literal["d-3", "d-1"]
 SCHEDULED_LOG_STALE_AFTER = timedelta(minutes=15)
+# 발송 중 이 예외가 나면 로그를 실패로 마감한다(CancelledError 는 마감 후 다시 올림)
+DELIVERY_ERRORS: tuple[type[Exception], ...] = (
+    RuntimeError,
+    TypeError,
+    ValueError,
+    OSError,
+    RequestException,
+    SQLAlchemyError,
+)
 
 
 @dataclass
 class BatchConfig:
-    """발송 배치 설정."""
+    """발송 배치 설정.
+
+    batch_size 는 발송 로그·만료 구독 정리를 모아 쓰는 단위다. 발송 속도는
+    고정 sleep 대신 pacer(push 서비스 origin 별 토큰 버킷)가 정한다.
+    """
 
     batch_size: int = 50
-    batch_delay_seconds: float = 1.0
     max_retries: int = 3
+    pacer: PushPacer | None = None
     scheduled_log_id: int | None = None
+    # 트리거가 여러 로그의 delivery 행을 미리 한 번에 만든 경우
+    deliveries_prepared: bool = False
 
 
 async def find_events_due_for_notification(
@@ -94,22 +109,11 @@ async def get_eligible_subscriptions(
 ) -> Sequence[PushSubscription]:
     """토픽 기준으로 알림 수신 가능한 구독 목록 반환.
 
-    로직:
-    1. 활성 구독(revoked_at IS NULL) 조회
-    2. member_id가 있는 경우, 해당 회원이 topic을 opt-out 했으면 제외
-    3. member_id가 없는 경우(익명 구독), 기본 포함
+    활성 구독(revoked_at IS NULL) 중 회원이 topic 을 opt-out 한 것을 제외하고,
+    익명 구독은 기본 포함한다(한 쿼리).
     """
-    all_subs = await subs_repo.list_active_subscriptions(db)
-    opted_out = await pref_repo.get_opted_out_member_ids(db, topic=topic)
-
-    eligible: list[PushSubscription] = []
-    for sub in all_subs:
-        member_id = getattr(sub, "member_id", None)
-        if member_id is not None and member_id in opted_out:
-            continue
-        eligible.append(sub)
-
-    return eligible
+    snapshot = await resolve_audience(db, topic=topic)
+    return snapshot.subscriptions
 
 
 async def send_batch_notifications(
@@ -120,7 +124,7 @@ async def send_batch_notifications(
     payload: dict[str, str],
     config: BatchConfig | None = None,
 ) -> SendResult:
-    """배치 단위로 알림 발송 (레이트리밋 준수).
+    """배치 단위로 알림 발송 (push 서비스별 적응형 속도 조절).
 
     예약 발송은 구독별 claim을 외부 호출 전에 커밋한다. 외부 호출 뒤
     프로세스가 중단되어 결과가 불확실해져도 다음 실행에서 해당 endpoint를
@@ -132,7 +136,7 @@ async def send_batch_notifications(
     scheduled_log_id = cfg.scheduled_log_id
 
     subs_list = list(subscriptions)
-    if scheduled_log_id is not None:
+    if scheduled_log_id is not None and not cfg.deliveries_prepared:
         await scheduled_repo.ensure_deliveries(
             db,
             scheduled_log_id=scheduled_log_id,
@@ -149,15 +153,12 @@ async def send_batch_notifications(
             DeliveryBatchConfig(
                 max_retries=cfg.max_retries,
                 scheduled_log_id=scheduled_log_id,
+                pacer=cfg.pacer,
             ),
         )
         accepted += chunk_accepted
         failed += chunk_failed
 
-        # 배치 간 딜레이 (레이트리밋 준수)
-        if i + cfg.batch_size < len(subs_list):
-            await asyncio.sleep(cfg.batch_delay_seconds)
-
     if scheduled_log_id is not None:
         counts = await scheduled_repo.get_delivery_counts(
             db, scheduled_log_id=scheduled_log_id
@@ -232,7 +233,7 @@ async def update_notification_log(
         await db.commit()
 
 
-async def _finalize_failed_notification(
+async def finalize_failed_notification(
     db: AsyncSession,
     *,
     log_id: int,
@@ -280,17 +281,24 @@ class ProcessResult:
     failed: int
 
 
-async def process_single_event(
-    db: AsyncSession,
-    provider: PushProvider,
-    event: Event,
-    d_type: DType,
-) -> ProcessResult:
-    """단일 이벤트 알림 처리 (스케줄러/수동 트리거 공용)."""
+@dataclass(frozen=True)
+class ClaimedEvent:
+    """발송 로그를 확보한 행사 한 건."""
+
+    event_id: int
+    title: str
+    location: str
+    d_type: DType
+    log_id: int
+
+
+async def claim_event_log(
+    db: AsyncSession, event: Event, d_type: DType
+) -> ClaimedEvent | None:
+    """stale 로그 회수·중복 확인 뒤 발송 로그를 만든다(스킵이면 None)."""
     event_id = cast(int, event.id)
     event_title = cast(str, event.title)
     raw_location = cast("str | None", event.location)
-    event_location = raw_location if raw_location else ""
 
     await scheduled_repo.reclaim_stale_log(
         db,
@@ -302,9 +310,7 @@ async def process_single_event(
     # 중복 발송 확인
     if await is_already_sent(db, event_id=event_id, d_type=d_type):
         logger.info(f"이미 발송됨: event_id={event_id}, d_type={d_type}")
-        return ProcessResult(
-            event_id=event_id, d_type=d_type, skipped=True, accepted=0, failed=0
-        )
+        return None
 
     # 발송 로그 생성 (in_progress 상태)
     # 신규 삽입 또는 failed stale 행 회수. pending/in_progress 충돌은 None이다.
@@ -316,17 +322,71 @@ async def process_single_event(
     )
     if log is None:
         logger.info(f"다른 워커가 처리 중: event_id={event_id}, d_type={d_type}")
-        return ProcessResult(
-            event_id=event_id, d_type=d_type, skipped=True, accepted=0, failed=0
-        )
-    log_id = cast(int, log.id)
+        return None
+    return ClaimedEvent(
+        event_id=event_id,
+        title=event_title,
+        location=raw_location if raw_location else "",
+        d_type=d_type,
+        log_id=cast(int, log.id),
+    )
+
+
+def _skipped(event: Event, d_type: DType) -> ProcessResult:
+    return ProcessResult(
+        event_id=cast(int, event.id),
+        d_type=d_type,
+        skipped=True,
+        accepted=0,
+        failed=0,
+    )
+
+
+async def process_single_event(
+    db: AsyncSession,
+    provider: PushProvider,
+    event: Event,
+    d_type: DType,
+) -> ProcessResult:
+    """단일 이벤트 알림 처리 (스케줄러/수동 트리거 공용)."""
+    claimed = await claim_event_log(db, event, d_type)
+    if claimed is None:
+        return _skipped(event, d_type)
+    return await deliver_claimed_event(db, provider, claimed, audience=None)
+
+
+async def deliver_claimed_event(
+    db: AsyncSession,
+    provider: PushProvider,
+    claimed: ClaimedEvent,
+    *,
+    audience: AudienceSnapshot | None,
+) -> ProcessResult:
+    """확보한 발송 로그로 대상에게 보낸다.
+
+    audience 가 주어지면 트리거가 미리 만든 delivery 행을 그대로 쓴다.
+    로그가 아직 pending 일 때만 in_progress 로 옮기고 발송한다.
+    """
+    event_id = claimed.event_id
+    d_type = claimed.d_type
+    log_id = claimed.log_id
     subs: Sequence[PushSubscription] = []
 
     try:
-        await update_notification_log(db, log_id, status="in_progress")
+        if not await scheduled_repo.start_log(db, log_id=log_id):
+            # 기다리는 동안 stale 회수로 실패 마감된 로그는 다음 실행이 다시 확보한다
+            logger.warning(
+                "발송 로그가 pending 이 아님: event_id=%s, d_type=%s", event_id, d_type
+            )
+            return ProcessResult(
+                event_id=event_id, d_type=d_type, skipped=True, accepted=0, failed=0
+            )
 
-        # 대상 구독자 조회
-        subs = await get_eligible_subscriptions(db, topic="event")
+        # 대상 구독자 조회 (트리거 실행이면 공유 스냅샷)
+        if audience is None:
+            subs = await get_eligible_subscriptions(db, topic="event")
+        else:
+            subs = audience.subscriptions
 
         if not subs:
             logger.info(f"발송 대상 없음: event_id={event_id}")
@@ -338,8 +398,8 @@ async def process_single_event(
         # 알림 페이로드 생성
         days_label = "3일" if d_type == "d-3" else "1일"
         payload = {
-            "title": f"[행사 알림] {event_title}",
-            "body": f"{days_label} 후 행사가 있습니다. {event_location}",
+            "title": f"[행사 알림] {claimed.title}",
+            "body": f"{days_label} 후 행사가 있습니다. {claimed.location}",
             "url": f"/events/{event_id}",
         }
 
@@ -350,24 +410,20 @@ async def process_single_event(
             provider,
             subscriptions=subs,
             payload=payload,
-            config=BatchConfig(scheduled_log_id=log_id),
+            config=BatchConfig(
+                scheduled_log_id=log_id,
+                deliveries_prepared=audience is not None,
+            ),
         )
     except asyncio.CancelledError:
         logger.exception("예약 발송 실패: event_id=%s, d_type=%s", event_id, d_type)
         await asyncio.shield(
-            _finalize_failed_notification(db, log_id=log_id, fallback_failed=len(subs))
+            finalize_failed_notification(db, log_id=log_id, fallback_failed=len(subs))
         )
         raise
-    except (
-        RuntimeError,
-        TypeError,
-        ValueError,
-        OSError,
-        RequestException,
-        SQLAlchemyError,
-    ):
+    except DELIVERY_ERRORS:
         logger.exception("예약 발송 실패: event_id=%s, d_type=%s", event_id, d_type)
-        counts = await _finalize_failed_notification(
+        counts = await finalize_failed_notification(
             db, log_id=log_id, fallback_failed=len(subs)
         )
         return ProcessResult(
@@ -393,7 +449,7 @@ async def process_single_event(
             event_id,
             d_type,
         )
-        counts = await _finalize_failed_notification(
+        counts = await finalize_failed_notification(
             db, log_id=log_id, fallback_failed=result.failed
         )
         return ProcessResult(
@@ -418,57 +474,6 @@ async def process_single_event(
     )
 
 
-@dataclass
-class TriggerResult:
-    """트리거 결과 요약."""
-
-    total_events: int
-    processed: int
-    skipped: int
-    total_accepted: int
-    total_failed: int
-
-
-async def trigger_scheduled_notifications(
-    db: AsyncSession,
-    provider: PushProvider,
-    *,
-    target_date: date | None = None,
-) -> TriggerResult:
-    """예약 알림 트리거 (스케줄러/수동 공용)."""
-    reclaimed = await reclaim_stale_scheduled_logs(db)
-    if reclaimed:
-        logger.info("stale 예약 로그 회수: count=%s", reclaimed)
-
-    events_by_dtype = await find_events_due_for_notification(
-        db, target_date=target_date
-    )
-
-    total_events = sum(len(evts) for evts in events_by_dtype.values())
-    processed = 0
-    skipped = 0
-    total_accepted = 0
-    total_failed = 0
-
-    for d_type, events in events_by_dtype.items():
-        for event in events:
-            result = await process_single_event(db, provider, event, d_type)
-            if result.skipped:
-                skipped += 1
-            else:
-                processed += 1
-                total_accepted += result.accepted
-                total_failed += result.failed
-
-    return TriggerResult(
-        total_events=total_events,
-        processed=processed,
-        skipped=skipped,
-        total_accepted=total_accepted,
-        total_failed=total_failed,
-    )
-
-
 async def reclaim_stale_scheduled_logs(
     db: AsyncSession,
     *,
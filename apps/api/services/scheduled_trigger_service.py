@@ -0,0 +1,270 @@
+"""예약 알림 트리거 실행 — 대상 공유와 묶음(digest) 발송.
+
+트리거 한 번은 D-3/D-1 행사마다 발송 로그를 먼저 확보한 뒤, 수신 대상을 한 번만
+계산해 모든 행사가 공유한다. 확보한 로그는 발송 직전에 pending → in_progress 로
+조건부 전이하고, 차례를 기다리는 로그는 행사마다 updated_at 을 갱신해 stale
+회수(실패 마감 후 재확보)와 겹쳐 두 번 보내지 않게 한다.
+
+- 기본: 행사마다 같은 대상에게 보낸다(delivery 행은 모든 로그에 한 문장으로 준비).
+- SCHEDULED_NOTIFICATION_DIGEST=true 이고 확보한 행사가 둘 이상이면 구독자마다
+  "다가오는 행사 N건" 알림 한 번만 보낸다. delivery 행·Push 호출은 대표 로그
+  (가장 작은 id) 하나에만 생기고, 행사별 ScheduledNotificationLog 는 같은 결과로
+  마감한다. 재시도에서도 대표 로그가 같아 이미 보낸 구독자는 다시 받지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..repositories import scheduled_notifications as scheduled_repo
+from . import scheduled_notifications_service as sched
+from .notification_audience import AudienceSnapshot, resolve_audience
+from .notifications_service import PushProvider, SendResult
+
+logger = logging.getLogger(__name__)
+
+# 묶음 알림 본문에 제목을 나열할 최대 행사 수 (나머지는 "외 N건")
+DIGEST_BODY_MAX_EVENTS = 3
+
+
+@dataclass
+class TriggerResult:
+    """트리거 결과 요약."""
+
+    total_events: int
+    processed: int
+    skipped: int
+    total_accepted: int
+    total_failed: int
+
+
+def build_digest_payload(claimed: Sequence[sched.ClaimedEvent]) -> dict[str, str]:
+    """가까운 행사부터 제목을 나열한 묶음 알림 페이로드."""
+    ordered = sorted(claimed, key=lambda item: (item.d_type != "d-1", item.title))
+    listed = [
+        f"{item.d_type.upper()} {item.title}"
+        for item in ordered[:DIGEST_BODY_MAX_EVENTS]
+    ]
+    body = " · ".join(listed)
+    if len(ordered) > DIGEST_BODY_MAX_EVENTS:
+        body += f" 외 {len(ordered) - DIGEST_BODY_MAX_EVENTS}건"
+    return {
+        "title": f"[행사 알림] 다가오는 행사 {len(ordered)}건",
+        "body": body,
+        "url": "/events",
+    }
+
+
+async def _prepare_trigger_audience(
+    db: AsyncSession, scheduled_log_ids: Sequence[int]
+) -> AudienceSnapshot | None:
+    """대상은 실행당 한 번만 계산하고 delivery 행을 한 문장으로 만든다."""
+    try:
+        audience = await resolve_audience(db, topic="event")
+        await scheduled_repo.ensure_deliveries_for_logs(
+            db,
+            scheduled_log_ids=scheduled_log_ids,
+            endpoint_hashes=audience.endpoint_hashes,
+        )
+    except SQLAlchemyError:
+        logger.exception("예약 알림 대상 준비 실패: logs=%s", len(scheduled_log_ids))
+        return None
+    logger.info(
+        "예약 알림 대상 확정: logs=%s, subscriptions=%s, version=%s",
+        len(scheduled_log_ids),
+        len(audience.subscriptions),
+        audience.version,
+    )
+    return audience
+
+
+async def _close_logs(
+    db: AsyncSession,
+    claimed: Sequence[sched.ClaimedEvent],
+    *,
+    status: str,
+    result: SendResult,
+) -> list[sched.ProcessResult]:
+    """행사별 로그를 같은 결과로 마감한다."""
+    for claim in claimed:
+        await sched.update_notification_log(
+            db,
+            claim.log_id,
+            status=status,
+            accepted_count=result.accepted,
+            failed_count=result.failed,
+        )
+    return [
+        sched.ProcessResult(
+            event_id=claim.event_id,
+            d_type=claim.d_type,
+            skipped=False,
+            accepted=result.accepted,
+            failed=result.failed,
+        )
+        for claim in claimed
+    ]
+
+
+async def _fail_logs(
+    db: AsyncSession,
+    claimed: Sequence[sched.ClaimedEvent],
+    *,
+    fallback_failed: int,
+) -> list[sched.ProcessResult]:
+    """대표 로그를 실패로 마감하고 같은 집계를 나머지 로그에 옮긴다."""
+    primary, *others = claimed
+    counts = await sched.finalize_failed_notification(
+        db, log_id=primary.log_id, fallback_failed=fallback_failed
+    )
+    result = SendResult(accepted=counts.accepted, failed=counts.failed)
+    primary_result = sched.ProcessResult(
+        event_id=primary.event_id,
+        d_type=primary.d_type,
+        skipped=False,
+        accepted=counts.accepted,
+        failed=counts.failed,
+    )
+    try:
+        rest = await _close_logs(db, others, status="failed", result=result)
+    except SQLAlchemyError:
+        # 남은 로그는 stale 회수에 맡긴다.
+        await db.rollback()
+        logger.exception("묶음 알림 실패 로그 마감 실패: events=%s", len(others))
+        rest = []
+    return [primary_result, *rest]
+
+
+async def _deliver_digest(
+    db: AsyncSession,
+    provider: PushProvider,
+    claimed: Sequence[sched.ClaimedEvent],
+    audience: AudienceSnapshot,
+) -> list[sched.ProcessResult]:
+    """구독자마다 묶음 알림 한 번을 대표 로그의 delivery 로 보낸다."""
+    ordered = sorted(claimed, key=lambda claim: claim.log_id)
+    primary = ordered[0]
+    subs = audience.subscriptions
+    if not await scheduled_repo.start_log(db, log_id=primary.log_id):
+        # delivery 행은 대표 로그에 묶여 있으니 대표를 못 잡으면 보내지 않는다
+        logger.warning(
+            "묶음 알림 대표 로그가 pending 이 아님: log_id=%s", primary.log_id
+        )
+        return []
+    ordered = [primary] + [
+        claim
+        for claim in ordered[1:]
+        if await scheduled_repo.start_log(db, log_id=claim.log_id)
+    ]
+    try:
+        if not subs:
+            return await _close_logs(
+                db, ordered, status="completed", result=SendResult(0, 0)
+            )
+        result = await sched.send_batch_notifications(
+            db,
+            provider,
+            subscriptions=subs,
+            payload=build_digest_payload(ordered),
+            config=sched.BatchConfig(
+                scheduled_log_id=primary.log_id, deliveries_prepared=True
+            ),
+        )
+    except asyncio.CancelledError:
+        logger.exception("묶음 알림 발송 실패: events=%s", len(ordered))
+        await asyncio.shield(_fail_logs(db, ordered, fallback_failed=len(subs)))
+        raise
+    except sched.DELIVERY_ERRORS:
+        logger.exception("묶음 알림 발송 실패: events=%s", len(ordered))
+        return await _fail_logs(db, ordered, fallback_failed=len(subs))
+
+    status = "failed" if result.failed else "completed"
+    try:
+        return await _close_logs(db, ordered, status=status, result=result)
+    except SQLAlchemyError:
+        logger.exception("묶음 알림 최종 로그 마감 실패: events=%s", len(ordered))
+        await db.rollback()
+        return await _fail_logs(db, ordered, fallback_failed=result.failed)
+
+
+async def _deliver_claimed(
+    db: AsyncSession,
+    provider: PushProvider,
+    claimed: Sequence[sched.ClaimedEvent],
+) -> list[sched.ProcessResult]:
+    digest = get_settings().scheduled_notification_digest and len(claimed) > 1
+    primary_id = min(claim.log_id for claim in claimed)
+    audience = await _prepare_trigger_audience(
+        db, [primary_id] if digest else [claim.log_id for claim in claimed]
+    )
+    if audience is None:
+        # 준비 실패: 확보한 로그는 실패로 마감해 다음 실행이 다시 회수한다.
+        results: list[sched.ProcessResult] = []
+        for claim in claimed:
+            counts = await sched.finalize_failed_notification(
+                db, log_id=claim.log_id, fallback_failed=0
+            )
+            results.append(
+                sched.ProcessResult(
+                    event_id=claim.event_id,
+                    d_type=claim.d_type,
+                    skipped=False,
+                    accepted=counts.accepted,
+                    failed=counts.failed,
+                )
+            )
+        return results
+    if digest:
+        return await _deliver_digest(db, provider, claimed, audience)
+    results = []
+    for index, claim in enumerate(claimed):
+        # 앞 행사를 보내는 동안 기다린 로그가 stale 회수되지 않게 갱신한다
+        await scheduled_repo.touch_pending_logs(
+            db, log_ids=[waiting.log_id for waiting in claimed[index:]]
+        )
+        results.append(
+            await sched.deliver_claimed_event(db, provider, claim, audience=audience)
+        )
+    return results
+
+
+async def trigger_scheduled_notifications(
+    db: AsyncSession,
+    provider: PushProvider,
+    *,
+    target_date: date | None = None,
+) -> TriggerResult:
+    """예약 알림 트리거 (스케줄러/수동 공용)."""
+    reclaimed = await sched.reclaim_stale_scheduled_logs(db)
+    if reclaimed:
+        logger.info("stale 예약 로그 회수: count=%s", reclaimed)
+
+    events_by_dtype = await sched.find_events_due_for_notification(
+        db, target_date=target_date
+    )
+    total_events = sum(len(evts) for evts in events_by_dtype.values())
+
+    claimed: list[sched.ClaimedEvent] = []
+    for d_type, events in events_by_dtype.items():
+        for event in events:
+            claim = await sched.claim_event_log(db, event, d_type)
+            if claim is not None:
+                claimed.append(claim)
+
+    results = await _deliver_claimed(db, provider, claimed) if claimed else []
+    processed = [result for result in results if not result.skipped]
+    return TriggerResult(
+        total_events=total_events,
+        processed=len(processed),
+        skipped=total_events - len(processed),
+        total_accepted=sum(result.accepted for result in results),
+        total_failed=sum(result.failed for result in results),
+    )
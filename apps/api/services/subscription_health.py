@@ -0,0 +1,113 @@
+"""Push 구독 건강도 — 발송 결과로 죽어 가는 구독을 미리 걸러낸다.
+
+404/410 은 발송 직후 바로 지우지만, 타임아웃·5xx 가 반복되는 endpoint 는
+발송마다 다시 호출되어 시간과 네트워크를 쓴다. 그래서 발송 로그 항목에서
+구독별 결과를 모아 다음을 적용한다.
+
+- 성공: 연속 실패 수를 0 으로, 격리를 풀고, 마지막 성공 시각을 남긴다.
+- 실패: 연속 실패 수를 올리고, `quarantine_after_failures` 번째부터
+  base 기간부터 두 배씩(max 상한) `quarantined_until` 까지 발송 대상에서 뺀다.
+  429 와 pacer 가 origin 을 멈춘 동안 받은 실패는 push 서비스 과부하이지
+  구독 문제가 아니므로 세지 않는다. 복호화 실패나 이전 실행이 중단되어
+  결과를 모르는 claim 처럼 provider 를 부르지 않은 실패도 세지 않는다.
+- sweep(매일 leader 잡): `revoke_after_days` 동안 성공이 없는 불건강 구독의
+  `revoked_at` 을 채운다. 사용자가 다시 구독하면 upsert 가 상태를 초기화한다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..repositories import notifications as subs_repo
+from ..repositories.send_logs import SendLogItem
+
+# 발송 루프가 곧바로 구독을 지우는 응답과 origin 과부하 응답(건강도 집계 대상 아님)
+_IGNORED_STATUSES = frozenset(
+    {
+        int(HTTPStatus.NOT_FOUND),
+        int(HTTPStatus.GONE),
+        int(HTTPStatus.TOO_MANY_REQUESTS),
+    }
+)
+
+
+@dataclass(frozen=True)
+class HealthPolicy:
+    """격리·해지 기준. 0 이면 해당 단계를 끈다."""
+
+    quarantine_after_failures: int = 3
+    quarantine_base: timedelta = timedelta(hours=1)
+    quarantine_max: timedelta = timedelta(days=7)
+    revoke_after_days: int = 30
+
+
+def default_policy() -> HealthPolicy:
+    settings = get_settings()
+    return HealthPolicy(
+        quarantine_after_failures=settings.push_quarantine_after_failures,
+        quarantine_base=timedelta(minutes=settings.push_quarantine_base_minutes),
+        quarantine_max=timedelta(hours=settings.push_quarantine_max_hours),
+        revoke_after_days=settings.push_revoke_after_days,
+    )
+
+
+def _endpoint_hash(item: SendLogItem) -> str | None:
+    if item.stored_endpoint_hash:
+        return item.stored_endpoint_hash
+    if item.endpoint:
+        return subs_repo.hash_endpoint(item.endpoint)
+    return None
+
+
+async def record_outcomes(
+    db: AsyncSession,
+    items: Sequence[SendLogItem],
+    *,
+    policy: HealthPolicy | None = None,
+) -> None:
+    """발송 로그 항목(구독별 최종 결과)으로 건강도를 갱신한다."""
+    policy = policy or default_policy()
+    succeeded: list[str] = []
+    failed: list[str] = []
+    for item in items:
+        endpoint_hash = _endpoint_hash(item)
+        if endpoint_hash is None:
+            continue
+        if item.ok:
+            succeeded.append(endpoint_hash)
+        elif item.origin_paused or item.local_failure:
+            continue
+        elif item.status_code not in _IGNORED_STATUSES:
+            failed.append(endpoint_hash)
+    await subs_repo.mark_send_successes(db, succeeded)
+    await subs_repo.mark_send_failures(
+        db,
+        failed,
+        quarantine_after=policy.quarantine_after_failures,
+        backoff_base_seconds=policy.quarantine_base.total_seconds(),
+        backoff_max_seconds=policy.quarantine_max.total_seconds(),
+    )
+
+
+async def sweep_dead_subscriptions(
+    db: AsyncSession,
+    *,
+    policy: HealthPolicy | None = None,
+    now: datetime | None = None,
+) -> int:
+    """오랫동안 성공 없이 실패만 쌓인 구독을 해지하고 그 수를 돌려준다."""
+    policy = policy or default_policy()
+    if policy.revoke_after_days <= 0:
+        return 0
+    dead_before = (now or datetime.now(UTC)) - timedelta(days=policy.revoke_after_days)
+    return await subs_repo.revoke_dead_subscriptions(
+        db,
+        min_failures=max(policy.quarantine_after_failures, 1),
+        dead_before=dead_before,
+    )
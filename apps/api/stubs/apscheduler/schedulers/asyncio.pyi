@@ -26,5 +26,7 @@ class AsyncIOScheduler:
         replace_existing: bool = False,
         **trigger_args: Any,
     ) -> Job: ...
+    def pause_job(self, job_id: str, jobstore: str | None = None) -> Job: ...
+    def resume_job(self, job_id: str, jobstore: str | None = None) -> Job | None: ...
     def start(self) -> None: ...
     def shutdown(self, wait: bool = True) -> None: ...
@@ -0,0 +1,12 @@
+"""APScheduler DateTrigger 타입 스텁."""
+
+from datetime import datetime, tzinfo
+
+from .base import BaseTrigger
+
+class DateTrigger(BaseTrigger):
+    def __init__(
+        self,
+        run_date: datetime | str | None = None,
+        timezone: tzinfo | str | None = None,
+    ) -> None: ...
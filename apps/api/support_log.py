@@ -0,0 +1,87 @@
+"""문의(support) 접수 파일 로그.
+
+예전에는 접수마다 `support.log` 전체를 read_text 로 읽고 `prev + line` 을
+write_text 로 다시 써서, 이벤트 루프에서 파일 크기(최대 1MB)만큼 블로킹 I/O 가
+일어났다. 여기서는 logging 파이프라인을 쓴다.
+
+- 요청 경로는 QueueHandler 로 큐에 넣기만 하고(논블로킹),
+- QueueListener 스레드의 RotatingFileHandler 가 append 모드로 쓰며
+  크기 상한에서 `support.log.1` 로 돌린다.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+DEFAULT_SUPPORT_LOG_PATH = Path("logs") / "support.log"
+SUPPORT_LOG_MAX_BYTES = 1 * 1024 * 1024
+SUPPORT_LOG_BACKUP_COUNT = 1
+
+
+class SupportLog:
+    """큐를 거쳐 백그라운드 스레드에서 append·로테이션하는 파일 로그."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = SUPPORT_LOG_MAX_BYTES,
+        backup_count: int = SUPPORT_LOG_BACKUP_COUNT,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_handler = RotatingFileHandler(
+            path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        self._file_handler.setFormatter(logging.Formatter("%(message)s"))
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener = QueueListener(records, self._file_handler)
+        # 앱 로거 트리와 분리해 콘솔·Sentry 로 문의 본문이 흘러가지 않게 한다.
+        self._logger = logging.Logger(f"apps.api.support_log.{path}")
+        self._logger.addHandler(QueueHandler(records))
+        self._logger.propagate = False
+        self._listener.start()
+
+    def write(self, entry: str) -> None:
+        """entry 한 건을 큐에 넣는다(디스크 I/O 는 리스너 스레드에서)."""
+        self._logger.info(entry)
+
+    def close(self) -> None:
+        """큐에 남은 항목을 모두 쓴 뒤 파일을 닫는다."""
+        self._listener.stop()
+        self._file_handler.close()
+
+
+# 모듈 상태 (global 문 대신 dict 사용)
+_state: dict[str, SupportLog | None] = {"log": None}
+
+
+def get_support_log() -> SupportLog:
+    log = _state["log"]
+    if log is None:
+        log = SupportLog(DEFAULT_SUPPORT_LOG_PATH)
+        _state["log"] = log
+    return log
+
+
+def shutdown_support_log() -> None:
+    """앱 종료 시 대기 중인 항목을 기록하고 리스너를 멈춘다."""
+    log = _state["log"]
+    _state["log"] = None
+    if log is not None:
+        log.close()
+
+
+def format_support_entry(
+    subject: str, contact: str | None, body: str, *, now: datetime | None = None
+) -> str:
+    """`시각\\t제목\\t연락처` 머리줄, 본문, 구분선(---) 형식 한 건."""
+    ts = (now or datetime.now(UTC)).isoformat()
+    return f"{ts}\t{subject}\t{contact or ''}\n{body}\n---"
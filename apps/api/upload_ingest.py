@@ -0,0 +1,335 @@
+"""업로드 스트리밍 수집(ingest)과 조기 거절.
+
+`await file.read()` 는 본문 전체를 메모리에 올린 뒤에야 크기를 확인하고,
+이어지는 `Image.open(BytesIO(...))` 가 사본을 하나 더 만든다. 여기서는
+청크 단위로 읽어 스풀(작으면 메모리, 크면 임시 파일)에 쌓으면서
+
+- 크기 상한을 넘는 순간 읽기를 멈추고 거절하고,
+- 첫 청크의 매직 바이트로 형식을 판별해 허용되지 않은 형식은 바로 거절하며,
+- 헤더만 읽어 가로·세로를 확인해 디코딩 폭탄을 전체 디코딩 전에 막는다.
+
+디코더(프로세스 풀)에는 메모리 스풀이면 바이트, 디스크로 넘쳤으면 임시 파일
+경로를 넘기므로 업로드당 메모리는 스풀 임계값 수준으로 묶인다.
+Content-Length 가 상한을 넘는 요청은 미들웨어가 본문을 읽기 전에 413 으로 끊는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import IO
+
+from fastapi import UploadFile
+from PIL import Image, UnidentifiedImageError
+from PIL.Image import DecompressionBombError
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import get_settings
+from .errors import ApiError
+from .image_pipeline import ImageSource
+from .logging_utils import log_json
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+# multipart 경계·헤더 몫. Content-Length 는 파일 크기보다 이만큼 클 수 있다.
+_MULTIPART_OVERHEAD = 64 * 1024
+
+UPLOAD_FORMATS = frozenset({"JPEG", "PNG", "WEBP", "GIF"})
+AVATAR_FORMATS = frozenset({"JPEG", "PNG", "WEBP"})
+
+# 종류별 거절 코드 (기존 API 오류 코드 유지)
+_ERRORS: dict[str, dict[str, tuple[str, str]]] = {
+    "upload": {
+        "empty": ("invalid_image_data", "이미지 파일이 비어 있습니다."),
+        "invalid": ("invalid_image_data", "이미지 파일을 읽을 수 없습니다."),
+        "too_large": ("image_too_large", "이미지 크기가 허용 범위를 초과했습니다."),
+        "format": ("invalid_image_data", "이미지 파일을 읽을 수 없습니다."),
+        "pixels": ("image_too_many_pixels", "이미지 해상도가 너무 큽니다."),
+    },
+    "avatar": {
+        "empty": ("avatar_empty", "이미지 파일이 비어 있습니다."),
+        "invalid": ("avatar_invalid_image", "이미지 형식을 인식할 수 없습니다."),
+        "too_large": (
+            "avatar_too_large_raw",
+            "업로드 파일 크기가 허용 범위를 초과했습니다.",
+        ),
+        "format": (
+            "avatar_unsupported_format",
+            "JPG, PNG, WEBP 형식만 업로드할 수 있습니다.",
+        ),
+        "pixels": ("avatar_too_many_pixels", "이미지 해상도가 너무 큽니다."),
+    },
+}
+
+
+@dataclass(frozen=True)
+class IngestPolicy:
+    """업로드 종류별 수집 한도."""
+
+    kind: str  # "upload" | "avatar"
+    max_bytes: int
+    formats: frozenset[str]
+    max_source_pixels: int
+
+
+@dataclass(frozen=True)
+class IngestedImage:
+    """검증을 통과한 업로드. source 는 컨텍스트 안에서만 유효하다."""
+
+    source: ImageSource
+    # 업로드 원본 바이트의 SHA-256 (수집하면서 계산, 재처리 생략 판단용)
+    digest: str
+    size: int
+    format: str
+    width: int
+    height: int
+
+
+def image_upload_policy() -> IngestPolicy:
+    settings = get_settings()
+    return IngestPolicy(
+        kind="upload",
+        max_bytes=settings.image_max_upload_bytes,
+        formats=UPLOAD_FORMATS,
+        max_source_pixels=settings.image_max_source_pixels,
+    )
+
+
+def avatar_upload_policy() -> IngestPolicy:
+    settings = get_settings()
+    return IngestPolicy(
+        kind="avatar",
+        max_bytes=settings.avatar_max_upload_bytes,
+        formats=AVATAR_FORMATS,
+        max_source_pixels=settings.image_max_source_pixels,
+    )
+
+
+def _reject(policy: IngestPolicy, reason: str) -> ApiError:
+    code, detail = _ERRORS[policy.kind][reason]
+    log_json(
+        logger,
+        logging.INFO,
+        "upload_ingest_rejected",
+        kind=policy.kind,
+        reason=reason,
+        code=code,
+    )
+    return ApiError(code=code, detail=detail, status=422)
+
+
+def sniff_format(head: bytes) -> str | None:
+    """매직 바이트로 이미지 형식을 판별한다(모르면 None)."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "JPEG"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "GIF"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    return None
+
+
+def _probe_dimensions(
+    source: ImageSource, fmt: str, policy: IngestPolicy
+) -> tuple[int, int]:
+    """헤더만 읽어 (가로, 세로)를 확인한다. load() 를 호출하지 않는다."""
+    fp: IO[bytes] | str = io.BytesIO(source) if isinstance(source, bytes) else source
+    try:
+        with Image.open(fp, formats=[fmt]) as img:
+            width, height = img.size
+    except DecompressionBombError as exc:
+        # PIL 자체 한도(기본 약 1.8억 픽셀)의 2배를 넘으면 open 에서 바로 막힌다.
+        raise _reject(policy, "pixels") from exc
+    except (UnidentifiedImageError, OSError, SyntaxError, ValueError) as exc:
+        raise _reject(policy, "invalid") from exc
+    if width * height > policy.max_source_pixels:
+        raise _reject(policy, "pixels")
+    return width, height
+
+
+class _Spool:
+    """임계값까지는 메모리, 넘치면 임시 파일로 옮겨 쓰는 버퍼."""
+
+    def __init__(self, threshold: int) -> None:
+        self._threshold = threshold
+        self._buffer = bytearray()
+        self._file: IO[bytes] | None = None
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    @property
+    def digest(self) -> str:
+        return self._hash.hexdigest()
+
+    async def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self._hash.update(chunk)
+        if self._file is None and self.size <= self._threshold:
+            self._buffer.extend(chunk)
+            return
+        if self._file is None:
+            self._file = await asyncio.to_thread(
+                tempfile.NamedTemporaryFile, prefix="upload-", delete=False
+            )
+            pending = bytes(self._buffer) + chunk
+            self._buffer = bytearray()
+            await asyncio.to_thread(self._file.write, pending)
+            return
+        await asyncio.to_thread(self._file.write, chunk)
+
+    async def finish(self) -> ImageSource:
+        if self._file is None:
+            return bytes(self._buffer)
+        await asyncio.to_thread(self._file.close)
+        return self._file.name
+
+    async def discard(self) -> None:
+        self._buffer = bytearray()
+        if self._file is not None:
+            await asyncio.to_thread(_remove_spill, self._file)
+            self._file = None
+
+
+def _remove_spill(file: IO[bytes]) -> None:
+    file.close()
+    try:
+        os.unlink(file.name)
+    except FileNotFoundError:
+        pass
+
+
+async def _read_into(file: UploadFile, spool: _Spool, policy: IngestPolicy) -> str:
+    """청크 단위로 스풀에 쓰고 판별된 형식을 반환한다(상한 초과 즉시 중단)."""
+    fmt: str | None = None
+    while chunk := await file.read(_CHUNK_SIZE):
+        if spool.size + len(chunk) > policy.max_bytes:
+            raise _reject(policy, "too_large")
+        if fmt is None:
+            fmt = sniff_format(chunk)
+            if fmt is None:
+                raise _reject(policy, "invalid")
+            if fmt not in policy.formats:
+                raise _reject(policy, "format")
+        await spool.write(chunk)
+    if fmt is None:
+        raise _reject(policy, "empty")
+    return fmt
+
+
+@asynccontextmanager
+async def ingest_image(
+    file: UploadFile, policy: IngestPolicy
+) -> AsyncGenerator[IngestedImage, None]:
+    """업로드를 검증·스풀하고, 컨텍스트를 벗어나면 임시 파일을 정리한다."""
+    spool = _Spool(get_settings().upload_spool_bytes)
+    try:
+        fmt = await _read_into(file, spool, policy)
+        source = await spool.finish()
+        if isinstance(source, bytes):
+            width, height = _probe_dimensions(source, fmt, policy)
+        else:
+            width, height = await asyncio.to_thread(
+                _probe_dimensions, source, fmt, policy
+            )
+        yield IngestedImage(
+            source=source,
+            digest=spool.digest,
+            size=spool.size,
+            format=fmt,
+            width=width,
+            height=height,
+        )
+    finally:
+        await spool.discard()
+        await file.close()
+
+
+def upload_size_limits() -> dict[str, int]:
+    """본문 크기를 미리 제한할 업로드 경로와 파일 크기 상한."""
+    settings = get_settings()
+    return {
+        "/uploads/images": settings.image_max_upload_bytes,
+        "/me/avatar": settings.avatar_max_upload_bytes,
+    }
+
+
+class UploadSizeLimitMiddleware:
+    """Content-Length 가 상한을 넘는 업로드를 본문 수신 전에 413 으로 끊는다.
+
+    FastAPI 는 핸들러 실행 전에 multipart 본문 전체를 파싱하므로 라우터에서는
+    이미 다 받은 뒤다. 선언된 길이만으로 거절할 수 있는 경우는 여기서 막고,
+    chunked 전송처럼 길이가 없는 요청은 ingest_image 의 청크 상한이 막는다.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Mapping[str, int]) -> None:
+        self.app = app
+        self.limits = dict(limits)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "POST":
+            limit = self.limits.get(scope["path"])
+            length = _content_length(scope) if limit is not None else None
+            if (
+                limit is not None
+                and length is not None
+                and length > limit + _MULTIPART_OVERHEAD
+            ):
+                await _send_too_large(send, scope["path"], length)
+                return
+        await self.app(scope, receive, send)
+
+
+def _content_length(scope: Scope) -> int | None:
+    for name, value in scope.get("headers", []):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+async def _send_too_large(send: Send, path: str, length: int) -> None:
+    status = 413
+    body = json.dumps(
+        {
+            "type": "about:blank",
+            "title": "",
+            "status": status,
+            "detail": "업로드 파일 크기가 허용 범위를 초과했습니다.",
+            "code": "upload_too_large",
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    log_json(
+        logger,
+        logging.WARNING,
+        "upload_ingest_rejected",
+        reason="content_length",
+        code="upload_too_large",
+        path=path,
+        content_length=length,
+    )
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"connection", b"close"),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+백그라운드 작업 워커.
+
+background_jobs 큐에서 작업을 `FOR UPDATE SKIP LOCKED` 로 하나씩 꺼내 실행한다.
+여러 프로세스를 띄워도 같은 작업을 두 번 집지 않는다. SIGTERM/SIGINT 를 받으면
+실행 중인 작업을 마친 뒤 종료한다. SCHEDULER_IN_WORKER=true 면 APScheduler
+잡도 웹 프로세스 대신 이 프로세스에서 돈다.
+
+    python -m apps.api.worker [--once] [--poll-interval 2.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from apps.api.config import get_settings
+from apps.api.db import AsyncSessionLocal, dispose_engine
+from apps.api.scheduler import shutdown_scheduler, start_scheduler
+from apps.api.services import jobs_service
+from apps.api.services.notifications_service import PyWebPushProvider
+
+logger = logging.getLogger("apps.api.worker")
+
+# stale running 작업 회수 주기(초)
+RECLAIM_INTERVAL_SECONDS = 60.0
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="백그라운드 작업 워커")
+    parser.add_argument(
+        "--once", action="store_true", help="큐가 빌 때까지 실행하고 종료"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="빈 큐 재확인 간격(초, 기본 JOB_POLL_INTERVAL_SECONDS)",
+    )
+    return parser.parse_args(argv)
+
+
+async def _run_once(
+    worker_id: str, handlers: dict[str, jobs_service.JobHandler]
+) -> bool:
+    async with AsyncSessionLocal() as db:
+        return await jobs_service.run_next_job(
+            db, worker_id=worker_id, handlers=handlers
+        )
+
+
+async def _reclaim() -> None:
+    async with AsyncSessionLocal() as db:
+        reclaimed = await jobs_service.reclaim_stale_jobs(db)
+    if reclaimed:
+        logger.info("stale 작업 회수: count=%s", reclaimed)
+
+
+async def run_worker(*, once: bool, poll_interval: float) -> int:
+    """작업 루프. 처리한 작업 수를 돌려준다."""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    handlers = jobs_service.default_job_handlers(PyWebPushProvider())
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    if not once:
+        start_scheduler(in_worker=True)
+    logger.info("워커 시작: id=%s, poll=%ss", worker_id, poll_interval)
+
+    processed = 0
+    next_reclaim = loop.time()
+    try:
+        while not stop.is_set():
+            try:
+                if loop.time() >= next_reclaim:
+                    await _reclaim()
+                    next_reclaim = loop.time() + RECLAIM_INTERVAL_SECONDS
+                ran = await _run_once(worker_id, handlers)
+            except SQLAlchemyError:
+                # DB 장애: 잠시 쉬었다가 다시 시도한다.
+                logger.exception("작업 큐 접근 실패")
+                ran = False
+            if ran:
+                processed += 1
+                continue
+            if once:
+                break
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+    finally:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
+        await shutdown_scheduler()
+        await dispose_engine()
+    logger.info("워커 종료: id=%s, processed=%s", worker_id, processed)
+    return processed
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s"
+    )
+    poll_interval = args.poll_interval or get_settings().job_poll_interval_seconds
+    asyncio.run(run_worker(once=args.once, poll_interval=poll_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import type { ReactNode } from 'react';
 import { beforeEach, describe, expect, it, vi } from 'vitest';
 
 import AdminNotificationsPage, {
+  JobStatusLine,
   LogsBlock,
   PrunePanel,
   StatsBlock,
@@ -41,6 +42,7 @@ vi.mock('../services/notifications', async (importOriginal) => {
     getSendLogs: vi.fn(),
     pruneSendLogs: vi.fn(),
     sendNotification: vi.fn(),
+    getNotificationJob: vi.fn(),
   };
 });
 
@@ -140,4 +142,27 @@ describe('알림 관리자 조작 접근성', () => {
     expect(limit).toHaveClass('min-h-11');
     expect(limit).toHaveClass('focus-visible:ring-2');
   });
+
+  it('발송 작업 진행률과 결과를 상태 문구로 표시한다', () => {
+    const base = {
+      id: 7,
+      attempts: 1,
+      max_attempts: 1,
+      last_error: null,
+      created_at: '2026-10-19T00:00:00+00:00',
+    };
+    const { rerender } = render(
+      <JobStatusLine
+        job={{ ...base, status: 'running', progress: { done: 50, total: 120 }, accepted: null, failed: null, finished_at: null }}
+      />,
+    );
+    expect(screen.getByRole('status')).toHaveTextContent('작업 #7 · 발송 중: 50 / 120');
+
+    rerender(
+      <JobStatusLine
+        job={{ ...base, status: 'succeeded', progress: { done: 120, total: 120 }, accepted: 118, failed: 2, finished_at: '2026-10-19T00:01:00+00:00' }}
+      />,
+    );
+    expect(screen.getByRole('status')).toHaveTextContent('발송 완료: 성공 118, 실패 2');
+  });
 });
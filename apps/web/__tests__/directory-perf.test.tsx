@@ -13,12 +13,11 @@ vi.mock('next/navigation', () => ({
   useSearchParams: () => currentSearchParams,
 }));
 
-const listMembersMock = vi.fn();
-const countMembersMock = vi.fn();
+const listMembersPageMock = vi.fn();
 
 vi.mock('../services/members', () => ({
-  listMembers: (...args: unknown[]) => listMembersMock(...(args as Parameters<typeof listMembersMock>)),
-  countMembers: (...args: unknown[]) => countMembersMock(...(args as Parameters<typeof countMembersMock>)),
+  listMembersPage: (...args: unknown[]) =>
+    listMembersPageMock(...(args as Parameters<typeof listMembersPageMock>)),
 }));
 
 class MockIntersectionObserver {
@@ -45,8 +44,7 @@ function renderDirectory() {
 describe('DirectoryPage 공유 링크/페이지 요약', () => {
   beforeEach(() => {
     replaceMock.mockReset();
-    listMembersMock.mockReset();
-    countMembersMock.mockReset();
+    listMembersPageMock.mockReset();
     currentSearchParams = new URLSearchParams([
       ['sort', 'cohort_asc'],
       ['page', '2'],
@@ -65,18 +63,27 @@ describe('DirectoryPage 공유 링크/페이지 요약', () => {
         visibility: 'all' as const,
       }));
 
-    listMembersMock.mockImplementation(({ offset }: { offset: number }) =>
-      Promise.resolve(makePage(offset))
-    );
-    countMembersMock.mockResolvedValue(25);
+    // 커서는 테스트에서만 offset 문자열로 쓴다. 전체 건수는 첫 페이지에만 온다
+    listMembersPageMock.mockImplementation(({ cursor }: { cursor?: string }) => {
+      const offset = Number(cursor ?? 0);
+      const items = makePage(offset);
+      const next = offset + items.length;
+      return Promise.resolve({
+        items,
+        next_cursor: next < 25 ? String(next) : null,
+        total: cursor ? null : 25,
+      });
+    });
   });
 
   it('URL 파라미터와 연동된 요약/공유 링크를 표시한다', async () => {
     renderDirectory();
 
     await waitFor(() => {
-      expect(listMembersMock).toHaveBeenCalledTimes(3);
+      expect(listMembersPageMock).toHaveBeenCalledTimes(3);
     });
+    expect(listMembersPageMock).toHaveBeenNthCalledWith(1, expect.objectContaining({ includeTotal: true }));
+    expect(listMembersPageMock).toHaveBeenNthCalledWith(2, expect.objectContaining({ cursor: '10', includeTotal: false }));
 
     // 공유 링크 패널 토글 후 링크 노출 확인
     const toggle = screen.getByRole('button', { name: '링크 표시' });
@@ -16,14 +16,17 @@ vi.mock('next/navigation', () => ({
   useSearchParams: () => currentSearchParams,
 }));
 
-const listMembersMock = vi.fn();
-const countMembersMock = vi.fn();
+const listMembersPageMock = vi.fn();
 
 vi.mock('../services/members', () => ({
-  listMembers: (...args: unknown[]) => listMembersMock(...(args as Parameters<typeof listMembersMock>)),
-  countMembers: (...args: unknown[]) => countMembersMock(...(args as Parameters<typeof countMembersMock>)),
+  listMembersPage: (...args: unknown[]) =>
+    listMembersPageMock(...(args as Parameters<typeof listMembersPageMock>)),
 }));
 
+function memberPage(items: unknown[], total: number | null = items.length, nextCursor: string | null = null) {
+  return { items, next_cursor: nextCursor, total };
+}
+
 class MockIntersectionObserver {
   observe() {}
   unobserve() {}
@@ -50,16 +53,13 @@ function renderDirectoryPage() {
 describe('DirectoryPage URL 동기화', () => {
   beforeEach(() => {
     replaceMock.mockClear();
-    listMembersMock.mockReset();
-    countMembersMock.mockReset();
+    listMembersPageMock.mockReset();
     currentSearchParams = new URLSearchParams();
-    listMembersMock.mockResolvedValue([]);
-    countMembersMock.mockResolvedValue(0);
+    listMembersPageMock.mockResolvedValue(memberPage([]));
   });
 
   it('입력 디바운스 후 URL 쿼리를 업데이트한다', async () => {
-    listMembersMock.mockResolvedValueOnce([]);
-    countMembersMock.mockResolvedValueOnce(0);
+    listMembersPageMock.mockResolvedValueOnce(memberPage([]));
 
     renderDirectoryPage();
 
@@ -102,7 +102,7 @@ describe('DirectoryPage URL 동기화', () => {
       expect(replaceMock).toHaveBeenCalledWith('/directory?sort=cohort_desc', { scroll: false });
     });
     await waitFor(() => {
-      expect(listMembersMock).toHaveBeenLastCalledWith(expect.objectContaining({ sort: 'cohort_desc' }));
+      expect(listMembersPageMock).toHaveBeenLastCalledWith(expect.objectContaining({ sort: 'cohort_desc' }));
     });
   });
 
@@ -128,7 +128,7 @@ describe('DirectoryPage URL 동기화', () => {
     const lastUrl = replaceMock.mock.calls.at(-1)?.[0] as string;
     const params = new URLSearchParams(lastUrl.split('?')[1] ?? '');
     expect(params.get('job_title')).toBe('팀장');
-    expect(listMembersMock).toHaveBeenLastCalledWith(expect.objectContaining({ jobTitle: '팀장' }));
+    expect(listMembersPageMock).toHaveBeenLastCalledWith(expect.objectContaining({ jobTitle: '팀장' }));
   });
 
   it('기본 검색 결과가 있어도 한 번에 기본 상태로 초기화한다', async () => {
@@ -144,8 +144,7 @@ describe('DirectoryPage URL 동기화', () => {
       roles: 'member' as const,
       visibility: 'all' as const,
     };
-    listMembersMock.mockResolvedValue([member]);
-    countMembersMock.mockResolvedValue(1);
+    listMembersPageMock.mockResolvedValue(memberPage([member]));
 
     renderDirectoryPage();
 
@@ -171,8 +170,7 @@ describe('DirectoryPage URL 동기화', () => {
       roles: 'member' as const,
       visibility: 'all' as const,
     };
-    listMembersMock.mockResolvedValue([member]);
-    countMembersMock.mockResolvedValue(1);
+    listMembersPageMock.mockResolvedValue(memberPage([member]));
 
     renderDirectoryPage();
     await screen.findAllByText('E2E 테스트 회원');
@@ -199,15 +197,14 @@ describe('DirectoryPage URL 동기화', () => {
         visibility: 'all' as const,
       }));
 
-    listMembersMock
-      .mockResolvedValueOnce(makePage(0))
-      .mockResolvedValueOnce(makePage(10))
-      .mockResolvedValueOnce([]);
-    countMembersMock.mockResolvedValue(25);
+    listMembersPageMock
+      .mockResolvedValueOnce(memberPage(makePage(0), 25, '10'))
+      .mockResolvedValueOnce(memberPage(makePage(10), null, '20'))
+      .mockResolvedValueOnce(memberPage([], null));
 
     renderDirectoryPage();
 
-    await waitFor(() => expect(listMembersMock).toHaveBeenCalledTimes(1));
+    await waitFor(() => expect(listMembersPageMock).toHaveBeenCalledTimes(1));
 
     const loadMoreButton = await screen.findByRole('button', { name: /더 불러오기/ });
     fireEvent.click(loadMoreButton);
@@ -233,21 +230,23 @@ describe('DirectoryPage URL 동기화', () => {
         visibility: 'all' as const,
       }));
 
-    listMembersMock.mockImplementation(({ offset }: { offset?: number }) => {
-      const off = offset ?? 0;
-      if (off >= 30) return Promise.resolve([]);
-      return Promise.resolve(makePage(off));
+    listMembersPageMock.mockImplementation(({ cursor }: { cursor?: string }) => {
+      const off = Number(cursor ?? 0);
+      if (off >= 30) return Promise.resolve(memberPage([], null));
+      return Promise.resolve(memberPage(makePage(off), cursor ? null : 42, String(off + 10)));
     });
-    countMembersMock.mockResolvedValue(42);
 
     renderDirectoryPage();
 
     await waitFor(() => {
-      expect(listMembersMock).toHaveBeenCalledTimes(3);
+      expect(listMembersPageMock).toHaveBeenCalledTimes(3);
     });
 
-    expect(listMembersMock).toHaveBeenNthCalledWith(1, expect.objectContaining({ offset: 0, sort: 'recent' }));
-    expect(listMembersMock).toHaveBeenNthCalledWith(2, expect.objectContaining({ offset: 10, sort: 'recent' }));
-    expect(listMembersMock).toHaveBeenNthCalledWith(3, expect.objectContaining({ offset: 20, sort: 'recent' }));
+    expect(listMembersPageMock).toHaveBeenNthCalledWith(
+      1,
+      expect.objectContaining({ cursor: undefined, includeTotal: true, sort: 'recent' })
+    );
+    expect(listMembersPageMock).toHaveBeenNthCalledWith(2, expect.objectContaining({ cursor: '10', sort: 'recent' }));
+    expect(listMembersPageMock).toHaveBeenNthCalledWith(3, expect.objectContaining({ cursor: '20', sort: 'recent' }));
   });
 });
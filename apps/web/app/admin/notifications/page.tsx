@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { useAuth } from '../../../hooks/useAuth';
 import { useToast } from '../../../components/toast';
 import { useQuery } from '@tanstack/react-query';
@@ -9,14 +9,34 @@ import { Button } from '../../../components/ui/button';
 import { FIELD_CONTROL } from '../../../components/ui/styles';
 import { hasPermissionSession } from '../../../lib/rbac';
 import {
+  getNotificationJob,
   getNotificationStats,
+  isNotificationJobDone,
   getSendLogs,
   pruneSendLogs,
   sendNotification,
   type SendLog,
   type NotificationStats,
+  type NotificationJob,
 } from '../../../services/notifications';
 
+const JOB_POLL_MS = 2_000;
+
+export function JobStatusLine({ job }: { job?: NotificationJob }) {
+  if (!job) return null;
+  let text: string;
+  if (job.status === 'succeeded') {
+    text = `발송 완료: 성공 ${job.accepted ?? 0}, 실패 ${job.failed ?? 0}`;
+  } else if (job.status === 'failed') {
+    text = '발송 작업이 실패했습니다.';
+  } else if (job.progress?.total) {
+    text = `발송 중: ${job.progress.done ?? 0} / ${job.progress.total}`;
+  } else {
+    text = '발송 대기 중';
+  }
+  return <p className="text-sm text-text-secondary" role="status">작업 #{job.id} · {text}</p>;
+}
+
 type RangeOpt = '24h' | '7d' | '30d';
 
 export function StatsBlock({ data, isLoading, isError, statsRange, setStatsRange, onRefresh }:{
@@ -155,6 +175,8 @@ export default function AdminNotificationsPage() {
   const [logLimit, setLogLimit] = useState(50);
   const [pruneDays, setPruneDays] = useState(30);
   const [statsRange, setStatsRange] = useState<'24h'|'7d'|'30d'>('7d');
+  const [jobId, setJobId] = useState<number | null>(null);
+  const announcedJob = useRef<number | null>(null);
   const canManageNotifications = auth.status === 'authorized'
     && hasPermissionSession(auth.data, 'admin_notifications');
   const stats = useQuery({
@@ -169,6 +191,29 @@ export default function AdminNotificationsPage() {
     staleTime: 10_000,
     enabled: canManageNotifications,
   });
+  const job = useQuery<NotificationJob>({
+    queryKey: ['notify', 'job', jobId],
+    queryFn: () => getNotificationJob(jobId as number),
+    enabled: canManageNotifications && jobId !== null,
+    refetchInterval: (query) => (
+      query.state.data && isNotificationJobDone(query.state.data) ? false : JOB_POLL_MS
+    ),
+  });
+
+  const finishedJob = job.data && isNotificationJobDone(job.data) ? job.data : undefined;
+  useEffect(() => {
+    if (!finishedJob || announcedJob.current === finishedJob.id) return;
+    announcedJob.current = finishedJob.id;
+    if (finishedJob.status === 'failed') {
+      toast.show('발송 작업이 실패했습니다.', { type: 'error' });
+    } else if (!finishedJob.accepted && !finishedJob.failed) {
+      toast.show('발송 대상이 없습니다. 로그인 사용자에서 알림을 다시 활성화해 주세요.', { type: 'info' });
+    } else {
+      toast.show(`발송 완료: 성공 ${finishedJob.accepted ?? 0}, 실패 ${finishedJob.failed ?? 0}`, { type: finishedJob.failed ? 'error' : 'success' });
+    }
+    void stats.refetch();
+    void logs.refetch();
+  }, [finishedJob, toast, stats, logs]);
 
   if (auth.status !== 'authorized') {
     return <AdminAuthState status={auth.status} />;
@@ -182,11 +227,8 @@ export default function AdminNotificationsPage() {
     try {
       const payload = { title, body, url: url || undefined };
       const res = await sendNotification(payload);
-      if (res.accepted === 0 && res.failed === 0) {
-        toast.show('발송 대상이 없습니다. 로그인 사용자에서 알림을 다시 활성화해 주세요.', { type: 'info' });
-      } else {
-        toast.show(`발송 요청 완료: 성공 ${res.accepted}, 실패 ${res.failed}`, { type: res.failed > 0 ? 'error' : 'success' });
-      }
+      setJobId(res.job_id);
+      toast.show(`발송 작업을 등록했습니다 (#${res.job_id}).`, { type: 'success' });
     } catch {
       toast.show('발송 중 오류가 발생했습니다.', { type: 'error' });
     } finally {
@@ -225,6 +267,7 @@ export default function AdminNotificationsPage() {
             <Button disabled={busy || !title.trim() || !body.trim()} onClick={onSend}>발송</Button>
             <Button type="button" variant="secondary" onClick={async () => { await stats.refetch(); await logs.refetch(); }}>새로고침</Button>
           </div>
+          <JobStatusLine job={job.data} />
         </div>
 
         <StatsBlock
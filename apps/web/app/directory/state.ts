@@ -1,9 +1,9 @@
-import { keepPreviousData, useInfiniteQuery, useQuery } from '@tanstack/react-query';
+import { keepPreviousData, useInfiniteQuery } from '@tanstack/react-query';
 import type { Route } from 'next';
 import { useRouter, useSearchParams } from 'next/navigation';
 import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
 
-import { countMembers, listMembers, type MemberListSort } from '../../services/members';
+import { listMembersPage, type MemberListSort, type MemberPage } from '../../services/members';
 
 export const PAGE_SIZE = 10;
 export const DEBOUNCE_MS = 350;
@@ -114,7 +114,7 @@ export function useDebouncedValue<T>(value: T, delay: number): T {
   return debounced;
 }
 
-export type MemberListPage = Awaited<ReturnType<typeof listMembers>>;
+export type MemberListPage = MemberPage['items'];
 
 type UrlSyncResult = {
   filters: FilterState;
@@ -247,8 +247,10 @@ export function useDirectoryUrlSync(): UrlSyncResult {
   };
 }
 
+type MembersQuery = ReturnType<typeof useInfiniteQuery<MemberPage>>;
+
 type DirectoryQueriesResult = {
-  membersQuery: ReturnType<typeof useInfiniteQuery<MemberListPage>>;
+  membersQuery: MembersQuery;
   visibleItems: MemberListPage;
   totalLabel: string;
   displayedCount: number;
@@ -273,7 +275,8 @@ export function useDirectoryQueries(debouncedFilters: FilterState): DirectoryQue
 
   const sortOption = debouncedFilters.sort;
 
-  const membersQuery = useInfiniteQuery<MemberListPage>({
+  // 커서 페이지. 첫 페이지 응답에 전체 건수를 함께 받아 /members/count 왕복을 없앤다
+  const membersQuery = useInfiniteQuery<MemberPage>({
     queryKey: [
       'directory',
       filtersForQuery.q,
@@ -285,42 +288,19 @@ export function useDirectoryQueries(debouncedFilters: FilterState): DirectoryQue
       filtersForQuery.jobTitle,
       sortOption,
     ],
-    initialPageParam: 0,
+    initialPageParam: null,
     queryFn: ({ pageParam }) =>
-      listMembers({
+      listMembersPage({
         ...filtersForQuery,
         sort: sortOption,
         limit: PAGE_SIZE,
-        offset: pageParam as number,
+        cursor: (pageParam as string | null) ?? undefined,
+        includeTotal: pageParam == null,
       }),
-    getNextPageParam: (lastPage, _pages, lastPageParam) =>
-      lastPage.length < PAGE_SIZE ? undefined : ((lastPageParam as number) + PAGE_SIZE),
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
     placeholderData: keepPreviousData,
   });
 
-  const totalQuery = useQuery({
-    queryKey: [
-      'directory-total',
-      filtersForQuery.q,
-      filtersForQuery.cohort,
-      filtersForQuery.major,
-      filtersForQuery.company,
-      filtersForQuery.industry,
-      filtersForQuery.region,
-      filtersForQuery.jobTitle,
-    ],
-    queryFn: () =>
-      countMembers({
-        q: filtersForQuery.q,
-        cohort: filtersForQuery.cohort,
-        major: filtersForQuery.major,
-        company: filtersForQuery.company,
-        industry: filtersForQuery.industry,
-        region: filtersForQuery.region,
-        jobTitle: filtersForQuery.jobTitle,
-      }),
-  });
-
   const desiredPageCount = debouncedFilters.page + 1;
   const loadedPages = membersQuery.data?.pages.length ?? 0;
 
@@ -335,19 +315,19 @@ export function useDirectoryQueries(debouncedFilters: FilterState): DirectoryQue
   const visibleItems = useMemo(() => {
     const pages = membersQuery.data?.pages ?? [];
     const limit = Math.min(desiredPageCount, pages.length);
-    return pages.slice(0, limit).flat();
+    return pages.slice(0, limit).flatMap((page) => page.items);
   }, [membersQuery.data, desiredPageCount]);
 
-  const totalCount = totalQuery.data ?? null;
+  const totalCount = membersQuery.data?.pages[0]?.total ?? null;
   const displayedCount = visibleItems.length;
   const currentPage = debouncedFilters.page + 1;
   const totalPages = totalCount ? Math.max(1, Math.ceil(totalCount / PAGE_SIZE)) : null;
   const loadMoreLabel = totalPages
     ? `더 불러오기 (다음 ${Math.min(currentPage + 1, totalPages)} / ${totalPages})`
     : '더 불러오기';
-  const totalLabel = totalQuery.isPending
+  const totalLabel = membersQuery.isPending
     ? '…'
-    : totalQuery.isError
+    : membersQuery.isError
     ? '—'
     : (totalCount ?? 0).toLocaleString();
 
@@ -369,7 +349,7 @@ type InfiniteLoaderResult = {
 };
 
 export function useInfiniteLoader(
-  membersQuery: ReturnType<typeof useInfiniteQuery<MemberListPage>>,
+  membersQuery: MembersQuery,
   currentPage: number,
   setPage: (page: number) => void
 ): InfiniteLoaderResult {
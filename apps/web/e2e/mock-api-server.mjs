@@ -191,10 +191,12 @@ function heroSlides(includeUnpublished) {
   return slides;
 }
 
-function directoryMembers(url) {
-  const offset = Number(url.searchParams.get('offset') ?? '0');
+function directoryMembersPage(url) {
+  const cursor = url.searchParams.get('cursor');
+  const offset = Number(cursor ?? '0');
   const limit = Number(url.searchParams.get('limit') ?? '10');
-  return Array.from({ length: Math.min(10, limit) }, (_, index) => {
+  const size = Math.min(10, limit);
+  const items = Array.from({ length: size }, (_, index) => {
     const id = offset + index + 1;
     return {
       id,
@@ -207,6 +209,8 @@ function directoryMembers(url) {
       visibility: 'all',
     };
   });
+  const includeTotal = url.searchParams.get('include_total') === 'true';
+  return { items, next_cursor: String(offset + size), total: includeTotal ? 25 : null };
 }
 
 const server = createServer(async (request, response) => {
@@ -411,12 +415,8 @@ const server = createServer(async (request, response) => {
     }, origin);
     return;
   }
-  if (method === 'GET' && url.pathname === '/members/') {
-    sendJson(response, 200, directoryMembers(url), origin);
-    return;
-  }
-  if (method === 'GET' && url.pathname === '/members/count') {
-    sendJson(response, 200, { count: 25 }, origin);
+  if (method === 'GET' && url.pathname === '/members/page') {
+    sendJson(response, 200, directoryMembersPage(url), origin);
     return;
   }
   if (method === 'GET' && url.pathname === '/posts/') {
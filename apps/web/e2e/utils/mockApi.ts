@@ -415,8 +415,9 @@ async function respondDirectoryApi(request: HTTPRequest, url: URL): Promise<bool
     });
     return true;
   }
-  if (method === 'GET' && path === '/members') {
-    const off = Number(url.searchParams.get('offset') ?? '0');
+  if (method === 'GET' && path === '/members/page') {
+    const cursor = url.searchParams.get('cursor');
+    const off = Number(cursor ?? '0');
     const limit = Number(url.searchParams.get('limit') ?? '10');
     const size = Math.min(10, limit);
     const items = Array.from({ length: size }, (_, i) => {
@@ -433,20 +434,16 @@ async function respondDirectoryApi(request: HTTPRequest, url: URL): Promise<bool
         visibility: 'all',
       };
     });
+    const includeTotal = url.searchParams.get('include_total') === 'true';
     await request.respond({
       status: 200,
       contentType: 'application/json',
       headers: corsHeaders,
-      body: JSON.stringify(items),
-    });
-    return true;
-  }
-  if (method === 'GET' && path === '/members/count') {
-    await request.respond({
-      status: 200,
-      contentType: 'application/json',
-      headers: corsHeaders,
-      body: JSON.stringify({ count: 25 }),
+      body: JSON.stringify({
+        items,
+        next_cursor: String(off + size),
+        total: includeTotal ? 25 : null,
+      }),
     });
     return true;
   }
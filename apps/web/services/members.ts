@@ -5,7 +5,9 @@ export type Member = Schema<'DirectoryMemberRead'>;
 
 export type MemberListSort = 'recent' | 'cohort_desc' | 'cohort_asc' | 'name';
 
-type MemberListParams = {
+export type MemberPage = Schema<'DirectoryMemberPage'>;
+
+type MemberPageParams = {
   q?: string;
   cohort?: number;
   major?: string;
@@ -15,11 +17,12 @@ type MemberListParams = {
   jobTitle?: string;
   sort?: MemberListSort;
   limit?: number;
-  offset?: number;
+  cursor?: string;
+  includeTotal?: boolean;
 };
 
 // 파라미터 키 매핑 (camelCase → snake_case)
-const PARAM_KEYS: Array<[keyof MemberListParams, string]> = [
+const PARAM_KEYS: Array<[keyof MemberPageParams, string]> = [
   ['q', 'q'],
   ['cohort', 'cohort'],
   ['major', 'major'],
@@ -29,31 +32,25 @@ const PARAM_KEYS: Array<[keyof MemberListParams, string]> = [
   ['jobTitle', 'job_title'],
   ['sort', 'sort'],
   ['limit', 'limit'],
-  ['offset', 'offset'],
+  ['cursor', 'cursor'],
+  ['includeTotal', 'include_total'],
 ];
 
-function buildQueryString(params: MemberListParams): string {
+function buildQueryString(params: MemberPageParams): string {
   const usp = new URLSearchParams();
   for (const [key, apiKey] of PARAM_KEYS) {
     const val = params[key];
-    if (val != null && val !== '') {
+    if (val != null && val !== '' && val !== false) {
       usp.set(apiKey, String(val));
     }
   }
   return usp.toString();
 }
 
-export async function listMembers(params: MemberListParams = {}): Promise<Member[]> {
-  const qs = buildQueryString(params);
-  return apiFetch<Member[]>(`/members/${qs ? `?${qs}` : ''}`);
-}
-
-type MemberCountParams = Omit<MemberListParams, 'sort' | 'limit' | 'offset'>;
-
-export async function countMembers(params: MemberCountParams = {}): Promise<number> {
+// 커서 페이지. 첫 페이지에 includeTotal 을 주면 전체 건수를 같은 응답으로 받는다
+export async function listMembersPage(params: MemberPageParams = {}): Promise<MemberPage> {
   const qs = buildQueryString(params);
-  const res = await apiFetch<{ count: number }>(`/members/count${qs ? `?${qs}` : ''}`);
-  return res.count;
+  return apiFetch<MemberPage>(`/members/page${qs ? `?${qs}` : ''}`);
 }
 
 export async function getMember(id: number): Promise<Member> {
@@ -3,12 +3,10 @@ import type { Schema } from './_dto';
 
 export type SendNotificationPayload = Schema<'SendPushPayload'>;
 
-// TODO: API가 구조화된 응답 스키마를 정의하면 Schema alias로 전환
-export type SendNotificationResult = {
-  accepted: number;
-  failed: number;
-};
+export type SendNotificationResult = Schema<'BroadcastJobAccepted'>;
+export type NotificationJob = Schema<'BroadcastJobRead'>;
 
+// 발송은 백그라운드 워커가 처리하므로 API는 작업 id만 돌려준다.
 export async function sendNotification(payload: SendNotificationPayload): Promise<SendNotificationResult> {
   return apiFetch<SendNotificationResult>('/notifications/admin/notifications/send', {
     method: 'POST',
@@ -16,6 +14,14 @@ export async function sendNotification(payload: SendNotificationPayload): Promis
   });
 }
 
+export async function getNotificationJob(jobId: number): Promise<NotificationJob> {
+  return apiFetch<NotificationJob>(`/notifications/admin/notifications/jobs/${jobId}`);
+}
+
+export function isNotificationJobDone(job: NotificationJob): boolean {
+  return job.status === 'succeeded' || job.status === 'failed';
+}
+
 export type SubscriptionPayload = Schema<'SubscriptionPayload'>;
 
 export async function saveSubscription(payload: SubscriptionPayload): Promise<void> {
@@ -1,6 +1,12 @@
 #!/bin/sh
 set -eu
 
+# `worker` 인자면 같은 이미지로 백그라운드 작업 워커를 띄운다(ops/cloud-start.sh).
+if [ "${1:-}" = "worker" ]; then
+  shift
+  exec python -m apps.api.worker "$@"
+fi
+
 # TRUSTED_PROXY_IPS → uvicorn --forwarded-allow-ips
 # 비어 있으면 127.0.0.1만 허용. '*'는 사용하지 않는다.
 _raw="${TRUSTED_PROXY_IPS:-}"
@@ -37,6 +37,10 @@ EXPECTED_GIN_INDEXES = {
         "column": "student_id",
     },
     "idx_members_company_trgm": {"table": "members", "column": "company"},
+    "idx_members_search_document_trgm": {
+        "table": "members",
+        "column": "search_document",
+    },
 }
 INDEX_CATALOG_QUERY = text(
     """
@@ -74,6 +74,8 @@ run_start() {
   WEB_IMAGE=web-test \
   API_CONTAINER=d6-api \
   WEB_CONTAINER=d6-web \
+  WORKER_CONTAINER=d6-worker \
+  WORKER_SETTLE_SECONDS=1 \
   API_ENV_FILE="${API_ENV_OVERRIDE:-$TMP_DIR/api.env}" \
   WEB_ENV_FILE="${WEB_ENV_OVERRIDE:-$TMP_DIR/web.env}" \
   UPLOADS_DIR="$TMP_DIR/uploads" \
@@ -143,7 +145,25 @@ api_run_number=$(grep -n 'run .*--name d6-api' "$FAKE_DOCKER_LOG" | cut -d: -f1)
 web_run_number=$(grep -n 'run .*--name d6-web' "$FAKE_DOCKER_LOG" | cut -d: -f1)
 api_healthy_line=$(grep -n 'inspect d6-api .*Health.Status' "$FAKE_DOCKER_LOG" | tail -1 | cut -d: -f1)
 (( api_run_number < api_healthy_line && api_healthy_line < web_run_number ))
-grep -qF 'API(d6-api)와 Web(d6-web) 컨테이너가 모두 healthy입니다.' "$TMP_DIR/success.out"
+# 발송 작업 워커: 같은 API 이미지·env file·uploads 볼륨, worker 모드, 재시작 정책
+worker_run_line=$(grep 'run .*--name d6-worker' "$FAKE_DOCKER_LOG")
+for worker_guard in \
+  '--restart unless-stopped' \
+  '--env-file '"$TMP_DIR"'/api.env' \
+  '--volume '"$TMP_DIR"'/uploads:/app/uploads' \
+  '--no-healthcheck' \
+  '--stop-timeout 60' \
+  '--cap-drop ALL'; do
+  grep -qF -- "$worker_guard" <<<"$worker_run_line"
+done
+[[ "$worker_run_line" == *' api-test worker' ]]
+if grep -qF -- '--publish' <<<"$worker_run_line"; then
+  echo 'worker container must not publish a port' >&2
+  exit 1
+fi
+worker_run_number=$(grep -n 'run .*--name d6-worker' "$FAKE_DOCKER_LOG" | cut -d: -f1)
+(( api_healthy_line < worker_run_number && worker_run_number < web_run_number ))
+grep -qF 'API(d6-api)·Worker(d6-worker)·Web(d6-web) 컨테이너가 모두 실행 중입니다.' "$TMP_DIR/success.out"
 
 # Image/env preflight happens before an existing container can be stopped.
 export FAKE_DOCKER_MODE=missing-image
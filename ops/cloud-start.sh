@@ -6,7 +6,8 @@ set -euo pipefail
 #
 # Required: API_IMAGE, WEB_IMAGE
 # Optional: API_ENV_FILE, WEB_ENV_FILE, API_CONTAINER, WEB_CONTAINER,
-# API_PORT, WEB_PORT, UPLOADS_DIR, DOCKER_NETWORK(default: sogecon_net), RELEASE
+# WORKER_CONTAINER, API_PORT, WEB_PORT, UPLOADS_DIR,
+# DOCKER_NETWORK(default: sogecon_net), RELEASE
 
 if ! command -v docker >/dev/null 2>&1; then
   echo "docker 명령이 필요합니다." >&2
@@ -20,6 +21,7 @@ fi
 
 API_CONTAINER=${API_CONTAINER:-alumni-api}
 WEB_CONTAINER=${WEB_CONTAINER:-alumni-web}
+WORKER_CONTAINER=${WORKER_CONTAINER:-alumni-worker}
 API_PORT=${API_PORT:-3001}
 WEB_PORT=${WEB_PORT:-3000}
 UPLOADS_DIR=${UPLOADS_DIR:-/var/lib/sogecon/uploads}
@@ -32,6 +34,12 @@ API_PIDS_LIMIT=${API_PIDS_LIMIT:-256}
 WEB_MEMORY=${WEB_MEMORY:-512m}
 WEB_CPUS=${WEB_CPUS:-1.0}
 WEB_PIDS_LIMIT=${WEB_PIDS_LIMIT:-256}
+WORKER_MEMORY=${WORKER_MEMORY:-512m}
+WORKER_CPUS=${WORKER_CPUS:-1.0}
+WORKER_PIDS_LIMIT=${WORKER_PIDS_LIMIT:-256}
+# 워커는 SIGTERM 뒤 실행 중인 작업을 마치고 끝난다(docker stop 대기 시간)
+WORKER_STOP_TIMEOUT=${WORKER_STOP_TIMEOUT:-60}
+WORKER_SETTLE_SECONDS=${WORKER_SETTLE_SECONDS:-3}
 CONTAINER_LOG_MAX_SIZE=${CONTAINER_LOG_MAX_SIZE:-10m}
 CONTAINER_LOG_MAX_FILE=${CONTAINER_LOG_MAX_FILE:-5}
 HEALTH_INTERVAL=${HEALTH_INTERVAL:-10s}
@@ -121,6 +129,22 @@ report_health_failure() {
   fi
 }
 
+wait_for_running() {
+  # HTTP healthcheck 가 없는 컨테이너(워커)는 잠시 running 을 유지하는지만 본다
+  local name=$1
+  local elapsed=0 status
+  while (( elapsed < WORKER_SETTLE_SECONDS )); do
+    status=$(docker inspect --format '{{.State.Status}}' "${name}" 2>/dev/null || printf 'unknown')
+    if [[ "${status}" != "running" && "${status}" != "created" ]]; then
+      report_health_failure "${name}"
+      return 1
+    fi
+    sleep 1
+    ((elapsed += 1))
+  done
+  echo "[health] ${name}: running"
+}
+
 wait_for_healthy() {
   local name=$1
   local elapsed=0 status health
@@ -175,6 +199,36 @@ run_api() {
   docker run "${args[@]}" "${API_IMAGE}"
 }
 
+run_worker() {
+  # API 이미지·env file·uploads 볼륨을 그대로 쓰고 entrypoint 의 worker 모드로 띄운다.
+  # 이미지 HEALTHCHECK 는 API 포트를 보므로 끈다.
+  local args=(
+    --detach
+    --restart unless-stopped
+    --name "${WORKER_CONTAINER}"
+    --network "${DOCKER_NETWORK}"
+    --memory "${WORKER_MEMORY}"
+    --cpus "${WORKER_CPUS}"
+    --pids-limit "${WORKER_PIDS_LIMIT}"
+    --stop-timeout "${WORKER_STOP_TIMEOUT}"
+    --log-driver json-file
+    --log-opt "max-size=${CONTAINER_LOG_MAX_SIZE}"
+    --log-opt "max-file=${CONTAINER_LOG_MAX_FILE}"
+    --security-opt no-new-privileges=true
+    --cap-drop ALL
+    --no-healthcheck
+  )
+  args+=(-e "APP_ENV=${APP_ENV:-prod}" -e "RELEASE=${RELEASE}")
+  if [[ -n "${API_ENV_FILE:-}" ]]; then
+    args+=(--env-file "${API_ENV_FILE}")
+  fi
+  if [[ -n "${DATABASE_URL:-}" ]]; then
+    args+=(-e "DATABASE_URL=${DATABASE_URL}")
+  fi
+  args+=(--volume "${UPLOADS_DIR}:/app/uploads")
+  docker run "${args[@]}" "${API_IMAGE}" worker
+}
+
 run_web() {
   local args=(
     --detach
@@ -206,8 +260,13 @@ stop_container "${API_CONTAINER}"
 run_api
 wait_for_healthy "${API_CONTAINER}"
 
+# 관리자 Push 발송은 background_jobs 에 쌓이고 워커가 처리한다
+stop_container "${WORKER_CONTAINER}"
+run_worker
+wait_for_running "${WORKER_CONTAINER}"
+
 stop_container "${WEB_CONTAINER}"
 run_web
 wait_for_healthy "${WEB_CONTAINER}"
 
-echo "API(${API_CONTAINER})와 Web(${WEB_CONTAINER}) 컨테이너가 모두 healthy입니다."
+echo "API(${API_CONTAINER})·Worker(${WORKER_CONTAINER})·Web(${WEB_CONTAINER}) 컨테이너가 모두 실행 중입니다."
@@ -38,6 +38,28 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/members/page": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * List Members Page
+         * @description 커서 기반 동문 수첩 목록. 다음 요청에 next_cursor 를 그대로 전달한다.
+         *
+         *     include_total=true 면 전체 건수를 함께 반환해 /members/count 호출을 생략한다.
+         */
+        get: operations["list_members_page_members_page_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/members/count": {
         parameters: {
             query?: never;
@@ -519,7 +541,10 @@ export interface paths {
         };
         get?: never;
         put?: never;
-        /** Send Push */
+        /**
+         * Send Push
+         * @description 전체·대상 지정 발송 작업을 큐에 넣고 바로 응답한다(발송은 백그라운드 워커).
+         */
         post: operations["send_push_notifications_admin_notifications_send_post"];
         delete?: never;
         options?: never;
@@ -527,6 +552,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/notifications/admin/notifications/jobs/{job_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Broadcast Job
+         * @description 전체 발송 작업의 상태·진행률 조회.
+         */
+        get: operations["get_broadcast_job_notifications_admin_notifications_jobs__job_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/notifications/admin/notifications/logs": {
         parameters: {
             query?: never;
@@ -745,6 +790,8 @@ export interface paths {
          *     - 최대 크기: 5MB (설정 가능)
          *     - 자동 리사이즈: 1920px 이하로 조정
          *     - GIF: 애니메이션은 첫 프레임만 저장 (정지 이미지로 변환)
+         *     - 반응형 변형: IMAGE_VARIANT_WIDTHS 폭별 WebP/AVIF 를 함께 저장 (srcset)
+         *     - 파일명: 출력 바이트 SHA-256 (같은 이미지는 한 파일로 중복 제거)
          */
         post: operations["upload_image_uploads_images_post"];
         delete?: never;
@@ -852,6 +899,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/admin/events/{event_id}/waitlist/promote": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Promote Event Waitlist
+         * @description 빈 자리만큼 대기열을 신청 순서대로 일괄 승급한다.
+         */
+        post: operations["promote_event_waitlist_admin_events__event_id__waitlist_promote_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/admin/hero/": {
         parameters: {
             query?: never;
@@ -1209,6 +1276,38 @@ export interface components {
             /** File */
             file: string;
         };
+        /** BroadcastJobAccepted */
+        BroadcastJobAccepted: {
+            /** Job Id */
+            job_id: number;
+            /** Status */
+            status: string;
+        };
+        /** BroadcastJobRead */
+        BroadcastJobRead: {
+            /** Id */
+            id: number;
+            /** Status */
+            status: string;
+            /** Attempts */
+            attempts: number;
+            /** Max Attempts */
+            max_attempts: number;
+            /** Progress */
+            progress: {
+                [key: string]: number;
+            } | null;
+            /** Accepted */
+            accepted: number | null;
+            /** Failed */
+            failed: number | null;
+            /** Last Error */
+            last_error: string | null;
+            /** Created At */
+            created_at: string;
+            /** Finished At */
+            finished_at: string | null;
+        };
         /** ChangePasswordPayload */
         ChangePasswordPayload: {
             /** Current Password */
@@ -1282,6 +1381,20 @@ export interface components {
             /** Activation Token */
             activation_token: string;
         };
+        /**
+         * DirectoryMemberPage
+         * @description 동문 수첩 커서 페이지. next_cursor 가 없으면 마지막 페이지다.
+         *
+         *     total 은 include_total 요청 시에만 채워진다.
+         */
+        DirectoryMemberPage: {
+            /** Items */
+            items: components["schemas"]["DirectoryMemberRead"][];
+            /** Next Cursor */
+            next_cursor?: string | null;
+            /** Total */
+            total?: number | null;
+        };
         /**
          * DirectoryMemberRead
          * @description 동문 수첩용 최소 응답. 인증·역할·학번은 노출하지 않는다.
@@ -1516,6 +1629,10 @@ export interface components {
             description: string;
             /** Image */
             image?: string | null;
+            /** Image Srcset */
+            image_srcset?: {
+                [key: string]: string;
+            };
             /** Href */
             href: string;
             /**
@@ -1565,6 +1682,10 @@ export interface components {
             url: string;
             /** Filename */
             filename: string;
+            /** Srcset */
+            srcset?: {
+                [key: string]: string;
+            };
         };
         /** LoginPayload */
         LoginPayload: {
@@ -1791,6 +1912,10 @@ export interface components {
              * @default 0
              */
             comment_count: number;
+            /** Cover Image Srcset */
+            cover_image_srcset?: {
+                [key: string]: string;
+            };
         };
         /**
          * PostUpdate
@@ -1985,6 +2110,12 @@ export interface components {
             body: string;
             /** Url */
             url?: string | null;
+            /** Topic */
+            topic?: string | null;
+            /** Cohorts */
+            cohorts?: number[] | null;
+            /** Member Ids */
+            member_ids?: number[] | null;
         };
         /** SignupActivationContextResponse */
         SignupActivationContextResponse: {
@@ -2160,6 +2291,15 @@ export interface components {
             /** Context */
             ctx?: Record<string, never>;
         };
+        /** WaitlistPromotionResponse */
+        WaitlistPromotionResponse: {
+            /** Promoted Member Ids */
+            promoted_member_ids: number[];
+            /** Going Count */
+            going_count: number;
+            /** Waitlist Count */
+            waitlist_count: number;
+        };
         /** WebVitalEvent */
         WebVitalEvent: {
             /**
@@ -2239,7 +2379,11 @@ export interface operations {
                 };
                 content: {
                     "application/json": {
-                        [key: string]: boolean;
+                        [key: string]: boolean | {
+                            [key: string]: string | null;
+                        } | {
+                            [key: string]: number;
+                        };
                     };
                 };
             };
@@ -2257,7 +2401,7 @@ export interface operations {
                 industry?: string | null;
                 region?: string | null;
                 job_title?: string | null;
-                sort?: "recent" | "cohort_desc" | "cohort_asc" | "name";
+                sort?: "recent" | "cohort_desc" | "cohort_asc" | "name" | "relevance";
             };
             header?: never;
             path?: never;
@@ -2285,6 +2429,47 @@ export interface operations {
             };
         };
     };
+    list_members_page_members_page_get: {
+        parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+                include_total?: boolean;
+                q?: string | null;
+                cohort?: number | null;
+                major?: string | null;
+                company?: string | null;
+                industry?: string | null;
+                region?: string | null;
+                job_title?: string | null;
+                sort?: "recent" | "cohort_desc" | "cohort_asc" | "name" | "relevance";
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["DirectoryMemberPage"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     count_members_members_count_get: {
         parameters: {
             query?: {
@@ -2297,7 +2482,7 @@ export interface operations {
                 industry?: string | null;
                 region?: string | null;
                 job_title?: string | null;
-                sort?: "recent" | "cohort_desc" | "cohort_asc" | "name";
+                sort?: "recent" | "cohort_desc" | "cohort_asc" | "name" | "relevance";
             };
             header?: never;
             path?: never;
@@ -3300,9 +3485,38 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": {
-                        [key: string]: number;
-                    };
+                    "application/json": components["schemas"]["BroadcastJobAccepted"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_broadcast_job_notifications_admin_notifications_jobs__job_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                job_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["BroadcastJobRead"];
                 };
             };
             /** @description Validation Error */
@@ -3986,6 +4200,37 @@ export interface operations {
             };
         };
     };
+    promote_event_waitlist_admin_events__event_id__waitlist_promote_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                event_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WaitlistPromotionResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     list_admin_hero_items_admin_hero__get: {
         parameters: {
             query?: {
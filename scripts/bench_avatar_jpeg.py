@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""아바타 JPEG 품질 탐색 벤치마크.
+
+예전 방식(85→50, 5 단위 선형 감소)과 품질 탐색(apps.api.jpeg_quality)을
+같은 표본에 돌려 아바타 1장당 인코딩 횟수·CPU 시간·선택 품질·크기를 비교한다.
+
+    python scripts/bench_avatar_jpeg.py                  # 합성 표본 24장, 25KB
+    python scripts/bench_avatar_jpeg.py --corpus ~/photos --max-bytes 60000
+
+합성 표본은 512px·품질 85 에서 평균 35KB 안팎이라, 기본 상한을 그보다 낮게
+두어 대부분의 표본이 품질 탐색을 거치게 한다(상한이 넉넉하면 모두 첫 인코딩에
+끝나 전략 차이가 드러나지 않는다).
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, cast
+
+from PIL import Image, ImageDraw, ImageFilter
+
+if TYPE_CHECKING:
+    from apps.api.jpeg_quality import JpegSearchOptions, JpegSearchResult
+
+
+class _JpegQualityModule(Protocol):
+    MIN_JPEG_QUALITY: int
+    JpegSearchOptions: type[JpegSearchOptions]
+
+    def search_jpeg_quality(
+        self,
+        image: Image.Image,
+        *,
+        max_bytes: int,
+        options: JpegSearchOptions | None = None,
+    ) -> JpegSearchResult | None: ...
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+_PHOTO_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+# (JPEG 바이트, 선택 품질, 인코딩 횟수) — 상한에 못 맞추면 None
+Outcome = tuple[bytes, int, int]
+Strategy = Callable[[Image.Image, int], Outcome | None]
+
+
+@dataclass
+class _Stats:
+    encodes: list[int]
+    cpu_ms: list[float]
+    quality: list[int]
+    size: list[int]
+    failed: int = 0
+
+
+def _load() -> _JpegQualityModule:
+    return cast(_JpegQualityModule, import_module("apps.api.jpeg_quality"))
+
+
+def _linear(image: Image.Image, max_bytes: int) -> Outcome | None:
+    """예전 구현: 85 에서 5 씩 내리며 매번 optimize 인코딩."""
+    floor = _load().MIN_JPEG_QUALITY
+    quality, encodes = 85, 0
+    buffer = io.BytesIO()
+    while True:
+        buffer.seek(0)
+        buffer.truncate(0)
+        image.save(buffer, format="JPEG", optimize=True, quality=quality)
+        encodes += 1
+        if buffer.tell() <= max_bytes or quality <= floor:
+            break
+        quality -= 5
+    if buffer.tell() > max_bytes:
+        return None
+    return buffer.getvalue(), quality, encodes
+
+
+def _strategies() -> dict[str, Strategy]:
+    module = _load()
+    options = module.JpegSearchOptions
+
+    def binary(opts: JpegSearchOptions) -> Strategy:
+        def run(image: Image.Image, max_bytes: int) -> Outcome | None:
+            result = module.search_jpeg_quality(
+                image, max_bytes=max_bytes, options=opts
+            )
+            if result is None:
+                return None
+            return result.data, result.quality, result.encodes
+
+        return run
+
+    return {
+        "linear(legacy)": _linear,
+        "search": binary(options()),
+        "search-progr": binary(options(progressive=True)),
+        "search-444": binary(options(subsampling=0)),
+    }
+
+
+def _synthetic_photo(seed: int, size: int) -> Image.Image:
+    """그라디언트·도형·블러·노이즈를 섞어 사진과 비슷한 압축 난도를 만든다."""
+    rnd = random.Random(seed)
+    img = Image.linear_gradient("L").resize((size, size)).convert("RGB")
+    draw = ImageDraw.Draw(img)
+    for _ in range(rnd.randrange(10, 60)):
+        x, y = rnd.randrange(size), rnd.randrange(size)
+        r = rnd.randrange(size // 50, size // 4)
+        color = (rnd.randrange(256), rnd.randrange(256), rnd.randrange(256))
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=color)
+    img = img.filter(ImageFilter.GaussianBlur(rnd.uniform(0.0, 3.0)))
+    noise = Image.effect_noise((size, size), rnd.uniform(5, 90)).convert("RGB")
+    return Image.blend(img, noise, rnd.uniform(0.05, 0.35))
+
+
+def _corpus(path: Path | None, count: int, max_pixels: int) -> Iterator[Image.Image]:
+    if path is None:
+        for seed in range(count):
+            yield _synthetic_photo(seed, 1200)
+        return
+    for file in sorted(path.iterdir()):
+        if file.suffix.lower() not in _PHOTO_SUFFIXES:
+            continue
+        with Image.open(file) as src:
+            image = src.convert("RGB")
+        image.thumbnail((max_pixels, max_pixels))
+        yield image
+
+
+def _prepare(image: Image.Image, max_pixels: int) -> Image.Image:
+    prepared = image.copy()
+    prepared.thumbnail((max_pixels, max_pixels))
+    return prepared
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=None)
+    parser.add_argument("--count", type=int, default=24)
+    parser.add_argument("--max-bytes", type=int, default=25_000)
+    parser.add_argument("--max-pixels", type=int, default=512)
+    args = parser.parse_args()
+
+    images = [
+        _prepare(image, args.max_pixels)
+        for image in _corpus(args.corpus, args.count, args.max_pixels)
+    ]
+    if not images:
+        raise SystemExit("표본 이미지가 없습니다.")
+
+    strategies = _strategies()
+    stats = {name: _Stats([], [], [], []) for name in strategies}
+    for image in images:
+        for name, strategy in strategies.items():
+            started = time.process_time()
+            result = strategy(image, args.max_bytes)
+            elapsed = (time.process_time() - started) * 1000
+            entry = stats[name]
+            entry.cpu_ms.append(elapsed)
+            if result is None:
+                entry.failed += 1
+                continue
+            data, quality, encodes = result
+            entry.encodes.append(encodes)
+            entry.quality.append(quality)
+            entry.size.append(len(data))
+
+    print(f"표본 {len(images)}장, 상한 {args.max_bytes:,}B, {args.max_pixels}px")
+    header = (
+        f"{'strategy':<16} {'enc avg':>8} {'enc max':>8} {'cpu ms':>8} "
+        f"{'cpu max':>8} {'quality':>8} {'bytes':>8} {'fail':>5}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, entry in stats.items():
+        encodes = entry.encodes or [0]
+        print(
+            f"{name:<16} {statistics.mean(encodes):>8.2f} {max(encodes):>8} "
+            f"{statistics.mean(entry.cpu_ms):>8.1f} {max(entry.cpu_ms):>8.1f} "
+            f"{statistics.mean(entry.quality or [0]):>8.1f} "
+            f"{statistics.mean(entry.size or [0]):>8.0f} {entry.failed:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
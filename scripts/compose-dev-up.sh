@@ -14,7 +14,7 @@ is_server_prod() {
     return 0
   fi
   # 2) Running containers with prod names
-  if docker ps --format '{{.Names}}' | grep -Eq '^(alumni-api|alumni-web)$'; then
+  if docker ps --format '{{.Names}}' | grep -Eq '^(alumni-api|alumni-worker|alumni-web)$'; then
     return 0
   fi
   # 3) Dedicated network used in prod
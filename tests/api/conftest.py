@@ -14,13 +14,15 @@ from sqlalchemy import create_engine, select, text
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from apps.api import models
+from apps.api import models, publication_clock
 from apps.api.config import reset_settings_cache
 from apps.api.db import get_db
 from apps.api.main import app
 from apps.api.routers.notifications import limiter_notifications
 from apps.api.routers.support import limiter as limiter_support
+from apps.api.services import hero_service, jobs_service
 from apps.api.services.auth_service import limiter_login
+from apps.api.services.notifications_service import PushProvider
 
 
 @pytest.fixture()
@@ -52,6 +54,16 @@ def reset_rate_limiters() -> Generator[None, None, None]:
             limiter.reset()
 
 
+@pytest.fixture(autouse=True)
+def reset_publication_state() -> Generator[None, None, None]:
+    """테스트마다 DB를 새로 만들므로 가시성 버전 기반 캐시도 비운다."""
+    publication_clock.reset_publication_clock()
+    hero_service.reset_hero_slides_cache()
+    yield
+    publication_clock.reset_publication_clock()
+    hero_service.reset_hero_slides_cache()
+
+
 @pytest.fixture()
 def client(tmp_path: Path) -> Generator[TestClient, None, None]:
     # 테스트 DB: PostgreSQL만 허용. 기본은 로컬 5434(appdb_test)
@@ -225,6 +237,28 @@ def admin_login(client: TestClient) -> TestClient:
     return client
 
 
+@pytest.fixture()
+def run_jobs(client: TestClient) -> Callable[[PushProvider], int]:
+    """큐에 쌓인 백그라운드 작업을 워커처럼 모두 처리하고 처리 수를 반환."""
+    override = app.dependency_overrides[get_db]
+
+    def _run(provider: PushProvider) -> int:
+        async def _drain() -> int:
+            handlers = jobs_service.default_job_handlers(provider)
+            processed = 0
+            async for session in override():
+                while await jobs_service.run_next_job(
+                    session, worker_id="pytest", handlers=handlers
+                ):
+                    processed += 1
+                break
+            return processed
+
+        return asyncio.run(_drain())
+
+    return _run
+
+
 @pytest.fixture()
 def admin_hero_login(admin_login: TestClient) -> TestClient:
     """게시물 권한 없이 hero와 게시물 preview만 가진 제한 관리자."""
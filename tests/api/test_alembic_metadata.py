@@ -2,7 +2,7 @@ import importlib
 
 import sqlalchemy as sa
 
-from apps.api import models, models_support
+from apps.api import models, models_jobs, models_support
 
 
 def test_support_ticket_table_is_registered_for_alembic() -> None:
@@ -14,6 +14,12 @@ def test_support_ticket_table_is_registered_for_alembic() -> None:
     )
 
 
+def test_background_job_table_is_registered_for_alembic() -> None:
+    assert models_jobs.BackgroundJob.__table__ is models.Base.metadata.tables[
+        "background_jobs"
+    ]
+
+
 def test_support_permission_backfill_preserves_existing_admin_access() -> None:
     migration = importlib.import_module(
         "apps.api.migrations.versions.b8e6d1f4a2c7_backfill_admin_support_roles"
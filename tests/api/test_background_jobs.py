@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.models_jobs import BackgroundJob
+from apps.api.repositories import jobs as jobs_repo
+from apps.api.services import jobs_service
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+def test_failed_job_retries_with_backoff_then_fails(client: TestClient) -> None:
+    calls: list[int] = []
+
+    async def _flaky(
+        _db: AsyncSession, ctx: jobs_service.JobContext
+    ) -> dict[str, object]:
+        calls.append(ctx.attempt)
+        raise RuntimeError("boom")
+
+    handlers = {"flaky": _flaky}
+
+    async def _scenario(db: AsyncSession) -> None:
+        job = await jobs_repo.enqueue_job(
+            db, jobs_repo.NewJob(kind="flaky", max_attempts=2)
+        )
+        job_id = int(job.id)
+        assert await jobs_service.run_next_job(db, worker_id="w", handlers=handlers)
+        row = await jobs_repo.get_job(db, job_id)
+        assert (row.status, row.attempts) == ("queued", 1)
+        assert row.run_at > datetime.now(UTC) + timedelta(seconds=20)
+        assert "RuntimeError: boom" in str(row.last_error)
+        # backoff 중에는 꺼내지 않는다
+        assert not await jobs_service.run_next_job(db, worker_id="w", handlers=handlers)
+
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id)
+            .values(run_at=datetime.now(UTC) - timedelta(seconds=1))
+        )
+        await db.commit()
+        assert await jobs_service.run_next_job(db, worker_id="w", handlers=handlers)
+        row = await jobs_repo.get_job(db, job_id)
+        assert (row.status, row.attempts) == ("failed", 2)
+        assert row.finished_at is not None
+
+    _run_in_test_session(_scenario)
+    assert calls == [1, 2]
+    assert jobs_service.retry_delay(1) == timedelta(seconds=30)
+    assert jobs_service.retry_delay(20) == jobs_service.JOB_RETRY_MAX
+
+
+def test_concurrent_workers_claim_distinct_jobs_by_priority(
+    client: TestClient,
+) -> None:
+    override = app.dependency_overrides[get_db]
+
+    async def _seed(db: AsyncSession) -> None:
+        for priority in (100, 100, 100, 10):
+            await jobs_repo.enqueue_job(
+                db, jobs_repo.NewJob(kind="noop", priority=priority)
+            )
+
+    _run_in_test_session(_seed)
+
+    async def _claim(worker: str) -> tuple[int, int] | None:
+        async for session in override():
+            job = await jobs_repo.claim_next_job(session, worker_id=worker)
+            return None if job is None else (int(job.id), int(job.priority))
+        raise RuntimeError("test session was not yielded")
+
+    async def _rush() -> list[tuple[int, int] | None]:
+        return list(await asyncio.gather(*(_claim(f"w{i}") for i in range(6))))
+
+    claimed = [item for item in asyncio.run(_rush()) if item is not None]
+    assert len(claimed) == 4
+    assert len({job_id for job_id, _ in claimed}) == 4
+
+    async def _first_priority(db: AsyncSession) -> None:
+        await db.execute(update(BackgroundJob).values(status="queued"))
+        await db.commit()
+        job = await jobs_repo.claim_next_job(db, worker_id="w")
+        assert job is not None
+        assert int(job.priority) == 10
+
+    _run_in_test_session(_first_priority)
+
+
+def test_stale_running_job_is_reclaimed(client: TestClient) -> None:
+    async def _scenario(db: AsyncSession) -> None:
+        retry = await jobs_repo.enqueue_job(db, jobs_repo.NewJob(kind="noop"))
+        final = await jobs_repo.enqueue_job(
+            db, jobs_repo.NewJob(kind="noop", max_attempts=1)
+        )
+        await jobs_repo.claim_next_job(db, worker_id="dead")
+        await jobs_repo.claim_next_job(db, worker_id="dead")
+        await db.execute(
+            update(BackgroundJob).values(
+                locked_at=datetime.now(UTC) - timedelta(hours=1)
+            )
+        )
+        await db.commit()
+
+        assert await jobs_service.reclaim_stale_jobs(db) == 2
+        assert (await jobs_repo.get_job(db, int(retry.id))).status == "queued"
+        assert (await jobs_repo.get_job(db, int(final.id))).status == "failed"
+
+    _run_in_test_session(_scenario)
+
+
+def test_broadcast_job_endpoint_hides_other_kinds(admin_login: TestClient) -> None:
+    ids: list[int] = []
+
+    async def _seed(db: AsyncSession) -> None:
+        job = await jobs_repo.enqueue_job(db, jobs_repo.NewJob(kind="noop"))
+        ids.append(int(job.id))
+
+    _run_in_test_session(_seed)
+    res = admin_login.get(f"/notifications/admin/notifications/jobs/{ids[0]}")
+    assert res.status_code == HTTPStatus.NOT_FOUND
+    missing = admin_login.get("/notifications/admin/notifications/jobs/999999")
+    assert missing.status_code == HTTPStatus.NOT_FOUND
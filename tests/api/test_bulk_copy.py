@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.repositories import bulk_copy
+from apps.api.repositories import scheduled_notifications as scheduled_repo
+from apps.api.repositories import send_logs as logs_repo
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+def test_create_logs_batch_copies_rows_and_rollup(client: TestClient) -> None:
+    items = [
+        logs_repo.SendLogItem(
+            endpoint=f"https://copy.example.com/push/{idx}",
+            ok=idx % 3 != 0,
+            status_code=201 if idx % 3 else 410,
+        )
+        for idx in range(3000)
+    ]
+    items.append(
+        logs_repo.SendLogItem(ok=False, status_code=None, stored_endpoint_hash="h" * 64)
+    )
+    # endpoint 도 저장 해시도 없는 항목은 건너뛴다
+    items.append(logs_repo.SendLogItem(ok=True, status_code=201))
+
+    async def _scenario(db: AsyncSession) -> None:
+        assert await logs_repo.create_logs_batch(db, items) == 3001
+        log = models.NotificationSendLog
+        total = await db.scalar(select(func.count()).select_from(log))
+        assert total == 3001
+        stored = await db.scalar(
+            select(log.endpoint_tail).where(log.status_code.is_(None))
+        )
+        assert stored == "h" * 16
+        aggregates = await logs_repo.aggregate_hourly_since(
+            db, cutoff=datetime.now(UTC) - timedelta(hours=1)
+        )
+        assert (aggregates.accepted, aggregates.failed) == (2000, 1001)
+        assert aggregates.failed_410 == 1000
+
+    _run_in_test_session(_scenario)
+
+
+def test_ensure_deliveries_stages_targets_with_copy(client: TestClient) -> None:
+    async def _scenario(db: AsyncSession) -> None:
+        starts = datetime.now(UTC) + timedelta(days=3)
+        event = models.Event(
+            title="copy",
+            starts_at=starts,
+            ends_at=starts + timedelta(hours=1),
+            location="Seoul",
+            capacity=10,
+        )
+        db.add(event)
+        await db.flush()
+        logs = [
+            models.ScheduledNotificationLog(
+                event_id=event.id, d_type=d_type, scheduled_at=starts
+            )
+            for d_type in ("d-3", "d-1")
+        ]
+        db.add_all(logs)
+        await db.commit()
+        log_ids = [int(log.id) for log in logs]
+        hashes = [f"{idx:064d}" for idx in range(2000)]
+
+        await scheduled_repo.ensure_deliveries_for_logs(
+            db, scheduled_log_ids=log_ids, endpoint_hashes=hashes
+        )
+        # 임시 테이블은 커밋과 함께 사라지므로 다시 불러도 되고 결과는 멱등적이다
+        await scheduled_repo.ensure_deliveries_for_logs(
+            db, scheduled_log_ids=log_ids, endpoint_hashes=[*hashes[:1500], ""]
+        )
+        delivery = models.ScheduledNotificationDelivery
+        counts = await db.execute(
+            select(delivery.status, func.count())
+            .group_by(delivery.status)
+            .order_by(delivery.status)
+        )
+        assert counts.tuples().all() == [("abandoned", 1000), ("pending", 3000)]
+
+        # 드라이버 오류는 SQLAlchemy 예외로 올라와 기존 처리 경로를 탄다
+        with pytest.raises(DBAPIError):
+            await bulk_copy.copy_rows(
+                db, "no_such_table", [("value", "text")], [("x",)]
+            )
+        await db.rollback()
+
+    _run_in_test_session(_scenario)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 from typing import Any
@@ -43,6 +43,27 @@ def _run_in_test_session(
     asyncio.run(_run())
 
 
+def _send_via_worker(
+    admin_login: TestClient,
+    run_jobs: Callable[[PushProvider], int],
+    provider: PushProvider,
+) -> dict[str, Any]:
+    """관리자 전체 발송을 큐에 넣고 워커로 처리한 뒤 작업 결과를 읽는다."""
+    res = admin_login.post(
+        "/notifications/admin/notifications/send",
+        json={"title": "t", "body": "b"},
+    )
+    assert res.status_code == HTTPStatus.ACCEPTED
+    queued = res.json()
+    assert queued["status"] == "queued"
+    assert run_jobs(provider) == 1
+    job = admin_login.get(f"/notifications/admin/notifications/jobs/{queued['job_id']}")
+    assert job.status_code == HTTPStatus.OK
+    body = job.json()
+    assert body["status"] == "succeeded"
+    return body
+
+
 def _seed_member(
     *,
     student_id: str,
@@ -307,7 +328,9 @@ def test_stats_aggregate_matches_list_counts(admin_login: TestClient) -> None:
 
 
 def test_send_to_all_batches_logs_and_expired_deletes(
-    admin_login: TestClient, monkeypatch: pytest.MonkeyPatch
+    admin_login: TestClient,
+    run_jobs: Callable[[PushProvider], int],
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     owner_id = _seed_member(student_id="d3-batch-owner")
     endpoints = [f"https://example.com/push/batch/{i}" for i in range(12)]
@@ -358,21 +381,13 @@ def test_send_to_all_batches_logs_and_expired_deletes(
     monkeypatch.setattr(subs_repo, "remove_by_endpoint_hashes", _count_remove)
     monkeypatch.setattr(notif_svc.repo, "remove_by_endpoint_hashes", _count_remove)
 
-    app.dependency_overrides[router_mod.get_push_provider] = lambda: provider
-    try:
-        res = admin_login.post(
-            "/notifications/admin/notifications/send",
-            json={"title": "t", "body": "b"},
-        )
-        assert res.status_code in (HTTPStatus.ACCEPTED, HTTPStatus.OK)
-        body = res.json()
-        assert body["accepted"] + body["failed"] == 12
-        assert batch_calls["logs"] == 1
-        assert batch_calls["removes"] == 1
-        assert body["failed"] >= 1
-        assert body["accepted"] >= 1
-    finally:
-        app.dependency_overrides.pop(router_mod.get_push_provider, None)
+    body = _send_via_worker(admin_login, run_jobs, provider)
+    assert body["accepted"] + body["failed"] == 12
+    assert body["progress"] == {"done": 12, "total": 12}
+    assert batch_calls["logs"] == 1
+    assert batch_calls["removes"] == 1
+    assert body["failed"] >= 1
+    assert body["accepted"] >= 1
 
 
 def test_remove_by_endpoint_hashes_bounded_batches() -> None:
@@ -397,11 +412,19 @@ def test_remove_by_endpoint_hashes_bounded_batches() -> None:
 
 
 def test_create_logs_batch_single_commit(monkeypatch: pytest.MonkeyPatch) -> None:
-    commits = {"n": 0}
+    commits = {"n": 0, "statements": 0}
+
+    async def _fake_copy(
+        _db: object, _table: str, _columns: object, rows: Iterable[object]
+    ) -> int:
+        return sum(1 for _ in rows)
+
+    monkeypatch.setattr(logs_repo.bulk_copy, "copy_rows", _fake_copy)
 
     class _FakeSession:
-        def add_all(self, _rows: object) -> None:
-            return None
+        async def execute(self, _stmt: object) -> None:
+            # 시간별 집계 upsert (배치당 한 문장)
+            commits["statements"] += 1
 
         async def commit(self) -> None:
             commits["n"] += 1
@@ -413,10 +436,11 @@ def test_create_logs_batch_single_commit(monkeypatch: pytest.MonkeyPatch) -> Non
     n = asyncio.run(logs_repo.create_logs_batch(_FakeSession(), items))
     assert n == 5
     assert commits["n"] == 1
+    assert commits["statements"] == 1
 
 
 def test_send_to_all_isolates_crypto_failure_per_subscription(
-    admin_login: TestClient,
+    admin_login: TestClient, run_jobs: Callable[[PushProvider], int]
 ) -> None:
     owner_id = _seed_member(student_id="d3-crypto-iso")
     good_ep = "https://example.com/push/crypto-good"
@@ -452,20 +476,10 @@ def test_send_to_all_isolates_crypto_failure_per_subscription(
         ) -> tuple[bool, int | None]:
             return self.send(sub, payload)
 
-    provider = _Dummy()
-    app.dependency_overrides[router_mod.get_push_provider] = lambda: provider
-    try:
-        res = admin_login.post(
-            "/notifications/admin/notifications/send",
-            json={"title": "t", "body": "b"},
-        )
-        assert res.status_code == HTTPStatus.ACCEPTED
-        body = res.json()
-        assert body["accepted"] >= 1
-        assert body["failed"] >= 1
-        assert body["accepted"] + body["failed"] >= 2
-    finally:
-        app.dependency_overrides.pop(router_mod.get_push_provider, None)
+    body = _send_via_worker(admin_login, run_jobs, _Dummy())
+    assert body["accepted"] >= 1
+    assert body["failed"] >= 1
+    assert body["accepted"] + body["failed"] >= 2
 
 
 def test_process_single_event_marks_failed_on_batch_exception(
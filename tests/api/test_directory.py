@@ -235,6 +235,7 @@ def test_directory_routes_do_not_preread_viewer(
         AsyncSession.execute,
     )
     query_count = 0
+    statements: list[str] = []
 
     async def _counting_execute(
         session: AsyncSession,
@@ -243,11 +244,12 @@ def test_directory_routes_do_not_preread_viewer(
     ) -> Result[Any]:
         nonlocal query_count
         query_count += 1
+        statements.append(str(args[0]) if args else "")
         return await original_execute(session, *args, **kwargs)
 
     monkeypatch.setattr(AsyncSession, "execute", _counting_execute)
-    # 요청마다 현재 계정 상태·역할을 확인하는 인증 쿼리 1개와, viewer
-    # scope를 scalar subquery로 포함한 디렉터리 본 쿼리 1개만 허용한다.
+    # 요청마다 현재 계정 상태·역할을 확인하는 인증 쿼리 1개와 디렉터리 본
+    # 쿼리 1개만 허용한다. viewer 기수는 인증 쿼리 결과를 파라미터로 쓴다.
     expected_queries_with_auth_refresh = 2
 
     before = query_count
@@ -255,6 +257,7 @@ def test_directory_routes_do_not_preread_viewer(
     assert listing.status_code == HTTPStatus.OK
     assert [row["id"] for row in listing.json()] == [viewer_id]
     assert query_count - before == expected_queries_with_auth_refresh
+    assert "(SELECT" not in statements[-1]
 
     before = query_count
     count = admin_login.get("/members/count?q=__seed__admin")
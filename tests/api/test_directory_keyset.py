@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, update
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+
+_BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _seed_members() -> None:
+    override = app.dependency_overrides.get(get_db)
+    assert override is not None
+
+    async def _do_seed() -> None:
+        async for db in override():
+            await db.execute(delete(models.Member))
+            db.add(
+                models.Member(
+                    student_id="member001",
+                    email="member001@example.com",
+                    name="조회자",
+                    cohort=99,
+                    roles="member",
+                    updated_at=_BASE_TIME,
+                )
+            )
+            # 같은 updated_at/이름/기수를 일부러 겹쳐 id 타이브레이커를 검증한다.
+            for idx in range(7):
+                db.add(
+                    models.Member(
+                        student_id=f"ks{idx:03d}",
+                        email=f"ks{idx:03d}@example.com",
+                        name="동명이인" if idx % 3 == 0 else f"회원{idx}",
+                        cohort=1 + idx % 2,
+                        roles="member",
+                        updated_at=_BASE_TIME + timedelta(minutes=idx // 2),
+                    )
+                )
+            await db.commit()
+            break
+
+    asyncio.run(_do_seed())
+
+
+def _touch_member(student_id: str) -> None:
+    override = app.dependency_overrides.get(get_db)
+    assert override is not None
+
+    async def _do_update() -> None:
+        async for db in override():
+            await db.execute(
+                update(models.Member)
+                .where(models.Member.student_id == student_id)
+                .values(updated_at=datetime.now(UTC))
+            )
+            await db.commit()
+            break
+
+    asyncio.run(_do_update())
+
+
+def _collect_pages(
+    client: TestClient, params: dict[str, str | int]
+) -> list[list[int]]:
+    pages: list[list[int]] = []
+    cursor: str | None = None
+    while True:
+        query = dict(params)
+        if cursor:
+            query["cursor"] = cursor
+        res = client.get("/members/page", params=query)
+        assert res.status_code == HTTPStatus.OK
+        body = res.json()
+        pages.append([row["id"] for row in body["items"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sort", ["recent", "cohort_desc", "cohort_asc", "name"])
+def test_keyset_pages_match_offset_order(
+    member_login: TestClient, sort: str
+) -> None:
+    _seed_members()
+
+    full = member_login.get("/members/", params={"sort": sort, "limit": 100})
+    assert full.status_code == HTTPStatus.OK
+    expected = [row["id"] for row in full.json()]
+
+    pages = _collect_pages(member_login, {"sort": sort, "limit": 3})
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert [mid for page in pages for mid in page] == expected
+
+
+def test_keyset_is_stable_across_concurrent_updates(
+    member_login: TestClient,
+) -> None:
+    _seed_members()
+
+    first = member_login.get("/members/page", params={"limit": 3}).json()
+    first_ids = [row["id"] for row in first["items"]]
+    assert first["next_cursor"]
+
+    # 뒤쪽 페이지 회원이 프로필을 수정해 맨 앞으로 이동하면 OFFSET 방식은
+    # 첫 페이지 행이 밀려 다음 페이지에 중복으로 나타난다. 키셋은 중복 없이
+    # 커서 이후 행만 이어서 반환한다(이동한 행은 새 목록의 첫 페이지에 보인다).
+    _touch_member("ks000")
+
+    rest: list[int] = []
+    cursor: str | None = first["next_cursor"]
+    while cursor:
+        body = member_login.get(
+            "/members/page", params={"limit": 3, "cursor": cursor}
+        ).json()
+        rest.extend(row["id"] for row in body["items"])
+        cursor = body["next_cursor"]
+
+    assert not set(first_ids) & set(rest)
+    assert len(rest) == len(set(rest)) == 4
+
+    fresh = member_login.get("/members/page", params={"limit": 1}).json()
+    assert fresh["items"][0]["name"] == "동명이인"
+    assert fresh["items"][0]["id"] not in rest
+
+
+def test_keyset_relevance_with_query(member_login: TestClient) -> None:
+    _seed_members()
+
+    pages = _collect_pages(
+        member_login, {"q": "동명", "sort": "relevance", "limit": 2}
+    )
+    assert [len(page) for page in pages] == [2, 1]
+
+
+def test_keyset_relevance_with_fractional_similarity(
+    member_login: TestClient,
+) -> None:
+    """ASCII 검색어는 소수 유사도를 내므로 커서 값 비교가 정확해야 한다."""
+    _seed_members()
+    override = app.dependency_overrides.get(get_db)
+    assert override is not None
+
+    async def _seed_ascii() -> None:
+        async for db in override():
+            companies = ["Kimchi", "Kimchi Foods", "Imchon", "Bimchi", "Kimch", "Imchi"]
+            for idx, company in enumerate(companies):
+                db.add(
+                    models.Member(
+                        student_id=f"rel{idx:03d}",
+                        email=f"rel{idx:03d}@example.com",
+                        name=f"관련도{idx}",
+                        cohort=3,
+                        roles="member",
+                        company=company,
+                    )
+                )
+            await db.commit()
+            break
+
+    asyncio.run(_seed_ascii())
+
+    params: dict[str, str | int] = {"q": "imch", "sort": "relevance"}
+    full = member_login.get("/members/", params={**params, "limit": 100})
+    assert full.status_code == HTTPStatus.OK
+    expected = [row["id"] for row in full.json()]
+    assert len(expected) == 6
+
+    pages = _collect_pages(member_login, {**params, "limit": 2})
+    assert [mid for page in pages for mid in page] == expected
+
+
+def test_keyset_include_total(member_login: TestClient) -> None:
+    _seed_members()
+
+    first = member_login.get(
+        "/members/page", params={"limit": 3, "include_total": "true"}
+    ).json()
+    assert first["total"] == 8
+
+    second = member_login.get(
+        "/members/page",
+        params={"limit": 3, "include_total": "true", "cursor": first["next_cursor"]},
+    ).json()
+    assert second["total"] == 8
+
+    filtered = member_login.get(
+        "/members/page", params={"q": "동명", "include_total": "true"}
+    ).json()
+    assert filtered["total"] == len(filtered["items"]) == 3
+
+    without = member_login.get("/members/page", params={"limit": 3}).json()
+    assert without["total"] is None
+
+
+def test_keyset_rejects_invalid_cursor(member_login: TestClient) -> None:
+    _seed_members()
+
+    garbage = member_login.get("/members/page", params={"cursor": "%%%not-base64"})
+    assert garbage.status_code == HTTPStatus.BAD_REQUEST
+    assert garbage.json()["code"] == "invalid_cursor"
+
+    name_page = member_login.get(
+        "/members/page", params={"sort": "name", "limit": 2}
+    ).json()
+    mismatched = member_login.get(
+        "/members/page",
+        params={"sort": "recent", "cursor": name_page["next_cursor"]},
+    )
+    assert mismatched.status_code == HTTPStatus.BAD_REQUEST
+    assert mismatched.json()["code"] == "invalid_cursor"
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+
+
+def _seed_members() -> None:
+    override = app.dependency_overrides.get(get_db)
+    assert override is not None
+
+    async def _do_seed() -> None:
+        async for db in override():
+            await db.execute(delete(models.Member))
+            payloads = [
+                dict(
+                    student_id="member001",
+                    email="member001@example.com",
+                    name="조회자",
+                    cohort=99,
+                ),
+                dict(
+                    student_id="s1001",
+                    email="kim.cs@example.com",
+                    name="김철수",
+                    cohort=1,
+                    major="경제학",
+                ),
+                dict(
+                    student_id="s1002",
+                    email="kim.ch@example.com",
+                    name="김철",
+                    cohort=2,
+                    industry="금융",
+                ),
+                dict(
+                    student_id="s1003",
+                    email="park@example.com",
+                    name="박영희",
+                    cohort=3,
+                    company="김철강",
+                ),
+                dict(
+                    student_id="s1004",
+                    email="lee@example.com",
+                    name="이민수",
+                    cohort=4,
+                    industry="금융",
+                ),
+            ]
+            for payload in payloads:
+                db.add(models.Member(**payload, roles="member"))
+            await db.commit()
+            break
+
+    asyncio.run(_do_seed())
+
+
+def test_q_searches_all_directory_fields(member_login: TestClient) -> None:
+    _seed_members()
+
+    # industry는 개별 인덱스가 없지만 통합 검색 문서로 찾는다.
+    finance = member_login.get("/members/", params={"q": "금융"})
+    assert finance.status_code == HTTPStatus.OK
+    assert {row["name"] for row in finance.json()} == {"김철", "이민수"}
+
+    count = member_login.get("/members/count", params={"q": "금융"})
+    assert count.json() == {"count": 2}
+
+
+def test_relevance_sort_prefers_exact_then_prefix_name(
+    member_login: TestClient,
+) -> None:
+    _seed_members()
+
+    res = member_login.get("/members/", params={"q": "김철", "sort": "relevance"})
+    assert res.status_code == HTTPStatus.OK
+    names = [row["name"] for row in res.json()]
+    # 이름 정확 일치 → 이름 접두 일치 → 다른 필드(회사명) 일치
+    assert names == ["김철", "김철수", "박영희"]
+
+
+def test_relevance_sort_without_q_falls_back_to_recent(
+    member_login: TestClient,
+) -> None:
+    _seed_members()
+
+    res = member_login.get("/members/", params={"sort": "relevance", "limit": 100})
+    assert res.status_code == HTTPStatus.OK
+    assert len(res.json()) == 5
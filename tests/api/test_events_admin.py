@@ -91,6 +91,20 @@ class TestAdminEventList:
             "cancel": 0,
         }
 
+    def test_admin_list_total_is_stable_across_pages(
+        self, admin_login: TestClient
+    ) -> None:
+        for idx in range(3):
+            _create_event(admin_login, f"페이지 총계 행사 {idx}")
+
+        first = admin_login.get("/admin/events/?q=페이지 총계&limit=2").json()
+        assert len(first["items"]) == 2
+        assert first["total"] == 3
+
+        # 범위를 넘은 offset 도 빈 목록과 함께 정확한 총계를 반환한다.
+        beyond = admin_login.get("/admin/events/?q=페이지 총계&offset=10").json()
+        assert beyond == {"items": [], "total": 3}
+
     def test_admin_list_filters_by_title_and_status(
         self, admin_login: TestClient
     ) -> None:
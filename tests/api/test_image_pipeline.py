@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import pickle
+from http import HTTPStatus
+from io import BytesIO
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from apps.api import image_pipeline, jpeg_quality
+from apps.api.config import get_settings
+from apps.api.errors import ApiError
+
+
+def _image_bytes(size: tuple[int, int], fmt: str = "JPEG") -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", size, color=(200, 120, 40)).save(buf, format=fmt)
+    return buf.getvalue()
+
+
+def test_render_upload_image_reports_stage_timings() -> None:
+    rendered, timings = image_pipeline.render_upload_image(
+        _image_bytes((400, 200)), ".png", 100
+    )
+
+    assert set(timings) == {"decode_ms", "resize_ms", "encode_ms"}
+    assert rendered.variants == ()
+    with Image.open(BytesIO(rendered.data)) as out:
+        assert out.format == "PNG"
+        assert out.size == (100, 50)
+
+
+def test_render_upload_image_builds_width_variants_without_upscaling() -> None:
+    spec = image_pipeline.VariantSpec(
+        widths=(320, 640, 2000), formats=("webp", "avif")
+    )
+    rendered, timings = image_pipeline.render_upload_image(
+        _image_bytes((1000, 500)), ".jpg", 1920, spec
+    )
+
+    assert "variants_ms" in timings
+    assert rendered.size == (1000, 500)
+    assert [(v.width, v.format) for v in rendered.variants] == [
+        (1000, "webp"),
+        (1000, "avif"),
+        (640, "webp"),
+        (640, "avif"),
+        (320, "webp"),
+        (320, "avif"),
+    ]
+    for variant in rendered.variants:
+        with Image.open(BytesIO(variant.data)) as out:
+            assert out.format == variant.format.upper()
+            assert out.size == (variant.width, variant.width // 2)
+    assert len(rendered.variants[-1].data) < len(rendered.data)
+
+
+def _noisy_image(size: int, sigma: float = 60) -> Image.Image:
+    return Image.effect_noise((size, size), sigma).convert("RGB")
+
+
+def test_jpeg_quality_search_fits_cap_with_bounded_encodes() -> None:
+    image = _noisy_image(256, sigma=20)
+    loose = jpeg_quality.search_jpeg_quality(image, max_bytes=10**9)
+    assert loose is not None
+    assert (loose.quality, loose.encodes) == (jpeg_quality.MAX_JPEG_QUALITY, 1)
+
+    cap = len(loose.data) * 3 // 5
+    options = jpeg_quality.JpegSearchOptions()
+    result = jpeg_quality.search_jpeg_quality(image, max_bytes=cap, options=options)
+
+    assert result is not None
+    assert len(result.data) <= cap
+    assert jpeg_quality.MIN_JPEG_QUALITY <= result.quality
+    assert result.quality < jpeg_quality.MAX_JPEG_QUALITY
+    assert result.encodes <= options.max_encodes + 1
+    with Image.open(BytesIO(result.data)) as out:
+        assert out.format == "JPEG"
+
+
+def test_jpeg_quality_search_returns_none_when_floor_does_not_fit() -> None:
+    result = jpeg_quality.search_jpeg_quality(_noisy_image(256), max_bytes=1000)
+
+    assert result is None
+
+
+def test_render_avatar_error_survives_process_boundary() -> None:
+    with pytest.raises(image_pipeline.ImageProcessingError) as exc_info:
+        image_pipeline.render_avatar(b"not-an-image", 512, 100_000)
+
+    restored = pickle.loads(pickle.dumps(exc_info.value))
+    assert restored.code == "avatar_invalid_image"
+    assert restored.detail == exc_info.value.detail
+
+
+def test_process_avatar_runs_in_pool_and_maps_errors() -> None:
+    async def _run() -> image_pipeline.RenderedImage:
+        return await image_pipeline.process_avatar(
+            _image_bytes((900, 600)), max_pixels=300, max_bytes=100_000
+        )
+
+    rendered = asyncio.run(_run())
+    assert rendered.size == (300, 200)
+    with Image.open(BytesIO(rendered.data)) as out:
+        assert out.format == "JPEG"
+        assert max(out.size) == 300
+
+    async def _invalid() -> image_pipeline.RenderedImage:
+        return await image_pipeline.process_avatar(
+            b"garbage", max_pixels=300, max_bytes=100_000
+        )
+
+    with pytest.raises(ApiError) as exc_info:
+        asyncio.run(_invalid())
+    assert exc_info.value.code == "avatar_invalid_image"
+    assert exc_info.value.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_upload_sheds_load_when_pipeline_is_full(
+    member_login: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limit = get_settings().image_max_pending
+    monkeypatch.setitem(image_pipeline._counters, "pending", limit)
+
+    res = member_login.post(
+        "/uploads/images",
+        files={"file": ("photo.jpg", _image_bytes((50, 50)), "image/jpeg")},
+    )
+
+    assert res.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert res.json()["code"] == "image_busy"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from io import BytesIO
+
+from fastapi.testclient import TestClient
+from PIL import Image
+
+
+def _upload(client: TestClient, size: tuple[int, int]) -> dict[str, object]:
+    buf = BytesIO()
+    Image.new("RGB", size, color=(30, 90, 160)).save(buf, format="JPEG")
+    res = client.post(
+        "/uploads/images",
+        files={"file": ("cover.jpg", buf.getvalue(), "image/jpeg")},
+    )
+    assert res.status_code == HTTPStatus.OK
+    return res.json()
+
+
+def test_upload_returns_srcset_per_format(admin_login: TestClient) -> None:
+    data = _upload(admin_login, (1500, 1000))
+
+    srcset = data["srcset"]
+    assert isinstance(srcset, dict)
+    assert set(srcset) == {"webp", "avif"}
+    stem = str(data["filename"]).removesuffix(".jpg")
+    assert srcset["webp"] == ", ".join(
+        f"/media/images/{stem}_w{width}.webp {width}w"
+        for width in (320, 640, 1280, 1500)
+    )
+
+
+def test_post_and_hero_expose_cover_srcset(admin_login: TestClient) -> None:
+    upload = _upload(admin_login, (800, 400))
+
+    post_res = admin_login.post(
+        "/posts/",
+        json={
+            "title": "반응형 커버",
+            "content": "본문",
+            "category": "news",
+            "published_at": "2020-01-01T00:00:00Z",
+            "cover_image": upload["url"],
+        },
+    )
+    assert post_res.status_code in (HTTPStatus.CREATED, HTTPStatus.OK)
+    post = post_res.json()
+    assert post["cover_image_srcset"] == upload["srcset"]
+    assert "640w" in post["cover_image_srcset"]["avif"]
+
+    listed = admin_login.get("/posts/?category=news").json()
+    assert listed[0]["cover_image_srcset"] == upload["srcset"]
+
+    hero_res = admin_login.post(
+        "/admin/hero/",
+        json={"target_type": "post", "target_id": post["id"], "enabled": True},
+    )
+    assert hero_res.status_code == HTTPStatus.CREATED
+    slides = admin_login.get("/hero/?limit=5").json()
+    assert slides[0]["image_srcset"] == upload["srcset"]
+
+    # 대표 이미지를 외부 URL 로 바꾸면 매니페스트도 비워진다.
+    updated = admin_login.patch(
+        f"/posts/{post['id']}",
+        json={"cover_image": "https://example.com/cover.png"},
+    )
+    assert updated.status_code == HTTPStatus.OK
+    assert updated.json()["cover_image_srcset"] == {}
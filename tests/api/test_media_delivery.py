@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from apps.api.config import get_settings
+from apps.api.media_delivery import (
+    IMMUTABLE_CACHE_CONTROL,
+    MediaDeliveryPolicy,
+    MediaFiles,
+)
+
+_HASHED = "ab" * 32 + "_w640.webp"
+
+
+@pytest.fixture
+def hashed_media(client: TestClient) -> Iterator[tuple[str, bytes]]:
+    # 메인 앱의 마운트 디렉터리(MEDIA_ROOT)에 직접 파일을 둔다.
+    path = Path(get_settings().media_root) / "images" / _HASHED
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = bytes(range(256)) * 4
+    path.write_bytes(data)
+    yield f"{get_settings().media_url_base}/images/{_HASHED}", data
+    path.unlink(missing_ok=True)
+
+
+def test_app_delivery_sets_immutable_cache_and_conditional_headers(
+    client: TestClient, hashed_media: tuple[str, bytes]
+) -> None:
+    url, data = hashed_media
+
+    res = client.get(url)
+    assert res.status_code == HTTPStatus.OK
+    assert res.content == data
+    assert res.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert res.headers["last-modified"]
+    etag = res.headers["etag"]
+
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == HTTPStatus.NOT_MODIFIED
+    assert cached.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    partial = client.get(url, headers={"Range": "bytes=10-19"})
+    assert partial.status_code == HTTPStatus.PARTIAL_CONTENT
+    assert partial.content == data[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(data)}"
+
+
+def _media_app(tmp_path: Path, mode: str) -> TestClient:
+    policy = MediaDeliveryPolicy(mode=mode, accel_prefix="/_media/", max_age=600)
+    files = MediaFiles(directory=str(tmp_path), policy=policy)
+    return TestClient(Starlette(routes=[Mount("/media", app=files)]))
+
+
+def test_legacy_names_get_bounded_public_cache(tmp_path: Path) -> None:
+    (tmp_path / "avatars").mkdir()
+    (tmp_path / "avatars" / "member_1_1700000000_ab12.jpg").write_bytes(b"jpeg")
+
+    res = _media_app(tmp_path, "app").get("/media/avatars/member_1_1700000000_ab12.jpg")
+
+    assert res.status_code == HTTPStatus.OK
+    assert res.headers["cache-control"] == "public, max-age=600"
+
+
+def test_accel_delivery_hands_off_to_nginx_without_reading(tmp_path: Path) -> None:
+    client = _media_app(tmp_path, "accel")
+
+    res = client.get(f"/media/images/{_HASHED}")
+    assert res.status_code == HTTPStatus.OK
+    assert res.content == b""
+    assert res.headers["x-accel-redirect"] == f"/_media/images/{_HASHED}"
+    assert res.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    assert client.get("/media/").status_code == HTTPStatus.NOT_FOUND
+    assert client.post(f"/media/images/{_HASHED}").status_code == (
+        HTTPStatus.METHOD_NOT_ALLOWED
+    )
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import config, image_pipeline
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.services import media_service
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+def _jpeg(color: tuple[int, int, int], size: tuple[int, int] = (700, 400)) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", size, color=color).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def media_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    root = tmp_path / "media"
+    monkeypatch.setenv("MEDIA_ROOT", str(root))
+    config.reset_settings_cache()
+    yield root
+    monkeypatch.delenv("MEDIA_ROOT")
+    config.reset_settings_cache()
+
+
+@pytest.fixture
+def render_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    upload = image_pipeline.process_upload_image
+    avatar = image_pipeline.process_avatar
+
+    async def _upload(
+        source: image_pipeline.ImageSource,
+        *,
+        ext: str,
+        max_pixels: int,
+        variants: image_pipeline.VariantSpec | None = None,
+    ) -> image_pipeline.RenderedImage:
+        calls.append("upload")
+        return await upload(source, ext=ext, max_pixels=max_pixels, variants=variants)
+
+    async def _avatar(
+        source: image_pipeline.ImageSource, *, max_pixels: int, max_bytes: int
+    ) -> image_pipeline.RenderedImage:
+        calls.append("avatar")
+        return await avatar(source, max_pixels=max_pixels, max_bytes=max_bytes)
+
+    monkeypatch.setattr(image_pipeline, "process_upload_image", _upload)
+    monkeypatch.setattr(image_pipeline, "process_avatar", _avatar)
+    return calls
+
+
+def _upload(client: TestClient, data: bytes) -> dict[str, object]:
+    res = client.post(
+        "/uploads/images", files={"file": ("poster.jpg", data, "image/jpeg")}
+    )
+    assert res.status_code == HTTPStatus.OK
+    return res.json()
+
+
+def test_same_upload_is_stored_once_by_content_hash(
+    admin_login: TestClient, media_root: Path, render_calls: list[str]
+) -> None:
+    poster = _jpeg((10, 120, 200))
+
+    first = _upload(admin_login, poster)
+    second = _upload(admin_login, poster)
+
+    assert first == second
+    assert render_calls == ["upload"]
+    stored = media_root / "images" / str(first["filename"])
+    digest = hashlib.sha256(stored.read_bytes()).hexdigest()
+    assert first["filename"] == f"{digest}.jpg"
+    assert all(path.name.startswith(digest) for path in stored.parent.iterdir())
+
+
+def test_avatar_reupload_reuses_content_addressed_file(
+    member_login: TestClient, media_root: Path, render_calls: list[str]
+) -> None:
+    avatar = _jpeg((200, 40, 40), size=(600, 600))
+
+    urls = []
+    for _ in range(2):
+        res = member_login.post(
+            "/me/avatar", files={"avatar": ("me.jpg", avatar, "image/jpeg")}
+        )
+        assert res.status_code == HTTPStatus.OK
+        urls.append(res.json()["avatar_url"])
+
+    assert urls[0] == urls[1]
+    assert render_calls == ["avatar"]
+    assert len(list((media_root / "avatars").iterdir())) == 1
+
+
+def test_gc_removes_unreferenced_assets_after_grace(
+    admin_login: TestClient, media_root: Path
+) -> None:
+    kept = _upload(admin_login, _jpeg((30, 160, 60)))
+    dropped = _upload(admin_login, _jpeg((220, 200, 20)))
+    post = admin_login.post(
+        "/posts/",
+        json={
+            "title": "포스터 공지",
+            "content": "본문",
+            "category": "notice",
+            "cover_image": kept["url"],
+        },
+    )
+    assert post.status_code in (HTTPStatus.CREATED, HTTPStatus.OK)
+    legacy = media_root / "avatars" / "member_1_1700000000_ab12.jpg"
+    legacy.parent.mkdir(parents=True, exist_ok=True)
+    legacy.write_bytes(b"old avatar")
+
+    results: list[media_service.MediaGcResult] = []
+
+    async def _collect(db: AsyncSession) -> None:
+        results.append(await media_service.collect_media_garbage(db))
+        later = datetime.now(UTC) + timedelta(days=2)
+        results.append(await media_service.collect_media_garbage(db, now=later))
+
+    _run_in_test_session(_collect)
+
+    fresh, expired = results
+    assert (fresh.assets_deleted, fresh.files_deleted) == (0, 0)
+    assert expired.assets_deleted == 1
+    assert expired.bytes_freed > 0
+
+    images = media_root / "images"
+    kept_stem = str(kept["filename"]).removesuffix(".jpg")
+    dropped_stem = str(dropped["filename"]).removesuffix(".jpg")
+    assert (images / str(kept["filename"])).exists()
+    assert list(images.glob(f"{kept_stem}_w*"))
+    assert not list(images.glob(f"{dropped_stem}*"))
+    assert not legacy.exists()
+
+
+def test_rewriting_existing_content_refreshes_mtime(media_root: Path) -> None:
+    stored = media_root / "images" / "reused.jpg"
+    stored.parent.mkdir(parents=True)
+    stored.write_bytes(b"same bytes")
+    old = (datetime.now(UTC) - timedelta(days=3)).timestamp()
+    os.utime(stored, (old, old))
+
+    asyncio.run(media_service._write_if_missing(stored, b"same bytes"))
+
+    # 재사용한 파일은 GC 유예 기간이 다시 시작되어 고아 파일 정리에 걸리지 않는다
+    cutoff = (datetime.now(UTC) - timedelta(hours=1)).timestamp()
+    assert stored.stat().st_mtime >= cutoff
+    assert media_service._sweep_orphan_files(media_root, set(), cutoff) == (0, 0)
+    assert stored.read_bytes() == b"same bytes"
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.repositories import notifications as subs_repo
+from apps.api.repositories.notifications import SubscriptionTarget
+from apps.api.services.notifications_service import PushProvider
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+async def _seed(session: AsyncSession) -> dict[str, int]:
+    """기수 90: ann·bob(notice opt-out), 기수 91: cat, 그리고 익명 구독 하나."""
+    members = {
+        name: models.Member(
+            student_id=f"target-{name}",
+            email=f"target-{name}@example.com",
+            name=name,
+            cohort=cohort,
+            roles="member",
+            status="active",
+        )
+        for name, cohort in (("ann", 90), ("bob", 90), ("cat", 91))
+    }
+    session.add_all(members.values())
+    await session.flush()
+    session.add(
+        models.NotificationPreference(
+            member_id=members["bob"].id,
+            channel="webpush",
+            topic="notice",
+            enabled=False,
+        )
+    )
+    for name, member_id in [
+        *((name, member.id) for name, member in members.items()),
+        ("anon", None),
+    ]:
+        endpoint = f"https://target.example.com/push/{name}"
+        session.add(
+            models.PushSubscription(
+                member_id=member_id,
+                endpoint=endpoint,
+                endpoint_hash=subs_repo.hash_endpoint(endpoint),
+                p256dh="p",
+                auth="a",
+            )
+        )
+    await session.commit()
+    return {name: int(member.id) for name, member in members.items()}
+
+
+def _names(endpoints: Iterable[object]) -> set[str]:
+    return {str(endpoint).rsplit("/", 1)[-1] for endpoint in endpoints}
+
+
+def test_target_subscriptions_resolved_in_one_query(client: TestClient) -> None:
+    async def _scenario(db: AsyncSession) -> None:
+        ids = await _seed(db)
+
+        async def _resolve(target: SubscriptionTarget) -> set[str]:
+            subs = await subs_repo.list_target_subscriptions(db, target)
+            return _names(sub.endpoint for sub in subs)
+
+        assert await _resolve(SubscriptionTarget()) == {"ann", "bob", "cat", "anon"}
+        # 주제만 지정하면 opt-out 한 회원만 빠지고 익명 구독은 남는다
+        assert await _resolve(SubscriptionTarget(topic="notice")) == {
+            "ann",
+            "cat",
+            "anon",
+        }
+        # 기수·회원 지정은 합집합이며 회원 구독만 고른다
+        assert await _resolve(SubscriptionTarget(cohorts=(90,))) == {"ann", "bob"}
+        assert await _resolve(
+            SubscriptionTarget(cohorts=(90,), member_ids=(ids["cat"],))
+        ) == {"ann", "bob", "cat"}
+        assert await _resolve(SubscriptionTarget(topic="notice", cohorts=(90,))) == {
+            "ann"
+        }
+
+    _run_in_test_session(_scenario)
+
+
+class _RecordingProvider(PushProvider):
+    def __init__(self) -> None:
+        self.endpoints: list[str] = []
+
+    def send(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        self.endpoints.append(str(sub.endpoint))
+        return (True, 201)
+
+    async def send_async(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        return self.send(sub, payload)
+
+
+def test_admin_targeted_send_reaches_only_targets(
+    admin_login: TestClient, run_jobs: Callable[[PushProvider], int]
+) -> None:
+    ids: dict[str, int] = {}
+
+    async def _seed_ids(db: AsyncSession) -> None:
+        ids.update(await _seed(db))
+
+    _run_in_test_session(_seed_ids)
+
+    res = admin_login.post(
+        "/notifications/admin/notifications/send",
+        json={
+            "title": "t",
+            "body": "b",
+            "topic": "notice",
+            "cohorts": [90],
+            "member_ids": [ids["cat"]],
+        },
+    )
+    assert res.status_code == HTTPStatus.ACCEPTED
+    provider = _RecordingProvider()
+    assert run_jobs(provider) == 1
+    assert _names(provider.endpoints) == {"ann", "cat"}
+
+    too_many = admin_login.post(
+        "/notifications/admin/notifications/send",
+        json={"title": "t", "body": "b", "member_ids": list(range(1001))},
+    )
+    assert too_many.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+from collections.abc import Callable
 from http import HTTPStatus
 from typing import Any
 
@@ -11,7 +12,6 @@ from sqlalchemy import select
 from apps.api import models
 from apps.api.db import get_db
 from apps.api.main import app
-from apps.api.routers import notifications as router_mod
 from apps.api.services.notifications_service import PushProvider
 
 
@@ -99,7 +99,9 @@ class _DummyProvider(PushProvider):
         return self.send(sub, payload)
 
 
-def test_admin_send_uses_provider_and_handles_410(admin_login: TestClient) -> None:
+def test_admin_send_uses_provider_and_handles_410(
+    admin_login: TestClient, run_jobs: Callable[[PushProvider], int]
+) -> None:
     client = admin_login
     # register two subscriptions
     for i in range(2):
@@ -112,18 +114,18 @@ def test_admin_send_uses_provider_and_handles_410(admin_login: TestClient) -> No
             },
         )
 
-    # override provider to avoid real network (FastAPI dependency override)
-    app.dependency_overrides[router_mod.get_push_provider] = lambda: _DummyProvider(
-        fail_every=2
-    )
-
     res = client.post(
         "/notifications/admin/notifications/send",
         json={"title": "t", "body": "b", "url": "https://example.com/x"},
     )
     assert res.status_code == HTTPStatus.ACCEPTED
-    data = res.json()
-    assert data["accepted"] + data["failed"] >= 1
+    job_id = res.json()["job_id"]
+
+    # 발송은 워커가 처리한다 (dummy provider 로 실제 네트워크 호출 없음)
+    assert run_jobs(_DummyProvider(fail_every=2)) == 1
+    job = client.get(f"/notifications/admin/notifications/jobs/{job_id}").json()
+    assert job["status"] == "succeeded"
+    assert job["accepted"] + job["failed"] >= 1
 
     # fetch stats and logs
     res2 = client.get("/notifications/admin/notifications/stats")
@@ -139,5 +141,3 @@ def test_admin_send_uses_provider_and_handles_410(admin_login: TestClient) -> No
     assert res3.status_code == HTTPStatus.OK
     logs = res3.json()
     assert isinstance(logs, list) and len(logs) >= 1
-    # clean override
-    app.dependency_overrides.pop(router_mod.get_push_provider, None)
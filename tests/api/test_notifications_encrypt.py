@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import os
+from collections.abc import Callable
 from http import HTTPStatus
 
 from fastapi.testclient import TestClient
@@ -15,10 +16,11 @@ from apps.api.db import get_db
 from apps.api.main import app
 from apps.api.repositories import notifications as subs_repo
 from apps.api.repositories import send_logs as logs_repo
+from apps.api.services.notifications_service import PushProvider, PyWebPushProvider
 
 
 def test_subscription_encrypted_at_rest_and_logged_plain_tail(
-    admin_login: TestClient,
+    admin_login: TestClient, run_jobs: Callable[[PushProvider], int]
 ) -> None:
     # Enable encryption via env
     os.environ["PUSH_ENCRYPT_AT_REST"] = "true"
@@ -74,6 +76,7 @@ def test_subscription_encrypted_at_rest_and_logged_plain_tail(
             json={"title": "t", "body": "b"},
         )
         assert res.status_code in (HTTPStatus.ACCEPTED, HTTPStatus.OK)
+        assert run_jobs(PyWebPushProvider()) == 1
 
         # encryption doesn't affect the log tail computation (uses plaintext)
         async def _check_logs() -> None:
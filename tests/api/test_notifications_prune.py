@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 
 from fastapi.testclient import TestClient
+from sqlalchemy import select, text
 
+from apps.api import models
 from apps.api.db import get_db
 from apps.api.main import app
+from apps.api.repositories import send_log_partitions as partitions
 from apps.api.repositories import send_logs as logs_repo
 
 
@@ -35,3 +39,63 @@ def test_prune_logs_admin(admin_login: TestClient) -> None:
     assert res.status_code in (HTTPStatus.OK, HTTPStatus.CREATED, HTTPStatus.ACCEPTED)
     data = res.json()
     assert "deleted" in data
+
+
+def test_prune_drops_whole_month_partitions(client: TestClient) -> None:
+    override = app.dependency_overrides[get_db]
+    now = datetime.now(UTC)
+    this_month = partitions.month_start(now)
+    months = [this_month]
+    for _ in range(3):
+        months.insert(0, partitions.month_start(months[0] - timedelta(days=1)))
+    oldest, older, previous, _ = months
+    # cutoff 이 지난달 안에 오도록: 지난달 1일 + 5일 무렵
+    days = (now - previous).days - 5
+
+    async def _scenario() -> None:
+        async for db in override():
+            db.add_all(
+                [
+                    _log("moved", oldest + timedelta(days=1)),
+                    _log("ancient", now - timedelta(days=400)),
+                ]
+            )
+            await db.commit()
+            created = await partitions.ensure_partitions(db, now=oldest, months_ahead=3)
+            assert created == [partitions.partition_name(m) for m in months]
+            # 파티션이 생기기 전 DEFAULT 로 들어간 같은 달 행은 새 파티션으로 옮겨진다
+            where = await db.execute(
+                text(
+                    "SELECT tableoid::regclass::text FROM notification_send_logs "
+                    "WHERE endpoint_hash = 'moved'"
+                )
+            )
+            assert where.scalar_one() == partitions.partition_name(oldest)
+
+            db.add_all(
+                [
+                    _log("older", older + timedelta(days=1)),
+                    _log("boundary", previous + timedelta(hours=1)),
+                    _log("keep", now),
+                ]
+            )
+            await db.commit()
+
+            pruned = await logs_repo.prune_older_than_days(db, days=days)
+            assert pruned == 4
+            assert await partitions.list_partitions(db) == [
+                partitions.DEFAULT_PARTITION,
+                partitions.partition_name(previous),
+                partitions.partition_name(this_month),
+            ]
+            left = await db.execute(select(models.NotificationSendLog.endpoint_hash))
+            assert left.scalars().all() == ["keep"]
+            break
+
+    asyncio.run(_scenario())
+
+
+def _log(name: str, created_at: datetime) -> models.NotificationSendLog:
+    return models.NotificationSendLog(
+        ok=1, status_code=201, endpoint_hash=name, created_at=created_at
+    )
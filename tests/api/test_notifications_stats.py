@@ -1,8 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.repositories import send_logs as logs_repo
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
 
 
 def test_stats_range_param(admin_login: TestClient) -> None:
@@ -12,3 +36,102 @@ def test_stats_range_param(admin_login: TestClient) -> None:
         assert res.status_code == HTTPStatus.OK
         data = res.json()
         assert data.get("range") == r
+
+
+def test_stats_read_hourly_rollup_maintained_on_insert(
+    admin_login: TestClient,
+) -> None:
+    cutoff = datetime.now(UTC) - timedelta(hours=24)
+
+    async def _seed(session: AsyncSession) -> None:
+        await logs_repo.create_logs_batch(
+            session,
+            [
+                logs_repo.SendLogItem(ok=True, status_code=201, endpoint="https://e/1"),
+                logs_repo.SendLogItem(ok=True, status_code=201, endpoint="https://e/2"),
+                logs_repo.SendLogItem(
+                    ok=False, status_code=404, endpoint="https://e/3"
+                ),
+                logs_repo.SendLogItem(
+                    ok=False, status_code=None, stored_endpoint_hash="h" * 64
+                ),
+            ],
+        )
+        await logs_repo.create_log(
+            session, endpoint="https://e/4", ok=False, status_code=503
+        )
+        await logs_repo.create_log(
+            session, endpoint="https://e/5", ok=False, status_code=410
+        )
+
+        stats = models.NotificationSendStatHourly
+        rows = (
+            await session.execute(
+                select(stats.ok, stats.status_class, stats.total).order_by(
+                    stats.ok, stats.status_class
+                )
+            )
+        ).all()
+        assert [tuple(r) for r in rows] == [
+            (0, "404", 1),
+            (0, "410", 1),
+            (0, "5xx", 1),
+            (0, "none", 1),
+            (1, "2xx", 2),
+        ]
+        hourly = await logs_repo.aggregate_hourly_since(session, cutoff=cutoff)
+        assert hourly == await logs_repo.aggregate_since(session, cutoff=cutoff)
+
+        # 집계를 거치지 않은 원본 행은 통계에 잡히지 않는다(원본 로그를 읽지 않음)
+        session.add(
+            models.NotificationSendLog(ok=1, status_code=201, endpoint_hash="raw")
+        )
+        await session.commit()
+
+    _run_in_test_session(_seed)
+
+    data = admin_login.get("/notifications/admin/notifications/stats?range=24h").json()
+    assert (data["recent_accepted"], data["recent_failed"]) == (2, 4)
+    assert (data["failed_404"], data["failed_410"], data["failed_other"]) == (1, 1, 2)
+    assert logs_repo.status_class(302) == "3xx"
+    assert logs_repo.status_class(999) == "other"
+
+
+def test_hourly_stats_count_only_from_cutoff(client: TestClient) -> None:
+    hour = datetime.now(UTC).replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    cutoff = hour + timedelta(minutes=30)
+
+    async def _scenario(session: AsyncSession) -> None:
+        stats = models.NotificationSendStatHourly
+        session.add_all(
+            [
+                # cutoff 가 속한 시간: 원본 로그 둘 중 cutoff 이후 하나만 센다
+                stats(hour=hour, ok=1, status_class="2xx", total=2),
+                stats(
+                    hour=hour + timedelta(hours=1), ok=1, status_class="2xx", total=5
+                ),
+                stats(
+                    hour=hour + timedelta(hours=1), ok=0, status_class="410", total=1
+                ),
+                *(
+                    models.NotificationSendLog(
+                        ok=1,
+                        status_code=201,
+                        endpoint_hash=f"edge-{minutes}",
+                        created_at=hour + timedelta(minutes=minutes),
+                    )
+                    for minutes in (10, 40)
+                ),
+            ]
+        )
+        await session.commit()
+
+        hourly = await logs_repo.aggregate_hourly_since(session, cutoff=cutoff)
+        assert (hourly.accepted, hourly.failed, hourly.failed_410) == (6, 1, 1)
+        # 정시 cutoff 는 원본 로그 없이 집계 행만 읽는다
+        on_the_hour = await logs_repo.aggregate_hourly_since(session, cutoff=hour)
+        assert (on_the_hour.accepted, on_the_hour.failed) == (7, 1)
+
+    _run_in_test_session(_scenario)
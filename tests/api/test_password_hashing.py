@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api import passwords
+from apps.api.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> None:
+    passwords.reset_password_hash_metrics()
+
+
+def test_async_hash_and_verify_run_on_pool() -> None:
+    async def _roundtrip() -> tuple[bool, bool]:
+        password_hash = await passwords.hash_password_async("pool-password")
+        ok, wrong = await asyncio.gather(
+            passwords.verify_password_async("pool-password", password_hash),
+            passwords.verify_password_async("other-password", password_hash),
+        )
+        return ok, wrong
+
+    ok, wrong = asyncio.run(_roundtrip())
+
+    assert ok is True
+    assert wrong is False
+    metrics = passwords.password_hash_metrics()
+    assert metrics["completed"] == 3
+    assert metrics["pending"] == 0
+    assert metrics["max_ms"] > 0
+
+
+def test_async_hash_rejects_long_password_before_queueing() -> None:
+    with pytest.raises(ValueError, match="UTF-8 기준 72바이트"):
+        asyncio.run(passwords.hash_password_async("a" * 73))
+
+    assert passwords.password_hash_metrics()["completed"] == 0
+
+
+def test_login_sheds_load_with_429_when_hash_queue_is_full(
+    member_login: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limit = get_settings().password_hash_max_pending
+    monkeypatch.setitem(passwords._counters, "pending", limit)
+
+    res = member_login.post(
+        "/auth/member/login",
+        json={"student_id": "member001", "password": "memberpass"},
+    )
+
+    assert res.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert res.json()["code"] == "auth_busy"
+    assert passwords.password_hash_metrics()["rejected"] == 1
+    health = member_login.get("/healthz").json()
+    assert health["password_hash"]["rejected"] == 1
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+
+from apps.api import publication_clock
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
+def test_observe_publication_wakes_for_earlier_schedule_only() -> None:
+    woken: list[datetime] = []
+    publication_clock.set_publication_waker(woken.append)
+    now = datetime(2030, 1, 1, tzinfo=UTC)
+    later = now + timedelta(hours=2)
+    sooner = now + timedelta(hours=1)
+
+    publication_clock.observe_publication(later, now=now)
+    publication_clock.observe_publication(later + timedelta(hours=1), now=now)
+    publication_clock.observe_publication(sooner, now=now)
+    publication_clock.observe_publication(now - timedelta(days=1), now=now)
+
+    assert woken == [later, sooner]
+    assert publication_clock.next_publication_at() == sooner
+    # 모든 쓰기는 공개 결과를 바꿀 수 있으므로 버전을 올린다.
+    assert publication_clock.current_version() == 4
+
+
+def test_hero_cache_follows_visibility_version(admin_login: TestClient) -> None:
+    client = admin_login
+    post_res = client.post(
+        "/posts/",
+        json={
+            "title": "예약 공지",
+            "content": "본문",
+            "category": "notice",
+            "published_at": _iso(datetime.now(UTC) + timedelta(days=1)),
+        },
+    )
+    assert post_res.status_code == HTTPStatus.CREATED
+    post_id = post_res.json()["id"]
+    # 예약 게시글 생성이 다음 공개 시각을 알린다.
+    assert publication_clock.next_publication_at() is not None
+
+    hero_res = client.post(
+        "/admin/hero/",
+        json={"target_type": "post", "target_id": post_id, "enabled": True},
+    )
+    assert hero_res.status_code == HTTPStatus.CREATED
+    assert client.get("/hero/").json() == []
+
+    version = publication_clock.current_version()
+    assert client.get("/hero/").json() == []
+    assert publication_clock.current_version() == version
+
+    # 공개 전환(쓰기)은 버전을 올려 캐시를 무효화한다.
+    patch_res = client.patch(
+        f"/posts/{post_id}",
+        json={"published_at": _iso(datetime(2020, 1, 1, tzinfo=UTC))},
+    )
+    assert patch_res.status_code == HTTPStatus.OK
+    slides = client.get("/hero/").json()
+    assert [slide["target_id"] for slide in slides] == [post_id]
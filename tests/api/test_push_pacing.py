@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.repositories import notifications as subs_repo
+from apps.api.services import notifications_service as notif_svc
+from apps.api.services import scheduled_notifications_service as sched
+from apps.api.services.notifications_service import PushProvider
+from apps.api.services.push_pacing import PacingConfig, PushPacer, parse_retry_after
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+def _pacer(clock: _FakeClock, **overrides: float) -> PushPacer:
+    return PushPacer(PacingConfig(**overrides), clock=clock, sleep=clock.sleep)
+
+
+def test_token_bucket_aimd_and_retry_after() -> None:
+    clock = _FakeClock()
+    pacer = _pacer(clock, initial_rate=2.0, max_rate=3.0)
+    fcm = "https://fcm.googleapis.com"
+    moz = "https://updates.push.services.mozilla.com"
+
+    async def _scenario() -> None:
+        # 버킷 용량(1초 분량)만큼은 기다리지 않고, 그다음은 1/rate 간격
+        for _ in range(3):
+            await pacer.acquire(fcm)
+        assert clock.sleeps == [0.5]
+
+        # 성공은 additive increase(상한 max_rate), 429 는 절반
+        for _ in range(5):
+            pacer.record(fcm, 201, ok=True)
+        assert pacer.rate(fcm) == 3.0
+        pacer.record(fcm, 429, ok=False)
+        assert pacer.rate(fcm) == 1.5
+        # 쿨다운 안의 연속 실패는 한 번만 줄인다. 4xx·결과 불명은 반영하지 않는다
+        pacer.record(fcm, 503, ok=False)
+        pacer.record(fcm, 413, ok=False)
+        pacer.record(fcm, None, ok=False)
+        assert pacer.rate(fcm) == 1.5
+
+        # Retry-After 동안 그 origin 만 멈춘다
+        clock.sleeps.clear()
+        pacer.pause(fcm, 7.0)
+        await pacer.acquire(moz)
+        assert clock.sleeps == []
+        await pacer.acquire(fcm)
+        assert clock.sleeps == [7.0]
+
+    asyncio.run(_scenario())
+
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    assert parse_retry_after("12") == 12.0
+    later = format_datetime(now + timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(later, now=now) == 30.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+class _ThrottlingProvider(PushProvider):
+    """첫 호출은 429 + Retry-After, 이후는 성공."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.pending_retry_after: dict[str, float] = {}
+
+    def send(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        self.calls += 1
+        if self.calls == 1:
+            self.pending_retry_after[str(sub.endpoint)] = 4.0
+            return (False, 429)
+        return (True, 201)
+
+    async def send_async(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        return self.send(sub, payload)
+
+    def pop_retry_after(self, endpoint: str) -> float | None:
+        return self.pending_retry_after.pop(endpoint, None)
+
+
+def test_broadcast_drains_retry_after(client: TestClient) -> None:
+    provider = _ThrottlingProvider()
+
+    async def _scenario(db: AsyncSession) -> None:
+        endpoint = "https://drain.example.com/push/1"
+        db.add(
+            models.PushSubscription(
+                endpoint=endpoint,
+                endpoint_hash=subs_repo.hash_endpoint(endpoint),
+                p256dh="p",
+                auth="a",
+            )
+        )
+        await db.commit()
+        await notif_svc.send_to_all(db, provider, title="t", body="b")
+
+    _run_in_test_session(_scenario)
+
+    # pacer 가 없는 전체 발송도 Retry-After 를 꺼내 가 provider 에 남지 않는다
+    assert provider.calls == 1
+    assert provider.pending_retry_after == {}
+
+
+def test_batch_loop_is_paced_by_provider_responses(client: TestClient) -> None:
+    clock = _FakeClock()
+    pacer = _pacer(clock, initial_rate=50.0)
+    provider = _ThrottlingProvider()
+    origin = "https://pace.example.com"
+
+    async def _scenario(db: AsyncSession) -> None:
+        for idx in range(120):
+            endpoint = f"{origin}/push/{idx}"
+            db.add(
+                models.PushSubscription(
+                    endpoint=endpoint,
+                    endpoint_hash=subs_repo.hash_endpoint(endpoint),
+                    p256dh="p",
+                    auth="a",
+                )
+            )
+        await db.commit()
+        subs = await sched.get_eligible_subscriptions(db)
+        result = await sched.send_batch_notifications(
+            db,
+            provider,
+            subscriptions=subs,
+            payload={"title": "t", "body": "b"},
+            config=sched.BatchConfig(pacer=pacer),
+        )
+        assert (result.accepted, result.failed) == (120, 0)
+
+    _run_in_test_session(_scenario)
+
+    # 고정 배치 sleep 없이 Retry-After(4초) 한 번 멈춘 뒤 줄어든 속도로 이어 보낸다
+    assert provider.calls == 121
+    assert clock.sleeps[0] == 4.0
+    assert 1.0 not in clock.sleeps
+    assert pacer.rate(origin) > 25.0
+
+
+class _OriginLimitedProvider(PushProvider):
+    """limited origin 첫 호출만 429 + Retry-After 30초, 나머지는 성공."""
+
+    def __init__(self, clock: _FakeClock, limited_origin: str) -> None:
+        self.clock = clock
+        self.limited_origin = limited_origin
+        self.sent: list[tuple[str, float]] = []
+        self.pending_retry_after: dict[str, float] = {}
+
+    def send(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        endpoint = str(sub.endpoint)
+        self.sent.append((endpoint, self.clock.now))
+        if endpoint.startswith(self.limited_origin) and len(self.sent) == 1:
+            self.pending_retry_after[endpoint] = 30.0
+            return (False, 429)
+        return (True, 201)
+
+    async def send_async(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        return self.send(sub, payload)
+
+    def pop_retry_after(self, endpoint: str) -> float | None:
+        return self.pending_retry_after.pop(endpoint, None)
+
+
+async def _scheduled_log_id(db: AsyncSession) -> int:
+    starts = datetime.now(UTC) + timedelta(days=1)
+    event = models.Event(
+        title="pacing",
+        starts_at=starts,
+        ends_at=starts + timedelta(hours=1),
+        location="Seoul",
+        capacity=10,
+    )
+    db.add(event)
+    await db.flush()
+    log = models.ScheduledNotificationLog(
+        event_id=event.id, d_type="d-1", scheduled_at=starts
+    )
+    db.add(log)
+    await db.commit()
+    return int(log.id)
+
+
+@pytest.mark.parametrize("scheduled", [False, True])
+def test_paused_origin_does_not_block_other_origins(
+    client: TestClient, scheduled: bool
+) -> None:
+    clock = _FakeClock()
+    pacer = _pacer(clock, initial_rate=50.0)
+    limited = "https://limited.example.com"
+    other = "https://other.example.com"
+    provider = _OriginLimitedProvider(clock, limited)
+    endpoints = [f"{limited}/push/{idx}" for idx in range(2)] + [
+        f"{other}/push/{idx}" for idx in range(5)
+    ]
+
+    async def _scenario(db: AsyncSession) -> None:
+        for endpoint in endpoints:
+            db.add(
+                models.PushSubscription(
+                    endpoint=endpoint,
+                    endpoint_hash=subs_repo.hash_endpoint(endpoint),
+                    p256dh="p",
+                    auth="a",
+                )
+            )
+        await db.commit()
+        subs = sorted(
+            await sched.get_eligible_subscriptions(db),
+            key=lambda sub: endpoints.index(str(sub.endpoint)),
+        )
+        # 예약 발송은 claim 전에 origin 을 알아야 멈춘 origin 을 건너뛴다
+        log_id = await _scheduled_log_id(db) if scheduled else None
+        result = await sched.send_batch_notifications(
+            db,
+            provider,
+            subscriptions=subs,
+            payload={"title": "t", "body": "b"},
+            config=sched.BatchConfig(pacer=pacer, scheduled_log_id=log_id),
+        )
+        assert (result.accepted, result.failed) == (7, 0)
+
+    _run_in_test_session(_scenario)
+
+    # limited 가 멈춘 30초 동안 other 는 기다리지 않고 모두 나가고,
+    # 미뤄 둔 limited 구독은 멈춤이 풀린 뒤 이어서 보낸다
+    other_times = [at for endpoint, at in provider.sent if endpoint.startswith(other)]
+    limited_after = [
+        at for endpoint, at in provider.sent[1:] if endpoint.startswith(limited)
+    ]
+    assert len(other_times) == 5
+    assert max(other_times) < 1.0
+    assert len(limited_after) == 2
+    assert min(limited_after) >= 30.0
+    assert clock.sleeps == [30.0]
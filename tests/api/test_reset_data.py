@@ -62,6 +62,7 @@ async def _seed_reset_target_data(session: AsyncSession) -> None:
         ends_at=datetime(2026, 2, 18, 2, 0, tzinfo=UTC),
         location="Seoul",
         capacity=100,
+        going_count=1,
     )
     session.add(event)
     await session.flush()
@@ -190,12 +191,14 @@ async def _assert_counts_after_reset(session: AsyncSession) -> None:
     event_count = await session.scalar(select(func.count()).select_from(models.Event))
     hero_count = await session.scalar(select(func.count()).select_from(models.HeroItem))
     ticket_count = await session.scalar(select(func.count()).select_from(SupportTicket))
+    going_total = await session.scalar(select(func.sum(models.Event.going_count)))
 
     assert member_count == 0
     assert auth_count == 0
     assert post_count == 0
     assert comment_count == 0
     assert rsvp_count == 0
+    assert going_total == 0
     assert pref_count == 0
     assert sub_count == 1
     assert signup_count == 0
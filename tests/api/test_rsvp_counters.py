@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.services import events_service
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+def _create_event(admin_login: TestClient, capacity: int) -> int:
+    starts = dt.datetime.now(dt.UTC) + dt.timedelta(days=3)
+    res = admin_login.post(
+        "/events/",
+        json={
+            "title": "정원 집계 행사",
+            "location": "세미나실",
+            "capacity": capacity,
+            "starts_at": starts.isoformat(),
+            "ends_at": (starts + dt.timedelta(hours=2)).isoformat(),
+        },
+    )
+    assert res.status_code == HTTPStatus.CREATED
+    return int(res.json()["id"])
+
+
+def _create_members(admin_login: TestClient, count: int) -> list[int]:
+    ids: list[int] = []
+    for index in range(count):
+        student_id = f"cnt{index:03d}"
+        res = admin_login.post(
+            "/admin/members/",
+            json={
+                "student_id": student_id,
+                "email": f"{student_id}@example.com",
+                "name": student_id.upper(),
+                "cohort": 2025,
+                "roles": ["member"],
+            },
+        )
+        assert res.status_code == HTTPStatus.CREATED
+        ids.append(int(res.json()["member"]["id"]))
+    return ids
+
+
+def _set_status(
+    admin_login: TestClient, event_id: int, member_id: int, status: str
+) -> str:
+    res = admin_login.post(
+        f"/admin/events/{event_id}/rsvps/{member_id}", json={"status": status}
+    )
+    assert res.status_code == HTTPStatus.CREATED
+    return str(res.json()["status"])
+
+
+def _counts(event_id: int) -> tuple[int, int]:
+    found: list[tuple[int, int]] = []
+
+    async def _read(db: AsyncSession) -> None:
+        row = (
+            await db.execute(
+                select(models.Event.going_count, models.Event.waitlist_count).where(
+                    models.Event.id == event_id
+                )
+            )
+        ).one()
+        found.append((int(row[0]), int(row[1])))
+
+    _run_in_test_session(_read)
+    return found[0]
+
+
+def test_counters_follow_rsvp_transitions(admin_login: TestClient) -> None:
+    event_id = _create_event(admin_login, capacity=1)
+    first, second, third = _create_members(admin_login, 3)
+
+    assert _set_status(admin_login, event_id, first, "going") == "going"
+    assert _set_status(admin_login, event_id, second, "going") == "waitlist"
+    assert _set_status(admin_login, event_id, third, "waitlist") == "waitlist"
+    # 재요청은 본인 자리를 다시 세지 않는다
+    assert _set_status(admin_login, event_id, first, "going") == "going"
+    assert _counts(event_id) == (1, 2)
+
+    # 취소하면 대기열 최상위가 자리를 넘겨받는다
+    assert _set_status(admin_login, event_id, first, "cancel") == "cancel"
+    assert _counts(event_id) == (1, 1)
+    res = admin_login.get(f"/admin/events/{event_id}/rsvps/{second}")
+    assert res.json()["status"] == "going"
+
+
+def test_concurrent_going_requests_do_not_overbook(admin_login: TestClient) -> None:
+    capacity = 3
+    event_id = _create_event(admin_login, capacity=capacity)
+    member_ids = _create_members(admin_login, 8)
+    override = app.dependency_overrides[get_db]
+
+    async def _rsvp(member_id: int) -> models.RSVPStatus:
+        async for session in override():
+            rsvp = await events_service.transition_rsvp_status(
+                session, event_id=event_id, member_id=member_id, requested="going"
+            )
+            return models.RSVPStatus(rsvp.status)
+        raise RuntimeError("test session was not yielded")
+
+    async def _rush() -> list[models.RSVPStatus]:
+        return list(await asyncio.gather(*(_rsvp(mid) for mid in member_ids)))
+
+    statuses = asyncio.run(_rush())
+
+    assert statuses.count(models.RSVPStatus.GOING) == capacity
+    assert statuses.count(models.RSVPStatus.WAITLIST) == len(member_ids) - capacity
+    assert _counts(event_id) == (capacity, len(member_ids) - capacity)
+
+
+def test_reconcile_fixes_drifted_counters(admin_login: TestClient) -> None:
+    event_id = _create_event(admin_login, capacity=5)
+    first, second = _create_members(admin_login, 2)
+    _set_status(admin_login, event_id, first, "going")
+    _set_status(admin_login, event_id, second, "waitlist")
+
+    fixed: list[list[int]] = []
+
+    async def _drift_and_reconcile(db: AsyncSession) -> None:
+        await db.execute(
+            update(models.Event)
+            .where(models.Event.id == event_id)
+            .values(going_count=4, waitlist_count=0)
+        )
+        await db.commit()
+        fixed.append(await events_service.reconcile_rsvp_counts(db))
+        fixed.append(await events_service.reconcile_rsvp_counts(db, event_id))
+
+    _run_in_test_session(_drift_and_reconcile)
+
+    assert fixed == [[event_id], []]
+    assert _counts(event_id) == (1, 1)
+
+
+def test_capacity_increase_promotes_waitlist_in_order(
+    admin_login: TestClient,
+) -> None:
+    event_id = _create_event(admin_login, capacity=1)
+    member_ids = _create_members(admin_login, 4)
+    for member_id in member_ids:
+        _set_status(admin_login, event_id, member_id, "going")
+    assert _counts(event_id) == (1, 3)
+
+    res = admin_login.patch(f"/admin/events/{event_id}", json={"capacity": 3})
+    assert res.status_code == HTTPStatus.OK
+    assert _counts(event_id) == (3, 1)
+    statuses = [
+        admin_login.get(f"/admin/events/{event_id}/rsvps/{mid}").json()["status"]
+        for mid in member_ids
+    ]
+    assert statuses == ["going", "going", "going", "waitlist"]
+
+
+def test_admin_promote_fills_all_free_seats(admin_login: TestClient) -> None:
+    event_id = _create_event(admin_login, capacity=2)
+    member_ids = _create_members(admin_login, 4)
+    for member_id in member_ids:
+        _set_status(admin_login, event_id, member_id, "waitlist")
+
+    res = admin_login.post(f"/admin/events/{event_id}/waitlist/promote")
+    assert res.status_code == HTTPStatus.OK
+    assert res.json() == {
+        "promoted_member_ids": member_ids[:2],
+        "going_count": 2,
+        "waitlist_count": 2,
+    }
+
+    again = admin_login.post(f"/admin/events/{event_id}/waitlist/promote")
+    assert again.json()["promoted_member_ids"] == []
+    missing = admin_login.post("/admin/events/999999/waitlist/promote")
+    assert missing.status_code == HTTPStatus.NOT_FOUND
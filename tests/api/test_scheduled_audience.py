@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import config, models
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.repositories import notifications as subs_repo
+from apps.api.services import scheduled_notifications_service as sched
+from apps.api.services import scheduled_trigger_service as trigger_svc
+from apps.api.services.notifications_service import PushProvider
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+class _CountingProvider(PushProvider):
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.titles: set[str] = set()
+
+    def send(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        self.sent.append(str(sub.endpoint_hash))
+        self.titles.add(str(payload["title"]))
+        return (True, 201)
+
+    async def send_async(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        return self.send(sub, payload)
+
+
+async def _seed(session: AsyncSession, target: datetime) -> None:
+    members = [
+        models.Member(
+            student_id=f"aud-{name}",
+            email=f"aud-{name}@example.com",
+            name=name,
+            cohort=1,
+            roles="member",
+            status="active",
+        )
+        for name in ("keep", "optout")
+    ]
+    session.add_all(members)
+    await session.flush()
+    session.add(
+        models.NotificationPreference(
+            member_id=members[1].id, channel="webpush", topic="event", enabled=False
+        )
+    )
+    for days in (3, 1, 1):
+        starts = target + timedelta(days=days, hours=10)
+        session.add(
+            models.Event(
+                title=f"D-{days} 행사",
+                starts_at=starts,
+                ends_at=starts + timedelta(hours=2),
+                location="Seoul",
+                capacity=10,
+            )
+        )
+    await session.commit()
+    for member, suffix in zip(members, ("keep", "optout"), strict=True):
+        await subs_repo.upsert_subscription(
+            session,
+            {
+                "endpoint": f"https://example.com/push/{suffix}",
+                "p256dh": "p",
+                "auth": "a",
+            },
+            actor_member_id=int(member.id),
+        )
+    anon_endpoint = "https://example.com/push/anon"
+    session.add(
+        models.PushSubscription(
+            member_id=None,
+            endpoint=anon_endpoint,
+            endpoint_hash=subs_repo.hash_endpoint(anon_endpoint),
+            p256dh="p",
+            auth="a",
+        )
+    )
+    await session.commit()
+
+
+def test_trigger_resolves_audience_once_for_all_due_events(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target_date = datetime.now(tz=sched.KST).date()
+    midnight = datetime.combine(target_date, datetime.min.time(), tzinfo=sched.KST)
+    _run_in_test_session(lambda session: _seed(session, midnight))
+
+    loads: list[str] = []
+    real_list = subs_repo.list_eligible_subscriptions
+
+    async def _counting_list(
+        db: AsyncSession, *, topic: str, channel: str = "webpush"
+    ) -> Sequence[models.PushSubscription]:
+        loads.append(topic)
+        return await real_list(db, topic=topic, channel=channel)
+
+    monkeypatch.setattr(subs_repo, "list_eligible_subscriptions", _counting_list)
+    provider = _CountingProvider()
+    results: list[trigger_svc.TriggerResult] = []
+
+    async def _trigger(session: AsyncSession) -> None:
+        results.append(
+            await trigger_svc.trigger_scheduled_notifications(
+                session, provider, target_date=target_date
+            )
+        )
+
+    _run_in_test_session(_trigger)
+
+    result = results[0]
+    assert loads == ["event"]
+    assert (result.total_events, result.processed, result.skipped) == (3, 3, 0)
+    # 회원 1명 opt-out: 남은 2개 구독 x 행사 3개
+    assert (result.total_accepted, result.total_failed) == (6, 0)
+    assert len(provider.sent) == 6
+    assert subs_repo.hash_endpoint("https://example.com/push/optout") not in set(
+        provider.sent
+    )
+
+    async def _verify(session: AsyncSession) -> None:
+        rows = (
+            await session.execute(select(models.ScheduledNotificationDelivery.status))
+        ).scalars()
+        assert sorted(str(status) for status in rows) == ["completed"] * 6
+
+    _run_in_test_session(_verify)
+
+
+class _StaleSweepProvider(_CountingProvider):
+    """첫 행사를 보내는 중에 다른 워커의 stale 회수가 끼어든 상황을 흉내 낸다."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pairs: list[tuple[str, str]] = []
+        self.swept = False
+
+    async def send_async(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        self.pairs.append((str(payload["url"]), str(sub.endpoint_hash)))
+        if not self.swept:
+            self.swept = True
+            override = app.dependency_overrides[get_db]
+            async for other in override():
+                log = models.ScheduledNotificationLog
+                await other.execute(
+                    update(log)
+                    .where(log.status == "pending")
+                    .values(updated_at=datetime.now(UTC) - timedelta(hours=1))
+                )
+                await other.commit()
+                await sched.reclaim_stale_scheduled_logs(other)
+                break
+        return self.send(sub, payload)
+
+
+def test_trigger_skips_logs_reclaimed_while_waiting(client: TestClient) -> None:
+    target_date = datetime.now(tz=sched.KST).date()
+    midnight = datetime.combine(target_date, datetime.min.time(), tzinfo=sched.KST)
+    _run_in_test_session(lambda session: _seed(session, midnight))
+    provider = _StaleSweepProvider()
+    results: list[trigger_svc.TriggerResult] = []
+
+    async def _trigger(session: AsyncSession) -> None:
+        results.append(
+            await trigger_svc.trigger_scheduled_notifications(
+                session, provider, target_date=target_date
+            )
+        )
+
+    _run_in_test_session(_trigger)
+    _run_in_test_session(_trigger)
+
+    # 회수된 로그는 in_progress 로 되살리지 않고 다음 실행이 다시 확보해 보낸다
+    first, second = results
+    assert (first.processed, first.skipped) == (1, 2)
+    assert (second.processed, second.skipped) == (2, 1)
+    assert len(provider.pairs) == 6
+    assert set(Counter(provider.pairs).values()) == {1}
+
+    async def _verify(session: AsyncSession) -> None:
+        logs = await sched.list_scheduled_logs(session, limit=10)
+        assert [str(log.status) for log in logs] == ["completed"] * 3
+
+    _run_in_test_session(_verify)
+
+
+def test_digest_mode_sends_one_push_per_subscriber(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SCHEDULED_NOTIFICATION_DIGEST", "true")
+    config.reset_settings_cache()
+    target_date = datetime.now(tz=sched.KST).date()
+    midnight = datetime.combine(target_date, datetime.min.time(), tzinfo=sched.KST)
+    _run_in_test_session(lambda session: _seed(session, midnight))
+    provider = _CountingProvider()
+    results: list[trigger_svc.TriggerResult] = []
+
+    async def _trigger(session: AsyncSession) -> None:
+        results.append(
+            await trigger_svc.trigger_scheduled_notifications(
+                session, provider, target_date=target_date
+            )
+        )
+
+    try:
+        _run_in_test_session(_trigger)
+        _run_in_test_session(_trigger)
+    finally:
+        monkeypatch.delenv("SCHEDULED_NOTIFICATION_DIGEST")
+        config.reset_settings_cache()
+
+    first, second = results
+    assert (first.processed, first.skipped) == (3, 0)
+    assert (second.processed, second.skipped) == (0, 3)
+    assert len(provider.sent) == 2
+    assert provider.titles == {"[행사 알림] 다가오는 행사 3건"}
+
+    async def _verify(session: AsyncSession) -> None:
+        deliveries = (
+            await session.execute(select(models.ScheduledNotificationDelivery))
+        ).scalars()
+        assert len({int(row.scheduled_log_id) for row in deliveries}) == 1
+        logs = await sched.list_scheduled_logs(session, limit=10)
+        assert [(str(log.status), int(log.accepted_count)) for log in logs] == [
+            ("completed", 2)
+        ] * 3
+
+    _run_in_test_session(_verify)
+
+
+def test_digest_payload_lists_nearest_events_first() -> None:
+    claimed = [
+        sched.ClaimedEvent(
+            event_id=index,
+            title=title,
+            location="",
+            d_type=d_type,
+            log_id=index,
+        )
+        for index, (title, d_type) in enumerate(
+            [("총회", "d-3"), ("세미나", "d-1"), ("송년회", "d-3"), ("특강", "d-3")]
+        )
+    ]
+    payload = trigger_svc.build_digest_payload(claimed)
+    assert payload["title"] == "[행사 알림] 다가오는 행사 4건"
+    assert payload["body"] == "D-1 세미나 · D-3 송년회 · D-3 총회 외 1건"
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api import models
+from apps.api.db import get_db
+from apps.api.main import app
+from apps.api.repositories import notifications as subs_repo
+from apps.api.repositories import scheduled_notifications as scheduled_repo
+from apps.api.repositories.send_logs import SendLogItem
+from apps.api.services import notifications_service as notif_svc
+from apps.api.services import scheduled_notifications_service as sched
+from apps.api.services import subscription_health as health
+from apps.api.services.notifications_service import PushProvider
+from apps.api.services.push_pacing import PushPacer
+
+
+def _run_in_test_session(fn: Callable[[AsyncSession], Awaitable[None]]) -> None:
+    override = app.dependency_overrides.get(get_db)
+    if override is None:
+        raise RuntimeError("get_db override not found")
+
+    async def _run() -> None:
+        async for session in override():
+            await fn(session)
+            return
+        raise RuntimeError("test session was not yielded")
+
+    asyncio.run(_run())
+
+
+def _subscription(name: str, **fields: object) -> models.PushSubscription:
+    endpoint = f"https://health.example.com/push/{name}"
+    return models.PushSubscription(
+        endpoint=endpoint,
+        endpoint_hash=subs_repo.hash_endpoint(endpoint),
+        p256dh="p",
+        auth="a",
+        **fields,
+    )
+
+
+async def _state(
+    db: AsyncSession, sub: models.PushSubscription
+) -> models.PushSubscription:
+    await db.refresh(sub)
+    return sub
+
+
+def test_failures_quarantine_with_backoff_and_success_restores(
+    client: TestClient,
+) -> None:
+    policy = health.HealthPolicy(
+        quarantine_after_failures=2,
+        quarantine_base=timedelta(hours=1),
+        quarantine_max=timedelta(hours=3),
+    )
+
+    async def _scenario(db: AsyncSession) -> None:
+        flaky = _subscription("flaky")
+        gone = _subscription("gone")
+        db.add_all([flaky, gone])
+        await db.commit()
+        flaky_hash = str(flaky.endpoint_hash)
+
+        def _fail(status: int | None) -> list[SendLogItem]:
+            return [
+                SendLogItem(ok=False, status_code=status, stored_endpoint_hash=h)
+                for h in (flaky_hash, str(gone.endpoint_hash))
+            ]
+
+        # 첫 실패는 세기만 하고, 404/410 은 발송 루프가 지우므로 세지 않는다
+        await health.record_outcomes(db, _fail(503)[:1], policy=policy)
+        await health.record_outcomes(db, _fail(410)[1:], policy=policy)
+        assert (await _state(db, flaky)).quarantined_until is None
+        assert (await _state(db, gone)).failure_count == 0
+
+        expected_hours = [1, 2, 3, 3]  # base * 2**n, max 상한
+        for hours in expected_hours:
+            before = datetime.now(UTC)
+            await health.record_outcomes(db, _fail(None)[:1], policy=policy)
+            until = (await _state(db, flaky)).quarantined_until
+            assert until is not None
+            assert abs(until - before - timedelta(hours=hours)) < timedelta(minutes=1)
+        assert flaky.failure_count == 5
+        active = await subs_repo.list_active_subscriptions(db)
+        assert [s.endpoint_hash for s in active] == [gone.endpoint_hash]
+        eligible = await subs_repo.list_eligible_subscriptions(db, topic="event")
+        assert flaky_hash not in {s.endpoint_hash for s in eligible}
+
+        await health.record_outcomes(
+            db,
+            [SendLogItem(ok=True, status_code=201, stored_endpoint_hash=flaky_hash)],
+            policy=policy,
+        )
+        restored = await _state(db, flaky)
+        assert (restored.failure_count, restored.quarantined_until) == (0, None)
+        assert restored.last_success_at is not None
+
+    _run_in_test_session(_scenario)
+
+
+def test_sweep_revokes_long_dead_and_resubscribe_restores(
+    client: TestClient,
+) -> None:
+    now = datetime.now(UTC)
+    old = now - timedelta(days=40)
+
+    async def _scenario(db: AsyncSession) -> None:
+        dead = _subscription("dead", failure_count=9, created_at=old)
+        recovering = _subscription(
+            "recovering", failure_count=9, created_at=old, last_success_at=now
+        )
+        quiet = _subscription("quiet", created_at=old)
+        db.add_all([dead, recovering, quiet])
+        await db.commit()
+
+        revoked = await health.sweep_dead_subscriptions(
+            db, policy=health.HealthPolicy(revoke_after_days=30)
+        )
+        assert revoked == 1
+        rows = await db.execute(
+            select(models.PushSubscription.endpoint_hash).where(
+                models.PushSubscription.revoked_at.is_not(None)
+            )
+        )
+        assert rows.scalars().all() == [dead.endpoint_hash]
+        disabled = health.HealthPolicy(revoke_after_days=0)
+        assert await health.sweep_dead_subscriptions(db, policy=disabled) == 0
+
+        member = models.Member(
+            student_id="health-owner",
+            email="health-owner@example.com",
+            name="health",
+            cohort=1,
+            roles="member",
+            status="active",
+        )
+        db.add(member)
+        await db.commit()
+        # 해지된 endpoint 를 다시 구독하면 건강한 활성 구독으로 돌아온다
+        again = await subs_repo.upsert_subscription(
+            db,
+            {"endpoint": str(dead.endpoint), "p256dh": "p", "auth": "a"},
+            actor_member_id=int(member.id),
+        )
+        assert (again.revoked_at, again.failure_count) == (None, 0)
+
+    _run_in_test_session(_scenario)
+
+
+class _FlakyProvider(PushProvider):
+    def __init__(self, flaky_hash: str) -> None:
+        self.flaky_hash = flaky_hash
+        self.calls: list[str] = []
+
+    def send(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        endpoint_hash = str(sub.endpoint_hash)
+        self.calls.append(endpoint_hash)
+        if endpoint_hash == self.flaky_hash:
+            return (False, 503)
+        return (True, 201)
+
+    async def send_async(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        return self.send(sub, payload)
+
+
+def test_broadcast_skips_quarantined_endpoint(client: TestClient) -> None:
+    async def _scenario(db: AsyncSession) -> None:
+        flaky = _subscription("broadcast-flaky")
+        healthy = _subscription("broadcast-ok")
+        db.add_all([flaky, healthy])
+        await db.commit()
+        provider = _FlakyProvider(str(flaky.endpoint_hash))
+
+        # 기본 정책: 3 번 연속 실패하면 격리되어 다음 발송에서 빠진다
+        for _ in range(4):
+            await notif_svc.send_to_all(db, provider, title="t", body="b")
+        assert provider.calls.count(str(flaky.endpoint_hash)) == 3
+        assert provider.calls.count(str(healthy.endpoint_hash)) == 4
+
+    _run_in_test_session(_scenario)
+
+
+class _OverloadedProvider(PushProvider):
+    """busy origin 은 다른 발송의 Retry-After 로 멈춘 사이 503 을 돌려준다."""
+
+    def __init__(self, pacer: PushPacer, busy_origin: str) -> None:
+        self.pacer = pacer
+        self.busy_origin = busy_origin
+
+    def send(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        return (False, 503)
+
+    async def send_async(
+        self, sub: models.PushSubscription, payload: dict[str, object]
+    ) -> tuple[bool, int | None]:
+        endpoint = str(sub.endpoint)
+        if endpoint.startswith(self.busy_origin):
+            self.pacer.pause(self.busy_origin, 30.0)
+        return self.send(sub, payload)
+
+
+def test_throttled_failures_do_not_quarantine(client: TestClient) -> None:
+    policy = health.HealthPolicy(quarantine_after_failures=1)
+
+    async def _scenario(db: AsyncSession) -> None:
+        limited = _subscription("limited")
+        busy_endpoint = "https://busy.example.com/push/1"
+        busy = models.PushSubscription(
+            endpoint=busy_endpoint,
+            endpoint_hash=subs_repo.hash_endpoint(busy_endpoint),
+            p256dh="p",
+            auth="a",
+        )
+        broken = _subscription("broken")
+        db.add_all([limited, busy, broken])
+        await db.commit()
+
+        # 429 는 origin 과부하라 몇 번을 받아도 세지 않는다
+        for _ in range(3):
+            await health.record_outcomes(
+                db,
+                [
+                    SendLogItem(
+                        ok=False,
+                        status_code=429,
+                        stored_endpoint_hash=str(limited.endpoint_hash),
+                    )
+                ],
+                policy=policy,
+            )
+        state = await _state(db, limited)
+        assert (state.failure_count, state.quarantined_until) == (0, None)
+
+        # pacer 가 origin 을 멈춘 사이 받은 503 도 세지 않고, 다른 origin 의 503 은 센다
+        pacer = PushPacer()
+        await sched.send_batch_notifications(
+            db,
+            _OverloadedProvider(pacer, "https://busy.example.com"),
+            subscriptions=[busy, broken],
+            payload={"title": "t", "body": "b"},
+            config=sched.BatchConfig(max_retries=0, pacer=pacer),
+        )
+        assert (await _state(db, busy)).failure_count == 0
+        assert (await _state(db, broken)).failure_count == 1
+
+    _run_in_test_session(_scenario)
+
+
+def test_local_failures_do_not_quarantine(client: TestClient) -> None:
+    policy = health.HealthPolicy(quarantine_after_failures=1)
+
+    async def _scenario(db: AsyncSession) -> None:
+        stale = _subscription("stale-claim")
+        db.add(stale)
+        starts = datetime.now(UTC) + timedelta(days=1)
+        event = models.Event(
+            title="health",
+            starts_at=starts,
+            ends_at=starts + timedelta(hours=1),
+            location="Seoul",
+            capacity=10,
+        )
+        db.add(event)
+        await db.flush()
+        log = models.ScheduledNotificationLog(
+            event_id=event.id, d_type="d-1", scheduled_at=starts
+        )
+        db.add(log)
+        await db.commit()
+        stale_hash = str(stale.endpoint_hash)
+
+        # 복호화 실패처럼 provider 를 부르지 않은 실패는 세지 않는다
+        await health.record_outcomes(
+            db,
+            [
+                SendLogItem(
+                    ok=False,
+                    status_code=None,
+                    stored_endpoint_hash=stale_hash,
+                    local_failure=True,
+                )
+            ],
+            policy=policy,
+        )
+        assert (await _state(db, stale)).failure_count == 0
+
+        # 이전 실행이 claim 뒤 중단되어 unknown 으로 남은 delivery 도 마찬가지다
+        await scheduled_repo.ensure_deliveries(
+            db, scheduled_log_id=int(log.id), endpoint_hashes=[stale_hash]
+        )
+        await db.execute(
+            update(models.ScheduledNotificationDelivery)
+            .where(models.ScheduledNotificationDelivery.scheduled_log_id == log.id)
+            .values(status="unknown")
+        )
+        await db.commit()
+        provider = _FlakyProvider(stale_hash)
+        result = await sched.send_batch_notifications(
+            db,
+            provider,
+            subscriptions=[stale],
+            payload={"title": "t", "body": "b"},
+            config=sched.BatchConfig(scheduled_log_id=int(log.id)),
+        )
+        assert (result.accepted, result.failed, provider.calls) == (0, 1, [])
+        state = await _state(db, stale)
+        assert (state.failure_count, state.quarantined_until) == (0, None)
+
+    _run_in_test_session(_scenario)
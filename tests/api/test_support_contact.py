@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
 from http import HTTPStatus
+from pathlib import Path
 
 import bcrypt
 import httpx
@@ -12,6 +14,8 @@ from sqlalchemy import select
 from apps.api import models
 from apps.api.db import get_db
 from apps.api.main import app
+from apps.api.routers.support import RecentSubmissions
+from apps.api.support_log import SupportLog, format_support_entry
 
 
 @pytest.fixture()
@@ -150,3 +154,35 @@ def test_active_admin_session_refreshes_backfilled_support_role(
     session = client.get("/auth/session")
     assert session.status_code == HTTPStatus.OK
     assert "admin_support" in session.json()["roles"]
+
+
+def test_support_log_appends_and_rotates_by_size(tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "support.log"
+    log = SupportLog(path, max_bytes=200, backup_count=1)
+    fixed = datetime(2026, 1, 1, tzinfo=UTC)
+    for i in range(6):
+        log.write(format_support_entry(f"제목{i}", None, "본문 " * 10, now=fixed))
+    log.close()
+
+    current = path.read_text(encoding="utf-8")
+    backup = path.with_name("support.log.1").read_text(encoding="utf-8")
+    assert current.endswith("---\n")
+    assert "제목5" in current
+    assert backup.startswith("2026-01-01T00:00:00+00:00\t제목")
+    assert not path.with_name("support.log.2").exists()
+
+
+def test_recent_submissions_is_ttl_and_size_bounded() -> None:
+    recent = RecentSubmissions(ttl=60.0, max_entries=3)
+
+    assert recent.seen("a", "hello", now=0.0) is False
+    assert recent.seen("a", "hello", now=30.0) is True
+    assert recent.seen("a", "other", now=31.0) is False
+    assert recent.seen("a", "other", now=200.0) is False
+
+    for i in range(10):
+        recent.seen(f"ip-{i}", "spam", now=201.0)
+    assert len(recent) == 3
+
+    recent.seen("late", "x", now=400.0)
+    assert len(recent) == 1
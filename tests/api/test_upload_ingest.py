@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Iterator
+from http import HTTPStatus
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+from fastapi.testclient import TestClient
+from PIL import Image
+from starlette.types import Receive, Scope, Send
+
+from apps.api import config, image_pipeline, upload_ingest
+from apps.api.errors import ApiError
+
+
+def _image_bytes(size: tuple[int, int], fmt: str, mode: str = "RGB") -> bytes:
+    buf = BytesIO()
+    Image.new(mode, size).save(buf, format=fmt)
+    return buf.getvalue()
+
+
+class _CountingFile(BytesIO):
+    """읽어 간 바이트 수를 기록한다(조기 중단 확인용)."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.consumed = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        chunk = super().read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+@pytest.fixture
+def small_spool(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("UPLOAD_SPOOL_BYTES", "16")
+    config.reset_settings_cache()
+    yield
+    monkeypatch.delenv("UPLOAD_SPOOL_BYTES")
+    config.reset_settings_cache()
+
+
+def test_sniff_format_reads_magic_bytes() -> None:
+    assert upload_ingest.sniff_format(_image_bytes((2, 2), "JPEG")) == "JPEG"
+    assert upload_ingest.sniff_format(_image_bytes((2, 2), "PNG")) == "PNG"
+    assert upload_ingest.sniff_format(_image_bytes((2, 2), "GIF")) == "GIF"
+    assert upload_ingest.sniff_format(_image_bytes((2, 2), "WEBP")) == "WEBP"
+    assert upload_ingest.sniff_format(b"BM" + b"\x00" * 16) is None
+
+
+@pytest.mark.usefixtures("small_spool")
+def test_large_upload_spills_to_disk_and_is_cleaned_up() -> None:
+    data = _image_bytes((300, 200), "PNG")
+    upload = UploadFile(file=BytesIO(data), filename="photo.png")
+
+    async def _run() -> tuple[str, bytes]:
+        policy = upload_ingest.image_upload_policy()
+        async with upload_ingest.ingest_image(upload, policy) as ingested:
+            assert isinstance(ingested.source, str)
+            assert os.path.exists(ingested.source)
+            assert (ingested.format, ingested.size) == ("PNG", len(data))
+            assert (ingested.width, ingested.height) == (300, 200)
+            rendered = await image_pipeline.process_upload_image(
+                ingested.source, ext=".png", max_pixels=100
+            )
+            return ingested.source, rendered.data
+
+    spill_path, encoded = asyncio.run(_run())
+
+    assert not os.path.exists(spill_path)
+    with Image.open(BytesIO(encoded)) as out:
+        assert out.size == (100, 66)
+
+
+def test_oversized_upload_stops_reading_at_cap() -> None:
+    data = _image_bytes((10, 10), "JPEG") + b"\x00" * 1_000_000
+    counting = _CountingFile(data)
+    upload = UploadFile(file=counting, filename="big.jpg")
+    policy = upload_ingest.IngestPolicy(
+        kind="upload",
+        max_bytes=100_000,
+        formats=upload_ingest.UPLOAD_FORMATS,
+        max_source_pixels=1_000_000,
+    )
+
+    async def _run() -> None:
+        async with upload_ingest.ingest_image(upload, policy):
+            pytest.fail("상한을 넘는 업로드가 통과했다")
+
+    with pytest.raises(ApiError) as exc_info:
+        asyncio.run(_run())
+
+    assert exc_info.value.code == "image_too_large"
+    assert counting.consumed < 200_000
+
+
+def test_upload_rejects_decompression_bomb_before_decode(
+    member_login: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # 1비트 PNG 는 수 KB 지만 헤더상 6400만 픽셀이다.
+    bomb = _image_bytes((8000, 8000), "PNG", mode="1")
+
+    async def _must_not_decode(*_args: object) -> bytes:
+        raise AssertionError("디코딩 단계까지 가면 안 된다")
+
+    monkeypatch.setattr(image_pipeline, "_run_in_pool", _must_not_decode)
+
+    res = member_login.post(
+        "/uploads/images",
+        files={"file": ("bomb.png", bomb, "image/png")},
+    )
+
+    assert res.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert res.json()["code"] == "image_too_many_pixels"
+
+
+def test_avatar_rejects_format_by_magic_bytes(member_login: TestClient) -> None:
+    res = member_login.post(
+        "/me/avatar",
+        files={"avatar": ("avatar.jpg", _image_bytes((20, 20), "GIF"), "image/jpeg")},
+    )
+
+    assert res.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert res.json()["code"] == "avatar_unsupported_format"
+
+
+def test_size_limit_middleware_rejects_by_content_length() -> None:
+    calls: list[str] = []
+
+    async def _inner(scope: Scope, _receive: Receive, send: Send) -> None:
+        calls.append(scope["path"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    app = upload_ingest.UploadSizeLimitMiddleware(_inner, limits={"/upload": 10})
+    client = TestClient(app)
+
+    res = client.post("/upload", content=b"\x00" * 200_000)
+    assert res.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert res.json()["code"] == "upload_too_large"
+    assert calls == []
+
+    assert client.post("/upload", content=b"\x00" * 100).status_code == HTTPStatus.OK
+    assert client.post("/other", content=b"\x00" * 200_000).status_code == 200